@@ -148,13 +148,14 @@ describe('AddFileDialog', () => {
     expect(screen.getByText(/only .txt and .md files are allowed/i)).toBeInTheDocument()
   })
 
-  it('shows extract started notification after successful upload', async () => {
+  it('shows extract scheduled notification after successful upload', async () => {
     server.use(
       http.post(`${BASE_URL}/api/projects/:projectId/files/bulk`, () => {
         return HttpResponse.json(
           {
             files: [{ id: 1, file_name: 'test.txt', content_hash: 'hash1' }],
-            extract_started: true,
+            extract_started: false,
+            extract_scheduled: true,
             extract_skipped_reason: null,
           },
           { status: 201 }
@@ -188,20 +189,21 @@ describe('AddFileDialog', () => {
     const addButton = screen.getByRole('button', { name: /add \(1\)/i })
     await userEvent.setup().click(addButton)
 
-    // Should show extract started notification
+    // Should show extract scheduled notification
     await waitFor(() => {
-      expect(screen.getByText(/extract started/i)).toBeInTheDocument()
+      expect(screen.getByText(/extract scheduled/i)).toBeInTheDocument()
     }, { timeout: 3000 })
   })
 
-  it('shows extract skipped notification when run already active', async () => {
+  it('shows extract skipped notification when scheduling fails', async () => {
     server.use(
       http.post(`${BASE_URL}/api/projects/:projectId/files/bulk`, () => {
         return HttpResponse.json(
           {
             files: [{ id: 1, file_name: 'test.txt', content_hash: 'hash1' }],
             extract_started: false,
-            extract_skipped_reason: 'Run already running: 10',
+            extract_scheduled: false,
+            extract_skipped_reason: '抽出処理をスキップしました',
           },
           { status: 201 }
         )
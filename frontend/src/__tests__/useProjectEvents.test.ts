@@ -0,0 +1,132 @@
+import { describe, expect, it, vi, beforeEach, afterEach } from 'vitest'
+import { renderHook, waitFor, act } from '@testing-library/react'
+import { QueryClient, QueryClientProvider } from '@tanstack/react-query'
+import React from 'react'
+import { useProjectEvents } from '../api/hooks/useProjectEvents'
+import { runKeys } from '../api/hooks/useRuns'
+import type { RunResponse } from '../api/types'
+
+// Get the mocked EventSource from setup.ts
+type MockEventSource = {
+  url: string
+  addEventListener: ReturnType<typeof vi.fn>
+  close: ReturnType<typeof vi.fn>
+  dispatchEvent: (event: Event) => boolean
+}
+
+const runningRun: RunResponse = {
+  id: 3,
+  scope: 'full',
+  status: 'running',
+  progress_current: 2,
+  progress_total: 10,
+  current_step: 'provisional',
+  created_at: '2026-01-01T00:00:00+00:00',
+  started_at: '2026-01-01T00:00:01+00:00',
+  finished_at: null,
+  triggered_by: 'api',
+  error_message: null,
+}
+
+const sseEvent = (type: string, data: unknown) =>
+  new MessageEvent(type, { data: JSON.stringify(data) })
+
+describe('useProjectEvents', () => {
+  const OriginalEventSource = window.EventSource
+  let instances: MockEventSource[]
+  let queryClient: QueryClient
+
+  const wrapper = ({ children }: { children: React.ReactNode }) =>
+    React.createElement(QueryClientProvider, { client: queryClient }, children)
+
+  beforeEach(() => {
+    instances = []
+    queryClient = new QueryClient({ defaultOptions: { queries: { retry: false } } })
+    window.EventSource = class extends OriginalEventSource {
+      constructor(url: string) {
+        super(url)
+        instances.push(this as unknown as MockEventSource)
+      }
+    } as typeof EventSource
+  })
+
+  afterEach(() => {
+    window.EventSource = OriginalEventSource
+  })
+
+  it('should connect to the project event stream', async () => {
+    renderHook(() => useProjectEvents(1), { wrapper })
+
+    await waitFor(() => expect(instances).toHaveLength(1))
+    expect(instances[0].url).toBe('http://localhost:8000/api/projects/1/events')
+  })
+
+  it('should not connect without a project', () => {
+    renderHook(() => useProjectEvents(undefined), { wrapper })
+
+    expect(instances).toHaveLength(0)
+  })
+
+  it('should store run and progress events as the current run', async () => {
+    renderHook(() => useProjectEvents(1), { wrapper })
+    await waitFor(() => expect(instances).toHaveLength(1))
+
+    act(() => {
+      instances[0].dispatchEvent(sseEvent('run', runningRun))
+    })
+    expect(queryClient.getQueryData(runKeys.current(1))).toEqual(runningRun)
+
+    act(() => {
+      instances[0].dispatchEvent(
+        sseEvent('progress', { ...runningRun, progress_current: 5 })
+      )
+    })
+    expect(queryClient.getQueryData<RunResponse>(runKeys.current(1))?.progress_current).toBe(5)
+  })
+
+  it('should invalidate only the resources named by the event', async () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries')
+    renderHook(() => useProjectEvents(1), { wrapper })
+    await waitFor(() => expect(instances).toHaveLength(1))
+
+    act(() => {
+      instances[0].dispatchEvent(sseEvent('invalidate', { resources: ['terms', 'synonym_groups'] }))
+    })
+
+    const keys = invalidateSpy.mock.calls.map(([filters]) => filters?.queryKey)
+    expect(keys).toEqual([
+      ['terms', 'list', 1],
+      ['terms', 'detail', 1],
+      ['synonymGroups', 'list', 1],
+      ['synonymGroups', 'detail', 1],
+    ])
+  })
+
+  it('should refetch everything after reconnecting', async () => {
+    const invalidateSpy = vi.spyOn(queryClient, 'invalidateQueries')
+    renderHook(() => useProjectEvents(1), { wrapper })
+    await waitFor(() => expect(instances).toHaveLength(1))
+    // Initial connection (opened by the mock) does not refetch
+    await waitFor(() =>
+      expect(instances[0].addEventListener).toHaveBeenCalledWith('open', expect.any(Function))
+    )
+    expect(invalidateSpy).not.toHaveBeenCalled()
+
+    act(() => {
+      instances[0].dispatchEvent(new Event('open'))
+    })
+
+    const keys = invalidateSpy.mock.calls.map(([filters]) => filters?.queryKey)
+    expect(keys).toContainEqual(['refined', 'list', 1])
+    expect(keys).toContainEqual(runKeys.current(1))
+  })
+
+  it('should close the stream on unmount', async () => {
+    const { unmount } = renderHook(() => useProjectEvents(1), { wrapper })
+    await waitFor(() => expect(instances).toHaveLength(1))
+
+    unmount()
+
+    expect(instances[0].close).toHaveBeenCalled()
+  })
+})
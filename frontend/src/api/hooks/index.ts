@@ -83,3 +83,4 @@ export {
 } from './useSynonymGroups'
 
 export { useLogStream } from './useLogStream'
+export { useProjectEvents } from './useProjectEvents'
@@ -0,0 +1,94 @@
+import { useEffect } from 'react'
+import { useQueryClient, type QueryKey } from '@tanstack/react-query'
+import { getBaseUrl } from '../client'
+import type { ProjectResource, RunResponse } from '../types'
+import { fileKeys } from './useFiles'
+import { termKeys } from './useTerms'
+import { excludedTermKeys } from './useExcludedTerms'
+import { requiredTermKeys } from './useRequiredTerms'
+import { provisionalKeys } from './useProvisional'
+import { issueKeys } from './useIssues'
+import { refinedKeys } from './useRefined'
+import { synonymGroupKeys } from './useSynonymGroups'
+import { runKeys } from './useRuns'
+
+// Resource name in invalidate events -> root query key of its hooks
+const RESOURCE_KEYS: Record<ProjectResource, QueryKey> = {
+  files: fileKeys.all,
+  terms: termKeys.all,
+  excluded_terms: excludedTermKeys.all,
+  required_terms: requiredTermKeys.all,
+  provisional: provisionalKeys.all,
+  issues: issueKeys.all,
+  refined: refinedKeys.all,
+  synonym_groups: synonymGroupKeys.all,
+}
+
+const ALL_RESOURCES = Object.keys(RESOURCE_KEYS) as ProjectResource[]
+
+const parseData = <T>(event: MessageEvent): T | null => {
+  try {
+    return JSON.parse(event.data) as T
+  } catch {
+    return null
+  }
+}
+
+/**
+ * Subscribe to the project's event stream and keep the query cache current.
+ *
+ * Run and progress events update the current run in place; invalidate
+ * events refetch only the lists and details of the resources that changed.
+ * This replaces polling /runs/current while a run is active.
+ */
+export function useProjectEvents(projectId: number | undefined) {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    // Use == null to correctly handle projectId=0 as valid
+    if (projectId == null) return
+
+    const url = `${getBaseUrl()}/api/projects/${projectId}/events`
+    const eventSource = new EventSource(url)
+    let hasConnected = false
+
+    const invalidate = (resources: ProjectResource[]) => {
+      resources.forEach((resource) => {
+        const root = RESOURCE_KEYS[resource]
+        if (!root) return
+        queryClient.invalidateQueries({ queryKey: [...root, 'list', projectId] })
+        queryClient.invalidateQueries({ queryKey: [...root, 'detail', projectId] })
+      })
+    }
+
+    const invalidateAll = () => {
+      invalidate(ALL_RESOURCES)
+      queryClient.invalidateQueries({ queryKey: runKeys.current(projectId) })
+    }
+
+    // EventSource reconnects by itself; changes made while it was
+    // disconnected are unknown, so refetch everything (mostly 304s)
+    const handleOpen = () => {
+      if (hasConnected) invalidateAll()
+      hasConnected = true
+    }
+
+    const handleRun = (event: MessageEvent) => {
+      const run = parseData<RunResponse>(event)
+      if (run) queryClient.setQueryData(runKeys.current(projectId), run)
+    }
+
+    const handleInvalidate = (event: MessageEvent) => {
+      const data = parseData<{ resources: ProjectResource[] }>(event)
+      if (data) invalidate(data.resources)
+    }
+
+    eventSource.addEventListener('open', handleOpen)
+    eventSource.addEventListener('run', handleRun as EventListener)
+    eventSource.addEventListener('progress', handleRun as EventListener)
+    eventSource.addEventListener('invalidate', handleInvalidate as EventListener)
+    eventSource.addEventListener('resync', invalidateAll)
+
+    return () => eventSource.close()  // eventSource.close() handles all cleanup
+  }, [projectId, queryClient])
+}
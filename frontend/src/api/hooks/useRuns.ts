@@ -16,13 +16,12 @@ const runApi = {
     apiClient.delete<{ message: string }>(`/api/projects/${projectId}/runs/${runId}`),
 }
 
+// No polling: run and progress events from useProjectEvents update this query
 export function useCurrentRun(projectId: number | undefined) {
   return useQuery({
     queryKey: runKeys.current(projectId!),
     queryFn: () => runApi.getCurrent(projectId!),
     enabled: projectId !== undefined,
-    refetchInterval: (query) =>
-      query.state.data?.status === 'running' ? 2000 : false,
   })
 }
 
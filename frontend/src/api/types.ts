@@ -62,6 +62,8 @@ export interface FileCreateBulkRequest {
 export interface FileCreateBulkResponse {
   files: FileResponse[]
   extract_started: boolean
+  // New files are queued; uploads in quick succession share one extract run
+  extract_scheduled: boolean
   extract_skipped_reason: string | null
 }
 
@@ -227,6 +229,17 @@ export interface RunResponse {
   error_message: string | null
 }
 
+// Resources named by invalidate events of the project event stream
+export type ProjectResource =
+  | 'files'
+  | 'terms'
+  | 'excluded_terms'
+  | 'required_terms'
+  | 'provisional'
+  | 'issues'
+  | 'refined'
+  | 'synonym_groups'
+
 // Settings types
 export interface SettingsResponse {
   id: number
@@ -112,10 +112,10 @@ export function AddFileDialog({ projectId, opened, onClose }: AddFileDialogProps
         content: f.content,
       }))
       const result = await createMutation.mutateAsync(files)
-      if (result.extract_started) {
+      if (result.extract_started || result.extract_scheduled) {
         notifications.show({
-          title: 'Extract started',
-          message: 'Term extraction has been triggered automatically.',
+          title: 'Extract scheduled',
+          message: 'Term extraction will start automatically for the new files.',
           color: 'green',
         })
       } else if (result.extract_skipped_reason) {
@@ -5,14 +5,7 @@ import { useCallback } from 'react'
 import { GlobalTopBar } from './GlobalTopBar'
 import { LeftNavRail } from './LeftNavRail'
 import { LogPanel } from './LogPanel'
-import {
-  useCurrentRun,
-  runKeys,
-  termKeys,
-  provisionalKeys,
-  issueKeys,
-  refinedKeys,
-} from '../../api/hooks'
+import { useCurrentRun, useProjectEvents, runKeys } from '../../api/hooks'
 import { extractProjectId } from '../../utils/extractProjectId'
 
 export function AppShell() {
@@ -20,21 +13,20 @@ export function AppShell() {
   const projectId = extractProjectId(location.pathname)
   const queryClient = useQueryClient()
 
+  // Keep the run and data caches current from the project event stream
+  useProjectEvents(projectId)
+
   // Get current run to pass runId to LogPanel
   const { data: currentRun } = useCurrentRun(projectId)
   const runId = currentRun?.status === 'running' ? currentRun.id : undefined
 
-  // Invalidate caches when SSE stream completes (run finished)
-  // All data lists are refreshed since run completion may affect any of them
+  // Refresh the run when its log stream completes. Data lists are refreshed
+  // by invalidate events, which name exactly the resources the run changed.
   // Uses completedProjectId from SSE context to avoid invalidating wrong cache
   // when user navigates to different project during run
   const handleRunComplete = useCallback(
     (completedProjectId: number) => {
       queryClient.invalidateQueries({ queryKey: runKeys.current(completedProjectId) })
-      queryClient.invalidateQueries({ queryKey: termKeys.list(completedProjectId) })
-      queryClient.invalidateQueries({ queryKey: provisionalKeys.list(completedProjectId) })
-      queryClient.invalidateQueries({ queryKey: issueKeys.list(completedProjectId) })
-      queryClient.invalidateQueries({ queryKey: refinedKeys.list(completedProjectId) })
     },
     [queryClient]
   )
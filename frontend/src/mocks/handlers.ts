@@ -290,7 +290,12 @@ export const handlers = [
       content_hash: 'new_hash_' + Date.now() + idx,
     }))
     return HttpResponse.json(
-      { files: newFiles, extract_started: true, extract_skipped_reason: null },
+      {
+        files: newFiles,
+        extract_started: false,
+        extract_scheduled: true,
+        extract_skipped_reason: null,
+      },
       { status: 201 }
     )
   }),
@@ -1,27 +1,68 @@
 """FastAPI application factory."""
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from threading import Thread
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from genglossary import __version__
+from genglossary.api.dependencies import (
+    close_project_llm_clients,
+    resume_auto_extract,
+)
 from genglossary.api.middleware import (
+    CompressionMiddleware,
     RequestIDMiddleware,
     StructuredLoggingMiddleware,
 )
 from genglossary.api.routers import (
+    events_router,
     excluded_terms_router,
     files_router,
     health_router,
     issues_router,
+    metrics_router,
     ollama_router,
     projects_router,
     provisional_router,
     refined_router,
     required_terms_router,
     runs_router,
+    search_router,
     synonym_groups_router,
     terms_router,
 )
+from genglossary.llm.http_pool import get_http_transport_registry
+from genglossary.morphological_analyzer import get_tokenizer_pool
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up_tokenizers() -> None:
+    """Load the SudachiPy dictionary so the first extract does not pay for it."""
+    try:
+        get_tokenizer_pool().warm_up()
+    except Exception:
+        logger.warning("SudachiPy warm-up failed", exc_info=True)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # In the background: the server accepts requests right away, and an
+    # extract that starts before warm-up ends waits for the same load
+    Thread(target=_warm_up_tokenizers, name="sudachi-warm-up", daemon=True).start()
+    # Uploads queued before a restart are extracted without waiting for a
+    # request to open their project
+    try:
+        resume_auto_extract()
+    except Exception:
+        logger.warning("Failed to resume auto-extract queues", exc_info=True)
+    yield
+    close_project_llm_clients()
+    get_http_transport_registry().close()
 
 
 def create_app() -> FastAPI:
@@ -34,10 +75,14 @@ def create_app() -> FastAPI:
         title="GenGlossary API",
         description="API for GenGlossary - AI-powered glossary generation tool",
         version=__version__,
+        lifespan=_lifespan,
     )
 
     # Middleware stack (applied in reverse order: last added = first executed)
-    # Order: CORS -> RequestID -> StructuredLogging -> routes
+    # Order: CORS -> RequestID -> StructuredLogging -> Compression -> routes
+
+    # Compression middleware (closest to routes, compresses the body only)
+    app.add_middleware(CompressionMiddleware)
 
     # Structured logging middleware (last executed, can access request_id)
     app.add_middleware(StructuredLoggingMiddleware)
@@ -57,11 +102,12 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["X-Request-ID"],
+        expose_headers=["X-Request-ID", "X-Next-Cursor", "ETag"],
     )
 
     # Include routers
     app.include_router(health_router)
+    app.include_router(metrics_router)
     app.include_router(projects_router)
     app.include_router(terms_router)
     app.include_router(excluded_terms_router)
@@ -71,6 +117,8 @@ def create_app() -> FastAPI:
     app.include_router(refined_router)
     app.include_router(files_router)
     app.include_router(runs_router)
+    app.include_router(events_router)
+    app.include_router(search_router)
     app.include_router(synonym_groups_router)
     app.include_router(ollama_router, prefix="/api")
 
@@ -1,25 +1,67 @@
 """Dependency injection for API."""
 
+import hashlib
+import logging
 import os
 import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
 from typing import Generator
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request, Response, status
 
+from genglossary import __version__
 from genglossary.config import Config
-from genglossary.db.connection import get_connection
-from genglossary.db.project_repository import get_project
+from genglossary.corpus import CorpusCache
+from genglossary.db.connection import database_connection, get_connection
+from genglossary.db.pending_extract_repository import list_pending_extract_documents
+from genglossary.db.project_repository import get_project, list_projects
 from genglossary.db.registry_schema import initialize_registry
 from genglossary.db.schema import initialize_db
+from genglossary.db.table_version_repository import get_table_versions
+from genglossary.events import ProjectEventHub
+from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.factory import create_llm_client
 from genglossary.models.project import Project
+from genglossary.runs.auto_extract import AutoExtractScheduler
 from genglossary.runs.manager import RunManager
 
+logger = logging.getLogger(__name__)
+
 # RunManager registry: one instance per project (keyed by db_path)
 _run_manager_registry: dict[str, RunManager] = {}
 _registry_lock = Lock()
 
+# Corpus cache registry: one instance per project (keyed by db_path)
+_corpus_cache_registry: dict[str, CorpusCache] = {}
+
+# Event hub registry: one instance per project (keyed by db_path)
+_event_hub_registry: dict[str, ProjectEventHub] = {}
+
+# Auto-extract scheduler registry: one instance per project (keyed by db_path)
+_auto_extract_registry: dict[str, AutoExtractScheduler] = {}
+
+
+@dataclass
+class _SharedLLMClient:
+    """A project's shared LLM client and the requests using it.
+
+    Protected by _registry_lock. A replaced client is closed once its last
+    lease is returned.
+    """
+
+    settings: tuple[str, str, str]
+    client: BaseLLMClient
+    leases: int = 0
+    retired: bool = False
+
+
+# Shared LLM client registry: one client per project (keyed by db_path)
+_llm_client_registry: dict[str, _SharedLLMClient] = {}
+
 
 def get_config() -> Config:
     """Get application configuration.
@@ -113,6 +155,52 @@ def get_project_db_path(project: Project = Depends(get_project_by_id)) -> str:
     return project.db_path
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header with an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(*tables: str) -> Callable[..., None]:
+    """Create a dependency that answers 304 Not Modified for unchanged tables.
+
+    The ETag is derived from the tables' change counters (schema v15), the
+    query string and the application version, so checking it reads one
+    small table instead of the data. A matching If-None-Match raises 304
+    before the endpoint runs; otherwise the ETag is set on the response.
+    Cache-Control: no-cache makes browsers revalidate on every fetch.
+
+    Args:
+        tables: Tables whose contents the endpoint returns.
+
+    Returns:
+        Callable: Dependency for a route's dependencies list.
+    """
+
+    def check_not_modified(
+        request: Request,
+        response: Response,
+        project_db: sqlite3.Connection = Depends(get_project_db),
+    ) -> None:
+        versions = get_table_versions(project_db, tables)
+        tag = ".".join(str(versions.get(table, 0)) for table in tables)
+        query = hashlib.sha256(request.url.query.encode()).hexdigest()[:8]
+        etag = f'W/"{tag}-{query}-{__version__}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return check_not_modified
+
+
 def _settings_match(manager: RunManager, project: Project) -> bool:
     """Check if manager settings match project settings.
 
@@ -148,9 +236,41 @@ def _create_and_register_manager(project: Project) -> RunManager:
         llm_base_url=project.llm_base_url,
     )
     _run_manager_registry[project.db_path] = manager
+    _bind_auto_extract_scheduler(project.db_path, manager)
     return manager
 
 
+def _bind_auto_extract_scheduler(
+    db_path: str, manager: RunManager
+) -> AutoExtractScheduler:
+    """Get or create the project's auto-extract scheduler and bind the manager.
+
+    A new scheduler resumes documents queued before a restart (see also
+    resume_auto_extract, which does this for every project at startup).
+    Caller must hold _registry_lock.
+
+    Args:
+        db_path: Project database path.
+        manager: Current RunManager of the project.
+
+    Returns:
+        AutoExtractScheduler: Scheduler shared by all requests for the project.
+    """
+    scheduler = _auto_extract_registry.get(db_path)
+    if scheduler is None:
+        config = Config()
+        scheduler = AutoExtractScheduler(
+            manager,
+            quiet_seconds=config.auto_extract_quiet_seconds,
+            max_delay_seconds=config.auto_extract_max_delay_seconds,
+        )
+        _auto_extract_registry[db_path] = scheduler
+        scheduler.resume()
+    else:
+        scheduler.manager = manager
+    return scheduler
+
+
 def get_run_manager(project: Project = Depends(get_project_by_id)) -> RunManager:
     """Get or create RunManager instance for the project (singleton per project).
 
@@ -177,3 +297,158 @@ def get_run_manager(project: Project = Depends(get_project_by_id)) -> RunManager
             return existing
 
         return _create_and_register_manager(project)
+
+
+def resume_auto_extract() -> None:
+    """Resume the auto-extract queues of all projects (at app startup).
+
+    Creates the RunManager and scheduler of every project with documents
+    queued before the restart, so they are extracted without waiting for a
+    request to open the project. Projects whose database cannot be read
+    are skipped.
+    """
+    registry = get_registry_db()
+    try:
+        projects = list_projects(next(registry))
+    finally:
+        registry.close()
+
+    for project in projects:
+        if not Path(project.db_path).exists():
+            continue
+        try:
+            with database_connection(project.db_path) as conn:
+                pending = list_pending_extract_documents(conn)
+        except sqlite3.Error:
+            # Not yet migrated to v17 (nothing queued) or unreadable
+            logger.warning(
+                "Cannot read the auto-extract queue of %s",
+                project.db_path,
+                exc_info=True,
+            )
+            continue
+        if not pending:
+            continue
+        with _registry_lock:
+            manager = _run_manager_registry.get(project.db_path)
+            if manager is None:
+                _create_and_register_manager(project)
+            else:
+                _bind_auto_extract_scheduler(project.db_path, manager)
+
+
+def get_auto_extract_scheduler(
+    project: Project = Depends(get_project_by_id),
+    manager: RunManager = Depends(get_run_manager),
+) -> AutoExtractScheduler:
+    """Get the auto-extract scheduler for the project (singleton per project).
+
+    Args:
+        project: Project instance from get_project_by_id.
+        manager: RunManager instance for the project.
+
+    Returns:
+        AutoExtractScheduler: Scheduler starting extract runs with the manager.
+    """
+    with _registry_lock:
+        return _bind_auto_extract_scheduler(project.db_path, manager)
+
+
+def get_corpus_cache(project: Project = Depends(get_project_by_id)) -> CorpusCache:
+    """Get the corpus cache for the project (singleton per project).
+
+    Args:
+        project: Project instance from get_project_by_id.
+
+    Returns:
+        CorpusCache: Corpus cache shared by all requests for the project.
+    """
+    with _registry_lock:
+        cache = _corpus_cache_registry.get(project.db_path)
+        if cache is None:
+            cache = CorpusCache()
+            _corpus_cache_registry[project.db_path] = cache
+        return cache
+
+
+def get_event_hub(project: Project = Depends(get_project_by_id)) -> ProjectEventHub:
+    """Get the event hub for the project (singleton per project).
+
+    Args:
+        project: Project instance from get_project_by_id.
+
+    Returns:
+        ProjectEventHub: Event hub shared by all event streams of the project.
+    """
+    with _registry_lock:
+        hub = _event_hub_registry.get(project.db_path)
+        if hub is None:
+            hub = ProjectEventHub(project.db_path)
+            _event_hub_registry[project.db_path] = hub
+        return hub
+
+
+@contextmanager
+def use_project_llm_client(project: Project) -> Iterator[BaseLLMClient]:
+    """Lease the shared LLM client of the project (singleton per project).
+
+    The client is reused across requests; its connections come from the
+    shared pool of the LLM server (see genglossary.llm.http_pool). A new
+    client is created when the project's LLM settings change, and the
+    replaced one is closed once no request is using it any more.
+
+    Args:
+        project: Project whose LLM settings to use.
+
+    Yields:
+        BaseLLMClient: LLM client for the project.
+
+    Raises:
+        ValueError: If the project's llm_provider is unknown.
+    """
+    settings = (project.llm_provider, project.llm_model, project.llm_base_url)
+    replaced: BaseLLMClient | None = None
+    with _registry_lock:
+        shared = _llm_client_registry.get(project.db_path)
+        if shared is None or shared.settings != settings:
+            client = create_llm_client(
+                project.llm_provider,
+                project.llm_model or None,
+                base_url=project.llm_base_url or None,
+            )
+            if shared is not None:
+                shared.retired = True
+                if shared.leases == 0:
+                    replaced = shared.client
+            shared = _SharedLLMClient(settings, client)
+            _llm_client_registry[project.db_path] = shared
+        shared.leases += 1
+    # Closing joins background threads, so never under the registry lock
+    if replaced is not None:
+        replaced.close()
+
+    try:
+        yield shared.client
+    finally:
+        with _registry_lock:
+            shared.leases -= 1
+            close = shared.retired and shared.leases == 0
+        if close:
+            shared.client.close()
+
+
+def close_project_llm_clients() -> None:
+    """Close every shared LLM client (at app shutdown).
+
+    Clients still leased are retired instead and closed by their last user.
+    """
+    with _registry_lock:
+        entries = list(_llm_client_registry.values())
+        _llm_client_registry.clear()
+        idle = []
+        for shared in entries:
+            shared.retired = True
+            if shared.leases == 0:
+                idle.append(shared.client)
+    for client in idle:
+        client.close()
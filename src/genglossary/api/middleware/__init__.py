@@ -1,9 +1,11 @@
 """API middleware components."""
 
+from genglossary.api.middleware.compression import CompressionMiddleware
 from genglossary.api.middleware.logging import StructuredLoggingMiddleware
 from genglossary.api.middleware.request_id import RequestIDMiddleware
 
 __all__ = [
+    "CompressionMiddleware",
     "RequestIDMiddleware",
     "StructuredLoggingMiddleware",
 ]
@@ -0,0 +1,247 @@
+"""Response compression middleware (gzip, and Brotli when available)."""
+
+import zlib
+from importlib.util import find_spec
+from typing import Any, Callable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Responses smaller than this are sent as is
+DEFAULT_MINIMUM_SIZE = 1024
+
+# zlib level 6 and Brotli quality 4 compress JSON nearly as well as the
+# maximum settings for a fraction of the CPU time
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+# Already compressed or streamed event by event ("type/*" matches a family)
+EXCLUDED_CONTENT_TYPES: frozenset[str] = frozenset(
+    {
+        "text/event-stream",
+        "application/gzip",
+        "application/x-gzip",
+        "application/zip",
+        "image/*",
+        "audio/*",
+        "video/*",
+        "font/woff",
+        "font/woff2",
+    }
+)
+
+
+def _brotli_available() -> bool:
+    return find_spec("brotli") is not None
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, deflate, br;q=0.5".
+
+    Returns:
+        set[str]: Lower-case codings with a non-zero quality.
+    """
+    encodings: set[str] = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            encodings.add(coding)
+    return encodings
+
+
+def _is_excluded_content_type(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    family = media_type.partition("/")[0] + "/*"
+    return media_type in EXCLUDED_CONTENT_TYPES or family in EXCLUDED_CONTENT_TYPES
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        return self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._zlib.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        # Optional dependency: only imported once a body is compressed
+        import brotli  # pyright: ignore[reportMissingImports]
+
+        self._brotli: Any = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.process(data)
+
+    def flush(self) -> bytes:
+        return self._brotli.flush()
+
+    def finish(self) -> bytes:
+        return self._brotli.finish()
+
+
+class CompressionResponder:
+    """Compresses one response body with the given coding.
+
+    Self-contained instead of building on Starlette's GZipResponder, whose
+    constructor and apply_compression signature differ between Starlette
+    releases.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        content_encoding: str,
+        make_compressor: Callable[[], _Compressor],
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_encoding = content_encoding
+        self.make_compressor = make_compressor
+        self.send: Send | None = None
+        self.initial_message: Message | None = None
+        self.passthrough = False
+        self.compressor: _Compressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        assert self.send is not None
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == 206
+                or _is_excluded_content_type(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Held back until the first body chunk decides the headers
+                self.initial_message = message
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message_type != "http.response.body":
+            # e.g. pathsend: sent as is
+            await self._send_initial_message()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if self.initial_message is None:
+                # Uncompressed response already started
+                await self.send(message)
+                return
+            if len(body) < self.minimum_size and not more_body:
+                await self._send_initial_message()
+                await self.send(message)
+                return
+            self.compressor = self.make_compressor()
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.content_encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+
+        data = self.compressor.compress(body)
+        data += self.compressor.flush() if more_body else self.compressor.finish()
+        if self.initial_message is not None and not more_body:
+            MutableHeaders(raw=self.initial_message["headers"])["Content-Length"] = str(
+                len(data)
+            )
+        await self._send_initial_message()
+        await self.send({**message, "body": data})
+
+    async def _send_initial_message(self) -> None:
+        if self.initial_message is not None:
+            assert self.send is not None
+            message, self.initial_message = self.initial_message, None
+            await self.send(message)
+
+
+class CompressionMiddleware:
+    """Compresses responses with Brotli or gzip, as the client accepts.
+
+    Brotli is preferred when the brotli package is installed; otherwise
+    gzip is used. Small responses, 304s and event streams are untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        compresslevel: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            minimum_size: Smallest body in bytes worth compressing.
+            compresslevel: gzip compression level.
+            brotli_quality: Brotli quality (0-11).
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.brotli_quality = brotli_quality
+        self.brotli_enabled = _brotli_available()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+        if self.brotli_enabled and "br" in encodings:
+            quality = self.brotli_quality
+            responder = CompressionResponder(
+                self.app, self.minimum_size, "br", lambda: _BrotliCompressor(quality)
+            )
+        elif "gzip" in encodings:
+            level = self.compresslevel
+            responder = CompressionResponder(
+                self.app, self.minimum_size, "gzip", lambda: _GzipCompressor(level)
+            )
+        else:
+            await self.app(scope, receive, send)
+            return
+        await responder(scope, receive, send)
@@ -7,11 +7,26 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from genglossary.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
 logger = logging.getLogger(__name__)
 
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_template(request: Request) -> str:
+    """Return the matched route's path template (e.g. /api/projects/{project_id})."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
 
 class StructuredLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log requests and responses in structured format."""
+    """Middleware to log requests and responses in structured format.
+
+    Also records per-route latency and request counts for /metrics, labelled
+    by route template rather than raw path.
+    """
 
     async def dispatch(self, request: Request, call_next) -> Response:
         """Log request and response details.
@@ -34,6 +49,10 @@ class StructuredLoggingMiddleware(BaseHTTPMiddleware):
         # Calculate duration
         duration = time.time() - start_time
 
+        route = _route_template(request)
+        HTTP_REQUEST_DURATION.labels(request.method, route).observe(duration)
+        HTTP_REQUESTS.labels(request.method, route, str(response.status_code)).inc()
+
         # Log structured data
         logger.info(
             "HTTP request",
@@ -1,29 +1,35 @@
 """API routers."""
 
+from genglossary.api.routers.events import router as events_router
 from genglossary.api.routers.excluded_terms import router as excluded_terms_router
 from genglossary.api.routers.files import router as files_router
 from genglossary.api.routers.required_terms import router as required_terms_router
 from genglossary.api.routers.health import router as health_router
 from genglossary.api.routers.issues import router as issues_router
+from genglossary.api.routers.metrics import router as metrics_router
 from genglossary.api.routers.ollama import router as ollama_router
 from genglossary.api.routers.projects import router as projects_router
 from genglossary.api.routers.provisional import router as provisional_router
 from genglossary.api.routers.refined import router as refined_router
 from genglossary.api.routers.runs import router as runs_router
+from genglossary.api.routers.search import router as search_router
 from genglossary.api.routers.synonym_groups import router as synonym_groups_router
 from genglossary.api.routers.terms import router as terms_router
 
 __all__ = [
+    "events_router",
     "excluded_terms_router",
     "required_terms_router",
     "files_router",
     "health_router",
     "issues_router",
+    "metrics_router",
     "ollama_router",
     "projects_router",
     "provisional_router",
     "refined_router",
     "runs_router",
+    "search_router",
     "synonym_groups_router",
     "terms_router",
 ]
@@ -2,7 +2,7 @@
 
 import sqlite3
 
-from genglossary.db.synonym_repository import list_groups
+from genglossary.db.synonym_repository import get_aliases_map
 
 
 def build_aliases_map(conn: sqlite3.Connection) -> dict[str, list[str]]:
@@ -14,14 +14,4 @@ def build_aliases_map(conn: sqlite3.Connection) -> dict[str, list[str]]:
     Returns:
         Dict mapping primary_term_text to list of non-primary member texts.
     """
-    groups = list_groups(conn)
-    aliases_map: dict[str, list[str]] = {}
-    for group in groups:
-        aliases = [
-            m.term_text
-            for m in group.members
-            if m.term_text != group.primary_term_text
-        ]
-        if aliases:
-            aliases_map[group.primary_term_text] = aliases
-    return aliases_map
+    return get_aliases_map(conn)
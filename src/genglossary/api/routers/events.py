@@ -0,0 +1,107 @@
+"""Project event stream API endpoint."""
+
+import asyncio
+import json
+from queue import Empty
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Path
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from genglossary.api.dependencies import get_event_hub, get_run_manager
+from genglossary.api.schemas.run_schemas import RunResponse
+from genglossary.events import ProjectEvent, ProjectEventHub
+from genglossary.metrics import EVENT_STREAM_SUBSCRIBERS
+from genglossary.runs.manager import RunManager
+
+router = APIRouter(prefix="/api/projects/{project_id}/events", tags=["events"])
+
+# The hub queue is a thread queue, so the async generator polls it without
+# blocking (see the run log stream in runs.py)
+_EVENT_POLL_INTERVAL_SECONDS = 0.05
+# Long enough to cost nothing, short enough for proxies not to time out
+_KEEPALIVE_INTERVAL_SECONDS = 15.0
+
+_RUN_EVENTS: set[str] = {"run", "progress"}
+
+
+def _format_event(event: ProjectEvent) -> str:
+    """Format an event as an SSE message.
+
+    Run rows are sent in the same shape as GET /runs/current.
+
+    Args:
+        event: The event.
+
+    Returns:
+        str: SSE message with an event name and JSON data.
+    """
+    data = event.data
+    if event.event in _RUN_EVENTS:
+        data = RunResponse.from_db_row(data).model_dump()
+    return f"event: {event.event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("")
+def stream_project_events(
+    project_id: int = Path(..., description="Project ID"),
+    hub: ProjectEventHub = Depends(get_event_hub),
+    manager: RunManager = Depends(get_run_manager),
+) -> StreamingResponse:
+    """Stream a project's changes using Server-Sent Events (SSE).
+
+    One stream carries everything the GUI needs to stay current without
+    polling:
+
+    - run: a run started or changed status (data: the run)
+    - progress: the current run's progress changed (data: the run)
+    - invalidate: data changed (data: {"resources": ["terms", ...]})
+    - resync: events were dropped; refetch everything
+
+    The first event is the current or latest run, if any.
+
+    Args:
+        project_id: Project ID (path parameter).
+        hub: Project event hub.
+        manager: RunManager instance.
+
+    Returns:
+        StreamingResponse: SSE stream of project events.
+    """
+
+    async def event_generator() -> AsyncIterator[str]:
+        # Subscribe before reading the snapshot so no change falls in between
+        queue = hub.subscribe()
+        EVENT_STREAM_SUBSCRIBERS.inc()
+        try:
+            row = await run_in_threadpool(manager.get_current_or_latest_run)
+            if row is not None:
+                yield _format_event(ProjectEvent("run", dict(row)))
+
+            idle_seconds = 0.0
+            while True:
+                try:
+                    event = queue.get_nowait()
+                except Empty:
+                    await asyncio.sleep(_EVENT_POLL_INTERVAL_SECONDS)
+                    idle_seconds += _EVENT_POLL_INTERVAL_SECONDS
+                    if idle_seconds >= _KEEPALIVE_INTERVAL_SECONDS:
+                        idle_seconds = 0.0
+                        yield ": keepalive\n\n"
+                    continue
+
+                idle_seconds = 0.0
+                yield _format_event(event)
+        finally:
+            EVENT_STREAM_SUBSCRIBERS.dec()
+            hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -25,7 +25,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=ExcludedTermListResponse)
-async def list_excluded_terms(
+def list_excluded_terms(
     project_id: int = Path(..., description="Project ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> ExcludedTermListResponse:
@@ -51,7 +51,7 @@ async def list_excluded_terms(
         200: {"description": "Term already exists, returning existing"},
     },
 )
-async def create_excluded_term(
+def create_excluded_term(
     project_id: int = Path(..., description="Project ID"),
     request: ExcludedTermCreateRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -96,7 +96,7 @@ async def create_excluded_term(
 
 
 @router.delete("/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_excluded_term_endpoint(
+def delete_excluded_term_endpoint(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Excluded term ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -2,11 +2,28 @@
 
 import logging
 import sqlite3
+import tempfile
 import unicodedata
+from typing import IO
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
-
-from genglossary.api.dependencies import get_project_db, get_run_manager
+from genglossary.api.dependencies import (
+    conditional_get,
+    get_auto_extract_scheduler,
+    get_project_db,
+)
 from genglossary.db.connection import transaction
 from genglossary.api.schemas.file_schemas import (
     FileCreateBulkRequest,
@@ -14,16 +31,25 @@ from genglossary.api.schemas.file_schemas import (
     FileCreateRequest,
     FileDetailResponse,
     FileResponse,
+    FileUploadResponse,
 )
-from genglossary.runs.manager import RunManager
+from genglossary.runs.auto_extract import AutoExtractScheduler
 from genglossary.db.document_repository import (
     create_document,
     delete_document,
     get_document,
     get_document_by_name,
-    list_all_documents,
+    insert_document,
+    list_document_metadata,
+)
+from genglossary.db.pending_extract_repository import add_pending_extract_documents
+from genglossary.utils.archive import (
+    UPLOAD_CONTENT_TYPES,
+    ArchiveError,
+    iter_archive_members,
+    upload_format,
 )
-from genglossary.utils.hash import compute_content_hash
+from genglossary.utils.hash import compute_bytes_hash, compute_content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +59,10 @@ ALLOWED_EXTENSIONS = {".txt", ".md"}
 MAX_SEGMENT_BYTES = 255
 MAX_PATH_BYTES = 1024
 MAX_CONTENT_BYTES = 3 * 1024 * 1024  # 3MB
+MAX_PAGE_SIZE = 1000
+MAX_UPLOAD_FILES = 10000
+MAX_UPLOAD_BYTES = 1024 * 1024 * 1024  # 1GB
+UPLOAD_SPOOL_BYTES = 8 * 1024 * 1024  # Bodies above 8MB are spooled to disk
 
 # Unicode look-alike characters that could be used to bypass path validation
 LOOKALIKE_SLASH = {"\u2215", "\uff0f", "\u2044", "\u29f8"}  # ∕ ／ ⁄ ⧸
@@ -214,26 +244,47 @@ def _validate_file_name(file_name: str) -> str:
     return normalized
 
 
-@router.get("", response_model=list[FileResponse])
-async def list_files(
+@router.get(
+    "",
+    response_model=list[FileResponse],
+    dependencies=[Depends(conditional_get("documents"))],
+)
+def list_files(
+    response: Response,
     project_id: int = Path(..., description="Project ID"),
+    after_id: int | None = Query(
+        None, description="Keyset cursor: only return files with a greater ID"
+    ),
+    limit: int | None = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of files to return"
+    ),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> list[FileResponse]:
-    """List all registered documents for a project.
+    """List registered documents for a project (metadata only).
+
+    File contents are never read. The response carries an ETag derived
+    from the documents change counter; a matching If-None-Match returns
+    304 without reading the table (see conditional_get).
+    When a page is full, X-Next-Cursor holds the after_id for the next page.
 
     Args:
+        response: Response used to set the cursor header.
         project_id: Project ID (path parameter).
+        after_id: Keyset pagination cursor.
+        limit: Page size.
         project_db: Project database connection.
 
     Returns:
-        list[FileResponse]: List of all documents.
+        list[FileResponse]: List of documents.
     """
-    rows = list_all_documents(project_db)
+    rows = list_document_metadata(project_db, after_id=after_id, limit=limit)
+    if limit is not None and len(rows) == limit:
+        response.headers["X-Next-Cursor"] = str(rows[-1]["id"])
     return FileResponse.from_db_rows(rows)
 
 
 @router.get("/{file_id}", response_model=FileDetailResponse)
-async def get_file_by_id(
+def get_file_by_id(
     project_id: int = Path(..., description="Project ID"),
     file_id: int = Path(..., description="File ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -259,7 +310,7 @@ async def get_file_by_id(
 
 
 @router.post("", response_model=FileResponse, status_code=status.HTTP_201_CREATED)
-async def create_file(
+def create_file(
     project_id: int = Path(..., description="Project ID"),
     request: FileCreateRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -304,23 +355,24 @@ async def create_file(
 @router.post(
     "/bulk", response_model=FileCreateBulkResponse, status_code=status.HTTP_201_CREATED
 )
-async def create_files_bulk(
+def create_files_bulk(
     project_id: int = Path(..., description="Project ID"),
     request: FileCreateBulkRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
-    manager: RunManager = Depends(get_run_manager),
+    scheduler: AutoExtractScheduler = Depends(get_auto_extract_scheduler),
 ) -> FileCreateBulkResponse:
-    """Add multiple document files to the project and auto-trigger extract.
+    """Add multiple document files to the project and schedule auto-extract.
 
     This is an atomic operation - if any file fails validation or already exists,
-    none of the files will be created. After successful creation, an extract run
-    is automatically triggered.
+    none of the files will be created. The new files are queued for the
+    auto-extract run in the same transaction; uploads arriving in quick
+    succession or during a run are merged into one incremental extract.
 
     Args:
         project_id: Project ID (path parameter).
         request: Bulk file creation request with list of files.
         project_db: Project database connection.
-        manager: Run manager for auto-triggering extract.
+        scheduler: Auto-extract scheduler of the project.
 
     Returns:
         FileCreateBulkResponse: Created documents with extract status.
@@ -360,6 +412,9 @@ async def create_files_bulk(
                     project_db, normalized_name, content, content_hash
                 )
                 created_rows.append(row)
+            add_pending_extract_documents(
+                project_db, [row["id"] for row in created_rows]
+            )
     except sqlite3.IntegrityError as e:
         # Only map UNIQUE constraint violations to 409; re-raise others
         if "UNIQUE constraint failed" in str(e):
@@ -372,30 +427,188 @@ async def create_files_bulk(
     # Build file responses
     file_responses = [FileResponse.from_db_row(row) for row in created_rows]
 
-    # Collect new document IDs for incremental extract
-    new_document_ids = [row["id"] for row in created_rows]
-
-    # Auto-trigger extract run (only for new files)
-    extract_started = False
-    extract_skipped_reason: str | None = None
-    try:
-        manager.start_run(
-            scope="extract", triggered_by="auto", document_ids=new_document_ids
-        )
-        extract_started = True
-    except Exception as e:
-        logger.warning("Auto-extract skipped: %s", e)
-        extract_skipped_reason = "抽出処理をスキップしました"
+    extract_scheduled, extract_skipped_reason = _schedule_auto_extract(scheduler)
 
     return FileCreateBulkResponse(
         files=file_responses,
-        extract_started=extract_started,
+        extract_started=False,
+        extract_scheduled=extract_scheduled,
+        extract_skipped_reason=extract_skipped_reason,
+    )
+
+
+@router.post(
+    "/upload", response_model=FileUploadResponse, status_code=status.HTTP_201_CREATED
+)
+async def upload_files(
+    request: Request,
+    project_id: int = Path(..., description="Project ID"),
+    project_db: sqlite3.Connection = Depends(get_project_db),
+    scheduler: AutoExtractScheduler = Depends(get_auto_extract_scheduler),
+) -> FileUploadResponse:
+    """Add the files of a zip, tar or NDJSON upload and schedule auto-extract.
+
+    The request body is streamed to a spooled temporary file instead of
+    being parsed as one JSON document, then each file is decoded,
+    validated, hashed and inserted one at a time inside a single
+    transaction, so memory stays bounded by the largest file. Files with
+    an unsupported extension are skipped and listed in skipped_files; any
+    other invalid file rolls back the whole upload. All new files are
+    queued for the auto-extract run in the same transaction.
+
+    Args:
+        request: Request whose body is the upload.
+        project_id: Project ID (path parameter).
+        project_db: Project database connection.
+        scheduler: Auto-extract scheduler of the project.
+
+    Returns:
+        FileUploadResponse: Created documents, skipped files and extract status.
+
+    Raises:
+        HTTPException: 400 if the upload is malformed or a file is invalid.
+        HTTPException: 409 if any file already exists.
+        HTTPException: 413 if the upload exceeds MAX_UPLOAD_BYTES.
+        HTTPException: 415 if the Content-Type is not supported.
+    """
+    fmt = upload_format(request.headers.get("content-type", ""))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported upload type. Allowed: {', '.join(UPLOAD_CONTENT_TYPES)}",
+        )
+
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_BYTES) as body:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail=f"Upload too large. Max: {MAX_UPLOAD_BYTES} bytes",
+                )
+            body.write(chunk)
+        body.seek(0)
+        created_rows, skipped_files = await run_in_threadpool(
+            _import_upload, project_db, body, fmt
+        )
+
+    extract_scheduled = False
+    extract_skipped_reason: str | None = None
+    if created_rows:
+        extract_scheduled, extract_skipped_reason = _schedule_auto_extract(scheduler)
+
+    return FileUploadResponse(
+        files=FileResponse.from_db_rows(created_rows),
+        skipped_files=skipped_files,
+        extract_started=False,
+        extract_scheduled=extract_scheduled,
         extract_skipped_reason=extract_skipped_reason,
     )
 
 
+def _has_allowed_extension(file_name: str) -> bool:
+    """Check the extension of a file name's basename against ALLOWED_EXTENSIONS."""
+    _, _, extension = file_name.rpartition("/")[2].rpartition(".")
+    return bool(extension) and f".{extension.lower()}" in ALLOWED_EXTENSIONS
+
+
+def _import_upload(
+    project_db: sqlite3.Connection, body: IO[bytes], fmt: str
+) -> tuple[list[sqlite3.Row], list[str]]:
+    """Insert the files of an upload in one transaction.
+
+    Args:
+        project_db: Project database connection.
+        body: Upload body, positioned at the start.
+        fmt: Upload format (see upload_format).
+
+    Returns:
+        tuple: Metadata rows of the created documents, and the names of
+        skipped files.
+
+    Raises:
+        HTTPException: 400/409 as described in upload_files; nothing is
+            inserted in that case.
+    """
+    created_rows: list[sqlite3.Row] = []
+    skipped_files: list[str] = []
+    seen: set[str] = set()
+    try:
+        with transaction(project_db):
+            for member in iter_archive_members(
+                body, fmt, max_member_bytes=MAX_CONTENT_BYTES
+            ):
+                if not _has_allowed_extension(member.name):
+                    skipped_files.append(member.name)
+                    continue
+                try:
+                    file_name = _validate_file_name(member.name)
+                except HTTPException as e:
+                    raise HTTPException(
+                        status_code=e.status_code, detail=f"{member.name}: {e.detail}"
+                    ) from None
+                if file_name in seen:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Duplicate file names in request: {file_name}",
+                    )
+                if len(seen) >= MAX_UPLOAD_FILES:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Too many files in upload. Max: {MAX_UPLOAD_FILES}",
+                    )
+                seen.add(file_name)
+                try:
+                    content = member.data.decode("utf-8")
+                except UnicodeDecodeError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"{file_name}: File is not valid UTF-8 text",
+                    ) from None
+                try:
+                    row = insert_document(
+                        project_db, file_name, content, compute_bytes_hash(member.data)
+                    )
+                except sqlite3.IntegrityError as e:
+                    if "UNIQUE constraint failed" in str(e):
+                        raise HTTPException(
+                            status_code=409, detail=f"File already exists: {file_name}"
+                        ) from None
+                    raise
+                created_rows.append(row)
+            add_pending_extract_documents(
+                project_db, [row["id"] for row in created_rows]
+            )
+    except ArchiveError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    return created_rows, skipped_files
+
+
+def _schedule_auto_extract(
+    scheduler: AutoExtractScheduler,
+) -> tuple[bool, str | None]:
+    """Schedule the auto-extract run for documents queued by an upload.
+
+    Failure never fails the file upload; the documents stay queued and are
+    extracted with the next upload or after a restart.
+
+    Args:
+        scheduler: Auto-extract scheduler of the project.
+
+    Returns:
+        tuple: (extract_scheduled, extract_skipped_reason).
+    """
+    try:
+        scheduler.notify()
+    except Exception as e:
+        logger.warning("Auto-extract not scheduled: %s", e)
+        return False, "抽出処理をスキップしました"
+    return True, None
+
+
 @router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_file(
+def delete_file(
     project_id: int = Path(..., description="Project ID"),
     file_id: int = Path(..., description="File ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -4,15 +4,19 @@ import sqlite3
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
-from genglossary.api.dependencies import get_project_db
+from genglossary.api.dependencies import conditional_get, get_project_db
 from genglossary.api.schemas.issue_schemas import IssueResponse
 from genglossary.db.issue_repository import get_issue, list_all_issues
 
 router = APIRouter(prefix="/api/projects/{project_id}/issues", tags=["issues"])
 
 
-@router.get("", response_model=list[IssueResponse])
-async def list_issues(
+@router.get(
+    "",
+    response_model=list[IssueResponse],
+    dependencies=[Depends(conditional_get("glossary_issues"))],
+)
+def list_issues(
     project_id: int = Path(..., description="Project ID"),
     issue_type: str | None = Query(None, description="Filter by issue type"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -37,7 +41,7 @@ async def list_issues(
 
 
 @router.get("/{issue_id}", response_model=IssueResponse)
-async def get_issue_by_id(
+def get_issue_by_id(
     project_id: int = Path(..., description="Project ID"),
     issue_id: int = Path(..., description="Issue ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
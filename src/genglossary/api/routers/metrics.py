@@ -0,0 +1,18 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from genglossary.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose in-process metrics in the Prometheus text format.
+
+    Returns:
+        Response: Text exposition of every registered metric.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -77,7 +77,7 @@ def _validate_ollama_url(url: str) -> str:
 
 
 @router.get("/models", response_model=OllamaModelsResponse)
-async def list_models(
+def list_models(
     base_url: str = Query(
         default=DEFAULT_OLLAMA_BASE_URL,
         description="Ollama server base URL",
@@ -86,7 +86,8 @@ async def list_models(
     """List available models from Ollama server.
 
     Args:
-        base_url: Base URL of the Ollama server.
+        base_url: Base URL of the Ollama server. For a load-balanced
+            project (comma-separated URLs) the first server is queried.
 
     Returns:
         OllamaModelsResponse: List of available models.
@@ -94,7 +95,7 @@ async def list_models(
     Raises:
         HTTPException: If connection fails or URL is invalid.
     """
-    validated_url = _validate_ollama_url(base_url)
+    validated_url = _validate_ollama_url(base_url.split(",")[0])
 
     client = OllamaClient(base_url=validated_url, timeout=5.0)
     try:
@@ -107,3 +108,6 @@ async def list_models(
         raise HTTPException(status_code=504, detail="Ollama server timeout")
     except httpx.HTTPError:
         raise HTTPException(status_code=503, detail="Ollama server error")
+    finally:
+        # Releases the lease; the shared connection pool stays open
+        client.close()
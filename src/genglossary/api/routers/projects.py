@@ -121,7 +121,7 @@ def _get_project_statistics(db_path: str) -> ProjectStatistics:
 
 
 @router.get("", response_model=list[ProjectResponse])
-async def list_all_projects(
+def list_all_projects(
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
 ) -> list[ProjectResponse]:
     """List all projects with statistics.
@@ -141,7 +141,7 @@ async def list_all_projects(
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project_by_id(
+def get_project_by_id(
     project_id: int = PathParam(..., description="Project ID"),
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
 ) -> ProjectResponse:
@@ -200,7 +200,7 @@ def _create_project_with_cleanup(
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-async def create_new_project(
+def create_new_project(
     request: ProjectCreateRequest = Body(...),
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
 ) -> ProjectResponse:
@@ -267,7 +267,7 @@ def _clone_project_with_cleanup(
     response_model=ProjectResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def clone_existing_project(
+def clone_existing_project(
     project_id: int = PathParam(..., description="Project ID to clone"),
     request: ProjectCloneRequest = Body(...),
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
@@ -293,7 +293,7 @@ async def clone_existing_project(
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_existing_project(
+def delete_existing_project(
     project_id: int = PathParam(..., description="Project ID to delete"),
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
 ) -> None:
@@ -315,7 +315,7 @@ async def delete_existing_project(
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
-async def update_existing_project(
+def update_existing_project(
     project_id: int = PathParam(..., description="Project ID to update"),
     request: ProjectUpdateRequest = Body(...),
     registry_conn: sqlite3.Connection = Depends(get_registry_db),
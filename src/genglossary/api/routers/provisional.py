@@ -3,9 +3,15 @@
 import sqlite3
 
 import httpx
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
-
-from genglossary.api.dependencies import get_project_by_id, get_project_db
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
+
+from genglossary.api.dependencies import (
+    conditional_get,
+    get_corpus_cache,
+    get_project_by_id,
+    get_project_db,
+    use_project_llm_client,
+)
 from genglossary.api.routers._synonym_helpers import build_aliases_map
 from genglossary.db.connection import transaction
 from genglossary.api.schemas.provisional_schemas import (
@@ -18,9 +24,8 @@ from genglossary.db.provisional_repository import (
     list_all_provisional,
     update_provisional_term,
 )
-from genglossary.document_loader import DocumentLoader
+from genglossary.corpus import CorpusCache
 from genglossary.glossary_generator import GlossaryGenerator
-from genglossary.llm.factory import create_llm_client
 from genglossary.models.project import Project
 
 router = APIRouter(prefix="/api/projects/{project_id}/provisional", tags=["provisional"])
@@ -65,12 +70,22 @@ def _get_term_response(conn: sqlite3.Connection, entry_id: int) -> ProvisionalRe
     return ProvisionalResponse.from_db_row(row, aliases_map)
 
 
-def _regenerate_definition(row: GlossaryTermRow, project: Project) -> tuple[str, float]:
+def _regenerate_definition(
+    row: GlossaryTermRow,
+    project: Project,
+    conn: sqlite3.Connection,
+    corpus: CorpusCache,
+) -> tuple[str, float]:
     """Regenerate definition for a term using LLM.
 
+    Uses the project's shared LLM client and cached corpus, so the cost of
+    a single-term regeneration is dominated by the LLM call itself.
+
     Args:
         row: Term row from database.
         project: Project instance.
+        conn: Project database connection.
+        corpus: Corpus cache for the project.
 
     Returns:
         tuple[str, float]: Regenerated (definition, confidence).
@@ -79,37 +94,52 @@ def _regenerate_definition(row: GlossaryTermRow, project: Project) -> tuple[str,
         httpx.TimeoutException: If LLM service times out.
         httpx.HTTPError: If LLM service is unavailable.
     """
-    llm_client = create_llm_client(project.llm_provider, project.llm_model)
-    documents = DocumentLoader().load_directory(project.doc_root)
-    generator = GlossaryGenerator(llm_client=llm_client)
-
-    occurrences = generator._find_term_occurrences(row["term_name"], documents)
-    occurrences = occurrences or row["occurrences"]
-
-    return generator._generate_definition(row["term_name"], occurrences)
-
-
-@router.get("", response_model=list[ProvisionalResponse])
-async def list_provisional(
+    with use_project_llm_client(project) as llm_client:
+        generator = GlossaryGenerator(llm_client=llm_client)
+
+        occurrences = corpus.find_occurrences(
+            conn, project.doc_root, row["term_name"], generator._find_term_occurrences
+        )
+        occurrences = occurrences or row["occurrences"]
+
+        return generator._generate_definition(row["term_name"], occurrences)
+
+
+@router.get(
+    "",
+    response_model=list[ProvisionalResponse],
+    dependencies=[
+        Depends(
+            conditional_get(
+                "glossary_provisional", "term_synonym_groups", "term_synonym_members"
+            )
+        )
+    ],
+)
+def list_provisional(
     project_id: int = Path(..., description="Project ID"),
+    include_occurrences: bool = Query(
+        True, description="Include term occurrences (empty lists when false)"
+    ),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> list[ProvisionalResponse]:
     """List all provisional glossary terms for a project.
 
     Args:
         project_id: Project ID (path parameter).
+        include_occurrences: Whether to load occurrences for each term.
         project_db: Project database connection.
 
     Returns:
         list[ProvisionalResponse]: List of all provisional terms.
     """
-    rows = list_all_provisional(project_db)
+    rows = list_all_provisional(project_db, include_occurrences=include_occurrences)
     aliases_map = build_aliases_map(project_db)
     return ProvisionalResponse.from_db_rows(rows, aliases_map)
 
 
 @router.get("/{entry_id}", response_model=ProvisionalResponse)
-async def get_provisional_by_id(
+def get_provisional_by_id(
     project_id: int = Path(..., description="Project ID"),
     entry_id: int = Path(..., description="Entry ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -133,7 +163,7 @@ async def get_provisional_by_id(
 
 
 @router.patch("/{entry_id}", response_model=ProvisionalResponse)
-async def update_provisional(
+def update_provisional(
     project_id: int = Path(..., description="Project ID"),
     entry_id: int = Path(..., description="Entry ID"),
     request: ProvisionalUpdateRequest = Body(...),
@@ -160,11 +190,12 @@ async def update_provisional(
 
 
 @router.post("/{entry_id}/regenerate", response_model=ProvisionalResponse)
-async def regenerate_provisional(
+def regenerate_provisional(
     project_id: int = Path(..., description="Project ID"),
     entry_id: int = Path(..., description="Entry ID"),
     project: Project = Depends(get_project_by_id),
     project_db: sqlite3.Connection = Depends(get_project_db),
+    corpus: CorpusCache = Depends(get_corpus_cache),
 ) -> ProvisionalResponse:
     """Regenerate definition for a provisional term using LLM.
 
@@ -173,6 +204,7 @@ async def regenerate_provisional(
         entry_id: Term entry ID to regenerate.
         project: Project instance.
         project_db: Project database connection.
+        corpus: Corpus cache for the project.
 
     Returns:
         ProvisionalResponse: The regenerated term.
@@ -184,7 +216,9 @@ async def regenerate_provisional(
     row = _ensure_term_exists(project_db, entry_id)
 
     try:
-        definition, confidence = _regenerate_definition(row, project)
+        definition, confidence = _regenerate_definition(
+            row, project, project_db, corpus
+        )
         with transaction(project_db):
             update_provisional_term(project_db, entry_id, definition, confidence)
         return _get_term_response(project_db, entry_id)
@@ -2,83 +2,118 @@
 
 import sqlite3
 
-from fastapi import APIRouter, Depends, HTTPException, Path
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
 
-from genglossary.api.dependencies import get_project_db
+from genglossary.api.dependencies import conditional_get, get_project_db
 from genglossary.api.routers._synonym_helpers import build_aliases_map
 from genglossary.api.schemas.refined_schemas import RefinedResponse
-from genglossary.db.refined_repository import get_refined_term, list_all_refined
+from genglossary.db.refined_repository import (
+    get_refined_term,
+    iter_refined,
+    list_all_refined,
+)
+from genglossary.output.export import (
+    EXPORT_FORMATS,
+    ExportFormat,
+    get_export_format,
+    iter_export_chunks,
+)
+
+EXPORT_FORMAT_PATTERN = f"^({'|'.join(EXPORT_FORMATS)})$"
 
 router = APIRouter(prefix="/api/projects/{project_id}/refined", tags=["refined"])
 
 
-@router.get("", response_model=list[RefinedResponse])
-async def list_refined(
+@router.get(
+    "",
+    response_model=list[RefinedResponse],
+    dependencies=[
+        Depends(
+            conditional_get(
+                "glossary_refined", "term_synonym_groups", "term_synonym_members"
+            )
+        )
+    ],
+)
+def list_refined(
     project_id: int = Path(..., description="Project ID"),
+    include_occurrences: bool = Query(
+        True, description="Include term occurrences (empty lists when false)"
+    ),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> list[RefinedResponse]:
     """List all refined glossary terms for a project.
 
     Args:
         project_id: Project ID (path parameter).
+        include_occurrences: Whether to load occurrences for each term.
         project_db: Project database connection.
 
     Returns:
         list[RefinedResponse]: List of all refined terms.
     """
-    rows = list_all_refined(project_db)
+    rows = list_all_refined(project_db, include_occurrences=include_occurrences)
     aliases_map = build_aliases_map(project_db)
     return RefinedResponse.from_db_rows(rows, aliases_map)
 
 
-@router.get("/export-md", response_class=PlainTextResponse)
-async def export_markdown(
+def _export_response(conn: sqlite3.Connection, fmt: ExportFormat) -> StreamingResponse:
+    """Stream the refined glossary of conn in fmt.
+
+    Rows are encoded while the cursor advances, so the first bytes are
+    sent before the whole glossary has been read.
+    """
+    chunks = iter_export_chunks(iter_refined(conn), fmt, build_aliases_map(conn))
+    return StreamingResponse(
+        chunks,
+        media_type=fmt.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="glossary.{fmt.extension}"'
+        },
+    )
+
+
+@router.get("/export")
+def export_glossary(
     project_id: int = Path(..., description="Project ID"),
+    format: str = Query(
+        "md", pattern=EXPORT_FORMAT_PATTERN, description="md, jsonl, csv or tsv"
+    ),
     project_db: sqlite3.Connection = Depends(get_project_db),
-) -> PlainTextResponse:
-    """Export refined glossary as Markdown.
+) -> StreamingResponse:
+    """Export the refined glossary as a streamed download.
 
     Args:
         project_id: Project ID (path parameter).
+        format: Export format name.
         project_db: Project database connection.
 
     Returns:
-        PlainTextResponse: Markdown formatted glossary.
+        StreamingResponse: The glossary in the requested format.
     """
-    rows = list_all_refined(project_db)
-    aliases_map = build_aliases_map(project_db)
-
-    # Generate Markdown
-    lines = ["# 用語集\n"]
-
-    for row in rows:
-        lines.append(f"## {row['term_name']}\n")
-        lines.append(f"**定義**: {row['definition']}\n")
-
-        aliases = aliases_map.get(row["term_name"], [])
-        if aliases:
-            lines.append(f"**別名**: {'、'.join(aliases)}\n")
+    return _export_response(project_db, get_export_format(format))
 
-        lines.append(f"**信頼度**: {row['confidence']:.2f}\n")
 
-        if row["occurrences"]:
-            lines.append("\n**出現箇所**:\n")
-            for occ in row["occurrences"]:
-                lines.append(f"- {occ.document_path}:{occ.line_number}\n")
-
-        lines.append("\n---\n\n")
+@router.get("/export-md", response_class=StreamingResponse)
+def export_markdown(
+    project_id: int = Path(..., description="Project ID"),
+    project_db: sqlite3.Connection = Depends(get_project_db),
+) -> StreamingResponse:
+    """Export refined glossary as Markdown.
 
-    markdown_content = "".join(lines)
+    Args:
+        project_id: Project ID (path parameter).
+        project_db: Project database connection.
 
-    return PlainTextResponse(
-        content=markdown_content,
-        media_type="text/markdown; charset=utf-8",
-    )
+    Returns:
+        StreamingResponse: Markdown formatted glossary.
+    """
+    return _export_response(project_db, EXPORT_FORMATS["md"])
 
 
 @router.get("/{term_id}", response_model=RefinedResponse)
-async def get_refined_by_id(
+def get_refined_by_id(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Term ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -25,7 +25,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=RequiredTermListResponse)
-async def list_required_terms(
+def list_required_terms(
     project_id: int = Path(..., description="Project ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> RequiredTermListResponse:
@@ -51,7 +51,7 @@ async def list_required_terms(
         200: {"description": "Term already exists, returning existing"},
     },
 )
-async def create_required_term(
+def create_required_term(
     project_id: int = Path(..., description="Project ID"),
     request: RequiredTermCreateRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -92,7 +92,7 @@ async def create_required_term(
 
 
 @router.delete("/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_required_term_endpoint(
+def delete_required_term_endpoint(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Required term ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -1,20 +1,28 @@
 """Runs API endpoints."""
 
+import asyncio
 import json
 import sqlite3
 from queue import Empty
 from typing import AsyncIterator
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
 from genglossary.api.dependencies import get_project_db, get_run_manager
-from genglossary.api.schemas.run_schemas import RunResponse, RunStartRequest
+from genglossary.api.schemas.run_schemas import (
+    RunProfileResponse,
+    RunResponse,
+    RunStartRequest,
+)
+from genglossary.db.run_profile_repository import get_run_profile
 from genglossary.db.runs_repository import (
     cancel_run as db_cancel_run,
     get_run,
     list_runs,
 )
+from genglossary.metrics import SSE_SUBSCRIBERS
 from genglossary.runs.manager import RunManager
 
 router = APIRouter(prefix="/api/projects/{project_id}/runs", tags=["runs"])
@@ -22,6 +30,11 @@ router = APIRouter(prefix="/api/projects/{project_id}/runs", tags=["runs"])
 # Finished run statuses
 _FINISHED_STATUSES: set[str] = {"completed", "failed", "cancelled"}
 
+# SSE log queue polling: the queue is a thread queue, so the async generator
+# polls it without blocking instead of calling queue.get() on the event loop.
+_LOG_POLL_INTERVAL_SECONDS = 0.05
+_KEEPALIVE_INTERVAL_SECONDS = 1.0
+
 
 def _is_run_finished(run_row: sqlite3.Row | None) -> bool:
     """Check if run is in a finished state.
@@ -36,7 +49,7 @@ def _is_run_finished(run_row: sqlite3.Row | None) -> bool:
 
 
 @router.post("", response_model=RunResponse, status_code=status.HTTP_201_CREATED)
-async def start_run(
+def start_run(
     project_id: int = Path(..., description="Project ID"),
     request: RunStartRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -72,7 +85,7 @@ async def start_run(
 
 
 @router.delete("/{run_id}", status_code=status.HTTP_200_OK)
-async def cancel_run(
+def cancel_run(
     project_id: int = Path(..., description="Project ID"),
     run_id: int = Path(..., description="Run ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -108,7 +121,7 @@ async def cancel_run(
 
 
 @router.get("", response_model=list[RunResponse])
-async def list_project_runs(
+def list_project_runs(
     project_id: int = Path(..., description="Project ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> list[RunResponse]:
@@ -126,7 +139,7 @@ async def list_project_runs(
 
 
 @router.get("/current", response_model=RunResponse)
-async def get_current_run(
+def get_current_run(
     project_id: int = Path(..., description="Project ID"),
     manager: RunManager = Depends(get_run_manager),
 ) -> RunResponse:
@@ -154,7 +167,7 @@ async def get_current_run(
 
 
 @router.get("/{run_id}", response_model=RunResponse)
-async def get_run_by_id(
+def get_run_by_id(
     project_id: int = Path(..., description="Project ID"),
     run_id: int = Path(..., description="Run ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -179,8 +192,39 @@ async def get_run_by_id(
     return RunResponse.from_db_row(row)
 
 
+@router.get("/{run_id}/profile", response_model=RunProfileResponse)
+def get_run_profile_by_id(
+    project_id: int = Path(..., description="Project ID"),
+    run_id: int = Path(..., description="Run ID"),
+    project_db: sqlite3.Connection = Depends(get_project_db),
+) -> RunProfileResponse:
+    """Get the performance profile of a finished run.
+
+    Args:
+        project_id: Project ID (path parameter).
+        run_id: Run ID.
+        project_db: Project database connection.
+
+    Returns:
+        RunProfileResponse: Step timings and LLM/DB statistics of the run.
+
+    Raises:
+        HTTPException: 404 if the run or its profile is not found.
+    """
+    if get_run(project_db, run_id) is None:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
+
+    profile = get_run_profile(project_db, run_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=404, detail=f"Profile for run {run_id} not found"
+        )
+
+    return RunProfileResponse.from_db_row(profile)
+
+
 @router.get("/{run_id}/logs")
-async def stream_run_logs(
+def stream_run_logs(
     project_id: int = Path(..., description="Project ID"),
     run_id: int = Path(..., description="Run ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -222,29 +266,38 @@ async def stream_run_logs(
     async def event_generator() -> AsyncIterator[str]:
         """Generate SSE events from log queue."""
         queue = manager.register_subscriber(run_id)
+        SSE_SUBSCRIBERS.inc()
         try:
             # Re-check status after subscribing to avoid missing completion signal.
-            latest = get_run(project_db, run_id)
+            latest = await run_in_threadpool(get_run, project_db, run_id)
             if _is_run_finished(latest):
                 yield "event: complete\ndata: {}\n\n"
                 return
 
+            idle_seconds = 0.0
             while True:
                 try:
-                    log_msg = queue.get(timeout=1)
-
-                    # Check for completion signal
-                    if log_msg.get("complete"):
-                        yield "event: complete\ndata: {}\n\n"
-                        break
-
-                    # Send log message as SSE event
-                    yield f"data: {json.dumps(log_msg)}\n\n"
-
+                    log_msg = queue.get_nowait()
                 except Empty:
-                    # Timeout - send keepalive
-                    yield ": keepalive\n\n"
+                    await asyncio.sleep(_LOG_POLL_INTERVAL_SECONDS)
+                    idle_seconds += _LOG_POLL_INTERVAL_SECONDS
+                    if idle_seconds >= _KEEPALIVE_INTERVAL_SECONDS:
+                        # Idle - send keepalive
+                        idle_seconds = 0.0
+                        yield ": keepalive\n\n"
+                    continue
+
+                idle_seconds = 0.0
+
+                # Check for completion signal
+                if log_msg.get("complete"):
+                    yield "event: complete\ndata: {}\n\n"
+                    break
+
+                # Send log message as SSE event
+                yield f"data: {json.dumps(log_msg)}\n\n"
         finally:
+            SSE_SUBSCRIBERS.dec()
             manager.unregister_subscriber(run_id, queue)
 
     return StreamingResponse(
@@ -0,0 +1,47 @@
+"""Full-text search API endpoint."""
+
+import sqlite3
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+
+from genglossary.api.dependencies import get_project_db
+from genglossary.api.schemas.search_schemas import SearchHitResponse
+from genglossary.db.search_repository import search as search_repository
+
+router = APIRouter(prefix="/api/projects/{project_id}/search", tags=["search"])
+
+MAX_SEARCH_LIMIT = 100
+
+
+@router.get("", response_model=list[SearchHitResponse])
+def search(
+    project_id: int = Path(..., description="Project ID"),
+    q: str = Query(..., min_length=1, description="Search query"),
+    source: list[str] | None = Query(
+        None, description="Sources to search (documents, terms, provisional, refined)"
+    ),
+    limit: int = Query(
+        20, ge=1, le=MAX_SEARCH_LIMIT, description="Maximum hits per source"
+    ),
+    project_db: sqlite3.Connection = Depends(get_project_db),
+) -> list[SearchHitResponse]:
+    """Search documents and glossary tables with snippets.
+
+    Args:
+        project_id: Project ID (path parameter).
+        q: Search query. Whitespace-separated tokens must all match.
+        source: Optional list of sources to restrict the search to.
+        limit: Maximum number of hits per source.
+        project_db: Project database connection.
+
+    Returns:
+        list[SearchHitResponse]: Hits grouped by source, ordered by relevance.
+
+    Raises:
+        HTTPException: 400 if an unknown source is requested.
+    """
+    try:
+        hits = search_repository(project_db, q, sources=source, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return SearchHitResponse.from_db_rows(hits)
@@ -4,7 +4,7 @@ import sqlite3
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
 
-from genglossary.api.dependencies import get_project_db
+from genglossary.api.dependencies import conditional_get, get_project_db
 from genglossary.api.schemas.synonym_group_schemas import (
     SynonymGroupCreateRequest,
     SynonymGroupListResponse,
@@ -30,8 +30,14 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=SynonymGroupListResponse)
-async def list_synonym_groups(
+@router.get(
+    "",
+    response_model=SynonymGroupListResponse,
+    dependencies=[
+        Depends(conditional_get("term_synonym_groups", "term_synonym_members"))
+    ],
+)
+def list_synonym_groups(
     project_id: int = Path(..., description="Project ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> SynonymGroupListResponse:
@@ -42,7 +48,7 @@ async def list_synonym_groups(
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=SynonymGroupResponse)
-async def create_synonym_group(
+def create_synonym_group(
     project_id: int = Path(..., description="Project ID"),
     request: SynonymGroupCreateRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -65,7 +71,7 @@ async def create_synonym_group(
 
 
 @router.delete("/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_synonym_group(
+def delete_synonym_group(
     project_id: int = Path(..., description="Project ID"),
     group_id: int = Path(..., description="Synonym group ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -82,7 +88,7 @@ async def delete_synonym_group(
 
 
 @router.patch("/{group_id}", response_model=SynonymGroupResponse)
-async def update_synonym_group(
+def update_synonym_group(
     project_id: int = Path(..., description="Project ID"),
     group_id: int = Path(..., description="Synonym group ID"),
     request: SynonymGroupUpdateRequest = Body(...),
@@ -116,7 +122,7 @@ async def update_synonym_group(
     status_code=status.HTTP_201_CREATED,
     response_model=SynonymMemberResponse,
 )
-async def add_member_to_group(
+def add_member_to_group(
     project_id: int = Path(..., description="Project ID"),
     group_id: int = Path(..., description="Synonym group ID"),
     request: SynonymMemberCreateRequest = Body(...),
@@ -146,7 +152,7 @@ async def add_member_to_group(
     "/{group_id}/members/{member_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-async def remove_member_from_group(
+def remove_member_from_group(
     project_id: int = Path(..., description="Project ID"),
     group_id: int = Path(..., description="Synonym group ID"),
     member_id: int = Path(..., description="Member ID"),
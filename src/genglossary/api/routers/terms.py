@@ -4,7 +4,7 @@ import sqlite3
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
 
-from genglossary.api.dependencies import get_project_db
+from genglossary.api.dependencies import conditional_get, get_project_db
 from genglossary.db.connection import transaction
 from genglossary.api.schemas.term_schemas import (
     TermCreateRequest,
@@ -22,8 +22,12 @@ from genglossary.db.term_repository import (
 router = APIRouter(prefix="/api/projects/{project_id}/terms", tags=["terms"])
 
 
-@router.get("", response_model=list[TermResponse])
-async def list_terms(
+@router.get(
+    "",
+    response_model=list[TermResponse],
+    dependencies=[Depends(conditional_get("terms_extracted"))],
+)
+def list_terms(
     project_id: int = Path(..., description="Project ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
 ) -> list[TermResponse]:
@@ -41,7 +45,7 @@ async def list_terms(
 
 
 @router.get("/{term_id}", response_model=TermResponse)
-async def get_term_by_id(
+def get_term_by_id(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Term ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -67,7 +71,7 @@ async def get_term_by_id(
 
 
 @router.post("", response_model=TermResponse, status_code=status.HTTP_201_CREATED)
-async def create_new_term(
+def create_new_term(
     project_id: int = Path(..., description="Project ID"),
     request: TermCreateRequest = Body(...),
     project_db: sqlite3.Connection = Depends(get_project_db),
@@ -100,7 +104,7 @@ async def create_new_term(
 
 
 @router.patch("/{term_id}", response_model=TermResponse)
-async def update_existing_term(
+def update_existing_term(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Term ID"),
     request: TermUpdateRequest = Body(...),
@@ -147,7 +151,7 @@ async def update_existing_term(
 
 
 @router.delete("/{term_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_existing_term(
+def delete_existing_term(
     project_id: int = Path(..., description="Project ID"),
     term_id: int = Path(..., description="Term ID"),
     project_db: sqlite3.Connection = Depends(get_project_db),
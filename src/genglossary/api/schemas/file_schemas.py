@@ -86,9 +86,26 @@ class FileCreateBulkResponse(BaseModel):
     """Response schema for bulk file creation with auto-extract status."""
 
     files: list[FileResponse] = Field(..., description="List of created files")
-    extract_started: bool = Field(..., description="Whether extract was auto-started")
+    extract_started: bool = Field(
+        ...,
+        description="Whether extract was started by this request "
+        "(always false; see extract_scheduled)",
+    )
+    extract_scheduled: bool = Field(
+        False,
+        description="Whether the new files were queued for the next auto-extract run",
+    )
     extract_skipped_reason: str | None = Field(
-        None, description="Reason extract was skipped (e.g., run already active)"
+        None, description="Reason auto-extract could not be scheduled"
+    )
+
+
+class FileUploadResponse(FileCreateBulkResponse):
+    """Response schema for archive/NDJSON upload with auto-extract status."""
+
+    skipped_files: list[str] = Field(
+        default_factory=list,
+        description="Files in the upload that were ignored (unsupported extension)",
     )
 
 
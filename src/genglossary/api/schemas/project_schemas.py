@@ -28,24 +28,28 @@ def _validate_project_name(v: str) -> str:
 def _validate_llm_base_url(v: str | None) -> str | None:
     """Validate LLM base URL format.
 
+    Several comma-separated URLs are allowed; requests are then load
+    balanced across them.
+
     Args:
-        v: The base URL to validate.
+        v: The base URL(s) to validate.
 
     Returns:
-        The validated URL or None.
+        The validated URL(s), normalized to "url1,url2", or None.
 
     Raises:
         ValueError: If the URL format is invalid.
     """
     if v is None or v == "":
         return v
-    stripped = v.strip()
-    if not stripped:
+    urls = [url.strip() for url in v.split(",") if url.strip()]
+    if not urls:
         return ""
     # Validate URL scheme
-    if not stripped.startswith(("http://", "https://")):
-        raise ValueError("Base URL must start with http:// or https://")
-    return stripped
+    for url in urls:
+        if not url.startswith(("http://", "https://")):
+            raise ValueError("Base URL must start with http:// or https://")
+    return ",".join(urls)
 
 
 class ProjectStatistics(BaseModel):
@@ -75,3 +75,50 @@ class RunResponse(BaseModel):
             list[RunResponse]: List of response instances.
         """
         return [cls.from_db_row(row) for row in rows]
+
+
+class RunProfileStepResponse(BaseModel):
+    """Wall time of one pipeline step."""
+
+    step: str = Field(..., description="Step name")
+    wall_seconds: float = Field(..., description="Wall time in seconds")
+
+
+class RunProfileResponse(BaseModel):
+    """Response schema for a run's performance profile."""
+
+    run_id: int = Field(..., description="Run ID")
+    llm_provider: str = Field(..., description="LLM provider used by the run")
+    llm_model: str = Field(..., description="LLM model used by the run")
+    llm_concurrency: int = Field(..., description="Maximum concurrent LLM calls")
+    streaming: bool = Field(..., description="Whether the streaming pipeline was used")
+    wall_seconds: float = Field(..., description="Total pipeline wall time in seconds")
+    steps: list[RunProfileStepResponse] = Field(
+        ..., description="Wall time per step in execution order"
+    )
+    llm_calls: int = Field(..., description="Number of LLM calls")
+    llm_failures: int = Field(..., description="LLM calls that failed")
+    llm_retries: int = Field(..., description="Retried LLM requests")
+    llm_retry_reasons: dict[str, int] = Field(
+        default_factory=dict,
+        description="Retried LLM requests per reason (empty before v18)",
+    )
+    json_parse_failures: int = Field(..., description="Unparseable JSON responses")
+    prompt_chars: int = Field(..., description="Total prompt characters")
+    response_chars: int = Field(..., description="Total response characters")
+    llm_latency_mean_ms: float | None = Field(None, description="Mean LLM call latency (ms)")
+    llm_latency_p95_ms: float | None = Field(None, description="95th percentile LLM call latency (ms)")
+    db_write_seconds: float = Field(..., description="Time spent writing to the database")
+    created_at: str = Field(..., description="Recorded timestamp")
+
+    @classmethod
+    def from_db_row(cls, row: Any) -> "RunProfileResponse":
+        """Create from a RunProfileRow.
+
+        Args:
+            row: Profile returned by get_run_profile.
+
+        Returns:
+            RunProfileResponse: Response instance.
+        """
+        return cls.model_validate(dict(row))
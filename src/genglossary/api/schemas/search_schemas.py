@@ -0,0 +1,49 @@
+"""Schemas for Search API."""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SearchHitResponse(BaseModel):
+    """Response schema for a single full-text search hit."""
+
+    source: str = Field(
+        ..., description="Source (documents, terms, provisional, refined)"
+    )
+    id: int = Field(..., description="Row ID in the source table")
+    title: str = Field(..., description="File name or term")
+    snippet: str = Field(
+        ..., description="Matched text with <mark> highlights (not HTML-escaped)"
+    )
+    rank: float = Field(..., description="Relevance (lower is better, 0 if unranked)")
+
+    @classmethod
+    def from_db_row(cls, row: Any) -> "SearchHitResponse":
+        """Create from a search hit row.
+
+        Args:
+            row: Search hit (SearchHitRow or dict-like).
+
+        Returns:
+            SearchHitResponse: Response instance.
+        """
+        return cls(
+            source=row["source"],
+            id=row["id"],
+            title=row["title"],
+            snippet=row["snippet"],
+            rank=row["rank"],
+        )
+
+    @classmethod
+    def from_db_rows(cls, rows: list[Any]) -> list["SearchHitResponse"]:
+        """Create list from search hit rows.
+
+        Args:
+            rows: List of search hits.
+
+        Returns:
+            list[SearchHitResponse]: List of response instances.
+        """
+        return [cls.from_db_row(row) for row in rows]
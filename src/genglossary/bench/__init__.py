@@ -0,0 +1 @@
+"""Benchmark harness: fake LLM server, synthetic corpora and stage metrics."""
@@ -0,0 +1,373 @@
+"""Local stand-in for Ollama and OpenAI-compatible LLM servers.
+
+Answers the structured-output prompts of every pipeline step with valid,
+deterministic JSON, after a configurable delay. Errors and malformed JSON
+can be injected at fixed rates to exercise the clients' retry paths.
+"""
+
+import ast
+import hashlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any
+
+# Marker added by BaseLLMClient._build_json_prompt before the schema
+SCHEMA_MARKER = "matching this structure: "
+
+# Returned for the malformed-JSON rate: truncated JSON after chatter
+MALFORMED_RESPONSE = '了解しました。以下が回答です: {"definition": "途中で'
+
+ISSUE_TYPES = ("unclear", "contradiction", "missing_relation")
+
+CATEGORIES = (
+    "person_name",
+    "place_name",
+    "organization",
+    "title",
+    "technical_term",
+    "common_noun",
+)
+
+
+@dataclass(frozen=True)
+class FakeLLMSettings:
+    """Behaviour of a FakeLLMServer.
+
+    Attributes:
+        latency_ms: Mean response delay in milliseconds.
+        jitter_ms: Maximum deviation from latency_ms (uniform).
+        error_rate: Probability of answering with HTTP 503.
+        malformed_rate: Probability of answering with unparseable JSON.
+        issue_rate: Fraction of reviewed terms reported as issues.
+        exclude_rate: Fraction of reviewed terms reported for exclusion.
+        seed: Seed for latency, error and malformed-JSON draws.
+        model: Model name reported by the server.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    issue_rate: float = 0.3
+    exclude_rate: float = 0.1
+    seed: int = 0
+    model: str = "fake-llm"
+
+    def __post_init__(self) -> None:
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency_ms and jitter_ms must not be negative")
+        for name in ("error_rate", "malformed_rate", "issue_rate", "exclude_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+
+def _fraction(text: str) -> float:
+    """Map text to a stable pseudo-random number in [0, 1)."""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def _tag_content(prompt: str, tag: str) -> str:
+    """Return the text inside the first <tag>...</tag> of the prompt."""
+    match = re.search(rf"<{tag}>(.*?)</{tag}>", prompt, re.DOTALL)
+    return match.group(1) if match else ""
+
+
+def _schema_from_prompt(prompt: str) -> dict[str, Any] | None:
+    """Recover the JSON schema that _build_json_prompt appended."""
+    pos = prompt.rfind(SCHEMA_MARKER)
+    if pos < 0:
+        return None
+    try:
+        schema = ast.literal_eval(prompt[pos + len(SCHEMA_MARKER) :].strip())
+    except (ValueError, SyntaxError):
+        return None
+    return schema if isinstance(schema, dict) else None
+
+
+def _value_for_schema(schema: dict[str, Any], defs: dict[str, Any]) -> Any:
+    """Build a minimal value satisfying a JSON schema."""
+    if "$ref" in schema:
+        return _value_for_schema(defs.get(schema["$ref"].rsplit("/", 1)[-1], {}), defs)
+    if "anyOf" in schema:
+        return _value_for_schema(schema["anyOf"][0], defs)
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return {
+            name: _value_for_schema(prop, defs)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return []
+    if schema_type == "number":
+        return 0.8
+    if schema_type == "integer":
+        return 1
+    if schema_type == "boolean":
+        return False
+    if schema_type == "null":
+        return None
+    return "ダミー"
+
+
+def _classify(prompt: str) -> dict[str, Any]:
+    terms = re.findall(r"^- (.+)$", _tag_content(prompt, "terms"), re.MULTILINE)
+    return {
+        "classifications": [
+            {
+                "term": term,
+                # Roughly one in six terms becomes a common noun
+                "category": CATEGORIES[int(_fraction(term) * len(CATEGORIES))],
+            }
+            for term in terms
+        ]
+    }
+
+
+def _define(prompt: str) -> dict[str, Any]:
+    term = _tag_content(prompt, "term")
+    return {
+        "definition": f"{term}は、この文書群で繰り返し言及される固有の概念である。",
+        "confidence": round(0.6 + 0.35 * _fraction(term), 2),
+    }
+
+
+def _review(prompt: str, settings: FakeLLMSettings) -> dict[str, Any]:
+    names = re.findall(r"^- ([^:\n]+): ", _tag_content(prompt, "glossary"), re.MULTILINE)
+    issues: list[dict[str, Any]] = []
+    for name in names:
+        draw = _fraction("review:" + name)
+        if draw < settings.exclude_rate:
+            issues.append({
+                "term": name,
+                "issue_type": "unnecessary",
+                "description": "一般的な語で、用語集に載せる必要がない。",
+                "should_exclude": True,
+                "exclusion_reason": "一般語",
+            })
+        elif draw < settings.exclude_rate + settings.issue_rate:
+            issues.append({
+                "term": name,
+                "issue_type": ISSUE_TYPES[int(_fraction(name) * len(ISSUE_TYPES))],
+                "description": "定義が抽象的で、文書中での役割が分からない。",
+            })
+    return {"issues": issues}
+
+
+def _refine(prompt: str) -> dict[str, Any]:
+    match = re.search(r"^用語: (.+)$", prompt, re.MULTILINE)
+    term = match.group(1) if match else "用語"
+    return {
+        "refined_definition": f"{term}は、文書中で具体的な役割を持つ固有の概念であり、関連語と区別される。",
+        "confidence": 0.9,
+    }
+
+
+def build_response(prompt: str, settings: FakeLLMSettings) -> str:
+    """Build the response text for a prompt.
+
+    Structured prompts get JSON matching the schema appended to them; the
+    pipeline's own response models get plausible content, anything else a
+    minimal schema-conforming value. Plain prompts get plain text.
+
+    Args:
+        prompt: The prompt sent by the client.
+        settings: Server settings (issue and exclusion rates).
+
+    Returns:
+        str: Response content.
+    """
+    schema = _schema_from_prompt(prompt)
+    if schema is None:
+        return "これはベンチマーク用の応答です。"
+
+    title = schema.get("title")
+    if title == "BatchTermClassificationResponse":
+        data = _classify(prompt)
+    elif title == "DefinitionResponse":
+        data = _define(prompt)
+    elif title == "ReviewResponse":
+        data = _review(prompt, settings)
+    elif title == "RefinementResponse":
+        data = _refine(prompt)
+    else:
+        data = _value_for_schema(schema, schema.get("$defs", {}))
+    return json.dumps(data, ensure_ascii=False)
+
+
+class FakeLLMServer:
+    """Threaded HTTP server speaking the Ollama and OpenAI chat APIs.
+
+    Supported endpoints:
+        - Ollama: POST /api/generate, POST /api/chat, GET /api/tags
+        - OpenAI: POST /chat/completions, GET /models (also under /v1)
+
+    Example:
+        with FakeLLMServer(FakeLLMSettings(latency_ms=50)) as server:
+            client = OllamaClient(base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        settings: FakeLLMSettings | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server (not started).
+
+        Args:
+            settings: Server behaviour. Defaults to no delay and no faults.
+            host: Bind host.
+            port: Bind port (0 picks a free port).
+        """
+        self.settings = settings or FakeLLMSettings()
+        self._random = random.Random(self.settings.seed)
+        self._lock = Lock()
+        self._counts: Counter[str] = Counter()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (for OllamaClient or OpenAI-compatible clients)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Request counts: 'requests', 'errors' and 'malformed'."""
+        with self._lock:
+            return dict(self._counts)
+
+    def start(self) -> "FakeLLMServer":
+        """Start serving on a background thread."""
+        self._thread = Thread(
+            target=self._httpd.serve_forever, name="fake-llm-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _draw(self) -> tuple[float, str | None]:
+        """Draw (delay seconds, fault) for one request."""
+        settings = self.settings
+        with self._lock:
+            delay = settings.latency_ms + self._random.uniform(
+                -settings.jitter_ms, settings.jitter_ms
+            )
+            fault_draw = self._random.random()
+            self._counts["requests"] += 1
+            fault: str | None = None
+            if fault_draw < settings.error_rate:
+                fault = "error"
+                self._counts["errors"] += 1
+            elif fault_draw < settings.error_rate + settings.malformed_rate:
+                fault = "malformed"
+                self._counts["malformed"] += 1
+        return max(delay, 0.0) / 1000, fault
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; avoid the Nagle stall
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Keep benchmark output clean
+
+            def _send_json(self, status: int, body: dict[str, Any]) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                path = self.path.split("?", 1)[0].removeprefix("/v1")
+                model = server.settings.model
+                if path == "/api/tags":
+                    self._send_json(200, {"models": [{"name": model, "model": model}]})
+                elif path == "/models":
+                    self._send_json(200, {"object": "list", "data": [{"id": model}]})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self) -> None:
+                path = self.path.split("?", 1)[0].removeprefix("/v1")
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send_json(400, {"error": "invalid JSON body"})
+                    return
+
+                if path == "/api/generate":
+                    prompt = str(payload.get("prompt", ""))
+                elif path in ("/api/chat", "/chat/completions"):
+                    messages = payload.get("messages") or [{}]
+                    prompt = str(messages[-1].get("content", ""))
+                else:
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                delay, fault = server._draw()
+                time.sleep(delay)
+                if fault == "error":
+                    self._send_json(503, {"error": "injected failure"})
+                    return
+                content = (
+                    MALFORMED_RESPONSE
+                    if fault == "malformed"
+                    else build_response(prompt, server.settings)
+                )
+
+                model = payload.get("model") or server.settings.model
+                if path == "/api/generate":
+                    body: dict[str, Any] = {"model": model, "response": content, "done": True}
+                elif path == "/api/chat":
+                    body = {
+                        "model": model,
+                        "message": {"role": "assistant", "content": content},
+                        "done": True,
+                    }
+                else:
+                    body = {
+                        "object": "chat.completion",
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }],
+                        "usage": {
+                            "prompt_tokens": len(prompt),
+                            "completion_tokens": len(content),
+                            "total_tokens": len(prompt) + len(content),
+                        },
+                    }
+                self._send_json(200, body)
+
+        return Handler
@@ -0,0 +1,408 @@
+"""Benchmark runner for the extract → generate → review → refine pipeline."""
+
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Type, TypeVar
+
+from pydantic import BaseModel
+
+from genglossary.bench.fake_llm_server import FakeLLMServer, FakeLLMSettings
+from genglossary.bench.synthetic_corpus import generate_corpus
+from genglossary.glossary_generator import GlossaryGenerator
+from genglossary.glossary_refiner import GlossaryRefiner
+from genglossary.glossary_reviewer import GlossaryReviewer
+from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.ollama_client import OllamaClient
+from genglossary.llm.openai_compatible_client import OpenAICompatibleClient
+from genglossary.models.document import Document
+from genglossary.term_extractor import TermExtractor
+from genglossary.utils.stats import percentile
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+T = TypeVar("T", bound=BaseModel)
+
+STAGES = ("extract", "generate", "review", "refine")
+
+# Bump when the baseline file layout changes
+BASELINE_VERSION = 1
+
+# Default allowed slowdown before compare_to_baseline reports a regression
+DEFAULT_TOLERANCE = 0.2
+
+
+@dataclass
+class StageMetrics:
+    """Measurements for one pipeline stage.
+
+    Attributes:
+        stage: Stage name (one of STAGES).
+        items: Units processed (classified candidates, generated or reviewed
+            terms, or issues).
+        wall_seconds: Elapsed wall-clock time.
+        cpu_seconds: Process CPU time (user + system, all threads).
+        peak_rss_mb: Peak resident set size of the process after the stage,
+            or None where the platform does not report it.
+        llm_calls: Number of LLM calls.
+        llm_failures: LLM calls that raised (after client-side retries).
+        latency_p50_ms: Median LLM call latency.
+        latency_p95_ms: 95th percentile LLM call latency.
+    """
+
+    stage: str
+    items: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: float | None
+    llm_calls: int
+    llm_failures: int
+    latency_p50_ms: float | None
+    latency_p95_ms: float | None
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second of wall-clock time."""
+        return self.items / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the baseline file (includes throughput)."""
+        return {**asdict(self), "throughput": round(self.throughput, 3)}
+
+
+@dataclass
+class BenchmarkResult:
+    """Benchmark result for one corpus.
+
+    Attributes:
+        size: Corpus size name.
+        documents: Number of documents.
+        characters: Total characters across documents.
+        stages: Per-stage metrics in pipeline order.
+    """
+
+    size: str
+    documents: int
+    characters: int
+    stages: list[StageMetrics] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the baseline file."""
+        return {
+            "documents": self.documents,
+            "characters": self.characters,
+            "stages": {m.stage: m.to_dict() for m in self.stages},
+        }
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class TimedLLMClient(BaseLLMClient):
+    """LLM client wrapper recording the latency of every call.
+
+    Thread-safe, so stages running LLM calls concurrently are measured too.
+    """
+
+    def __init__(self, client: BaseLLMClient) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            client: The client to delegate to.
+        """
+        self._client = client
+        self.model = getattr(client, "model", "unknown")
+        self._lock = Lock()
+        self._latencies: list[float] = []
+        self._failures = 0
+
+    def _timed(self, call: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return call()
+        except Exception:
+            with self._lock:
+                self._failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._latencies.append(elapsed)
+
+    def generate(self, prompt: str) -> str:
+        """Delegate generate() and record its latency."""
+        return self._timed(lambda: self._client.generate(prompt))
+
+    def generate_structured(self, prompt: str, response_model: Type[T]) -> T:
+        """Delegate generate_structured() and record its latency."""
+        return self._timed(
+            lambda: self._client.generate_structured(prompt, response_model)
+        )
+
+    def is_available(self) -> bool:
+        """Delegate is_available()."""
+        return self._client.is_available()
+
+    def close(self) -> None:
+        """Close the wrapped client."""
+        self._client.close()
+
+    def take_samples(self) -> tuple[list[float], int]:
+        """Return and reset the recorded (latencies in seconds, failures)."""
+        with self._lock:
+            samples, failures = self._latencies, self._failures
+            self._latencies, self._failures = [], 0
+        return samples, failures
+
+
+def _measure(
+    stage: str, client: TimedLLMClient, work: Callable[[], tuple[Any, int]]
+) -> tuple[Any, StageMetrics]:
+    """Run one stage and collect its metrics.
+
+    Args:
+        stage: Stage name.
+        client: The timed client used by the stage.
+        work: Runs the stage, returning (output, items processed).
+
+    Returns:
+        tuple[Any, StageMetrics]: The stage output and its metrics.
+    """
+    client.take_samples()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    output, items = work()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    latencies, failures = client.take_samples()
+
+    def as_ms(value: float | None) -> float | None:
+        return None if value is None else round(value * 1000, 2)
+
+    return output, StageMetrics(
+        stage=stage,
+        items=items,
+        wall_seconds=round(wall, 4),
+        cpu_seconds=round(cpu, 4),
+        peak_rss_mb=peak_rss_mb(),
+        llm_calls=len(latencies),
+        llm_failures=failures,
+        latency_p50_ms=as_ms(percentile(latencies, 50)),
+        latency_p95_ms=as_ms(percentile(latencies, 95)),
+    )
+
+
+def run_pipeline_benchmark(
+    documents: list[Document],
+    llm_client: BaseLLMClient,
+    max_concurrency: int = 1,
+    review_batch_size: int = GlossaryReviewer.DEFAULT_BATCH_SIZE,
+) -> list[StageMetrics]:
+    """Run every pipeline stage once and measure it.
+
+    Stages run in order on the output of the previous one, the way a
+    staged full run does, without touching any database.
+
+    Args:
+        documents: Corpus to process.
+        llm_client: LLM client (typically pointed at a FakeLLMServer).
+        max_concurrency: Concurrent LLM calls for review and refine.
+        review_batch_size: Terms per review request.
+
+    Returns:
+        list[StageMetrics]: Metrics for extract, generate, review, refine.
+    """
+    client = TimedLLMClient(llm_client)
+
+    def extract() -> tuple[Any, int]:
+        classified = TermExtractor(llm_client=client).extract_terms(
+            documents, return_categories=True
+        )
+        return classified, len(classified)
+
+    def generate() -> tuple[Any, int]:
+        glossary = GlossaryGenerator(llm_client=client).generate(terms, documents)
+        return glossary, glossary.term_count
+
+    def review() -> tuple[Any, int]:
+        reviewer = GlossaryReviewer(
+            llm_client=client,
+            batch_size=review_batch_size,
+            max_concurrency=max_concurrency,
+        )
+        return reviewer.review(provisional) or [], provisional.term_count
+
+    def refine() -> tuple[Any, int]:
+        refiner = GlossaryRefiner(llm_client=client, max_concurrency=max_concurrency)
+        return refiner.refine(provisional, issues, documents), len(issues)
+
+    terms, extract_metrics = _measure("extract", client, extract)
+    provisional, generate_metrics = _measure("generate", client, generate)
+    issues, review_metrics = _measure("review", client, review)
+    _, refine_metrics = _measure("refine", client, refine)
+    return [extract_metrics, generate_metrics, review_metrics, refine_metrics]
+
+
+def create_bench_client(provider: str, base_url: str, timeout: float = 60.0) -> BaseLLMClient:
+    """Create a real LLM client pointed at a benchmark server.
+
+    Clients are built directly rather than through create_llm_client, so
+    the local .env (API keys, Azure settings) cannot change the requests.
+
+    Args:
+        provider: "ollama" or "openai".
+        base_url: Server URL.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        BaseLLMClient: The client.
+
+    Raises:
+        ValueError: If provider is unknown.
+    """
+    if provider == "ollama":
+        return OllamaClient(base_url=base_url, model="fake-llm", timeout=timeout)
+    if provider == "openai":
+        return OpenAICompatibleClient(
+            base_url=base_url, api_key="bench", model="fake-llm", timeout=timeout
+        )
+    raise ValueError(f"Unknown provider: {provider}. Must be 'ollama' or 'openai'.")
+
+
+def run_benchmarks(
+    sizes: list[str],
+    settings: FakeLLMSettings,
+    provider: str = "ollama",
+    max_concurrency: int = 1,
+    seed: int = 0,
+    result_callback: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """Benchmark the pipeline on synthetic corpora against a FakeLLMServer.
+
+    Args:
+        sizes: Corpus size names (keys of CORPUS_SIZES).
+        settings: Fake server behaviour.
+        provider: Client API to exercise ("ollama" or "openai").
+        max_concurrency: Concurrent LLM calls for review and refine.
+        seed: Corpus seed.
+        result_callback: Called with each result as soon as it is ready.
+
+    Returns:
+        list[BenchmarkResult]: One result per size, in order.
+    """
+    results: list[BenchmarkResult] = []
+    with FakeLLMServer(settings) as server:
+        client = create_bench_client(provider, server.url)
+        try:
+            for size in sizes:
+                documents = generate_corpus(size, seed=seed)
+                result = BenchmarkResult(
+                    size=size,
+                    documents=len(documents),
+                    characters=sum(len(d.content) for d in documents),
+                    stages=run_pipeline_benchmark(
+                        documents, client, max_concurrency=max_concurrency
+                    ),
+                )
+                results.append(result)
+                if result_callback is not None:
+                    result_callback(result)
+        finally:
+            client.close()
+    return results
+
+
+def write_baseline(
+    path: Path,
+    results: list[BenchmarkResult],
+    parameters: dict[str, Any],
+) -> None:
+    """Write benchmark results as a machine-readable baseline file.
+
+    Args:
+        path: Output JSON file.
+        results: Benchmark results.
+        parameters: Run parameters (server settings, provider, concurrency).
+    """
+    data = {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "parameters": parameters,
+        "results": {r.size: r.to_dict() for r in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    """Load a baseline file written by write_baseline.
+
+    Raises:
+        ValueError: If the file is not a baseline of a supported version.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline file: {path}")
+    return data
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Compare results with a baseline.
+
+    A stage regresses when its throughput drops, or its p95 latency or CPU
+    time grows, by more than the tolerance. Sizes and stages missing from
+    the baseline are skipped.
+
+    Args:
+        results: Current results.
+        baseline: Data returned by load_baseline.
+        tolerance: Allowed relative change (0.2 = 20%).
+
+    Returns:
+        list[str]: One message per regression; empty when none.
+    """
+    regressions: list[str] = []
+    for result in results:
+        base_stages = baseline["results"].get(result.size, {}).get("stages", {})
+        for metrics in result.stages:
+            base = base_stages.get(metrics.stage)
+            if base is None:
+                continue
+            checks = [
+                ("throughput", metrics.throughput, base.get("throughput"), False),
+                ("latency_p95_ms", metrics.latency_p95_ms, base.get("latency_p95_ms"), True),
+                ("cpu_seconds", metrics.cpu_seconds, base.get("cpu_seconds"), True),
+            ]
+            for name, current, previous, higher_is_worse in checks:
+                if current is None or not previous:
+                    continue
+                if higher_is_worse:
+                    regressed = current > previous * (1 + tolerance)
+                else:
+                    regressed = current < previous * (1 - tolerance)
+                if regressed:
+                    regressions.append(
+                        f"{result.size}/{metrics.stage}: {name} "
+                        f"{current:g} (baseline {previous:g})"
+                    )
+    return regressions
@@ -0,0 +1,123 @@
+"""Synthetic Japanese corpora for benchmarks.
+
+Documents are built from sentence templates filled with invented names
+(katakana people and places, organizations, titles and kanji technical
+terms), so SudachiPy yields a realistic mix of candidates without any
+copyrighted text. Generation is seeded and fully reproducible.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from genglossary.models.document import Document
+
+KATAKANA = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワ"
+KANJI = "聖魔神術印剣盾炎氷雷光闇星月陽風樹鋼晶紋環界律契"
+
+TITLES = ["団長", "騎士代理", "司祭長", "宰相", "近衛隊長", "書記官"]
+
+SENTENCES = [
+    "{person}卿は{place}島で{org}の任務に就いていた。",
+    "{org}の{title}である{person}は、{tech}について説明した。",
+    "{place}島では古くから{tech}が受け継がれている。",
+    "{person}は{tech}を用いて{place}島の防衛を指揮した。",
+    "{org}は{place}島の{tech}を管理する組織である。",
+    "その日、{person}卿は{title}として{org}に報告書を提出した。",
+    "{tech}の研究は{org}によって秘密裏に進められていた。",
+    "{place}島の住民は{person}卿の{tech}に感謝した。",
+]
+
+
+@dataclass(frozen=True)
+class CorpusSize:
+    """Shape of a synthetic corpus.
+
+    Attributes:
+        documents: Number of documents.
+        paragraphs: Paragraphs per document (each of 4-6 sentences).
+        vocabulary: Names generated per kind (person, place, organization,
+            technical term).
+    """
+
+    documents: int
+    paragraphs: int
+    vocabulary: int
+
+
+CORPUS_SIZES: dict[str, CorpusSize] = {
+    "small": CorpusSize(documents=2, paragraphs=8, vocabulary=5),
+    "medium": CorpusSize(documents=6, paragraphs=20, vocabulary=12),
+    "large": CorpusSize(documents=20, paragraphs=40, vocabulary=30),
+}
+
+
+def _katakana_name(rng: random.Random) -> str:
+    return "".join(rng.choices(KATAKANA, k=rng.randint(3, 5)))
+
+
+def _kanji_term(rng: random.Random) -> str:
+    return "".join(rng.choices(KANJI, k=rng.randint(2, 3)))
+
+
+def _unique(rng: random.Random, make, count: int, suffix: str = "") -> list[str]:
+    names: list[str] = []
+    while len(names) < count:
+        name = make(rng) + suffix
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def generate_corpus(size: str, seed: int = 0) -> list[Document]:
+    """Generate a synthetic Japanese corpus.
+
+    Args:
+        size: Corpus size name (key of CORPUS_SIZES).
+        seed: Random seed; the same seed always yields the same corpus.
+
+    Returns:
+        list[Document]: Generated documents named bench_NN.md.
+
+    Raises:
+        ValueError: If size is not a known corpus size.
+    """
+    from genglossary.models.document import Document
+
+    if size not in CORPUS_SIZES:
+        raise ValueError(
+            f"Unknown corpus size: {size} (choose from {', '.join(CORPUS_SIZES)})"
+        )
+    shape = CORPUS_SIZES[size]
+    rng = random.Random(seed)
+
+    persons = _unique(rng, _katakana_name, shape.vocabulary)
+    places = _unique(rng, _katakana_name, shape.vocabulary)
+    orgs = _unique(rng, _katakana_name, shape.vocabulary, suffix="騎士団")
+    techs = _unique(rng, _kanji_term, shape.vocabulary)
+
+    documents: list[Document] = []
+    for doc_index in range(shape.documents):
+        paragraphs = []
+        for _ in range(shape.paragraphs):
+            sentences = [
+                rng.choice(SENTENCES).format(
+                    person=rng.choice(persons),
+                    place=rng.choice(places),
+                    org=rng.choice(orgs),
+                    title=rng.choice(TITLES),
+                    tech=rng.choice(techs),
+                )
+                for _ in range(rng.randint(4, 6))
+            ]
+            paragraphs.append("".join(sentences))
+        documents.append(
+            Document(
+                file_path=f"bench_{doc_index + 1:02d}.md",
+                content=f"# 記録 {doc_index + 1}\n\n" + "\n\n".join(paragraphs) + "\n",
+            )
+        )
+    return documents
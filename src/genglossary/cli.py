@@ -1,35 +1,22 @@
 """Command-line interface for GenGlossary."""
 
+from __future__ import annotations
+
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 
-from genglossary.config import Config
-from genglossary.db.connection import get_connection
-from genglossary.db.document_repository import create_document
-from genglossary.db.issue_repository import create_issue
-from genglossary.db.provisional_repository import create_provisional_term
-from genglossary.db.refined_repository import create_refined_term
-from genglossary.db.metadata_repository import upsert_metadata
-from genglossary.db.schema import initialize_db
-from genglossary.db.term_repository import create_term
-from genglossary.document_loader import DocumentLoader
-from genglossary.glossary_generator import GlossaryGenerator
-from genglossary.glossary_refiner import GlossaryRefiner
-from genglossary.glossary_reviewer import GlossaryReviewer
-from genglossary.llm.base import BaseLLMClient
-from genglossary.llm.factory import create_llm_client
-from genglossary.models.document import Document
-from genglossary.models.glossary import Glossary
-from genglossary.progress import progress_task
-from genglossary.output.markdown_writer import MarkdownWriter
-from genglossary.term_extractor import TermExtractor, TermExtractionAnalysis
-from genglossary.utils.hash import compute_content_hash
-from genglossary.utils.path_utils import to_safe_relative_path
+if TYPE_CHECKING:
+    # The pipeline pulls in SudachiPy, httpx and pydantic; commands import
+    # it when they run so that `--help` and `db ...` start quickly.
+    from genglossary.llm.base import BaseLLMClient
+    from genglossary.models.document import Document
+    from genglossary.models.glossary import Glossary
+    from genglossary.term_extractor import TermExtractionAnalysis, TermExtractor
 
 console = Console()
 
@@ -47,6 +34,8 @@ def _get_actual_model_name(provider: str, model: str | None) -> str:
     if model is not None:
         return model
 
+    from genglossary.config import Config
+
     config = Config()
     return config.ollama_model if provider == "ollama" else config.openai_model
 
@@ -84,6 +73,11 @@ def generate_glossary(
         verbose: Whether to show verbose output.
         db_path: Path to SQLite database for persistence (optional).
     """
+    from genglossary.db.connection import get_connection
+    from genglossary.db.metadata_repository import upsert_metadata
+    from genglossary.db.schema import initialize_db
+    from genglossary.llm.factory import create_llm_client
+
     # Initialize database connection if db_path is provided
     conn = None
     if db_path is not None:
@@ -166,6 +160,23 @@ def _generate_glossary_with_db(
         verbose: Whether to show verbose output.
         conn: Database connection (None if database is disabled).
     """
+    from genglossary.config import Config
+    from genglossary.db.document_repository import create_document
+    from genglossary.db.issue_repository import create_issue
+    from genglossary.db.provisional_repository import create_provisional_term
+    from genglossary.db.refined_repository import create_refined_term
+    from genglossary.db.term_repository import create_term
+    from genglossary.document_loader import DocumentLoader
+    from genglossary.glossary_generator import GlossaryGenerator
+    from genglossary.glossary_refiner import GlossaryRefiner
+    from genglossary.glossary_reviewer import GlossaryReviewer
+    from genglossary.llm.factory import create_batcher
+    from genglossary.output.markdown_writer import MarkdownWriter
+    from genglossary.progress import progress_task
+    from genglossary.term_extractor import TermExtractor
+    from genglossary.utils.hash import compute_content_hash
+    from genglossary.utils.path_utils import to_safe_relative_path
+
     # 1. Load documents
     if verbose:
         console.print("[dim]ドキュメントを読み込み中...[/dim]")
@@ -190,8 +201,12 @@ def _generate_glossary_with_db(
             console.print(f"[dim]  → データベースに {len(documents)} 件のドキュメントを保存[/dim]")
 
     # 2. Extract terms
+    batcher = create_batcher(getattr(llm_client, "model", actual_model))
     extractor = TermExtractor(
-        llm_client=llm_client, excluded_term_repo=conn, required_term_repo=conn
+        llm_client=llm_client,
+        excluded_term_repo=conn,
+        required_term_repo=conn,
+        batcher=batcher,
     )
 
     # Extract terms with categories if DB is enabled
@@ -252,7 +267,11 @@ def _generate_glossary_with_db(
             console.print(f"[dim]  → データベースに {len(glossary.terms)} 件の暫定用語を保存[/dim]")
 
     # 4. Review glossary
-    reviewer = GlossaryReviewer(llm_client=llm_client)
+    reviewer = GlossaryReviewer(
+        llm_client=llm_client,
+        max_concurrency=Config().llm_max_concurrency,
+        batcher=batcher,
+    )
     if verbose:
         with progress_task(console, "精査中...", use_spinner_only=True):
             issues = reviewer.review(glossary)
@@ -330,7 +349,44 @@ def _generate_glossary_with_db(
         conn.close()
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports its subcommand modules on first use.
+
+    Subcommands are given as {name: "module:attribute"}.
+    """
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            # __import__ rather than importlib.import_module: only the former
+            # shows up in `python -X importtime` profiles
+            module = __import__(module_name, fromlist=[attr])
+            command = getattr(module, attr)
+            if not isinstance(command, click.Command):
+                raise TypeError(f"{self.lazy_subcommands[cmd_name]} is not a click command")
+            return command
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "db": "genglossary.cli_db:db",
+        "api": "genglossary.cli_api:api",
+        "project": "genglossary.cli_project:project",
+        "bench": "genglossary.cli_bench:bench",
+        "export": "genglossary.cli_export:export",
+    },
+)
 @click.version_option(version="0.1.0", prog_name="GenGlossary")
 def main() -> None:
     """GenGlossary - AI-powered glossary generator from documents.
@@ -406,6 +462,8 @@ def generate(
     指定されたディレクトリ内のドキュメントを解析し、
     AIを使って用語集を自動生成します。
     """
+    from genglossary.progress import progress_task
+
     try:
         # Verify input directory exists
         if not input_dir.exists():
@@ -581,6 +639,8 @@ def _run_term_extraction_analysis(
     Returns:
         Term extraction analysis results.
     """
+    from genglossary.progress import progress_task
+
     # Extract candidates and show initial info
     console.print("[dim]候補抽出中...[/dim]")
     all_candidates = extractor.get_candidates(documents, filter_contained=True)
@@ -647,6 +707,10 @@ def analyze_terms(
     SudachiPyによる固有名詞抽出とLLMによる用語判定の結果を表示し、
     用語抽出の品質を確認するためのコマンドです。
     """
+    from genglossary.document_loader import DocumentLoader
+    from genglossary.llm.factory import create_llm_client
+    from genglossary.term_extractor import TermExtractor
+
     try:
         console.print("[bold green]=== 用語抽出分析 ===[/bold green]\n")
 
@@ -707,21 +771,5 @@ def analyze_terms(
         sys.exit(1)
 
 
-# Register db subcommand group
-from genglossary.cli_db import db
-
-main.add_command(db)
-
-# Register api subcommand group
-from genglossary.cli_api import api
-
-main.add_command(api)
-
-# Register project subcommand group
-from genglossary.cli_project import project
-
-main.add_command(project)
-
-
 if __name__ == "__main__":
     main()
@@ -3,7 +3,6 @@
 import os
 
 import click
-import uvicorn
 from rich.console import Console
 
 console = Console()
@@ -52,6 +51,8 @@ def serve(host: str, port: int, reload: bool, llm_debug: bool) -> None:
         genglossary api serve --reload  # Development mode
         genglossary api serve --llm-debug  # Enable LLM debug logging
     """
+    import uvicorn
+
     if llm_debug:
         os.environ["LLM_DEBUG"] = "true"
         console.print("[yellow]LLM debug logging enabled[/yellow]")
@@ -0,0 +1,221 @@
+"""Benchmark command for GenGlossary CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from genglossary.bench.synthetic_corpus import CORPUS_SIZES
+
+if TYPE_CHECKING:
+    # The runner imports the whole pipeline; load it only when benchmarking
+    from genglossary.bench.runner import BenchmarkResult
+
+console = Console()
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _result_table(result: BenchmarkResult) -> Table:
+    """Create a table of per-stage metrics for one corpus."""
+    table = Table(
+        title=f"{result.size} ({result.documents} 文書 / {result.characters:,} 文字)"
+    )
+    table.add_column("ステージ", style="cyan")
+    table.add_column("件数", justify="right")
+    table.add_column("件/秒", justify="right", style="green")
+    table.add_column("p50ms", justify="right")
+    table.add_column("p95ms", justify="right")
+    table.add_column("CPU秒", justify="right")
+    table.add_column("RSS MB", justify="right")
+    table.add_column("LLM", justify="right")
+    table.add_column("失敗", justify="right", style="red")
+    for m in result.stages:
+        table.add_row(
+            m.stage,
+            str(m.items),
+            f"{m.throughput:.1f}",
+            _format_ms(m.latency_p50_ms),
+            _format_ms(m.latency_p95_ms),
+            f"{m.cpu_seconds:.2f}",
+            "-" if m.peak_rss_mb is None else f"{m.peak_rss_mb:.1f}",
+            str(m.llm_calls),
+            str(m.llm_failures),
+        )
+    return table
+
+
+@click.command()
+@click.option(
+    "--size",
+    "sizes",
+    type=click.Choice(list(CORPUS_SIZES)),
+    multiple=True,
+    help="コーパスサイズ（複数指定可、省略時は small と medium）",
+)
+@click.option(
+    "--llm-provider",
+    type=click.Choice(["ollama", "openai"], case_sensitive=False),
+    default="ollama",
+    show_default=True,
+    help="模擬サーバーに対して使用するクライアントのAPI",
+)
+@click.option(
+    "--latency-ms",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="模擬LLMの平均応答遅延（ミリ秒）",
+)
+@click.option(
+    "--jitter-ms",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="応答遅延の揺らぎ幅（ミリ秒、一様分布）",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="HTTP 503 を返す確率",
+)
+@click.option(
+    "--malformed-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="不正なJSONを返す確率",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="レビュー・改善の同時LLM呼び出し数（省略時は LLM_MAX_CONCURRENCY）",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="コーパス生成と障害注入の乱数シード",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="結果をベースラインJSONとして保存するパス",
+)
+@click.option(
+    "--baseline",
+    "baseline_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="比較対象のベースラインJSON（劣化があれば終了コード1）",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="劣化とみなす相対変化の閾値（省略時は 0.2）",
+)
+def bench(
+    sizes: tuple[str, ...],
+    llm_provider: str,
+    latency_ms: float,
+    jitter_ms: float,
+    error_rate: float,
+    malformed_rate: float,
+    concurrency: int | None,
+    seed: int,
+    output_file: Path | None,
+    baseline_file: Path | None,
+    tolerance: float | None,
+) -> None:
+    """パイプラインのベンチマークを実行します。
+
+    ローカルの模擬LLMサーバー（Ollama / OpenAI互換API）と合成した日本語
+    コーパスを使い、抽出・生成・レビュー・改善の各ステージのスループット、
+    LLM呼び出しのp50/p95レイテンシ、CPU時間、ピークRSSを計測します。
+    """
+    from genglossary.bench.fake_llm_server import FakeLLMSettings
+    from genglossary.bench.runner import (
+        DEFAULT_TOLERANCE,
+        compare_to_baseline,
+        load_baseline,
+        run_benchmarks,
+        write_baseline,
+    )
+    from genglossary.config import Config
+
+    if error_rate + malformed_rate > 1:
+        console.print("[red]エラー: --error-rate と --malformed-rate の合計は1以下にしてください[/red]")
+        sys.exit(1)
+
+    selected = list(sizes) or ["small", "medium"]
+    max_concurrency = concurrency or Config().llm_max_concurrency
+    settings = FakeLLMSettings(
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        error_rate=error_rate,
+        malformed_rate=malformed_rate,
+        seed=seed,
+    )
+
+    console.print("[bold green]GenGlossary ベンチマーク[/bold green]")
+    console.print(f"プロバイダー: {llm_provider} / 同時実行数: {max_concurrency}")
+    console.print()
+
+    results = run_benchmarks(
+        selected,
+        settings,
+        provider=llm_provider,
+        max_concurrency=max_concurrency,
+        seed=seed,
+        result_callback=lambda result: console.print(_result_table(result)),
+    )
+
+    parameters = {
+        "provider": llm_provider,
+        "max_concurrency": max_concurrency,
+        "seed": seed,
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "error_rate": error_rate,
+        "malformed_rate": malformed_rate,
+    }
+    if output_file is not None:
+        write_baseline(output_file, results, parameters=parameters)
+        console.print(f"\n結果を保存しました: {output_file}")
+
+    if baseline_file is not None:
+        try:
+            baseline = load_baseline(baseline_file)
+        except ValueError as e:
+            console.print(f"[red]エラー: {e}[/red]")
+            sys.exit(1)
+        if baseline.get("parameters") != parameters:
+            console.print(
+                "[yellow]警告: ベースラインと実行条件が異なります[/yellow]"
+            )
+        regressions = compare_to_baseline(
+            results,
+            baseline,
+            tolerance=DEFAULT_TOLERANCE if tolerance is None else tolerance,
+        )
+        if regressions:
+            console.print("\n[red]ベースラインからの劣化を検出しました:[/red]")
+            for message in regressions:
+                console.print(f"  - {message}")
+            sys.exit(1)
+        console.print("\n[green]✓ ベースラインからの劣化はありません[/green]")
@@ -1,34 +1,22 @@
 """Database CLI commands for GenGlossary."""
 
+from __future__ import annotations
+
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import click
 import sqlite3
 from rich.console import Console
 from rich.table import Table
 
-from genglossary.llm.factory import create_llm_client
 from genglossary.db.connection import database_connection, transaction
 from genglossary.db.document_repository import list_all_documents
 from genglossary.db.issue_repository import delete_all_issues, list_all_issues, create_issue
-from genglossary.db.models import GlossaryTermRow
-from genglossary.db.provisional_repository import (
-    create_provisional_term,
-    delete_all_provisional,
-    get_provisional_term,
-    list_all_provisional,
-    update_provisional_term,
-)
-from genglossary.db.refined_repository import (
-    create_refined_term,
-    delete_all_refined,
-    get_refined_term,
-    list_all_refined,
-    update_refined_term,
-)
 from genglossary.db.metadata_repository import get_metadata
+from genglossary.db.run_profile_repository import get_run_profile
+from genglossary.db.runs_repository import get_run, list_runs
 from genglossary.db.schema import initialize_db
 from genglossary.db.term_repository import (
     create_term,
@@ -38,13 +26,13 @@ from genglossary.db.term_repository import (
     list_all_terms,
     update_term,
 )
-from genglossary.document_loader import DocumentLoader
-from genglossary.glossary_generator import GlossaryGenerator
-from genglossary.glossary_refiner import GlossaryRefiner
-from genglossary.glossary_reviewer import GlossaryReviewer
-from genglossary.models.document import Document
-from genglossary.models.glossary import Glossary, GlossaryIssue
-from genglossary.term_extractor import TermExtractor
+
+if TYPE_CHECKING:
+    # Commands import the LLM pipeline and the glossary repositories (which
+    # need pydantic) when they run, so that the other commands start fast.
+    from genglossary.db.models import GlossaryTermRow
+    from genglossary.models.document import Document
+    from genglossary.models.glossary import Glossary, GlossaryIssue
 
 console = Console()
 
@@ -67,6 +55,8 @@ def _initialize_llm_client(llm_provider: str, model: str | None):
     Raises:
         click.Abort: If LLM client is not available.
     """
+    from genglossary.llm.factory import create_llm_client
+
     llm_client = create_llm_client(llm_provider, model)
     if not llm_client.is_available():
         console.print(f"[red]{llm_provider} が利用できません[/red]")
@@ -111,6 +101,8 @@ def _reconstruct_documents_from_db(
 
     Warns about missing files but continues processing.
     """
+    from genglossary.models.document import Document
+
     documents: list[Document] = []
     for doc_row in doc_rows:
         doc = Document(
@@ -132,6 +124,7 @@ def _reconstruct_glossary_from_rows(
     Returns:
         Reconstructed Glossary object.
     """
+    from genglossary.models.glossary import Glossary
     from genglossary.models.term import Term
 
     glossary = Glossary()
@@ -157,6 +150,8 @@ def _reconstruct_issues_from_rows(
     Returns:
         List of reconstructed GlossaryIssue objects.
     """
+    from genglossary.models.glossary import GlossaryIssue
+
     issues: list[GlossaryIssue] = []
     for issue_row in issue_rows:
         issue = GlossaryIssue(
@@ -533,6 +528,10 @@ def terms_regenerate(input: str, llm_provider: str, model: str | None, db_path:
     Example:
         genglossary db terms regenerate --input ./target_docs
     """
+    from genglossary.document_loader import DocumentLoader
+    from genglossary.llm.factory import create_batcher
+    from genglossary.term_extractor import TermExtractor
+
     llm_client = _initialize_llm_client(llm_provider, model)
 
     with _db_operation(db_path) as conn:
@@ -548,7 +547,10 @@ def terms_regenerate(input: str, llm_provider: str, model: str | None, db_path:
 
         # Extract terms with categories
         extractor = TermExtractor(
-            llm_client=llm_client, excluded_term_repo=conn, required_term_repo=conn
+            llm_client=llm_client,
+            excluded_term_repo=conn,
+            required_term_repo=conn,
+            batcher=create_batcher(getattr(llm_client, "model", model or "")),
         )
         console.print("[dim]用語を抽出中（カテゴリ付き）...[/dim]")
         classified_terms = extractor.extract_terms(documents, return_categories=True)
@@ -586,6 +588,8 @@ def provisional_list(db_path: str) -> None:
     Example:
         genglossary db provisional list
     """
+    from genglossary.db.provisional_repository import list_all_provisional
+
     with _db_operation(db_path) as conn:
         term_list = list_all_provisional(conn)
 
@@ -611,6 +615,8 @@ def provisional_show(term_id: int, db_path: str) -> None:
     Example:
         genglossary db provisional show 1
     """
+    from genglossary.db.provisional_repository import get_provisional_term
+
     with _db_operation(db_path) as conn:
         term = get_provisional_term(conn, term_id)
 
@@ -647,6 +653,8 @@ def provisional_update(term_id: int, definition: str, confidence: float, db_path
     Example:
         genglossary db provisional update 1 --definition "新しい定義" --confidence 0.95
     """
+    from genglossary.db.provisional_repository import update_provisional_term
+
     with _db_operation(db_path) as conn:
         with transaction(conn):
             update_provisional_term(conn, term_id, definition, confidence)
@@ -677,6 +685,12 @@ def provisional_regenerate(llm_provider: str, model: str | None, db_path: str) -
     Example:
         genglossary db provisional regenerate
     """
+    from genglossary.db.provisional_repository import (
+        create_provisional_term,
+        delete_all_provisional,
+    )
+    from genglossary.glossary_generator import GlossaryGenerator
+
     llm_client = _initialize_llm_client(llm_provider, model)
 
     with _db_operation(db_path) as conn:
@@ -744,6 +758,8 @@ def refined_list(db_path: str) -> None:
     Example:
         genglossary db refined list
     """
+    from genglossary.db.refined_repository import list_all_refined
+
     with _db_operation(db_path) as conn:
         term_list = list_all_refined(conn)
 
@@ -769,6 +785,8 @@ def refined_show(term_id: int, db_path: str) -> None:
     Example:
         genglossary db refined show 1
     """
+    from genglossary.db.refined_repository import get_refined_term
+
     with _db_operation(db_path) as conn:
         term = get_refined_term(conn, term_id)
 
@@ -805,6 +823,8 @@ def refined_update(term_id: int, definition: str, confidence: float, db_path: st
     Example:
         genglossary db refined update 1 --definition "新しい定義" --confidence 0.98
     """
+    from genglossary.db.refined_repository import update_refined_term
+
     with _db_operation(db_path) as conn:
         with transaction(conn):
             update_refined_term(conn, term_id, definition, confidence)
@@ -830,33 +850,24 @@ def refined_export_md(output: str, db_path: str) -> None:
     Example:
         genglossary db refined export-md --output ./glossary.md
     """
-    with _db_operation(db_path) as conn:
-        term_list = list_all_refined(conn)
-
-    if not term_list:
-        console.print("[yellow]エクスポートする用語がありません[/yellow]")
-        return
-
-    # Generate Markdown
-    md_lines = ["# 用語集\n"]
-    for term in term_list:
-        md_lines.append(f"## {term['term_name']}\n")
-        md_lines.append(f"**定義**: {term['definition']}\n")
-        md_lines.append(f"**信頼度**: {term['confidence']:.2f}\n")
-
-        if term["occurrences"]:
-            md_lines.append("\n**出現箇所**:\n")
-            for occ in term["occurrences"]:
-                md_lines.append(f"- {occ.document_path}:{occ.line_number}\n")
+    from genglossary.db.refined_repository import iter_refined
+    from genglossary.db.stats_repository import count_refined_terms
+    from genglossary.output.export import EXPORT_FORMATS, iter_export_chunks
 
-        md_lines.append("\n---\n\n")
+    with _db_operation(db_path) as conn:
+        term_count = count_refined_terms(conn)
+        if not term_count:
+            console.print("[yellow]エクスポートする用語がありません[/yellow]")
+            return
 
-    # Write to file
-    output_path = Path(output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("".join(md_lines), encoding="utf-8")
+        # Stream to the file with the same encoder as `genglossary export`
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("wb") as out:
+            for chunk in iter_export_chunks(iter_refined(conn), EXPORT_FORMATS["md"], {}):
+                out.write(chunk)
 
-    console.print(f"[green]✓[/green] {len(term_list)}件の用語を {output} にエクスポートしました")
+    console.print(f"[green]✓[/green] {term_count}件の用語を {output} にエクスポートしました")
 
 
 @refined.command("regenerate")
@@ -883,6 +894,13 @@ def refined_regenerate(llm_provider: str, model: str | None, db_path: str) -> No
     Example:
         genglossary db refined regenerate
     """
+    from genglossary.db.provisional_repository import list_all_provisional
+    from genglossary.db.refined_repository import (
+        create_refined_term,
+        delete_all_refined,
+    )
+    from genglossary.glossary_refiner import GlossaryRefiner
+
     llm_client = _initialize_llm_client(llm_provider, model)
 
     with _db_operation(db_path) as conn:
@@ -991,6 +1009,11 @@ def issues_regenerate(llm_provider: str, model: str | None, db_path: str) -> Non
     Example:
         genglossary db issues regenerate
     """
+    from genglossary.config import Config
+    from genglossary.db.provisional_repository import list_all_provisional
+    from genglossary.glossary_reviewer import GlossaryReviewer
+    from genglossary.llm.factory import create_batcher
+
     llm_client = _initialize_llm_client(llm_provider, model)
 
     with _db_operation(db_path) as conn:
@@ -1010,7 +1033,12 @@ def issues_regenerate(llm_provider: str, model: str | None, db_path: str) -> Non
         console.print(f"[dim]{len(glossary.terms)} 個の暫定用語を読み込みました[/dim]")
 
         # Review glossary
-        reviewer = GlossaryReviewer(llm_client=llm_client)
+        config = Config()
+        reviewer = GlossaryReviewer(
+            llm_client=llm_client,
+            max_concurrency=config.llm_max_concurrency,
+            batcher=create_batcher(getattr(llm_client, "model", model or ""), config),
+        )
         console.print("[dim]用語集を精査中...[/dim]")
         issues = reviewer.review(glossary)
         # Handle None return (cancellation case - should not happen in CLI)
@@ -1021,3 +1049,121 @@ def issues_regenerate(llm_provider: str, model: str | None, db_path: str) -> Non
         # Save issues to database
         count = _save_issues(conn, issues)
         console.print(f"[green]✓[/green] {count}件の問題を保存しました")
+
+
+@db.group()
+def runs() -> None:
+    """実行履歴の管理コマンド."""
+    pass
+
+
+@runs.command("list")
+@click.option(
+    "--db-path",
+    type=click.Path(exists=True),
+    default="./genglossary.db",
+    help="Path to database file",
+)
+def runs_list(db_path: str) -> None:
+    """実行履歴の一覧を表示.
+
+    Example:
+        genglossary db runs list
+    """
+    with _db_operation(db_path) as conn:
+        run_list = list_runs(conn)
+
+    if not run_list:
+        console.print("[yellow]実行履歴がありません[/yellow]")
+        return
+
+    table = Table(title="実行履歴")
+    table.add_column("ID", style="cyan")
+    table.add_column("スコープ", style="magenta")
+    table.add_column("状態", style="green")
+    table.add_column("開始", style="white")
+    table.add_column("終了", style="white")
+
+    for run in run_list:
+        table.add_row(
+            str(run["id"]),
+            run["scope"],
+            run["status"],
+            run["started_at"] or "-",
+            run["finished_at"] or "-",
+        )
+
+    console.print(table)
+
+
+def _format_optional_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f} ms"
+
+
+@runs.command("show")
+@click.argument("run_id", type=int)
+@click.option(
+    "--db-path",
+    type=click.Path(exists=True),
+    default="./genglossary.db",
+    help="Path to database file",
+)
+def runs_show(run_id: int, db_path: str) -> None:
+    """指定されたrun_idの詳細とパフォーマンスプロファイルを表示.
+
+    Example:
+        genglossary db runs show 1
+    """
+    with _db_operation(db_path) as conn:
+        run = get_run(conn, run_id)
+        profile = get_run_profile(conn, run_id) if run is not None else None
+
+    if run is None:
+        console.print(f"[red]Run ID {run_id} が見つかりません[/red]")
+        raise click.Abort()
+
+    console.print(f"\n[bold]Run #{run['id']}[/bold]")
+    console.print(f"スコープ: {run['scope']}")
+    console.print(f"状態: {run['status']}")
+    console.print(f"開始: {run['started_at'] or '-'}")
+    console.print(f"終了: {run['finished_at'] or '-'}")
+    if run["error_message"]:
+        console.print(f"エラー: {run['error_message']}")
+
+    if profile is None:
+        console.print("\n[yellow]プロファイルがありません[/yellow]")
+        return
+
+    console.print("\n[bold]プロファイル[/bold]")
+    console.print(f"LLM: {profile['llm_provider']} / {profile['llm_model'] or '-'}")
+    console.print(
+        f"同時実行数: {profile['llm_concurrency']}"
+        f"（ストリーミング: {'有効' if profile['streaming'] else '無効'}）"
+    )
+    console.print(f"実行時間: {profile['wall_seconds']:.2f} 秒")
+    console.print(
+        f"LLM呼び出し: {profile['llm_calls']} 回"
+        f"（失敗 {profile['llm_failures']} / リトライ {profile['llm_retries']}"
+        f" / JSON解析失敗 {profile['json_parse_failures']}）"
+    )
+    if profile["llm_retry_reasons"]:
+        reasons = ", ".join(
+            f"{reason} {count}" for reason, count in profile["llm_retry_reasons"].items()
+        )
+        console.print(f"リトライ理由: {reasons}")
+    console.print(
+        f"LLMレイテンシ: 平均 {_format_optional_ms(profile['llm_latency_mean_ms'])}"
+        f" / p95 {_format_optional_ms(profile['llm_latency_p95_ms'])}"
+    )
+    console.print(
+        f"文字数: プロンプト {profile['prompt_chars']:,} / 応答 {profile['response_chars']:,}"
+    )
+    console.print(f"DB書き込み: {profile['db_write_seconds']:.2f} 秒")
+
+    if profile["steps"]:
+        table = Table(title="ステップ別実行時間")
+        table.add_column("ステップ", style="cyan")
+        table.add_column("秒", justify="right", style="green")
+        for step in profile["steps"]:
+            table.add_row(step["step"], f"{step['wall_seconds']:.2f}")
+        console.print(table)
@@ -0,0 +1,61 @@
+"""Export command for GenGlossary CLI."""
+
+import sys
+
+import click
+from rich.console import Console
+
+from genglossary.db.connection import database_connection
+from genglossary.output.export import EXPORT_FORMATS, get_export_format, iter_export_chunks
+
+# Messages go to stderr so that `--output -` can be piped
+console = Console(stderr=True)
+
+
+@click.command()
+@click.option(
+    "--format",
+    "-f",
+    "format_name",
+    type=click.Choice(list(EXPORT_FORMATS), case_sensitive=False),
+    default="md",
+    help="出力形式: md / jsonl / csv / tsv（デフォルト: md）",
+)
+@click.option(
+    "--output",
+    "-o",
+    default="-",
+    help="出力ファイルのパス（- で標準出力、デフォルト: -）",
+)
+@click.option(
+    "--db-path",
+    type=click.Path(exists=True, dir_okay=False),
+    default="./genglossary.db",
+    help="SQLiteデータベースのパス（デフォルト: genglossary.db）",
+)
+def export(format_name: str, output: str, db_path: str) -> None:
+    """最終用語集をストリーミングでエクスポートします。
+
+    用語を1件ずつDBから読みながら書き出すため、用語集が大きくても
+    メモリ使用量は一定です。
+
+    Example:
+        genglossary export --format jsonl --output glossary.jsonl
+    """
+    from genglossary.db.refined_repository import iter_refined
+    from genglossary.db.synonym_repository import get_aliases_map
+
+    fmt = get_export_format(format_name.lower())
+    try:
+        with database_connection(db_path) as conn, click.open_file(
+            output, "wb", atomic=output != "-"
+        ) as out:
+            chunks = iter_export_chunks(iter_refined(conn), fmt, get_aliases_map(conn))
+            for chunk in chunks:
+                out.write(chunk)
+    except Exception as e:
+        console.print(f"[red]エラー: {e}[/red]")
+        sys.exit(1)
+
+    if output != "-":
+        console.print(f"[green]✓[/green] {fmt.name} 形式で {output} にエクスポートしました")
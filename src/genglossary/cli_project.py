@@ -11,19 +11,11 @@ from rich.console import Console
 from rich.table import Table
 
 from genglossary.db.connection import transaction
-from genglossary.db.project_repository import (
-    clone_project,
-    create_project,
-    delete_project,
-    get_project_by_name,
-    list_projects,
-)
 from genglossary.db.registry_connection import (
     get_default_registry_path,
     get_registry_connection,
 )
 from genglossary.db.registry_schema import initialize_registry
-from genglossary.models.project import ProjectStatus
 
 console = Console()
 
@@ -127,6 +119,9 @@ def init(
 
     プロジェクトはドキュメントディレクトリと設定をまとめて管理します。
     """
+    # Project models need pydantic; import them only when a command runs
+    from genglossary.db.project_repository import create_project
+
     try:
         with _registry_connection(str(registry) if registry else None) as conn:
             project_db_path = _get_project_db_path(registry, name)
@@ -160,6 +155,9 @@ def init(
 )
 def list(registry: Path | None):
     """プロジェクト一覧を表示する"""
+    from genglossary.db.project_repository import list_projects
+    from genglossary.models.project import ProjectStatus
+
     try:
         with _registry_connection(str(registry) if registry else None) as conn:
             projects = list_projects(conn)
@@ -215,6 +213,8 @@ def delete(name: str, registry: Path | None):
 
     注意: プロジェクトのDBファイルは削除されません。
     """
+    from genglossary.db.project_repository import delete_project, get_project_by_name
+
     try:
         with _registry_connection(str(registry) if registry else None) as conn:
             # Find project by name
@@ -245,6 +245,8 @@ def delete(name: str, registry: Path | None):
 )
 def clone(source_name: str, new_name: str, registry: Path | None):
     """プロジェクトを複製する"""
+    from genglossary.db.project_repository import clone_project, get_project_by_name
+
     try:
         with _registry_connection(str(registry) if registry else None) as conn:
             # Find source project
@@ -17,6 +17,30 @@ class Config(BaseSettings):
         openai_model: Model name to use with OpenAI-compatible API.
         openai_timeout: Timeout in seconds for OpenAI API calls.
         azure_openai_api_version: Azure OpenAI API version.
+        openai_http2: Use HTTP/2 for the OpenAI-compatible API (needs h2).
+        llm_http_max_connections: Maximum connections per LLM server.
+        llm_http_max_keepalive: Idle connections kept open per LLM server.
+        llm_http_keepalive_expiry: Seconds an idle LLM connection is kept.
+        llm_lb_policy: Routing policy when a base URL lists several servers.
+        llm_health_check_interval: Seconds between endpoint health checks.
+        llm_eject_base_seconds: Ejection time of a failed endpoint.
+        llm_eject_max_seconds: Upper bound of the ejection time.
+        llm_concurrency_initial_limit: Starting adaptive in-flight limit per server.
+        llm_concurrency_min_limit: Lower bound of the adaptive limit.
+        llm_concurrency_max_limit: Upper bound of the adaptive limit.
+        llm_latency_spike_factor: Latency multiple that cuts the adaptive limit.
+        llm_batch_token_budget: Target tokens per classification/review batch.
+        llm_batch_token_budgets: Per-model budgets overriding the default.
+        llm_batch_max_items: Upper bound of items per token-budget batch.
+        llm_tokenizer: Tokenizer estimating batch sizes (heuristic or tiktoken).
+        llm_max_concurrency: Maximum number of concurrent LLM calls per step.
+        pipeline_streaming: Overlap generate, review and refine in full runs.
+        auto_extract_quiet_seconds: Upload-free seconds before the auto-extract run.
+        auto_extract_max_delay_seconds: Upper bound of the auto-extract wait.
+        llm_debug: Enable LLM debug logging of prompts and responses.
+        llm_debug_format: Debug log format (jsonl or files).
+        llm_debug_max_bytes: Size at which a JSONL debug log file is rotated.
+        llm_debug_compress: Gzip-compress JSONL debug log files.
         input_dir: Directory containing input documents.
         output_file: Path to output glossary file.
     """
@@ -37,7 +61,7 @@ class Config(BaseSettings):
     ollama_base_url: str = Field(
         default="http://localhost:11434",
         validation_alias="OLLAMA_BASE_URL",
-        description="Base URL for Ollama API",
+        description="Base URL for Ollama API (comma-separated for load balancing)",
     )
 
     ollama_model: str = Field(
@@ -56,7 +80,7 @@ class Config(BaseSettings):
     openai_base_url: str = Field(
         default="https://api.openai.com/v1",
         validation_alias="OPENAI_BASE_URL",
-        description="Base URL for OpenAI-compatible API",
+        description="Base URL for OpenAI-compatible API (comma-separated for load balancing)",
     )
 
     openai_api_key: str | None = Field(
@@ -84,12 +108,166 @@ class Config(BaseSettings):
         description="Azure OpenAI API version (e.g., '2024-02-15-preview')",
     )
 
+    openai_http2: bool = Field(
+        default=False,
+        validation_alias="OPENAI_HTTP2",
+        description="Use HTTP/2 for the OpenAI-compatible API (requires the h2 package)",
+    )
+
+    llm_http_max_connections: int = Field(
+        default=20,
+        validation_alias="LLM_HTTP_MAX_CONNECTIONS",
+        description="Maximum open connections to one LLM server",
+        gt=0,
+    )
+
+    llm_http_max_keepalive: int = Field(
+        default=10,
+        validation_alias="LLM_HTTP_MAX_KEEPALIVE",
+        description="Idle connections kept open for reuse per LLM server",
+        ge=0,
+    )
+
+    llm_http_keepalive_expiry: float = Field(
+        default=30.0,
+        validation_alias="LLM_HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle LLM connection is kept open",
+        gt=0,
+    )
+
+    llm_lb_policy: str = Field(
+        default="least_outstanding",
+        validation_alias="LLM_LB_POLICY",
+        description="Routing policy over comma-separated base URLs: 'least_outstanding' or 'latency'",
+    )
+
+    llm_health_check_interval: float = Field(
+        default=30.0,
+        validation_alias="LLM_HEALTH_CHECK_INTERVAL",
+        description="Seconds between health checks of load-balanced endpoints (0 disables)",
+        ge=0,
+    )
+
+    llm_eject_base_seconds: float = Field(
+        default=5.0,
+        validation_alias="LLM_EJECT_BASE_SECONDS",
+        description="Seconds a failed endpoint is ejected; doubles per consecutive failure",
+        gt=0,
+    )
+
+    llm_eject_max_seconds: float = Field(
+        default=300.0,
+        validation_alias="LLM_EJECT_MAX_SECONDS",
+        description="Upper bound of the ejection time of a failed endpoint",
+        gt=0,
+    )
+
+    llm_concurrency_initial_limit: int = Field(
+        default=4,
+        validation_alias="LLM_CONCURRENCY_INITIAL_LIMIT",
+        description="In-flight requests allowed per LLM server before the adaptive limiter has feedback",
+        gt=0,
+    )
+
+    llm_concurrency_min_limit: int = Field(
+        default=1,
+        validation_alias="LLM_CONCURRENCY_MIN_LIMIT",
+        description="Lower bound of the adaptive in-flight limit per LLM server",
+        gt=0,
+    )
+
+    llm_concurrency_max_limit: int = Field(
+        default=32,
+        validation_alias="LLM_CONCURRENCY_MAX_LIMIT",
+        description="Upper bound of the adaptive in-flight limit per LLM server",
+        gt=0,
+    )
+
+    llm_latency_spike_factor: float = Field(
+        default=2.0,
+        validation_alias="LLM_LATENCY_SPIKE_FACTOR",
+        description="Latency above this multiple of the moving average cuts the adaptive limit",
+        gt=1,
+    )
+
+    llm_batch_token_budget: int = Field(
+        default=1500,
+        validation_alias="LLM_BATCH_TOKEN_BUDGET",
+        description="Target tokens of terms or definitions per classification/review request; 0 uses fixed-size batches",
+        ge=0,
+    )
+
+    llm_batch_token_budgets: str = Field(
+        default="",
+        validation_alias="LLM_BATCH_TOKEN_BUDGETS",
+        description="Per-model batch token budgets as model=tokens pairs separated by commas",
+    )
+
+    llm_batch_max_items: int = Field(
+        default=30,
+        validation_alias="LLM_BATCH_MAX_ITEMS",
+        description="Upper bound of items per token-budget batch",
+        gt=0,
+    )
+
+    llm_tokenizer: str = Field(
+        default="heuristic",
+        validation_alias="LLM_TOKENIZER",
+        description="Tokenizer used to size batches (heuristic or tiktoken)",
+    )
+
+    llm_max_concurrency: int = Field(
+        default=1,
+        validation_alias="LLM_MAX_CONCURRENCY",
+        description="Maximum number of concurrent LLM calls per pipeline step",
+        gt=0,
+    )
+
+    pipeline_streaming: bool = Field(
+        default=False,
+        validation_alias="PIPELINE_STREAMING",
+        description="Run generate, review and refine as overlapping stages in full runs",
+    )
+
+    auto_extract_quiet_seconds: float = Field(
+        default=2.0,
+        validation_alias="AUTO_EXTRACT_QUIET_SECONDS",
+        description="Seconds without uploads before queued documents are extracted",
+        ge=0,
+    )
+
+    auto_extract_max_delay_seconds: float = Field(
+        default=30.0,
+        validation_alias="AUTO_EXTRACT_MAX_DELAY_SECONDS",
+        description="Maximum seconds queued documents wait for the auto-extract run",
+        ge=0,
+    )
+
     llm_debug: bool = Field(
         default=False,
         validation_alias="LLM_DEBUG",
         description="Enable LLM debug logging of prompts and responses",
     )
 
+    llm_debug_format: str = Field(
+        default="jsonl",
+        validation_alias="LLM_DEBUG_FORMAT",
+        description="LLM debug log format: 'jsonl' (buffered, rotated) or 'files' (one file per call)",
+    )
+
+    llm_debug_max_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        validation_alias="LLM_DEBUG_MAX_BYTES",
+        description="Size in bytes at which a JSONL debug log file is rotated",
+        gt=0,
+    )
+
+    llm_debug_compress: bool = Field(
+        default=False,
+        validation_alias="LLM_DEBUG_COMPRESS",
+        description="Gzip-compress JSONL debug log files",
+    )
+
     input_dir: str = Field(
         default="./target_docs",
         validation_alias="GENGLOSSARY_INPUT_DIR",
@@ -117,3 +295,36 @@ class Config(BaseSettings):
         if v not in ("ollama", "openai"):
             raise ValueError("llm_provider must be 'ollama' or 'openai'")
         return v
+
+    @field_validator("llm_lb_policy")
+    @classmethod
+    def validate_lb_policy(cls, v: str) -> str:
+        """Validate that the load balancing policy is one of the supported values."""
+        if v not in ("least_outstanding", "latency"):
+            raise ValueError("llm_lb_policy must be 'least_outstanding' or 'latency'")
+        return v
+
+    @field_validator("llm_batch_token_budgets")
+    @classmethod
+    def validate_batch_token_budgets(cls, v: str) -> str:
+        """Validate that per-model budgets are model=tokens pairs."""
+        from genglossary.llm.batching import parse_model_budgets
+
+        parse_model_budgets(v)
+        return v
+
+    @field_validator("llm_tokenizer")
+    @classmethod
+    def validate_tokenizer(cls, v: str) -> str:
+        """Validate that the tokenizer is one of the supported values."""
+        if v not in ("heuristic", "tiktoken"):
+            raise ValueError("llm_tokenizer must be 'heuristic' or 'tiktoken'")
+        return v
+
+    @field_validator("llm_debug_format")
+    @classmethod
+    def validate_debug_format(cls, v: str) -> str:
+        """Validate that the debug log format is one of the supported values."""
+        if v not in ("jsonl", "files"):
+            raise ValueError("llm_debug_format must be 'jsonl' or 'files'")
+        return v
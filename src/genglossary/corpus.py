@@ -0,0 +1,128 @@
+"""Project-scoped document corpus cache."""
+
+import sqlite3
+from collections.abc import Callable
+from threading import Lock
+
+from genglossary.db.document_repository import (
+    get_documents_fingerprint,
+    list_all_documents,
+)
+from genglossary.document_loader import DocumentLoader
+from genglossary.models.document import Document
+from genglossary.models.term import TermOccurrence
+
+# Finder signature: (term, documents) -> occurrences
+OccurrenceFinder = Callable[[str, list[Document]], list[TermOccurrence]]
+
+
+class CorpusCache:
+    """Caches a project's documents and per-term occurrence lookups.
+
+    Documents are loaded from the project database and kept until the
+    documents table fingerprint (ids and content hashes) changes, so
+    repeated single-term operations skip re-reading the corpus. Occurrence
+    lookups are memoized per term for the lifetime of a loaded corpus.
+
+    When the documents table is empty (CLI mode), documents are read from
+    doc_root on every call, since there is no change signal to invalidate on.
+
+    Thread-safe: a single instance is shared by all requests for a project.
+    """
+
+    # Upper bound on memoized occurrence lookups per corpus
+    MAX_CACHED_TERMS = 4096
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._lock = Lock()
+        self._fingerprint: str | None = None
+        self._documents: list[Document] = []
+        self._occurrences: dict[str, list[TermOccurrence]] = {}
+
+    def get_documents(self, conn: sqlite3.Connection, doc_root: str) -> list[Document]:
+        """Return the project's documents, reloading only if they changed.
+
+        Args:
+            conn: Project database connection.
+            doc_root: Document root used when the database has no documents.
+
+        Returns:
+            list[Document]: The project's documents.
+
+        Raises:
+            FileNotFoundError: If falling back to doc_root and it does not exist.
+            NotADirectoryError: If falling back to doc_root and it is not a directory.
+        """
+        documents, _ = self._refresh(conn, doc_root)
+        return documents
+
+    def find_occurrences(
+        self,
+        conn: sqlite3.Connection,
+        doc_root: str,
+        term: str,
+        finder: OccurrenceFinder,
+    ) -> list[TermOccurrence]:
+        """Find a term's occurrences, memoized until the corpus changes.
+
+        Args:
+            conn: Project database connection.
+            doc_root: Document root used when the database has no documents.
+            term: The term to look up.
+            finder: Function that scans documents for the term.
+
+        Returns:
+            list[TermOccurrence]: Occurrences of the term.
+        """
+        documents, cacheable = self._refresh(conn, doc_root)
+        if not cacheable:
+            return finder(term, documents)
+
+        with self._lock:
+            cached = self._occurrences.get(term)
+        if cached is not None:
+            return cached
+
+        occurrences = finder(term, documents)
+        with self._lock:
+            # Only store if the corpus was not swapped while we were scanning
+            if self._documents is documents:
+                if len(self._occurrences) >= self.MAX_CACHED_TERMS:
+                    self._occurrences.clear()
+                self._occurrences[term] = occurrences
+        return occurrences
+
+    def invalidate(self) -> None:
+        """Drop the cached corpus and occurrence lookups."""
+        with self._lock:
+            self._fingerprint = None
+            self._documents = []
+            self._occurrences = {}
+
+    def _refresh(
+        self, conn: sqlite3.Connection, doc_root: str
+    ) -> tuple[list[Document], bool]:
+        """Reload documents if the fingerprint changed.
+
+        Returns:
+            tuple[list[Document], bool]: (documents, whether they are cached).
+        """
+        fingerprint = get_documents_fingerprint(conn)
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return self._documents, True
+
+        rows = list_all_documents(conn)
+        if not rows:
+            return DocumentLoader().load_directory(doc_root), False
+
+        documents = [
+            Document(file_path=row["file_name"], content=row["content"])
+            for row in rows
+        ]
+        with self._lock:
+            self._fingerprint = fingerprint
+            self._documents = documents
+            self._occurrences = {}
+        return documents, True
@@ -1,94 +1,186 @@
-"""Database access layer for GenGlossary."""
-
-# Connection management
-from genglossary.db.connection import database_connection, get_connection
-
-# Registry connection management
-from genglossary.db.registry_connection import (
-    get_default_registry_path,
-    get_registry_connection,
-    registry_connection,
-)
-
-# Schema management
-from genglossary.db.schema import get_schema_version, initialize_db
-
-# Registry schema management
-from genglossary.db.registry_schema import (
-    get_registry_schema_version,
-    initialize_registry,
-)
-
-# Project repository
-from genglossary.db.project_repository import (
-    clone_project,
-    create_project,
-    delete_project,
-    get_project,
-    get_project_by_name,
-    list_projects,
-    update_project,
-)
-
-# Metadata repository
-from genglossary.db.metadata_repository import (
-    clear_metadata,
-    get_metadata,
-    upsert_metadata,
-)
-
-# Document repository
-from genglossary.db.document_repository import (
-    create_document,
-    delete_all_documents,
-    delete_document,
-    get_document,
-    get_document_by_name,
-    list_all_documents,
-)
-
-# Term repository
-from genglossary.db.term_repository import (
-    create_term,
-    delete_all_terms,
-    delete_term,
-    get_term,
-    list_all_terms,
-    update_term,
-)
-
-# Provisional glossary repository
-from genglossary.db.provisional_repository import (
-    create_provisional_term,
-    delete_all_provisional,
-    get_provisional_term,
-    list_all_provisional,
-    update_provisional_term,
-)
-
-# Issue repository
-from genglossary.db.issue_repository import (
-    create_issue,
-    delete_all_issues,
-    get_issue,
-    list_all_issues,
-)
-
-# Refined glossary repository
-from genglossary.db.refined_repository import (
-    create_refined_term,
-    delete_all_refined,
-    get_refined_term,
-    list_all_refined,
-    update_refined_term,
-)
-
-# Database models
-from genglossary.db.models import (
-    GlossaryTermRow,
-    deserialize_occurrences,
-    serialize_occurrences,
-)
+"""Database access layer for GenGlossary.
+
+The names below are re-exported lazily: importing genglossary.db (or one
+of its submodules) does not load every repository and the pydantic models
+behind them until a name is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Connection management
+    from genglossary.db.connection import (
+        database_connection,
+        get_connection,
+    )
+
+    # Registry connection management
+    from genglossary.db.registry_connection import (
+        get_default_registry_path,
+        get_registry_connection,
+        registry_connection,
+    )
+
+    # Schema management
+    from genglossary.db.schema import (
+        get_schema_version,
+        initialize_db,
+    )
+
+    # Registry schema management
+    from genglossary.db.registry_schema import (
+        get_registry_schema_version,
+        initialize_registry,
+    )
+
+    # Project repository
+    from genglossary.db.project_repository import (
+        clone_project,
+        create_project,
+        delete_project,
+        get_project,
+        get_project_by_name,
+        list_projects,
+        update_project,
+    )
+
+    # Metadata repository
+    from genglossary.db.metadata_repository import (
+        clear_metadata,
+        get_metadata,
+        upsert_metadata,
+    )
+
+    # Document repository
+    from genglossary.db.document_repository import (
+        create_document,
+        delete_all_documents,
+        delete_document,
+        get_document,
+        get_document_by_name,
+        list_all_documents,
+    )
+
+    # Term repository
+    from genglossary.db.term_repository import (
+        create_term,
+        delete_all_terms,
+        delete_term,
+        get_term,
+        list_all_terms,
+        update_term,
+    )
+
+    # Provisional glossary repository
+    from genglossary.db.provisional_repository import (
+        create_provisional_term,
+        delete_all_provisional,
+        get_provisional_term,
+        list_all_provisional,
+        update_provisional_term,
+    )
+
+    # Issue repository
+    from genglossary.db.issue_repository import (
+        create_issue,
+        delete_all_issues,
+        get_issue,
+        list_all_issues,
+    )
+
+    # Refined glossary repository
+    from genglossary.db.refined_repository import (
+        create_refined_term,
+        delete_all_refined,
+        get_refined_term,
+        list_all_refined,
+        update_refined_term,
+    )
+
+    # Database models
+    from genglossary.db.models import (
+        GlossaryTermRow,
+        deserialize_occurrences,
+        serialize_occurrences,
+    )
+
+_EXPORTS: dict[str, str] = {
+    # Connection management
+    "database_connection": "genglossary.db.connection",
+    "get_connection": "genglossary.db.connection",
+    # Registry connection management
+    "get_default_registry_path": "genglossary.db.registry_connection",
+    "get_registry_connection": "genglossary.db.registry_connection",
+    "registry_connection": "genglossary.db.registry_connection",
+    # Schema management
+    "get_schema_version": "genglossary.db.schema",
+    "initialize_db": "genglossary.db.schema",
+    # Registry schema management
+    "get_registry_schema_version": "genglossary.db.registry_schema",
+    "initialize_registry": "genglossary.db.registry_schema",
+    # Project repository
+    "clone_project": "genglossary.db.project_repository",
+    "create_project": "genglossary.db.project_repository",
+    "delete_project": "genglossary.db.project_repository",
+    "get_project": "genglossary.db.project_repository",
+    "get_project_by_name": "genglossary.db.project_repository",
+    "list_projects": "genglossary.db.project_repository",
+    "update_project": "genglossary.db.project_repository",
+    # Metadata repository
+    "clear_metadata": "genglossary.db.metadata_repository",
+    "get_metadata": "genglossary.db.metadata_repository",
+    "upsert_metadata": "genglossary.db.metadata_repository",
+    # Document repository
+    "create_document": "genglossary.db.document_repository",
+    "delete_all_documents": "genglossary.db.document_repository",
+    "delete_document": "genglossary.db.document_repository",
+    "get_document": "genglossary.db.document_repository",
+    "get_document_by_name": "genglossary.db.document_repository",
+    "list_all_documents": "genglossary.db.document_repository",
+    # Term repository
+    "create_term": "genglossary.db.term_repository",
+    "delete_all_terms": "genglossary.db.term_repository",
+    "delete_term": "genglossary.db.term_repository",
+    "get_term": "genglossary.db.term_repository",
+    "list_all_terms": "genglossary.db.term_repository",
+    "update_term": "genglossary.db.term_repository",
+    # Provisional glossary repository
+    "create_provisional_term": "genglossary.db.provisional_repository",
+    "delete_all_provisional": "genglossary.db.provisional_repository",
+    "get_provisional_term": "genglossary.db.provisional_repository",
+    "list_all_provisional": "genglossary.db.provisional_repository",
+    "update_provisional_term": "genglossary.db.provisional_repository",
+    # Issue repository
+    "create_issue": "genglossary.db.issue_repository",
+    "delete_all_issues": "genglossary.db.issue_repository",
+    "get_issue": "genglossary.db.issue_repository",
+    "list_all_issues": "genglossary.db.issue_repository",
+    # Refined glossary repository
+    "create_refined_term": "genglossary.db.refined_repository",
+    "delete_all_refined": "genglossary.db.refined_repository",
+    "get_refined_term": "genglossary.db.refined_repository",
+    "list_all_refined": "genglossary.db.refined_repository",
+    "update_refined_term": "genglossary.db.refined_repository",
+    # Database models
+    "GlossaryTermRow": "genglossary.db.models",
+    "deserialize_occurrences": "genglossary.db.models",
+    "serialize_occurrences": "genglossary.db.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     # Connection
@@ -1,11 +1,14 @@
 """Database connection management."""
 
 import sqlite3
+import time
 import uuid
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
+from genglossary.metrics import SQLITE_BUSY_ERRORS, SQLITE_LOCK_WAIT, is_busy_error
+
 
 def get_connection(db_path: str) -> sqlite3.Connection:
     """Get a SQLite database connection.
@@ -91,7 +94,9 @@ def transaction(conn: sqlite3.Connection) -> Iterator[None]:
     try:
         yield
         commit_fn()
-    except Exception:
+    except Exception as e:
+        if isinstance(e, sqlite3.OperationalError) and is_busy_error(e):
+            SQLITE_BUSY_ERRORS.inc()
         rollback_fn()
         raise
 
@@ -104,7 +109,8 @@ def immediate_transaction(conn: sqlite3.Connection) -> Iterator[None]:
     connections from starting concurrent write transactions. This
     ensures atomicity of check-then-act patterns across processes.
 
-    Unlike transaction(), this does not support nesting.
+    Unlike transaction(), this does not support nesting. The time spent
+    waiting for the write lock is recorded in the SQLite lock-wait metric.
 
     Args:
         conn: Database connection to manage transaction for.
@@ -117,11 +123,21 @@ def immediate_transaction(conn: sqlite3.Connection) -> Iterator[None]:
             within busy_timeout.
         Exception: Re-raises any exception that occurs within the transaction.
     """
-    conn.execute("BEGIN IMMEDIATE")
+    start = time.perf_counter()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+    except sqlite3.OperationalError as e:
+        if is_busy_error(e):
+            SQLITE_BUSY_ERRORS.inc()
+        raise
+    finally:
+        SQLITE_LOCK_WAIT.observe(time.perf_counter() - start)
     try:
         yield
         conn.commit()
-    except Exception:
+    except Exception as e:
+        if isinstance(e, sqlite3.OperationalError) and is_busy_error(e):
+            SQLITE_BUSY_ERRORS.inc()
         conn.rollback()
         raise
 
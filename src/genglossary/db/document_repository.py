@@ -1,10 +1,14 @@
 """Repository for documents table CRUD operations."""
 
+import hashlib
 import sqlite3
 from collections.abc import Sequence
 
 from genglossary.db.db_helpers import batch_insert
 
+# Columns served by idx_documents_metadata (never touches content)
+_METADATA_COLUMNS = "id, file_name, content_hash"
+
 
 def create_document(
     conn: sqlite3.Connection, file_name: str, content: str, content_hash: str
@@ -37,6 +41,38 @@ def create_document(
     return row
 
 
+def insert_document(
+    conn: sqlite3.Connection, file_name: str, content: str, content_hash: str
+) -> sqlite3.Row:
+    """Create a new document record and return only its metadata.
+
+    Like create_document, but the returned row omits content, so bulk
+    imports do not keep every inserted file in memory.
+
+    Args:
+        conn: Database connection.
+        file_name: Name of the document file.
+        content: Content of the document.
+        content_hash: Hash of the document content (for change detection).
+
+    Returns:
+        sqlite3.Row: id, file_name and content_hash of the created document.
+
+    Raises:
+        sqlite3.IntegrityError: If file_name already exists.
+    """
+    row = conn.execute(
+        f"""
+        INSERT INTO documents (file_name, content, content_hash)
+        VALUES (?, ?, ?)
+        RETURNING {_METADATA_COLUMNS}
+        """,
+        (file_name, content, content_hash),
+    ).fetchone()
+    assert row is not None
+    return row
+
+
 def get_document(conn: sqlite3.Connection, document_id: int) -> sqlite3.Row | None:
     """Get a document by ID.
 
@@ -66,6 +102,64 @@ def list_all_documents(conn: sqlite3.Connection) -> list[sqlite3.Row]:
     return cursor.fetchall()
 
 
+def list_document_metadata(
+    conn: sqlite3.Connection,
+    after_id: int | None = None,
+    limit: int | None = None,
+) -> list[sqlite3.Row]:
+    """List document metadata without loading file contents.
+
+    Selects only id, file_name and content_hash, which are answered from
+    the covering index. Supports keyset pagination via after_id.
+
+    Args:
+        conn: Database connection.
+        after_id: Return only documents with id greater than this value.
+        limit: Maximum number of documents to return (None for all).
+
+    Returns:
+        list[sqlite3.Row]: Document metadata records ordered by id.
+    """
+    query = f"SELECT {_METADATA_COLUMNS} FROM documents"
+    params: list[int] = []
+    if after_id is not None:
+        query += " WHERE id > ?"
+        params.append(after_id)
+    query += " ORDER BY id"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def get_documents_fingerprint(conn: sqlite3.Connection) -> str:
+    """Compute a fingerprint of the documents table for cache validation.
+
+    Derived from the max id, the row count and a digest of every
+    (id, content_hash) pair, all read from the covering index. Changes
+    whenever a document is added, deleted or has its content replaced.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        str: Opaque fingerprint string.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, content_hash FROM documents ORDER BY id")
+    digest = hashlib.sha256()
+    max_id = 0
+    count = 0
+    for row in cursor:
+        max_id = row[0]
+        count += 1
+        digest.update(f"{row[0]}:{row[1]};".encode())
+    return f"{max_id}-{count}-{digest.hexdigest()[:16]}"
+
+
 def list_documents_by_ids(
     conn: sqlite3.Connection, ids: Sequence[int]
 ) -> list[sqlite3.Row]:
@@ -117,6 +211,7 @@ def delete_document(conn: sqlite3.Connection, document_id: int) -> None:
         document_id: The document ID to delete.
     """
     cursor = conn.cursor()
+    cursor.execute("DELETE FROM document_manifest WHERE document_id = ?", (document_id,))
     cursor.execute("DELETE FROM documents WHERE id = ?", (document_id,))
 
 
@@ -127,6 +222,7 @@ def delete_all_documents(conn: sqlite3.Connection) -> None:
         conn: Database connection.
     """
     cursor = conn.cursor()
+    cursor.execute("DELETE FROM document_manifest")
     cursor.execute("DELETE FROM documents")
 
 
@@ -146,3 +242,114 @@ def create_documents_batch(
     batch_insert(
         conn, "documents", ["file_name", "content", "content_hash"], documents
     )
+
+
+def list_document_manifest(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    """List the manifest of documents loaded from the filesystem.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        list[sqlite3.Row]: file_name, content_hash, size and mtime_ns of
+        every document that has a manifest entry.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT d.file_name, d.content_hash, m.size, m.mtime_ns
+        FROM document_manifest m
+        JOIN documents d ON d.id = m.document_id
+        ORDER BY d.id
+        """
+    )
+    return cursor.fetchall()
+
+
+def has_document_manifest(conn: sqlite3.Connection) -> bool:
+    """Check whether any document was loaded from the filesystem.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        bool: True if the manifest has at least one entry.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM document_manifest LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def upsert_document_file(
+    conn: sqlite3.Connection,
+    file_name: str,
+    content: str,
+    content_hash: str,
+    size: int,
+    mtime_ns: int,
+) -> None:
+    """Create or update a document read from the filesystem, with its manifest.
+
+    The content is only rewritten when content_hash differs, so a file
+    that was merely touched only updates its manifest entry.
+
+    Args:
+        conn: Database connection.
+        file_name: Relative path of the file.
+        content: Content of the file.
+        content_hash: Hash of the content.
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, content_hash FROM documents WHERE file_name = ?", (file_name,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute(
+            """
+            INSERT INTO documents (file_name, content, content_hash)
+            VALUES (?, ?, ?)
+            RETURNING id
+            """,
+            (file_name, content, content_hash),
+        )
+        document_id = cursor.fetchone()[0]
+    else:
+        document_id = row["id"]
+        if row["content_hash"] != content_hash:
+            cursor.execute(
+                "UPDATE documents SET content = ?, content_hash = ? WHERE id = ?",
+                (content, content_hash, document_id),
+            )
+    cursor.execute(
+        """
+        INSERT INTO document_manifest (document_id, size, mtime_ns)
+        VALUES (?, ?, ?)
+        ON CONFLICT(document_id) DO UPDATE
+        SET size = excluded.size, mtime_ns = excluded.mtime_ns
+        """,
+        (document_id, size, mtime_ns),
+    )
+
+
+def delete_documents_by_names(
+    conn: sqlite3.Connection, file_names: Sequence[str]
+) -> None:
+    """Delete documents (and their manifest entries) by file_name.
+
+    Args:
+        conn: Database connection.
+        file_names: File names to delete.
+    """
+    cursor = conn.cursor()
+    for file_name in file_names:
+        cursor.execute(
+            """
+            DELETE FROM document_manifest WHERE document_id IN
+                (SELECT id FROM documents WHERE file_name = ?)
+            """,
+            (file_name,),
+        )
+        cursor.execute("DELETE FROM documents WHERE file_name = ?", (file_name,))
@@ -5,15 +5,11 @@ and glossary_refined tables to reduce code duplication.
 """
 
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Literal, cast
 
 from genglossary.db.db_helpers import batch_insert
-from genglossary.db.models import (
-    GlossaryTermRow,
-    deserialize_occurrences,
-    serialize_occurrences,
-)
+from genglossary.db.models import GlossaryTermRow
 from genglossary.models.term import TermOccurrence
 
 # Type for glossary table names
@@ -23,6 +19,15 @@ GlossaryTable = Literal["glossary_provisional", "glossary_refined"]
 ALLOWED_TABLES: set[str] = {"glossary_provisional", "glossary_refined"}
 
 
+# Child table holding the occurrences of each glossary table
+OCCURRENCE_TABLES: dict[str, str] = {
+    "glossary_provisional": "glossary_provisional_occurrences",
+    "glossary_refined": "glossary_refined_occurrences",
+}
+
+_OCCURRENCE_COLUMNS = ["term_id", "position", "document_path", "line_number", "context"]
+
+
 def _validate_table_name(table_name: str) -> None:
     """Validate that the table name is allowed.
 
@@ -64,17 +69,90 @@ def create_glossary_term(
     _validate_table_name(table_name)
 
     cursor = conn.cursor()
-    occurrences_json = serialize_occurrences(occurrences)
-
     cursor.execute(
         f"""
         INSERT INTO {table_name}
-        (term_name, definition, confidence, occurrences)
-        VALUES (?, ?, ?, ?)
+        (term_name, definition, confidence)
+        VALUES (?, ?, ?)
         """,
-        (term_name, definition, confidence, occurrences_json),
+        (term_name, definition, confidence),
+    )
+    term_id = cast(int, cursor.lastrowid)
+    batch_insert(
+        conn,
+        OCCURRENCE_TABLES[table_name],
+        _OCCURRENCE_COLUMNS,
+        _occurrence_rows(term_id, occurrences),
     )
-    return cast(int, cursor.lastrowid)
+    return term_id
+
+
+def _occurrence_rows(
+    term_id: int, occurrences: list[TermOccurrence]
+) -> list[tuple[int, int, str, int, str]]:
+    """Convert occurrences to rows for the occurrence child table.
+
+    Args:
+        term_id: The owning glossary term ID.
+        occurrences: List of term occurrences, in display order.
+
+    Returns:
+        list[tuple]: Rows of (term_id, position, document_path, line_number, context).
+    """
+    return [
+        (term_id, position, occ.document_path, occ.line_number, occ.context)
+        for position, occ in enumerate(occurrences)
+    ]
+
+
+def _occurrence_from_row(row: sqlite3.Row) -> TermOccurrence:
+    """Build a TermOccurrence from an occurrence table row.
+
+    Rows were validated on insert (and line_number is CHECK-constrained),
+    so validation is skipped to keep bulk reads cheap.
+
+    Args:
+        row: Row with document_path, line_number and context columns.
+
+    Returns:
+        TermOccurrence: The occurrence.
+    """
+    return TermOccurrence.model_construct(
+        document_path=row["document_path"],
+        line_number=row["line_number"],
+        context=row["context"],
+    )
+
+
+def list_glossary_term_occurrences(
+    conn: sqlite3.Connection, table_name: GlossaryTable, term_id: int
+) -> list[TermOccurrence]:
+    """List the occurrences of a single glossary term.
+
+    Args:
+        conn: Database connection.
+        table_name: The glossary table ("glossary_provisional" or "glossary_refined").
+        term_id: The owning term ID.
+
+    Returns:
+        list[TermOccurrence]: Occurrences in their original order.
+
+    Raises:
+        ValueError: If table_name is not allowed.
+    """
+    _validate_table_name(table_name)
+
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        SELECT document_path, line_number, context
+        FROM {OCCURRENCE_TABLES[table_name]}
+        WHERE term_id = ?
+        ORDER BY position
+        """,
+        (term_id,),
+    )
+    return [_occurrence_from_row(row) for row in cursor.fetchall()]
 
 
 def get_glossary_term(
@@ -88,7 +166,7 @@ def get_glossary_term(
         term_id: The term ID to retrieve.
 
     Returns:
-        GlossaryTermRow | None: The term record with deserialized occurrences,
+        GlossaryTermRow | None: The term record with its occurrences,
             or None if not found.
 
     Raises:
@@ -97,7 +175,10 @@ def get_glossary_term(
     _validate_table_name(table_name)
 
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (term_id,))
+    cursor.execute(
+        f"SELECT id, term_name, definition, confidence FROM {table_name} WHERE id = ?",
+        (term_id,),
+    )
     row = cursor.fetchone()
 
     if row is None:
@@ -108,21 +189,28 @@ def get_glossary_term(
         term_name=row["term_name"],
         definition=row["definition"],
         confidence=row["confidence"],
-        occurrences=deserialize_occurrences(row["occurrences"]),
+        occurrences=list_glossary_term_occurrences(conn, table_name, term_id),
     )
 
 
 def list_all_glossary_terms(
-    conn: sqlite3.Connection, table_name: GlossaryTable
+    conn: sqlite3.Connection,
+    table_name: GlossaryTable,
+    include_occurrences: bool = True,
 ) -> list[GlossaryTermRow]:
     """List all glossary terms from the specified table.
 
+    Occurrences are loaded in bulk through a single LEFT JOIN against the
+    occurrence child table, ordered by term ID and occurrence position.
+
     Args:
         conn: Database connection.
         table_name: The glossary table ("glossary_provisional" or "glossary_refined").
+        include_occurrences: If False, skip the occurrence table entirely and
+            return every term with an empty occurrences list.
 
     Returns:
-        list[GlossaryTermRow]: List of term records with deserialized occurrences.
+        list[GlossaryTermRow]: List of term records.
 
     Raises:
         ValueError: If table_name is not allowed.
@@ -130,19 +218,73 @@ def list_all_glossary_terms(
     _validate_table_name(table_name)
 
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {table_name} ORDER BY id")
-    rows = cursor.fetchall()
 
-    return [
-        GlossaryTermRow(
-            id=row["id"],
-            term_name=row["term_name"],
-            definition=row["definition"],
-            confidence=row["confidence"],
-            occurrences=deserialize_occurrences(row["occurrences"]),
+    if not include_occurrences:
+        cursor.execute(
+            f"SELECT id, term_name, definition, confidence FROM {table_name} ORDER BY id"
         )
-        for row in rows
-    ]
+        return [
+            GlossaryTermRow(
+                id=row["id"],
+                term_name=row["term_name"],
+                definition=row["definition"],
+                confidence=row["confidence"],
+                occurrences=[],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    return list(iter_glossary_terms(conn, table_name))
+
+
+def iter_glossary_terms(
+    conn: sqlite3.Connection, table_name: GlossaryTable
+) -> Iterator[GlossaryTermRow]:
+    """Iterate over the glossary terms of a table, with their occurrences.
+
+    Terms are read from the same LEFT JOIN as list_all_glossary_terms but
+    yielded one at a time while the cursor advances, so memory stays
+    constant however large the glossary is (used by streaming exports).
+
+    Args:
+        conn: Database connection.
+        table_name: The glossary table ("glossary_provisional" or "glossary_refined").
+
+    Yields:
+        GlossaryTermRow: Terms in ID order.
+
+    Raises:
+        ValueError: If table_name is not allowed.
+    """
+    _validate_table_name(table_name)
+
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        SELECT g.id, g.term_name, g.definition, g.confidence,
+               o.document_path, o.line_number, o.context
+        FROM {table_name} g
+        LEFT JOIN {OCCURRENCE_TABLES[table_name]} o ON o.term_id = g.id
+        ORDER BY g.id, o.position
+        """
+    )
+
+    term: GlossaryTermRow | None = None
+    for row in cursor:
+        if term is None or term["id"] != row["id"]:
+            if term is not None:
+                yield term
+            term = GlossaryTermRow(
+                id=row["id"],
+                term_name=row["term_name"],
+                definition=row["definition"],
+                confidence=row["confidence"],
+                occurrences=[],
+            )
+        if row["document_path"] is not None:
+            term["occurrences"].append(_occurrence_from_row(row))
+    if term is not None:
+        yield term
 
 
 def update_glossary_term(
@@ -194,6 +336,8 @@ def delete_all_glossary_terms(
     _validate_table_name(table_name)
 
     cursor = conn.cursor()
+    # Clear children explicitly so this does not depend on PRAGMA foreign_keys
+    cursor.execute(f"DELETE FROM {OCCURRENCE_TABLES[table_name]}")
     cursor.execute(f"DELETE FROM {table_name}")
 
 
@@ -215,12 +359,23 @@ def create_glossary_terms_batch(
     """
     _validate_table_name(table_name)
 
-    # Convert terms to format suitable for batch_insert
-    data = [
-        (term_name, definition, confidence, serialize_occurrences(occurrences))
-        for term_name, definition, confidence, occurrences in terms
-    ]
+    # Parents are inserted one by one to learn their IDs; the occurrence
+    # rows for the whole batch then go through a single executemany.
+    cursor = conn.cursor()
+    occurrence_data: list[tuple[int, int, str, int, str]] = []
+    for term_name, definition, confidence, occurrences in terms:
+        cursor.execute(
+            f"""
+            INSERT INTO {table_name}
+            (term_name, definition, confidence)
+            VALUES (?, ?, ?)
+            """,
+            (term_name, definition, confidence),
+        )
+        occurrence_data.extend(
+            _occurrence_rows(cast(int, cursor.lastrowid), occurrences)
+        )
 
     batch_insert(
-        conn, table_name, ["term_name", "definition", "confidence", "occurrences"], data
+        conn, OCCURRENCE_TABLES[table_name], _OCCURRENCE_COLUMNS, occurrence_data
     )
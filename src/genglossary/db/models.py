@@ -3,14 +3,27 @@
 Handles conversion between Pydantic models and JSON strings for database storage.
 """
 
+from __future__ import annotations
+
 import json
-from typing import TypeVar, TypedDict
+from functools import cache
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    # pydantic is imported on first use; run and term tables do not need it
+    from pydantic import TypeAdapter
+
+    from genglossary.models.term import TermOccurrence
+
 
-from pydantic import BaseModel, TypeAdapter
+@cache
+def _occurrences_adapter() -> TypeAdapter[list[TermOccurrence]]:
+    # Built once, on first use: constructing a TypeAdapter is expensive
+    from pydantic import TypeAdapter
 
-from genglossary.models.term import TermOccurrence
+    from genglossary.models.term import TermOccurrence
 
-T = TypeVar("T", bound=BaseModel)
+    return TypeAdapter(list[TermOccurrence])
 
 
 class GlossaryTermRow(TypedDict):
@@ -56,6 +69,34 @@ def deserialize_occurrences(json_str: str) -> list[TermOccurrence]:
     # Parse JSON
     data = json.loads(json_str)
 
-    # Use TypeAdapter for list validation
-    adapter = TypeAdapter(list[TermOccurrence])
-    return adapter.validate_python(data)
+    return _occurrences_adapter().validate_python(data)
+
+
+class RunProfileStepRow(TypedDict):
+    """Wall time of one step in a run profile."""
+
+    step: str
+    wall_seconds: float
+
+
+class RunProfileRow(TypedDict):
+    """Typed dict for a run profile with its steps in execution order."""
+
+    run_id: int
+    llm_provider: str
+    llm_model: str
+    llm_concurrency: int
+    streaming: bool
+    wall_seconds: float
+    steps: list[RunProfileStepRow]
+    llm_calls: int
+    llm_failures: int
+    llm_retries: int
+    llm_retry_reasons: dict[str, int]
+    json_parse_failures: int
+    prompt_chars: int
+    response_chars: int
+    llm_latency_mean_ms: float | None
+    llm_latency_p95_ms: float | None
+    db_write_seconds: float
+    created_at: str
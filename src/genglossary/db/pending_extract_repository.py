@@ -0,0 +1,55 @@
+"""Repository for documents waiting for the auto-extract run (v17)."""
+
+import sqlite3
+from collections.abc import Sequence
+
+
+def add_pending_extract_documents(
+    conn: sqlite3.Connection, document_ids: Sequence[int]
+) -> None:
+    """Queue documents for the next auto-extract run.
+
+    Documents already in the queue keep their original queued_at.
+
+    Args:
+        conn: Database connection.
+        document_ids: IDs of the documents.
+    """
+    conn.executemany(
+        "INSERT OR IGNORE INTO pending_extract_documents (document_id) VALUES (?)",
+        [(document_id,) for document_id in document_ids],
+    )
+
+
+def list_pending_extract_documents(conn: sqlite3.Connection) -> list[int]:
+    """List the queued documents, oldest first.
+
+    Deleted documents drop out of the queue by ON DELETE CASCADE.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        list[int]: Document IDs.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT document_id FROM pending_extract_documents "
+        "ORDER BY queued_at, document_id"
+    )
+    return [row["document_id"] for row in cursor.fetchall()]
+
+
+def remove_pending_extract_documents(
+    conn: sqlite3.Connection, document_ids: Sequence[int]
+) -> None:
+    """Remove documents from the queue.
+
+    Args:
+        conn: Database connection.
+        document_ids: IDs of the documents.
+    """
+    conn.executemany(
+        "DELETE FROM pending_extract_documents WHERE document_id = ?",
+        [(document_id,) for document_id in document_ids],
+    )
@@ -52,22 +52,26 @@ def get_provisional_term(
         term_id: The term ID to retrieve.
 
     Returns:
-        GlossaryTermRow | None: The term record with deserialized occurrences,
+        GlossaryTermRow | None: The term record with its occurrences,
             or None if not found.
     """
     return get_glossary_term(conn, "glossary_provisional", term_id)
 
 
-def list_all_provisional(conn: sqlite3.Connection) -> list[GlossaryTermRow]:
+def list_all_provisional(
+    conn: sqlite3.Connection, include_occurrences: bool = True
+) -> list[GlossaryTermRow]:
     """List all provisional terms.
 
     Args:
         conn: Database connection.
+        include_occurrences: If False, occurrences are not loaded and every
+            term is returned with an empty occurrences list.
 
     Returns:
-        list[GlossaryTermRow]: List of term records with deserialized occurrences.
+        list[GlossaryTermRow]: List of term records.
     """
-    return list_all_glossary_terms(conn, "glossary_provisional")
+    return list_all_glossary_terms(conn, "glossary_provisional", include_occurrences)
 
 
 def update_provisional_term(
@@ -1,13 +1,14 @@
 """Repository for glossary_refined table CRUD operations."""
 
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from genglossary.db.glossary_helpers import (
     create_glossary_term,
     create_glossary_terms_batch,
     delete_all_glossary_terms,
     get_glossary_term,
+    iter_glossary_terms,
     list_all_glossary_terms,
     update_glossary_term,
 )
@@ -52,22 +53,38 @@ def get_refined_term(
         term_id: The term ID to retrieve.
 
     Returns:
-        GlossaryTermRow | None: The term record with deserialized occurrences,
+        GlossaryTermRow | None: The term record with its occurrences,
             or None if not found.
     """
     return get_glossary_term(conn, "glossary_refined", term_id)
 
 
-def list_all_refined(conn: sqlite3.Connection) -> list[GlossaryTermRow]:
+def list_all_refined(
+    conn: sqlite3.Connection, include_occurrences: bool = True
+) -> list[GlossaryTermRow]:
     """List all refined terms.
 
     Args:
         conn: Database connection.
+        include_occurrences: If False, occurrences are not loaded and every
+            term is returned with an empty occurrences list.
 
     Returns:
-        list[GlossaryTermRow]: List of term records with deserialized occurrences.
+        list[GlossaryTermRow]: List of term records.
     """
-    return list_all_glossary_terms(conn, "glossary_refined")
+    return list_all_glossary_terms(conn, "glossary_refined", include_occurrences)
+
+
+def iter_refined(conn: sqlite3.Connection) -> Iterator[GlossaryTermRow]:
+    """Iterate over refined terms one at a time (for streaming exports).
+
+    Args:
+        conn: Database connection.
+
+    Yields:
+        GlossaryTermRow: Terms with their occurrences, in ID order.
+    """
+    return iter_glossary_terms(conn, "glossary_refined")
 
 
 def update_refined_term(
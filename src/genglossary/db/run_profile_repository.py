@@ -0,0 +1,141 @@
+"""Repository for run_profiles, run_profile_steps and run_profile_retries."""
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from genglossary.db.models import RunProfileRow, RunProfileStepRow
+
+if TYPE_CHECKING:
+    # Imported for typing only: genglossary.runs imports this module
+    from genglossary.runs.profile import RunProfile
+
+
+def save_run_profile(
+    conn: sqlite3.Connection,
+    run_id: int,
+    profile: "RunProfile",
+    *,
+    llm_provider: str,
+    llm_model: str,
+    llm_concurrency: int,
+    streaming: bool,
+) -> None:
+    """Save the profile of a run, replacing any existing one.
+
+    Args:
+        conn: Project database connection.
+        run_id: Run ID.
+        profile: Collected performance profile.
+        llm_provider: LLM provider used by the run.
+        llm_model: LLM model used by the run.
+        llm_concurrency: Maximum concurrent LLM calls per step.
+        streaming: Whether the run used the streaming pipeline.
+    """
+    cursor = conn.cursor()
+    # Clear old steps explicitly so this does not depend on PRAGMA foreign_keys
+    cursor.execute("DELETE FROM run_profile_steps WHERE run_id = ?", (run_id,))
+    cursor.execute("DELETE FROM run_profile_retries WHERE run_id = ?", (run_id,))
+    cursor.execute(
+        """
+        INSERT OR REPLACE INTO run_profiles (
+            run_id, llm_provider, llm_model, llm_concurrency, streaming,
+            wall_seconds, llm_calls, llm_failures, llm_retries,
+            json_parse_failures, prompt_chars, response_chars,
+            llm_latency_mean_ms, llm_latency_p95_ms, db_write_seconds
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            llm_provider,
+            llm_model,
+            llm_concurrency,
+            int(streaming),
+            profile.wall_seconds,
+            profile.llm_calls,
+            profile.llm_failures,
+            profile.llm_retries,
+            profile.json_parse_failures,
+            profile.prompt_chars,
+            profile.response_chars,
+            profile.llm_latency_mean_ms,
+            profile.llm_latency_p95_ms,
+            profile.db_write_seconds,
+        ),
+    )
+    cursor.executemany(
+        """
+        INSERT INTO run_profile_steps (run_id, position, step, wall_seconds)
+        VALUES (?, ?, ?, ?)
+        """,
+        [
+            (run_id, position, step, seconds)
+            for position, (step, seconds) in enumerate(profile.step_seconds.items())
+        ],
+    )
+    cursor.executemany(
+        "INSERT INTO run_profile_retries (run_id, reason, count) VALUES (?, ?, ?)",
+        [
+            (run_id, reason, count)
+            for reason, count in profile.llm_retry_reasons.items()
+        ],
+    )
+
+
+def get_run_profile(conn: sqlite3.Connection, run_id: int) -> RunProfileRow | None:
+    """Get the profile of a run.
+
+    Args:
+        conn: Project database connection.
+        run_id: Run ID.
+
+    Returns:
+        RunProfileRow | None: The profile with its steps and retry reasons,
+        or None if the run has no profile (still running, or finished
+        before v13).
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM run_profiles WHERE run_id = ?", (run_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+
+    cursor.execute(
+        """
+        SELECT step, wall_seconds FROM run_profile_steps
+        WHERE run_id = ? ORDER BY position
+        """,
+        (run_id,),
+    )
+    steps = [
+        RunProfileStepRow(step=step["step"], wall_seconds=step["wall_seconds"])
+        for step in cursor.fetchall()
+    ]
+    cursor.execute(
+        """
+        SELECT reason, count FROM run_profile_retries
+        WHERE run_id = ? ORDER BY reason
+        """,
+        (run_id,),
+    )
+    retry_reasons = {retry["reason"]: retry["count"] for retry in cursor.fetchall()}
+    return RunProfileRow(
+        run_id=row["run_id"],
+        llm_provider=row["llm_provider"],
+        llm_model=row["llm_model"],
+        llm_concurrency=row["llm_concurrency"],
+        streaming=bool(row["streaming"]),
+        wall_seconds=row["wall_seconds"],
+        steps=steps,
+        llm_calls=row["llm_calls"],
+        llm_failures=row["llm_failures"],
+        llm_retries=row["llm_retries"],
+        llm_retry_reasons=retry_reasons,
+        json_parse_failures=row["json_parse_failures"],
+        prompt_chars=row["prompt_chars"],
+        response_chars=row["response_chars"],
+        llm_latency_mean_ms=row["llm_latency_mean_ms"],
+        llm_latency_p95_ms=row["llm_latency_p95_ms"],
+        db_write_seconds=row["db_write_seconds"],
+        created_at=row["created_at"],
+    )
@@ -1,8 +1,12 @@
 """Database schema initialization and migration."""
 
+import logging
+import secrets
 import sqlite3
 
-SCHEMA_VERSION = 9
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 18
 
 SCHEMA_SQL = """
 -- Schema version tracking
@@ -29,6 +33,14 @@ CREATE TABLE IF NOT EXISTS documents (
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
+-- Size and mtime of documents loaded from doc_root (v14). Lets CLI runs
+-- skip reading files that did not change since the previous load.
+CREATE TABLE IF NOT EXISTS document_manifest (
+    document_id INTEGER PRIMARY KEY REFERENCES documents(id) ON DELETE CASCADE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+
 -- Extracted terms (v7: user_notes column added)
 CREATE TABLE IF NOT EXISTS terms_extracted (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,16 +50,25 @@ CREATE TABLE IF NOT EXISTS terms_extracted (
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
--- Provisional glossary
+-- Provisional glossary (v10: occurrences moved to glossary_provisional_occurrences)
 CREATE TABLE IF NOT EXISTS glossary_provisional (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     term_name TEXT NOT NULL UNIQUE,
     definition TEXT NOT NULL,
     confidence REAL DEFAULT 0.0,
-    occurrences TEXT DEFAULT '[]',
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
+-- Provisional glossary occurrences (v10: one row per occurrence, ordered by position)
+CREATE TABLE IF NOT EXISTS glossary_provisional_occurrences (
+    term_id INTEGER NOT NULL REFERENCES glossary_provisional(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    document_path TEXT NOT NULL,
+    line_number INTEGER NOT NULL CHECK (line_number > 0),
+    context TEXT NOT NULL,
+    PRIMARY KEY (term_id, position)
+) WITHOUT ROWID;
+
 -- Review issues (v9: should_exclude, exclusion_reason columns added)
 CREATE TABLE IF NOT EXISTS glossary_issues (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -59,16 +80,25 @@ CREATE TABLE IF NOT EXISTS glossary_issues (
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
--- Refined glossary
+-- Refined glossary (v10: occurrences moved to glossary_refined_occurrences)
 CREATE TABLE IF NOT EXISTS glossary_refined (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     term_name TEXT NOT NULL UNIQUE,
     definition TEXT NOT NULL,
     confidence REAL DEFAULT 0.0,
-    occurrences TEXT DEFAULT '[]',
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
+-- Refined glossary occurrences (v10: one row per occurrence, ordered by position)
+CREATE TABLE IF NOT EXISTS glossary_refined_occurrences (
+    term_id INTEGER NOT NULL REFERENCES glossary_refined(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    document_path TEXT NOT NULL,
+    line_number INTEGER NOT NULL CHECK (line_number > 0),
+    context TEXT NOT NULL,
+    PRIMARY KEY (term_id, position)
+) WITHOUT ROWID;
+
 -- Excluded terms (v5: terms to skip during extraction)
 CREATE TABLE IF NOT EXISTS terms_excluded (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -114,6 +144,125 @@ CREATE TABLE IF NOT EXISTS runs (
     current_step TEXT,
     created_at TEXT NOT NULL  -- Set by Python, not SQLite default
 );
+
+-- Run performance profiles (v13: one row per finished run)
+CREATE TABLE IF NOT EXISTS run_profiles (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    llm_provider TEXT NOT NULL,
+    llm_model TEXT NOT NULL,
+    llm_concurrency INTEGER NOT NULL,
+    streaming INTEGER NOT NULL DEFAULT 0,
+    wall_seconds REAL NOT NULL,
+    llm_calls INTEGER NOT NULL DEFAULT 0,
+    llm_failures INTEGER NOT NULL DEFAULT 0,
+    llm_retries INTEGER NOT NULL DEFAULT 0,
+    json_parse_failures INTEGER NOT NULL DEFAULT 0,
+    prompt_chars INTEGER NOT NULL DEFAULT 0,
+    response_chars INTEGER NOT NULL DEFAULT 0,
+    llm_latency_mean_ms REAL,
+    llm_latency_p95_ms REAL,
+    db_write_seconds REAL NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- Wall time per pipeline step of a profiled run (v13)
+CREATE TABLE IF NOT EXISTS run_profile_steps (
+    run_id INTEGER NOT NULL REFERENCES run_profiles(run_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    step TEXT NOT NULL,
+    wall_seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, step)
+);
+
+-- Retried LLM requests per reason of a profiled run (v18)
+CREATE TABLE IF NOT EXISTS run_profile_retries (
+    run_id INTEGER NOT NULL REFERENCES run_profiles(run_id) ON DELETE CASCADE,
+    reason TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, reason)
+);
+
+-- Change counter per table (v15), bumped by triggers on every write.
+-- Lets list endpoints answer conditional GETs without reading the table.
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
+-- Documents waiting for the auto-extract run (v17). Uploads add rows and
+-- the scheduler removes them once their extract run has started, so
+-- pending documents survive a server restart.
+CREATE TABLE IF NOT EXISTS pending_extract_documents (
+    document_id INTEGER PRIMARY KEY REFERENCES documents(id) ON DELETE CASCADE,
+    queued_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+"""
+
+# Full-text search indexes (v12): FTS5 table name -> (content table, columns).
+# External-content tables with the trigram tokenizer, so Japanese text is
+# searchable without word segmentation. Kept in sync by triggers.
+FTS_TABLES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "documents_fts": ("documents", ("file_name", "content")),
+    "terms_extracted_fts": ("terms_extracted", ("term_text",)),
+    "glossary_provisional_fts": ("glossary_provisional", ("term_name", "definition")),
+    "glossary_refined_fts": ("glossary_refined", ("term_name", "definition")),
+}
+
+
+# Tables with a change counter (v15; runs and the excluded/required term
+# lists since v16). Occurrence child tables are left out: their rows are
+# only written together with their term's row.
+VERSIONED_TABLES: tuple[str, ...] = (
+    "documents",
+    "terms_extracted",
+    "terms_excluded",
+    "terms_required",
+    "glossary_provisional",
+    "glossary_issues",
+    "glossary_refined",
+    "term_synonym_groups",
+    "term_synonym_members",
+    "runs",
+)
+
+
+def _build_fts_sql(
+    fts_table: str, content_table: str, columns: tuple[str, ...]
+) -> str:
+    """Build DDL for an external-content FTS5 table and its sync triggers.
+
+    Args:
+        fts_table: Name of the FTS5 virtual table.
+        content_table: Table whose rows are indexed (rowid = id).
+        columns: Indexed columns of the content table.
+
+    Returns:
+        str: SQL script creating the table and triggers.
+    """
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    insert_new = (
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+    {cols}, content='{content_table}', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {content_table} BEGIN
+    {insert_new}
+END;
+CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {content_table} BEGIN
+    {delete_old}
+END;
+CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {cols} ON {content_table} BEGIN
+    {delete_old}
+    {insert_new}
+END;
 """
 
 
@@ -134,9 +283,14 @@ def initialize_db(conn: sqlite3.Connection) -> None:
 
     _ensure_metadata_input_path(conn)
     _migrate_documents_table_v4(conn)
+    _create_documents_metadata_index_v11(conn)
     _migrate_terms_user_notes_v7(conn)
     _migrate_synonym_tables_v8(conn)
     _migrate_issues_exclude_columns_v9(conn)
+    _migrate_glossary_occurrences_v10(conn, "glossary_provisional")
+    _migrate_glossary_occurrences_v10(conn, "glossary_refined")
+    _create_fts_tables_v12(conn)
+    _create_table_version_triggers_v15(conn)
 
     # Set schema version if not already set (INSERT OR IGNORE handles race conditions)
     cursor = conn.cursor()
@@ -209,6 +363,19 @@ def _migrate_documents_table_v4(conn: sqlite3.Connection) -> None:
         cursor.execute("ALTER TABLE documents_new RENAME TO documents")
 
 
+def _create_documents_metadata_index_v11(conn: sqlite3.Connection) -> None:
+    """Create the v11 covering index for metadata-only document listing.
+
+    Without it, reading content_hash walks the overflow pages of the
+    preceding content column. Runs after the v4 migration, which adds
+    file_name to older databases.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_metadata "
+        "ON documents(id, file_name, content_hash)"
+    )
+
+
 def _migrate_terms_user_notes_v7(conn: sqlite3.Connection) -> None:
     """Migrate terms_extracted table to v7: add user_notes column."""
     cursor = conn.cursor()
@@ -263,6 +430,156 @@ def _migrate_issues_exclude_columns_v9(conn: sqlite3.Connection) -> None:
         )
 
 
+def _migrate_glossary_occurrences_v10(
+    conn: sqlite3.Connection, table_name: str
+) -> None:
+    """Migrate to v10: move JSON occurrences into the normalized child table.
+
+    Existing rows keep their occurrences; the legacy ``occurrences`` column
+    is dropped afterwards. On SQLite builds without DROP COLUMN support
+    (< 3.35) the column is kept but emptied, and is ignored from then on.
+
+    Args:
+        conn: SQLite database connection.
+        table_name: The glossary table ("glossary_provisional" or "glossary_refined").
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    columns = {row[1] for row in cursor.fetchall()}
+    if "occurrences" not in columns:
+        return
+
+    # Only old databases need this; keep pydantic out of plain schema setup
+    from genglossary.db.models import deserialize_occurrences
+
+    cursor.execute(f"SELECT id, occurrences FROM {table_name}")
+    data = [
+        (row[0], position, occ.document_path, occ.line_number, occ.context)
+        for row in cursor.fetchall()
+        for position, occ in enumerate(deserialize_occurrences(row[1] or "[]"))
+    ]
+    cursor.executemany(
+        f"""
+        INSERT OR IGNORE INTO {table_name}_occurrences
+        (term_id, position, document_path, line_number, context)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        data,
+    )
+
+    try:
+        cursor.execute(f"ALTER TABLE {table_name} DROP COLUMN occurrences")
+    except sqlite3.OperationalError:
+        cursor.execute(f"UPDATE {table_name} SET occurrences = '[]'")
+
+
+def _create_fts_tables_v12(conn: sqlite3.Connection) -> None:
+    """Create v12 full-text search tables and triggers.
+
+    Runs after the other migrations so triggers attach to the final table
+    definitions. Newly created indexes are rebuilt from existing rows;
+    existing ones are left alone, so reopening a database runs no DDL.
+
+    SQLite builds without FTS5 or its trigram tokenizer (< 3.34) get no
+    FTS tables; search_repository then scans with LIKE (see fts_available).
+
+    Args:
+        conn: SQLite database connection.
+    """
+    global _fts_unsupported_logged
+    cursor = conn.cursor()
+    for fts_table, (content_table, columns) in FTS_TABLES.items():
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (fts_table,),
+        )
+        is_new = cursor.fetchone() is None
+        if not is_new:
+            continue
+        try:
+            conn.executescript(_build_fts_sql(fts_table, content_table, columns))
+        except sqlite3.OperationalError as e:
+            if not _fts_unsupported_logged:
+                _fts_unsupported_logged = True
+                logger.warning(
+                    "SQLite %s cannot create FTS5 trigram tables (%s); "
+                    "full-text search falls back to LIKE scans",
+                    sqlite3.sqlite_version,
+                    e,
+                )
+            return
+        cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+
+
+# Log the missing FTS5 support once per process, not on every database open
+_fts_unsupported_logged = False
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    """Check whether the database has its full-text search tables.
+
+    They are missing when the SQLite build that initialized the database
+    lacks FTS5 trigram support.
+
+    Args:
+        conn: SQLite database connection.
+
+    Returns:
+        bool: True if every table in FTS_TABLES exists.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'table' AND name IN ({", ".join("?" for _ in FTS_TABLES)})
+        """,
+        tuple(FTS_TABLES),
+    )
+    return cursor.fetchone()[0] == len(FTS_TABLES)
+
+
+def _create_table_version_triggers_v15(conn: sqlite3.Connection) -> None:
+    """Create v15 change counters and the triggers that bump them.
+
+    Tables added to VERSIONED_TABLES later (v16) get theirs on the next
+    initialization of an existing database.
+
+    Counters start at a random value, so a recreated database does not
+    hand out the ETags of the one it replaced.
+
+    Args:
+        conn: SQLite database connection.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT table_name FROM table_versions")
+    existing = {row[0] for row in cursor.fetchall()}
+    for table in VERSIONED_TABLES:
+        if table in existing:
+            continue
+        bump = (
+            f"UPDATE table_versions SET version = version + 1 "
+            f"WHERE table_name = '{table}';"
+        )
+        conn.executescript(
+            f"""
+CREATE TRIGGER IF NOT EXISTS {table}_version_ai AFTER INSERT ON {table} BEGIN
+    {bump}
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_version_ad AFTER DELETE ON {table} BEGIN
+    {bump}
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_version_au AFTER UPDATE ON {table} BEGIN
+    {bump}
+END;
+"""
+        )
+        # Inserted after the triggers: an existing row means they exist too
+        cursor.execute(
+            "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES (?, ?)",
+            (table, secrets.randbelow(2**31)),
+        )
+
+
 def get_schema_version(conn: sqlite3.Connection) -> int:
     """Get current schema version.
 
@@ -0,0 +1,242 @@
+"""Repository for full-text search over the FTS5 indexes.
+
+Databases initialized by a SQLite build without FTS5 trigram support have
+no FTS tables; every search then scans the content tables with LIKE.
+"""
+
+import sqlite3
+from collections.abc import Sequence
+from typing import TypedDict
+
+from genglossary.db.schema import FTS_TABLES, fts_available
+
+# Search source name -> (FTS table, title column)
+SEARCH_SOURCES: dict[str, tuple[str, str]] = {
+    "documents": ("documents_fts", "file_name"),
+    "terms": ("terms_extracted_fts", "term_text"),
+    "provisional": ("glossary_provisional_fts", "term_name"),
+    "refined": ("glossary_refined_fts", "term_name"),
+}
+
+# The trigram tokenizer can only use the index for tokens of 3+ characters
+MIN_INDEXED_LENGTH = 3
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+
+# Snippet length: FTS5 tokens (trigrams, ~1 char each) / chars per side
+SNIPPET_TOKENS = 48
+SNIPPET_CONTEXT_CHARS = 24
+
+
+class SearchHitRow(TypedDict):
+    """A single full-text search hit."""
+
+    source: str
+    id: int
+    title: str
+    snippet: str
+    rank: float
+
+
+def _split_query(query: str) -> list[str]:
+    """Split a user query into whitespace-separated search tokens."""
+    return query.split()
+
+
+def _match_expression(tokens: Sequence[str]) -> str:
+    """Build an FTS5 MATCH expression requiring every token as a phrase.
+
+    Quoting each token disables FTS5 query syntax in user input.
+    """
+    return " AND ".join('"' + token.replace('"', '""') + '"' for token in tokens)
+
+
+def _escape_like(token: str) -> str:
+    """Escape LIKE wildcards in a token (escape character is backslash)."""
+    return token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _make_snippet(text: str, token: str) -> str:
+    """Build a highlighted snippet around the first match of token in text.
+
+    Used for short queries the trigram index cannot serve, where FTS5's
+    snippet() is unavailable.
+    """
+    pos = text.lower().find(token.lower())
+    if pos < 0:
+        return text[: SNIPPET_CONTEXT_CHARS * 2]
+    start = max(0, pos - SNIPPET_CONTEXT_CHARS)
+    end = min(len(text), pos + len(token) + SNIPPET_CONTEXT_CHARS)
+    return (
+        (SNIPPET_ELLIPSIS if start > 0 else "")
+        + text[start:pos]
+        + SNIPPET_START
+        + text[pos : pos + len(token)]
+        + SNIPPET_END
+        + text[pos + len(token) : end]
+        + (SNIPPET_ELLIPSIS if end < len(text) else "")
+    )
+
+
+def _search_source(
+    conn: sqlite3.Connection,
+    source: str,
+    tokens: list[str],
+    limit: int,
+    use_fts: bool,
+) -> list[SearchHitRow]:
+    """Search a single source.
+
+    Args:
+        conn: Project database connection.
+        source: Source name (key of SEARCH_SOURCES).
+        tokens: Non-empty list of search tokens.
+        limit: Maximum number of hits.
+        use_fts: Whether the database has its FTS tables.
+
+    Returns:
+        list[SearchHitRow]: Hits ordered by relevance.
+    """
+    fts_table, title_column = SEARCH_SOURCES[source]
+    cursor = conn.cursor()
+
+    if use_fts and all(len(token) >= MIN_INDEXED_LENGTH for token in tokens):
+        cursor.execute(
+            f"""
+            SELECT rowid AS id, {title_column} AS title,
+                   snippet({fts_table}, -1, ?, ?, ?, {SNIPPET_TOKENS}) AS snippet,
+                   rank
+            FROM {fts_table}
+            WHERE {fts_table} MATCH ?
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (
+                SNIPPET_START,
+                SNIPPET_END,
+                SNIPPET_ELLIPSIS,
+                _match_expression(tokens),
+                limit,
+            ),
+        )
+        return [
+            SearchHitRow(
+                source=source,
+                id=row["id"],
+                title=row["title"],
+                snippet=row["snippet"],
+                rank=row["rank"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    # Short tokens or no FTS: fall back to a LIKE scan over the indexed
+    # columns of the content table (rowid = id, as in the FTS index)
+    content_table, columns = FTS_TABLES[fts_table]
+    any_column = "(" + " OR ".join(f"{c} LIKE ? ESCAPE '\\'" for c in columns) + ")"
+    params = [
+        f"%{_escape_like(token)}%" for token in tokens for _ in columns
+    ]
+    cursor.execute(
+        f"""
+        SELECT rowid AS id, {title_column} AS title, {", ".join(columns)}
+        FROM {content_table}
+        WHERE {" AND ".join(any_column for _ in tokens)}
+        ORDER BY rowid
+        LIMIT ?
+        """,
+        (*params, limit),
+    )
+    hits: list[SearchHitRow] = []
+    for row in cursor.fetchall():
+        # Highlight the first token in the first column that contains it
+        text = next(
+            (row[c] for c in columns if tokens[0].lower() in row[c].lower()),
+            row[columns[-1]],
+        )
+        hits.append(
+            SearchHitRow(
+                source=source,
+                id=row["id"],
+                title=row["title"],
+                snippet=_make_snippet(text, tokens[0]),
+                rank=0.0,
+            )
+        )
+    return hits
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    sources: Sequence[str] | None = None,
+    limit: int = 20,
+) -> list[SearchHitRow]:
+    """Full-text search over documents and glossary tables.
+
+    Every whitespace-separated token in the query must match (substring
+    semantics, case-insensitive for ASCII). Tokens shorter than three
+    characters cannot use the trigram index and fall back to a scan, as
+    does every query on a database without FTS tables.
+
+    Args:
+        conn: Project database connection.
+        query: Search query.
+        sources: Sources to search (keys of SEARCH_SOURCES). All if None.
+        limit: Maximum number of hits per source.
+
+    Returns:
+        list[SearchHitRow]: Hits grouped by source, each ordered by relevance.
+
+    Raises:
+        ValueError: If an unknown source is requested.
+    """
+    selected = list(sources) if sources else list(SEARCH_SOURCES)
+    unknown = [s for s in selected if s not in SEARCH_SOURCES]
+    if unknown:
+        raise ValueError(f"Unknown search source: {', '.join(unknown)}")
+
+    tokens = _split_query(query)
+    if not tokens:
+        return []
+
+    use_fts = fts_available(conn)
+    hits: list[SearchHitRow] = []
+    for source in selected:
+        hits.extend(_search_source(conn, source, tokens, limit, use_fts))
+    return hits
+
+
+def find_document_names(conn: sqlite3.Connection, terms: Sequence[str]) -> set[str]:
+    """Find the names of documents containing any of the given terms.
+
+    Used to narrow context retrieval to candidate documents before the
+    exact, line-level matching done in Python.
+
+    Args:
+        conn: Project database connection.
+        terms: Terms to look for (substring match).
+
+    Returns:
+        set[str]: file_name of every document containing at least one term.
+    """
+    use_fts = fts_available(conn)
+    cursor = conn.cursor()
+    names: set[str] = set()
+    for term in terms:
+        if not term:
+            continue
+        if use_fts and len(term) >= MIN_INDEXED_LENGTH:
+            cursor.execute(
+                "SELECT file_name FROM documents_fts WHERE documents_fts MATCH ?",
+                ("content : " + _match_expression([term]),),
+            )
+        else:
+            cursor.execute(
+                "SELECT file_name FROM documents WHERE content LIKE ? ESCAPE '\\'",
+                (f"%{_escape_like(term)}%",),
+            )
+        names.update(row["file_name"] for row in cursor.fetchall())
+    return names
@@ -46,3 +46,18 @@ def count_issues(conn: sqlite3.Connection) -> int:
     cursor.execute("SELECT COUNT(*) FROM glossary_issues")
     result = cursor.fetchone()
     return result[0] if result else 0
+
+
+def count_refined_terms(conn: sqlite3.Connection) -> int:
+    """Count the number of refined glossary terms.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        int: Number of refined terms.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM glossary_refined")
+    result = cursor.fetchone()
+    return result[0] if result else 0
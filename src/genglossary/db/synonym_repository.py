@@ -238,6 +238,32 @@ def list_groups(conn: sqlite3.Connection) -> list[SynonymGroup]:
     return groups
 
 
+def get_aliases_map(conn: sqlite3.Connection) -> dict[str, list[str]]:
+    """Map each group's primary term to its other members.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Dict mapping primary_term_text to non-primary member texts (in
+        member order). Groups without other members are omitted.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT g.primary_term_text, m.term_text
+        FROM term_synonym_groups g
+        JOIN term_synonym_members m ON g.id = m.group_id
+        WHERE m.term_text != g.primary_term_text
+        ORDER BY g.id, m.id
+        """
+    )
+    aliases_map: dict[str, list[str]] = {}
+    for row in cursor:
+        aliases_map.setdefault(row["primary_term_text"], []).append(row["term_text"])
+    return aliases_map
+
+
 def get_synonyms_for_term(
     conn: sqlite3.Connection, term_text: str
 ) -> list[str]:
@@ -0,0 +1,30 @@
+"""Repository for the per-table change counters (v15)."""
+
+import sqlite3
+from collections.abc import Sequence
+
+
+def get_table_versions(
+    conn: sqlite3.Connection, tables: Sequence[str]
+) -> dict[str, int]:
+    """Get the change counters of tables.
+
+    Every INSERT, UPDATE and DELETE on a versioned table (see
+    schema.VERSIONED_TABLES) bumps its counter, so equal counters mean
+    unchanged contents. Reading them touches one small index only.
+
+    Args:
+        conn: Database connection.
+        tables: Table names.
+
+    Returns:
+        dict[str, int]: Counter per table; tables without a counter are omitted.
+    """
+    placeholders = ", ".join("?" for _ in tables)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT table_name, version FROM table_versions "
+        f"WHERE table_name IN ({placeholders})",
+        tuple(tables),
+    )
+    return {row["table_name"]: row["version"] for row in cursor.fetchall()}
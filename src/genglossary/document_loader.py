@@ -1,7 +1,18 @@
-"""Document loader for reading documents from files and directories."""
+"""Document loader for reading documents from files and directories.
+
+Directory loads walk the tree with os.scandir, pruning excluded
+directories (e.g. .git) instead of descending into them, and read files
+in a thread pool. scan_directory compares each file's size and mtime
+with a manifest of the previous load, so unchanged files cost one
+stat() and are never read.
+"""
 
 import fnmatch
 import os
+import re
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from genglossary.exceptions import (
@@ -10,6 +21,7 @@ from genglossary.exceptions import (
     PathTraversalError,
 )
 from genglossary.models.document import Document
+from genglossary.utils.hash import compute_content_hash
 from genglossary.utils.path_utils import to_safe_relative_path
 
 # Default patterns for files that should be excluded for security
@@ -28,6 +40,61 @@ DEFAULT_EXCLUDED_PATTERNS = [
 # Default maximum file size (10MB)
 DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# Default number of threads reading files
+DEFAULT_READ_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FileStat:
+    """Size and modification time recorded for a loaded file.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+    """
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """A new or modified file read by scan_directory.
+
+    Attributes:
+        file_name: Relative path from the directory root (POSIX format).
+        content: File content.
+        content_hash: SHA256 of the content.
+        stat: Size and mtime at the time of reading.
+    """
+
+    file_name: str
+    content: str
+    content_hash: str
+    stat: FileStat
+
+
+@dataclass
+class DirectoryScan:
+    """Result of comparing a directory with a manifest.
+
+    Attributes:
+        changed: Files that are new or whose size/mtime differ (read).
+        unchanged: Relative paths whose size and mtime match (not read).
+        removed: Manifest paths that no longer exist or cannot be read.
+    """
+
+    changed: list[ScannedFile]
+    unchanged: list[str]
+    removed: list[str]
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    path: Path
+    file_name: str
+    stat: FileStat
+
 
 class DocumentLoader:
     """Loads documents from files and directories.
@@ -37,6 +104,7 @@ class DocumentLoader:
         max_file_size: Maximum file size in bytes (None for unlimited).
         excluded_patterns: List of glob patterns for excluded files.
         validate_path: Whether to validate paths to prevent directory traversal.
+        max_workers: Number of threads reading files in directory loads.
     """
 
     def __init__(
@@ -45,6 +113,7 @@ class DocumentLoader:
         max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
         excluded_patterns: list[str] | None = None,
         validate_path: bool = True,
+        max_workers: int = DEFAULT_READ_WORKERS,
     ) -> None:
         """Initialize the DocumentLoader.
 
@@ -58,6 +127,8 @@ class DocumentLoader:
                 Set to [] to disable exclusion.
             validate_path: Whether to validate paths to prevent directory
                 traversal attacks. Defaults to True.
+            max_workers: Number of threads reading files in directory
+                loads. Defaults to 8.
         """
         self.supported_extensions = supported_extensions or [".txt", ".md"]
         self.max_file_size = max_file_size
@@ -66,6 +137,39 @@ class DocumentLoader:
             else DEFAULT_EXCLUDED_PATTERNS
         )
         self.validate_path = validate_path
+        self.max_workers = max_workers
+        self._excluded_key: tuple[str, ...] | None = None
+        self._excluded_regex: re.Pattern[str] | None = None
+
+    def _excluded_matcher(self) -> re.Pattern[str] | None:
+        """Compile all exclusion patterns into one regex (cached).
+
+        Recompiled only when excluded_patterns changes.
+
+        Returns:
+            The compiled matcher, or None if there are no patterns.
+        """
+        key = tuple(self.excluded_patterns)
+        if key != self._excluded_key:
+            self._excluded_key = key
+            self._excluded_regex = (
+                re.compile(
+                    "|".join(
+                        f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in key
+                    )
+                )
+                if key
+                else None
+            )
+        return self._excluded_regex
+
+    def _match_excluded(self, name: str) -> str | None:
+        """Return the first exclusion pattern matching a single path part."""
+        matcher = self._excluded_matcher()
+        if matcher is None or not matcher.match(os.path.normcase(name)):
+            return None
+        # Rare path: find which pattern matched, for error messages
+        return next(p for p in self.excluded_patterns if fnmatch.fnmatch(name, p))
 
     def _is_excluded(self, file_path: Path, base_path: Path | None = None) -> str | None:
         """Check if a file or any of its parent directories matches exclusion pattern.
@@ -81,19 +185,18 @@ class DocumentLoader:
             The matching pattern if excluded, None otherwise.
         """
         # Check filename
-        filename = file_path.name
-        for pattern in self.excluded_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return pattern
+        matched = self._match_excluded(file_path.name)
+        if matched:
+            return matched
 
         # Check path components (for excluding entire directories like .git/)
         if base_path:
             try:
                 relative_path = file_path.resolve().relative_to(base_path.resolve())
                 for part in relative_path.parts:
-                    for pattern in self.excluded_patterns:
-                        if fnmatch.fnmatch(part, pattern):
-                            return pattern
+                    matched = self._match_excluded(part)
+                    if matched:
+                        return matched
             except ValueError:
                 pass
 
@@ -215,6 +318,7 @@ class DocumentLoader:
         directory root to prevent absolute path leakage to external services.
         Files that resolve outside the directory (e.g., symlinks pointing
         outside) are silently skipped regardless of the validate_path setting.
+        Files are read by a pool of max_workers threads.
 
         Args:
             path: The path to the directory.
@@ -229,52 +333,176 @@ class DocumentLoader:
             PathTraversalError: If any file attempts to escape the directory
                 (when validate_path is True).
         """
-        dir_path = Path(path)
+        candidates = list(self._iter_candidates(path, recursive))
+        contents = self._map_files(self._read_text, candidates)
+        return [
+            Document(file_path=candidate.file_name, content=content)
+            for candidate, content in zip(candidates, contents)
+            if content is not None
+        ]
+
+    def scan_directory(
+        self,
+        path: str,
+        manifest: Mapping[str, FileStat],
+        recursive: bool = True,
+    ) -> DirectoryScan:
+        """Compare a directory with the manifest of a previous load.
 
-        if not dir_path.exists():
-            raise FileNotFoundError(f"Directory not found: {path}")
+        Files whose size and mtime match the manifest are reported as
+        unchanged without being read. New and modified files are read and
+        hashed in the thread pool. Applies the same filters as
+        load_directory.
 
-        if not dir_path.is_dir():
-            raise NotADirectoryError(f"Path is not a directory: {path}")
+        Args:
+            path: The path to the directory.
+            manifest: FileStat per relative path from the previous load.
+            recursive: Whether to search subdirectories recursively.
 
-        documents: list[Document] = []
+        Returns:
+            DirectoryScan: Changed, unchanged and removed files.
 
-        files = dir_path.rglob("*") if recursive else dir_path.glob("*")
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            NotADirectoryError: If the path is not a directory.
+            PathTraversalError: If any file attempts to escape the directory
+                (when validate_path is True).
+        """
+        unchanged: list[str] = []
+        to_read: list[_Candidate] = []
+        for candidate in self._iter_candidates(path, recursive):
+            if manifest.get(candidate.file_name) == candidate.stat:
+                unchanged.append(candidate.file_name)
+            else:
+                to_read.append(candidate)
+
+        changed = [
+            ScannedFile(
+                file_name=candidate.file_name,
+                content=content,
+                content_hash=compute_content_hash(content),
+                stat=candidate.stat,
+            )
+            for candidate, content in zip(
+                to_read, self._map_files(self._read_text, to_read)
+            )
+            if content is not None
+        ]
+        present = set(unchanged) | {scanned.file_name for scanned in changed}
+        removed = [file_name for file_name in manifest if file_name not in present]
+        return DirectoryScan(changed=changed, unchanged=unchanged, removed=removed)
 
-        for file_path in files:
-            if not file_path.is_file():
-                continue
+    def _iter_candidates(self, path: str, recursive: bool) -> Iterator[_Candidate]:
+        """Walk a directory and yield the files to load.
 
-            if file_path.suffix not in self.supported_extensions:
-                continue
+        Order is deterministic: each directory's files in name order, then
+        its subdirectories in name order.
 
-            # Skip excluded or oversized files silently
-            if self._is_excluded(file_path, dir_path):
-                continue
+        Excluded directories are pruned without being listed. Each
+        supported file costs one stat() call; symlinks are additionally
+        resolved and checked against the directory root.
 
-            if self._exceeds_file_size(file_path):
-                continue
+        Args:
+            path: The path to the directory.
+            recursive: Whether to descend into subdirectories.
 
-            self._validate_path_in_directory(file_path, dir_path)
+        Yields:
+            _Candidate: Path, relative file name and stat of each file.
 
-            # Convert to relative path first to prevent privacy leaks
-            # when file paths are sent to external LLM services
-            try:
-                relative_path = to_safe_relative_path(file_path, dir_path)
-            except ValueError:
-                # Skip files outside the directory (e.g., symlinks pointing outside)
-                continue
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            NotADirectoryError: If the path is not a directory.
+            PathTraversalError: If a symlink escapes the directory
+                (when validate_path is True).
+        """
+        dir_path = Path(path)
 
+        if not dir_path.exists():
+            raise FileNotFoundError(f"Directory not found: {path}")
+
+        if not dir_path.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {path}")
+
+        root = Path(os.path.realpath(dir_path))
+        seen: set[str] = set()
+        visited_dirs = {str(root)}
+        # (directory, relative prefix, reached through a symlink)
+        stack: list[tuple[Path, str, bool]] = [(dir_path, "", False)]
+        while stack:
+            directory, prefix, via_link = stack.pop()
             try:
-                content = file_path.read_text(encoding="utf-8")
-                documents.append(
-                    Document(file_path=relative_path, content=content)
-                )
-            except (OSError, UnicodeDecodeError):
-                # Skip files that can't be read
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
                 continue
 
-        return documents
+            subdirs: list[tuple[Path, str, bool]] = []
+            for entry in entries:
+                if self._match_excluded(entry.name):
+                    continue
+                entry_path = Path(entry.path)
+                linked = via_link or entry.is_symlink()
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if not recursive:
+                        continue
+                    if linked:
+                        # Guard against symlink cycles
+                        real_dir = os.path.realpath(entry_path)
+                        if real_dir in visited_dirs:
+                            continue
+                        visited_dirs.add(real_dir)
+                    subdirs.append((entry_path, f"{prefix}{entry.name}/", linked))
+                    continue
+
+                if not is_file or entry_path.suffix not in self.supported_extensions:
+                    continue
+
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if self.max_file_size is not None and st.st_size > self.max_file_size:
+                    continue
+
+                file_name = f"{prefix}{entry.name}"
+                if linked:
+                    # Convert to the real relative path; this also rejects
+                    # links pointing outside the directory
+                    self._validate_path_in_directory(entry_path, root)
+                    try:
+                        file_name = to_safe_relative_path(entry_path, root)
+                    except ValueError:
+                        continue
+
+                if file_name in seen:
+                    continue
+                seen.add(file_name)
+                yield _Candidate(entry_path, file_name, FileStat(st.st_size, st.st_mtime_ns))
+
+            # Pop subdirectories in name order
+            stack.extend(reversed(subdirs))
+
+    def _map_files(self, read, candidates: list[_Candidate]) -> list:
+        """Apply read to each candidate, in the thread pool when worthwhile."""
+        if self.max_workers <= 1 or len(candidates) < 2:
+            return [read(candidate) for candidate in candidates]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(read, candidates))
+
+    @staticmethod
+    def _read_text(candidate: _Candidate) -> str | None:
+        """Read a file as UTF-8, or None if it cannot be read."""
+        try:
+            return candidate.path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Skip files that can't be read
+            return None
 
     def load_documents(
         self,
@@ -0,0 +1,201 @@
+"""Project-scoped change events for the API event stream."""
+
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any
+
+from genglossary.db.connection import database_connection
+from genglossary.db.runs_repository import get_current_or_latest_run
+from genglossary.db.schema import initialize_db
+from genglossary.db.table_version_repository import get_table_versions
+
+logger = logging.getLogger(__name__)
+
+# Table -> API resources whose responses it affects. Synonym groups also
+# change the aliases listed by the provisional and refined glossaries.
+TABLE_RESOURCES: dict[str, tuple[str, ...]] = {
+    "documents": ("files",),
+    "terms_extracted": ("terms",),
+    "terms_excluded": ("excluded_terms",),
+    "terms_required": ("required_terms",),
+    "glossary_provisional": ("provisional",),
+    "glossary_issues": ("issues",),
+    "glossary_refined": ("refined",),
+    "term_synonym_groups": ("synonym_groups", "provisional", "refined"),
+    "term_synonym_members": ("synonym_groups", "provisional", "refined"),
+}
+
+_WATCHED_TABLES: tuple[str, ...] = (*TABLE_RESOURCES, "runs")
+
+
+@dataclass(frozen=True)
+class ProjectEvent:
+    """A change in a project.
+
+    Attributes:
+        event: "run" (a run started or changed status), "progress" (the
+            current run's progress changed), "invalidate" (resources
+            changed) or "resync" (events were dropped; refetch everything).
+        data: The run row for run/progress, {"resources": [...]} for
+            invalidate, and {} for resync.
+    """
+
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class ProjectEventHub:
+    """Publishes a project's changes to event stream subscribers.
+
+    One watcher thread per project polls the table change counters
+    (schema v15) while at least one subscriber is connected, and turns
+    counter changes into events. Writes are seen no matter where they
+    come from: API requests, the run thread or a CLI in another process.
+    Reading the counters touches one small table, so the cost does not
+    depend on the number of subscribers or the size of the data.
+
+    Thread-safe: a single instance is shared by all requests for a project.
+    """
+
+    DEFAULT_POLL_INTERVAL = 0.25
+
+    # Events kept per subscriber before it is told to resync
+    MAX_QUEUE_SIZE = 256
+
+    def __init__(self, db_path: str, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize the hub.
+
+        Args:
+            db_path: Path to the project database.
+            poll_interval: Seconds between counter checks.
+        """
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self._lock = Lock()
+        self._subscribers: set[Queue] = set()
+        self._thread: Thread | None = None
+        self._stop = Event()
+        self._versions: dict[str, int] | None = None
+        self._run_state: tuple[int, str] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self) -> Queue:
+        """Register a subscriber, starting the watcher if needed.
+
+        Returns:
+            Queue: Receives ProjectEvent objects.
+        """
+        queue: Queue = Queue(maxsize=self.MAX_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(queue)
+            # Also keeps a watcher that is about to stop running
+            self._stop.clear()
+            if self._thread is None:
+                self._start_watcher()
+        return queue
+
+    def unsubscribe(self, queue: Queue) -> None:
+        """Unregister a subscriber. The watcher stops with the last one.
+
+        Args:
+            queue: Queue returned by subscribe.
+        """
+        with self._lock:
+            self._subscribers.discard(queue)
+            if not self._subscribers:
+                self._stop.set()
+
+    def poll(self, conn: sqlite3.Connection) -> list[ProjectEvent]:
+        """Check the change counters and return the events since the last check.
+
+        The first call only records the current state.
+
+        Args:
+            conn: Project database connection.
+
+        Returns:
+            list[ProjectEvent]: Events in publishing order.
+        """
+        versions = get_table_versions(conn, _WATCHED_TABLES)
+        previous, self._versions = self._versions, versions
+        if previous is None:
+            row = get_current_or_latest_run(conn)
+            self._run_state = None if row is None else (row["id"], row["status"])
+            return []
+
+        changed = {
+            table for table, version in versions.items() if previous.get(table) != version
+        }
+        events: list[ProjectEvent] = []
+        if "runs" in changed:
+            row = get_current_or_latest_run(conn)
+            if row is not None:
+                state = (row["id"], row["status"])
+                kind = "progress" if state == self._run_state else "run"
+                self._run_state = state
+                events.append(ProjectEvent(kind, dict(row)))
+        resources = sorted(
+            {resource for table in changed for resource in TABLE_RESOURCES.get(table, ())}
+        )
+        if resources:
+            events.append(ProjectEvent("invalidate", {"resources": resources}))
+        return events
+
+    def publish(self, event: ProjectEvent) -> None:
+        """Send an event to every subscriber.
+
+        A subscriber whose queue is full gets its queue replaced by a single
+        resync event, so it never silently misses a change.
+
+        Args:
+            event: The event.
+        """
+        with self._lock:
+            for queue in self._subscribers:
+                try:
+                    queue.put_nowait(event)
+                except Full:
+                    while True:
+                        try:
+                            queue.get_nowait()
+                        except Empty:
+                            break
+                    queue.put_nowait(ProjectEvent("resync"))
+
+    def _start_watcher(self) -> None:
+        self._thread = Thread(target=self._watch, name="project-events", daemon=True)
+        self._thread.start()
+
+    def _watch(self) -> None:
+        restart = False
+        try:
+            with database_connection(self.db_path) as conn:
+                initialize_db(conn)
+                conn.commit()
+                while not self._stop.is_set():
+                    try:
+                        events = self.poll(conn)
+                    except sqlite3.Error:
+                        logger.debug("Polling project changes failed", exc_info=True)
+                        events = []
+                    for event in events:
+                        self.publish(event)
+                    self._stop.wait(self.poll_interval)
+            restart = True
+        except Exception:
+            logger.warning("Project event watcher stopped", exc_info=True)
+        finally:
+            with self._lock:
+                self._thread = None
+                self._versions = None
+                # A subscriber arrived after the loop ended
+                if restart and self._subscribers and not self._stop.is_set():
+                    self._start_watcher()
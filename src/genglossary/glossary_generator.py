@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Callable
 from threading import Event
 from typing import TypeGuard, cast
 
@@ -15,10 +16,10 @@ from genglossary.models.glossary import Glossary
 from genglossary.models.synonym import SynonymGroup
 from genglossary.synonym_utils import build_non_primary_set, build_synonym_lookup
 from genglossary.models.term import ClassifiedTerm, Term, TermCategory, TermOccurrence
-from genglossary.types import ProgressCallback, TermProgressCallback
+from genglossary.types import DocumentSearch, ProgressCallback, TermProgressCallback
 from genglossary.utils.callback import safe_callback
 from genglossary.utils.prompt_escape import escape_prompt_content, wrap_user_data
-from genglossary.utils.text import contains_cjk
+from genglossary.utils.text import compile_term_pattern
 
 
 class DefinitionResponse(BaseModel):
@@ -61,13 +62,21 @@ class GlossaryGenerator:
 Output:
 {"definition": "エデルト王国の辺境、アソリウス島を守る騎士団。魔神討伐の最前線として重要な役割を担う。", "confidence": 0.9}"""
 
-    def __init__(self, llm_client: BaseLLMClient) -> None:
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        document_search: DocumentSearch | None = None,
+    ) -> None:
         """Initialize the GlossaryGenerator.
 
         Args:
             llm_client: The LLM client to use for definition generation.
+            document_search: Optional full-text search used to skip documents
+                that cannot contain a term. Must return the file_path of every
+                document containing any of the given terms.
         """
         self.llm_client = llm_client
+        self.document_search = document_search
 
     def generate(
         self,
@@ -79,6 +88,7 @@ Output:
         cancel_event: Event | None = None,
         user_notes_map: dict[str, str] | None = None,
         synonym_groups: list[SynonymGroup] | None = None,
+        term_callback: Callable[[Term], None] | None = None,
     ) -> Glossary:
         """Generate a provisional glossary.
 
@@ -94,6 +104,9 @@ Output:
                 Receives (current, total, term_name) where current is 1-indexed.
             cancel_event: Optional threading.Event for cancellation. If set, processing
                 stops and returns the partial glossary built so far.
+            term_callback: Optional callback called with each Term as soon as
+                its definition is generated (before the progress callbacks).
+                Lets later pipeline stages start before generation finishes.
 
         Returns:
             A Glossary object with terms and their definitions.
@@ -168,6 +181,9 @@ Output:
                     exc_info=True,
                 )
                 continue
+            else:
+                if term_callback is not None:
+                    term_callback(term)
             finally:
                 # Call progress callbacks (guarded to prevent pipeline interruption)
                 safe_callback(progress_callback, idx, total_terms)
@@ -221,13 +237,7 @@ Output:
         Returns:
             Compiled regex pattern.
         """
-        escaped_term = re.escape(term)
-
-        if contains_cjk(term):
-            return re.compile(escaped_term)
-
-        # For ASCII terms, match if not preceded/followed by ASCII word characters
-        return re.compile(rf"(?<![a-zA-Z0-9_]){escaped_term}(?![a-zA-Z0-9_])")
+        return compile_term_pattern(term)
 
     def _create_occurrence(
         self, doc: Document, line_num: int
@@ -273,6 +283,10 @@ Output:
         occurrences: list[TermOccurrence] = []
         seen_locations: set[tuple[str, int]] = set()
 
+        if self.document_search is not None:
+            candidates = self.document_search(search_terms)
+            documents = [doc for doc in documents if doc.file_path in candidates]
+
         for doc in documents:
             for line_num, line in enumerate(doc.lines, start=1):
                 for pattern in patterns:
@@ -1,8 +1,9 @@
 """Glossary refiner - Step 4: Refine glossary based on issues using LLM."""
 
 import logging
-import re
-from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, SimpleQueue
 from threading import Event
 
 from pydantic import BaseModel
@@ -15,8 +16,9 @@ from genglossary.models.glossary import Glossary, GlossaryIssue
 from genglossary.models.synonym import SynonymGroup
 from genglossary.synonym_utils import get_synonyms_for_primary
 from genglossary.models.term import Term
-from genglossary.types import ProgressCallback, TermProgressCallback
+from genglossary.types import DocumentSearch, ProgressCallback, TermProgressCallback
 from genglossary.utils.callback import safe_callback
+from genglossary.utils.ngram_index import NgramIndex
 from genglossary.utils.prompt_escape import wrap_user_data
 
 
@@ -34,13 +36,36 @@ class GlossaryRefiner:
     refining term definitions based on issues identified during review.
     """
 
-    def __init__(self, llm_client: BaseLLMClient) -> None:
+    # Maximum number of document lines included as additional context
+    MAX_CONTEXT_LINES = 5
+
+    # How often to re-check cancel_event while waiting on in-flight terms
+    CANCEL_POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        document_search: DocumentSearch | None = None,
+        max_concurrency: int = 1,
+    ) -> None:
         """Initialize the GlossaryRefiner.
 
         Args:
             llm_client: The LLM client to use for refinement.
+            document_search: Optional full-text search used to index only the
+                documents that mention a term under review. Must return the
+                file_path of every document containing any of the given terms.
+            max_concurrency: Maximum number of terms refined at once.
+                Defaults to 1 (sequential).
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.llm_client = llm_client
+        self.document_search = document_search
+        self.max_concurrency = max_concurrency
 
     def refine(
         self,
@@ -52,6 +77,7 @@ class GlossaryRefiner:
         cancel_event: Event | None = None,
         user_notes_map: dict[str, str] | None = None,
         synonym_groups: list[SynonymGroup] | None = None,
+        context_index: NgramIndex | None = None,
     ) -> Glossary:
         """Refine the glossary based on identified issues.
 
@@ -65,6 +91,9 @@ class GlossaryRefiner:
                 Receives (current, total, term_name) where current is 1-indexed.
             cancel_event: Optional threading.Event for cancellation. If set, processing
                 stops and returns the glossary as refined so far.
+            context_index: Optional prebuilt index (see build_context_index).
+                When given, documents are not searched or indexed again,
+                which lets callers refining in small pieces share one index.
 
         Returns:
             A refined Glossary object.
@@ -104,58 +133,189 @@ class GlossaryRefiner:
             return refined_glossary
 
         # Build context index once for all issues
-        context_index = self._build_context_index(documents)
-        resolved_count = 0
-
+        if context_index is None:
+            if self.document_search is not None:
+                candidates = self.document_search(
+                    list({issue.term_name for issue in refine_issues})
+                )
+                documents = [doc for doc in documents if doc.file_path in candidates]
+            context_index = self.build_context_index(documents)
         total_issues = len(refine_issues)
-        for idx, issue in enumerate(refine_issues, start=1):
+
+        def resolve(term: Term, issue: GlossaryIssue) -> Term:
+            notes = (user_notes_map or {}).get(issue.term_name, "")
+            return self._resolve_issue(
+                term, issue, context_index, notes,
+                synonym_groups=synonym_groups,
+            )
+
+        def report(current: int, term_name: str) -> None:
+            # Call progress callbacks (guarded to prevent pipeline interruption)
+            safe_callback(progress_callback, current, total_issues)
+            safe_callback(term_progress_callback, current, total_issues, term_name)
+
+        if self.max_concurrency > 1:
+            resolved_count = self._refine_concurrently(
+                refined_glossary, refine_issues, resolve, report, cancel_event
+            )
+        else:
+            resolved_count = self._refine_sequentially(
+                refined_glossary, refine_issues, resolve, report, cancel_event
+            )
+
+        refined_glossary.metadata["resolved_issues"] = resolved_count
+        return refined_glossary
+
+    def _refine_sequentially(
+        self,
+        glossary: Glossary,
+        issues: list[GlossaryIssue],
+        resolve: Callable[[Term, GlossaryIssue], Term],
+        report: Callable[[int, str], None],
+        cancel_event: Event | None,
+    ) -> int:
+        """Resolve issues one at a time, updating glossary in place.
+
+        Returns:
+            Number of issues resolved.
+        """
+        resolved_count = 0
+        for idx, issue in enumerate(issues, start=1):
             # Check for cancellation before processing each issue
             if cancel_event is not None and cancel_event.is_set():
                 break
 
-            term = refined_glossary.get_term(issue.term_name)
+            term = glossary.get_term(issue.term_name)
 
             try:
                 if term is None:
                     continue
 
-                notes = (user_notes_map or {}).get(issue.term_name, "")
-                refined_term = self._resolve_issue(
-                    term, issue, context_index, notes,
-                    synonym_groups=synonym_groups,
-                )
-                refined_glossary.terms[issue.term_name] = refined_term
+                glossary.terms[issue.term_name] = resolve(term, issue)
                 resolved_count += 1
             except Exception as e:
-                logger.warning(
-                    "Failed to refine '%s': %s",
-                    issue.term_name,
-                    e,
-                    exc_info=True,
-                )
+                self._log_failure(issue, e)
             finally:
-                # Call progress callbacks (guarded to prevent pipeline interruption)
-                safe_callback(progress_callback, idx, total_issues)
-                safe_callback(term_progress_callback, idx, total_issues, issue.term_name)
+                report(idx, issue.term_name)
 
-        refined_glossary.metadata["resolved_issues"] = resolved_count
-        return refined_glossary
+        return resolved_count
+
+    def _refine_concurrently(
+        self,
+        glossary: Glossary,
+        issues: list[GlossaryIssue],
+        resolve: Callable[[Term, GlossaryIssue], Term],
+        report: Callable[[int, str], None],
+        cancel_event: Event | None,
+    ) -> int:
+        """Resolve issues for different terms in parallel.
+
+        Issues are grouped by term. Groups run on up to max_concurrency
+        worker threads; issues within a group are resolved in order, each
+        starting from the previous refinement, as in sequential mode. The
+        glossary is only updated and progress only reported on the calling
+        thread, one issue at a time.
+
+        On cancellation no further groups or issues are started and the
+        method returns without waiting for in-flight LLM calls, whose
+        results are discarded.
+
+        Returns:
+            Number of issues resolved.
+        """
+        groups: dict[str, list[GlossaryIssue]] = {}
+        for issue in issues:
+            groups.setdefault(issue.term_name, []).append(issue)
+        waiting = iter(groups.items())
+
+        # (issue, refined term or None if skipped/failed), in completion order
+        events: SimpleQueue[tuple[GlossaryIssue, Term | None]] = SimpleQueue()
+
+        def resolve_group(term: Term | None, group: list[GlossaryIssue]) -> None:
+            for issue in group:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                refined: Term | None = None
+                if term is not None:
+                    try:
+                        refined = resolve(term, issue)
+                        term = refined
+                    except Exception as e:
+                        self._log_failure(issue, e)
+                events.put((issue, refined))
 
-    def _build_context_index(
-        self, documents: list[Document]
-    ) -> dict[str, list[str]]:
-        """Build an index mapping normalized terms to their context lines.
+        resolved_count = 0
+        processed = 0
+        pending: set[Future[None]] = set()
+        exhausted = False
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="refine"
+        )
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_concurrency:
+                    if cancel_event is not None and cancel_event.is_set():
+                        return resolved_count
+                    next_group = next(waiting, None)
+                    if next_group is None:
+                        exhausted = True
+                        break
+                    term_name, group = next_group
+                    pending.add(
+                        pool.submit(resolve_group, glossary.get_term(term_name), group)
+                    )
+
+                if exhausted and not pending and events.empty():
+                    return resolved_count
+
+                try:
+                    issue, refined = events.get(
+                        timeout=self.CANCEL_POLL_INTERVAL_SECONDS
+                    )
+                except Empty:
+                    pass
+                else:
+                    processed += 1
+                    if refined is not None:
+                        glossary.terms[issue.term_name] = refined
+                        resolved_count += 1
+                    report(processed, issue.term_name)
+
+                if cancel_event is not None and cancel_event.is_set():
+                    return resolved_count
+
+                # A finished group has already queued all of its events
+                for future in [f for f in pending if f.done()]:
+                    pending.discard(future)
+                    future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _log_failure(issue: GlossaryIssue, error: Exception) -> None:
+        """Log a failed refinement and continue with the remaining issues."""
+        logger.warning(
+            "Failed to refine '%s': %s",
+            issue.term_name,
+            error,
+            exc_info=True,
+        )
+
+    def build_context_index(self, documents: list[Document]) -> NgramIndex:
+        """Build an n-gram index over all non-empty document lines.
 
         This method processes all documents once to create a searchable index,
         avoiding O(n²) complexity when looking up contexts for multiple terms.
+        Character n-grams work for Japanese text, which has no spaces between
+        words.
 
         Args:
             documents: List of documents to index.
 
         Returns:
-            Dictionary mapping normalized term names to their context lines.
+            NgramIndex mapping lines to their formatted context.
         """
-        index: dict[str, list[str]] = defaultdict(list)
+        index = NgramIndex()
 
         for doc in documents:
             for line_num, line in enumerate(doc.lines, start=1):
@@ -164,12 +324,7 @@ class GlossaryRefiner:
                     continue
 
                 # Store context with location for later retrieval
-                context = f"- [{doc.file_path}:{line_num}] {line_stripped}"
-
-                # Index by words in the line (normalized to lowercase)
-                words = re.findall(r"\w+", line_stripped)
-                for word in words:
-                    index[word.lower()].append(context)
+                index.add(line_stripped, f"- [{doc.file_path}:{line_num}] {line_stripped}")
 
         return index
 
@@ -177,7 +332,7 @@ class GlossaryRefiner:
         self,
         term: Term,
         issue: GlossaryIssue,
-        context_index: dict[str, list[str]],
+        context_index: NgramIndex,
         user_notes: str = "",
         synonym_groups: list[SynonymGroup] | None = None,
     ) -> Term:
@@ -210,7 +365,7 @@ class GlossaryRefiner:
         self,
         term: Term,
         issue: GlossaryIssue,
-        context_index: dict[str, list[str]],
+        context_index: NgramIndex,
         user_notes: str = "",
         synonym_groups: list[SynonymGroup] | None = None,
     ) -> str:
@@ -284,31 +439,18 @@ class GlossaryRefiner:
 JSON形式で回答してください:
 {{"refined_definition": "改善された定義", "confidence": 0.0-1.0}}"""
 
-    def _extract_context(
-        self, term_name: str, context_index: dict[str, list[str]]
-    ) -> str:
+    def _extract_context(self, term_name: str, context_index: NgramIndex) -> str:
         """Extract relevant context for a term from the pre-built index.
 
         Args:
             term_name: The term to find context for.
-            context_index: Pre-built index of term contexts.
+            context_index: Pre-built index of document lines.
 
         Returns:
             Formatted context string.
         """
-        matching_contexts: list[str] = []
-
-        # Check each word in the term name
-        term_words = re.findall(r"\w+", term_name)
-        for word in term_words:
-            word_lower = word.lower()
-            if word_lower in context_index:
-                for context in context_index[word_lower]:
-                    # Verify the full term appears in the context
-                    if re.search(re.escape(term_name), context, re.IGNORECASE):
-                        if context not in matching_contexts:
-                            matching_contexts.append(context)
+        matching_contexts = context_index.search(term_name, limit=self.MAX_CONTEXT_LINES)
 
         if matching_contexts:
-            return "\n".join(matching_contexts[:5])
+            return "\n".join(matching_contexts)
         return "(追加のコンテキストはありません)"
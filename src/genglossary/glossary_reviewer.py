@@ -2,14 +2,17 @@
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from threading import Event
 from typing import Any
 
 from pydantic import BaseModel, ValidationError
 
 from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.batching import TokenBudgetBatcher
 from genglossary.models.glossary import Glossary, GlossaryIssue, IssueType
 from genglossary.models.synonym import SynonymGroup
+from genglossary.models.term import Term
 from genglossary.synonym_utils import build_synonym_lookup
 from genglossary.utils.prompt_escape import wrap_user_data
 
@@ -42,22 +45,40 @@ class GlossaryReviewer:
 
     DEFAULT_BATCH_SIZE = 10
 
+    # How often to re-check cancel_event while waiting on in-flight batches
+    CANCEL_POLL_INTERVAL_SECONDS = 0.1
+
     def __init__(
-        self, llm_client: BaseLLMClient, batch_size: int = DEFAULT_BATCH_SIZE
+        self,
+        llm_client: BaseLLMClient,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 1,
+        batcher: TokenBudgetBatcher | None = None,
     ) -> None:
         """Initialize the GlossaryReviewer.
 
         Args:
             llm_client: The LLM client to use for review.
-            batch_size: Number of terms to process per batch. Defaults to 20.
+            batch_size: Number of terms to process per batch. Defaults to 10.
+                Ignored when a batcher is given.
+            max_concurrency: Maximum number of batches reviewed at once.
+                Defaults to 1 (sequential).
+            batcher: Optional token-budget batcher. If provided, terms are
+                packed into batches by the token count of their definitions,
+                synonyms and user notes, and batches whose response is
+                truncated or unparseable are split and retried.
 
         Raises:
-            ValueError: If batch_size is less than 1.
+            ValueError: If batch_size or max_concurrency is less than 1.
         """
         if batch_size < 1:
             raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.llm_client = llm_client
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.batcher = batcher
 
     def review(
         self,
@@ -74,10 +95,11 @@ class GlossaryReviewer:
             cancel_event: Optional threading.Event for cancellation. If set,
                 returns None without calling LLM.
             batch_progress_callback: Optional callback(current_batch, total_batches)
-                called before processing each batch.
+                called before processing each batch (when it is dispatched, in
+                batch order, in concurrent mode).
 
         Returns:
-            A list of identified issues, or None if cancelled.
+            A list of identified issues in batch order, or None if cancelled.
             - None: cancelled, no review was performed
             - []: review was performed, no issues found
         """
@@ -88,52 +110,202 @@ class GlossaryReviewer:
         if glossary.term_count == 0:
             return []
 
-        # Split terms into batches
-        all_terms = glossary.all_term_names
-        batches = [
-            all_terms[i : i + self.batch_size]
-            for i in range(0, len(all_terms), self.batch_size)
-        ]
+        batches = self.split_into_batches(glossary, user_notes_map, synonym_groups)
 
-        all_issues: list[GlossaryIssue] = []
+        total = len(batches)
         failed_batches: list[int] = []
-        for batch_idx, batch_terms in enumerate(batches):
-            # Check for cancellation before each batch
-            if cancel_event is not None and cancel_event.is_set():
-                return None
-
-            # Report progress (best-effort, don't abort on callback errors)
-            if batch_progress_callback is not None:
-                try:
-                    batch_progress_callback(batch_idx + 1, len(batches))
-                except Exception as e:
-                    logger.warning("Batch progress callback failed: %s", e)
 
+        def review_one(batch_idx: int) -> list[GlossaryIssue]:
             # Review this batch (skip on error, continue with next batch)
             try:
-                issues = self._review_batch(
-                    glossary, batch_terms, user_notes_map,
+                return self._review_batch(
+                    glossary, batches[batch_idx], user_notes_map,
                     synonym_groups=synonym_groups,
                 )
-                all_issues.extend(issues)
             except Exception as e:
                 failed_batches.append(batch_idx + 1)
                 logger.warning(
-                    "Batch %d/%d failed, skipping: %s",
-                    batch_idx + 1,
-                    len(batches),
-                    e,
+                    "Batch %d/%d failed, skipping: %s", batch_idx + 1, total, e
                 )
+                return []
+
+        if self.max_concurrency > 1 and total > 1:
+            results = self._run_batches_concurrently(
+                total, review_one, cancel_event, batch_progress_callback
+            )
+        else:
+            results = self._run_batches(
+                total, review_one, cancel_event, batch_progress_callback
+            )
+        if results is None:
+            return None
 
         if failed_batches:
             logger.warning(
                 "Review completed with %d/%d batches failed: %s",
                 len(failed_batches),
-                len(batches),
-                failed_batches,
+                total,
+                sorted(failed_batches),
+            )
+
+        # Deterministic order regardless of completion order
+        return [issue for batch_idx in range(total) for issue in results[batch_idx]]
+
+    def split_into_batches(
+        self,
+        glossary: Glossary,
+        user_notes_map: dict[str, str] | None = None,
+        synonym_groups: list[SynonymGroup] | None = None,
+    ) -> list[list[str]]:
+        """Split the glossary's term names into review batches.
+
+        Args:
+            glossary: The glossary to review.
+            user_notes_map: Optional mapping of term_text to user notes.
+            synonym_groups: Optional list of synonym groups.
+
+        Returns:
+            Term names per batch, in glossary order.
+        """
+        all_terms = glossary.all_term_names
+        if self.batcher is None:
+            return [
+                all_terms[i : i + self.batch_size]
+                for i in range(0, len(all_terms), self.batch_size)
+            ]
+        term_text = self._term_text_function(user_notes_map, synonym_groups)
+        return self.batcher.pack(
+            all_terms, lambda name: term_text(glossary.terms[name])
+        )
+
+    def batch_is_full(
+        self,
+        terms: list[Term],
+        user_notes_map: dict[str, str] | None = None,
+        synonym_groups: list[SynonymGroup] | None = None,
+    ) -> bool:
+        """Return True if terms collected one by one fill a review batch.
+
+        Args:
+            terms: Terms collected for the next batch.
+            user_notes_map: Optional mapping of term_text to user notes.
+            synonym_groups: Optional list of synonym groups.
+        """
+        if self.batcher is None:
+            return len(terms) >= self.batch_size
+        return self.batcher.is_full(
+            terms, self._term_text_function(user_notes_map, synonym_groups)
+        )
+
+    def _term_text_function(
+        self,
+        user_notes_map: dict[str, str] | None,
+        synonym_groups: list[SynonymGroup] | None,
+    ) -> Callable[[Term], str]:
+        """Return a function giving the prompt text of a term."""
+        notes_map = user_notes_map or {}
+        synonym_lookup = build_synonym_lookup(synonym_groups)
+
+        def term_text(term: Term) -> str:
+            return self._format_term_line(
+                term, synonym_lookup.get(term.name), notes_map.get(term.name, "")
             )
 
-        return all_issues
+        return term_text
+
+    @staticmethod
+    def _format_term_line(
+        term: Term, synonyms: list[str] | None, notes: str
+    ) -> str:
+        """Format one term of the review prompt."""
+        confidence_pct = int(term.confidence * 100)
+        line = f"- {term.name}: {term.definition} (信頼度: {confidence_pct}%)"
+        if synonyms:
+            line += f"\n  同義語: {', '.join(synonyms)}"
+        if notes:
+            wrapped_notes = wrap_user_data(notes, "user_note")
+            line += f"\n  補足情報: {wrapped_notes}"
+        return line
+
+    @staticmethod
+    def _report_batch_progress(
+        callback: Callable[[int, int], None] | None, current: int, total: int
+    ) -> None:
+        """Report progress (best-effort, don't abort on callback errors)."""
+        if callback is None:
+            return
+        try:
+            callback(current, total)
+        except Exception as e:
+            logger.warning("Batch progress callback failed: %s", e)
+
+    def _run_batches(
+        self,
+        total: int,
+        review_one: Callable[[int], list[GlossaryIssue]],
+        cancel_event: Event | None,
+        batch_progress_callback: Callable[[int, int], None] | None,
+    ) -> dict[int, list[GlossaryIssue]] | None:
+        """Review batches one after another.
+
+        Returns:
+            Issues keyed by batch index, or None if cancelled.
+        """
+        results: dict[int, list[GlossaryIssue]] = {}
+        for batch_idx in range(total):
+            # Check for cancellation before each batch
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            self._report_batch_progress(batch_progress_callback, batch_idx + 1, total)
+            results[batch_idx] = review_one(batch_idx)
+        return results
+
+    def _run_batches_concurrently(
+        self,
+        total: int,
+        review_one: Callable[[int], list[GlossaryIssue]],
+        cancel_event: Event | None,
+        batch_progress_callback: Callable[[int, int], None] | None,
+    ) -> dict[int, list[GlossaryIssue]] | None:
+        """Review batches with at most max_concurrency in flight.
+
+        Batches are dispatched in index order, and the progress callback is
+        called as each one is dispatched. On cancellation no further batches
+        are dispatched and the method returns without waiting for in-flight
+        batches, whose results are discarded.
+
+        Returns:
+            Issues keyed by batch index, or None if cancelled.
+        """
+        results: dict[int, list[GlossaryIssue]] = {}
+        pending: dict[Future[list[GlossaryIssue]], int] = {}
+        next_idx = 0
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="review"
+        )
+        try:
+            while next_idx < total or pending:
+                while next_idx < total and len(pending) < self.max_concurrency:
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+                    self._report_batch_progress(
+                        batch_progress_callback, next_idx + 1, total
+                    )
+                    pending[pool.submit(review_one, next_idx)] = next_idx
+                    next_idx += 1
+
+                done, _ = wait(
+                    pending,
+                    timeout=self.CANCEL_POLL_INTERVAL_SECONDS,
+                    return_when=FIRST_COMPLETED,
+                )
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            return results
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _review_batch(
         self,
@@ -153,12 +325,22 @@ class GlossaryReviewer:
         Returns:
             List of issues found in this batch.
         """
-        prompt = self._create_review_prompt(
-            glossary, term_names, user_notes_map=user_notes_map,
-            synonym_groups=synonym_groups,
-        )
-        response = self.llm_client.generate_structured(prompt, ReviewResponse)
-        return self._parse_issues(response.issues)
+
+        def review(names: list[str]) -> list[GlossaryIssue]:
+            prompt = self._create_review_prompt(
+                glossary, names, user_notes_map=user_notes_map,
+                synonym_groups=synonym_groups,
+            )
+            response = self.llm_client.generate_structured(prompt, ReviewResponse)
+            return self._parse_issues(response.issues)
+
+        if self.batcher is None:
+            return review(term_names)
+        return [
+            issue
+            for issues in self.batcher.run(term_names, review)
+            for issue in issues
+        ]
 
     def _create_review_prompt(
         self,
@@ -189,17 +371,11 @@ class GlossaryReviewer:
         for term_name in target_terms:
             term = glossary.get_term(term_name)
             if term is not None:
-                confidence_pct = int(term.confidence * 100)
-                line = f"- {term.name}: {term.definition} (信頼度: {confidence_pct}%)"
-                # Add synonym info
-                synonyms = synonym_lookup.get(term_name)
-                if synonyms:
-                    line += f"\n  同義語: {', '.join(synonyms)}"
-                notes = notes_map.get(term_name, "")
-                if notes:
-                    wrapped_notes = wrap_user_data(notes, "user_note")
-                    line += f"\n  補足情報: {wrapped_notes}"
-                term_lines.append(line)
+                term_lines.append(
+                    self._format_term_line(
+                        term, synonym_lookup.get(term_name), notes_map.get(term_name, "")
+                    )
+                )
 
         terms_text = "\n".join(term_lines)
 
@@ -6,10 +6,12 @@ import logging
 import re
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Protocol, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+from genglossary.metrics import LLM_RETRIES
+
 if TYPE_CHECKING:
     from genglossary.llm.debug_logger import LlmDebugLogger
 
@@ -18,6 +20,60 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+class ResponseTruncatedError(ValueError):
+    """The model stopped at its output token limit, so the response is incomplete.
+
+    Raised by generate_structured without retrying the same prompt, since
+    it would be cut off again; callers can retry with a smaller request.
+    """
+
+
+class LlmCallObserver(Protocol):
+    """Receives per-call statistics from a client (e.g. a run profiler).
+
+    Methods may be called from several threads at once.
+    """
+
+    def record_llm_call(
+        self, seconds: float, prompt_chars: int, response_chars: int, failed: bool
+    ) -> None:
+        """Record one generate()/generate_structured() call."""
+
+    def record_llm_retry(self, reason: str) -> None:
+        """Record one retried request (HTTP error or invalid JSON)."""
+
+    def record_json_parse_failure(self) -> None:
+        """Record one response that could not be parsed as the expected JSON."""
+
+
+def _observe_call(
+    client: BaseLLMClient,
+    start: float,
+    prompt: str,
+    response: Callable[[], str] | None,
+) -> None:
+    """Report a finished call to the client's observer, if any.
+
+    Args:
+        client: The client that made the call.
+        start: time.time() at the start of the call.
+        prompt: The caller's prompt.
+        response: Returns the response text; None if the call failed.
+    """
+    observer = client.call_observer
+    if observer is None:
+        return
+    try:
+        observer.record_llm_call(
+            seconds=time.time() - start,
+            prompt_chars=len(prompt),
+            response_chars=0 if response is None else len(response()),
+            failed=response is None,
+        )
+    except Exception:
+        logger.warning("Failed to record LLM call", exc_info=True)
+
+
 def _wrap_generate(original: Any) -> Any:
     """Wrap a generate method with debug logging."""
     if getattr(original, "_debug_wrapped", False):
@@ -25,8 +81,13 @@ def _wrap_generate(original: Any) -> Any:
 
     def wrapped(self: BaseLLMClient, prompt: str, *args: Any, **kwargs: Any) -> str:
         start = time.time()
-        result = original(self, prompt, *args, **kwargs)
+        try:
+            result = original(self, prompt, *args, **kwargs)
+        except Exception:
+            _observe_call(self, start, prompt, None)
+            raise
         duration = time.time() - start
+        _observe_call(self, start, prompt, lambda: result)
         if self._debug_logger is not None:
             try:
                 model_name = getattr(self, "model", "unknown")
@@ -52,8 +113,18 @@ def _wrap_generate_structured(original: Any) -> Any:
 
     def wrapped(self: BaseLLMClient, prompt: str, *args: Any, **kwargs: Any) -> Any:
         start = time.time()
-        result = original(self, prompt, *args, **kwargs)
+        try:
+            result = original(self, prompt, *args, **kwargs)
+        except Exception:
+            _observe_call(self, start, prompt, None)
+            raise
         duration = time.time() - start
+        _observe_call(
+            self,
+            start,
+            prompt,
+            lambda: result.model_dump_json() if isinstance(result, BaseModel) else str(result),
+        )
         if self._debug_logger is not None:
             try:
                 model_name = getattr(self, "model", "unknown")
@@ -85,9 +156,11 @@ class BaseLLMClient(ABC):
 
     Subclasses that override generate() or generate_structured() are
     automatically wrapped with debug logging support via __init_subclass__.
+    The same wrappers report each call to call_observer when one is set.
     """
 
     _debug_logger: LlmDebugLogger | None = None
+    call_observer: LlmCallObserver | None = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -138,13 +211,29 @@ class BaseLLMClient(ABC):
         """Close the client and release resources.
 
         This method can be called from another thread to cancel
-        ongoing requests. Default implementation does nothing.
-        Subclasses should override to close HTTP connections etc.
+        ongoing requests. The default implementation flushes and closes
+        the debug logger. Subclasses should override to close HTTP
+        connections etc. and call super().close().
         """
-        pass
+        if self._debug_logger is not None:
+            self._debug_logger.close()
 
     # Common helper methods (available to subclasses)
 
+    def _record_retry(self, reason: str) -> None:
+        """Count a retried request in the metrics and the call observer.
+
+        Args:
+            reason: Retry reason label (e.g. "server_error", "invalid_json").
+        """
+        LLM_RETRIES.labels(
+            getattr(self, "provider", "unknown"),
+            getattr(self, "model", "unknown"),
+            reason,
+        ).inc()
+        if self.call_observer is not None:
+            self.call_observer.record_llm_retry(reason)
+
     def _build_json_prompt(self, prompt: str, response_model: Type[T]) -> str:
         """Build JSON-formatted prompt with schema information.
 
@@ -221,7 +310,10 @@ class BaseLLMClient(ABC):
                 return parsed_model
 
             last_error = ValueError(f"Failed to parse JSON on attempt {attempt + 1}")
+            if self.call_observer is not None:
+                self.call_observer.record_json_parse_failure()
             if attempt < max_retries - 1:
+                self._record_retry("invalid_json")
                 time.sleep(0.5)
 
         raise ValueError(
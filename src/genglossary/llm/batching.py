@@ -0,0 +1,307 @@
+"""Token-budget batching of LLM work items.
+
+Term classification and glossary review send several items (terms,
+term definitions) in one prompt. Instead of a fixed number of items per
+request, a TokenBudgetBatcher packs items until their estimated token
+count reaches the model's budget, so batches of short terms get large
+and batches of long definitions or user notes stay small enough for the
+context window.
+
+The budget adapts to the model: when a batch fails because the response
+was truncated or could not be parsed (a ValueError from
+generate_structured), the batch is split in half and each half retried,
+and the budget is halved for later batches. Every successful batch
+restores a little of the budget, up to the configured value.
+
+Batchers are shared process-wide per model (see get_batcher), so what
+one run learns about a model also applies to the next.
+"""
+
+import logging
+import math
+import re
+from collections.abc import Callable, Sequence
+from importlib.util import find_spec
+from threading import Lock
+from typing import Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+TOKENIZERS = ("heuristic", "tiktoken")
+
+# The budget never shrinks below this many tokens
+MIN_TOKEN_BUDGET = 64
+
+# Share of the configured budget restored by each successful batch
+_RECOVERY_RATIO = 1 / 16
+
+# Tokens counted for the line break and list marker around each item
+_ITEM_OVERHEAD_TOKENS = 2
+
+_CJK_CHARS = (
+    "\u3040-\u30ff"  # Hiragana, Katakana
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"  # CJK ideographs
+    "\uff00-\uffef"  # Full-width forms
+)
+_TOKEN_PATTERN = re.compile(rf"[{_CJK_CHARS}]|[A-Za-z0-9]+|[^\s{_CJK_CHARS}A-Za-z0-9]")
+
+
+class Tokenizer(Protocol):
+    """Counts the tokens of a text for a model."""
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        ...
+
+
+class HeuristicTokenizer:
+    """Dependency-free token estimate.
+
+    Counts one token per CJK character, one per four characters of an
+    ASCII word or number (at least one per word) and one per other
+    symbol. Japanese text costs far more than the chars/4 estimate of
+    TokenCounter suggests, so this is much closer to real tokenizers for
+    the documents this tool handles.
+    """
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for match in _TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            tokens += math.ceil(len(token) / 4) if token.isascii() else 1
+        return tokens
+
+
+class TiktokenTokenizer:
+    """Exact token counts with tiktoken (optional dependency)."""
+
+    def __init__(self, model: str) -> None:
+        """Load the encoding of model, or cl100k_base for unknown models.
+
+        Args:
+            model: Model name.
+        """
+        import tiktoken  # pyright: ignore[reportMissingImports]
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def _tiktoken_available() -> bool:
+    return find_spec("tiktoken") is not None
+
+
+def get_tokenizer(name: str, model: str) -> Tokenizer:
+    """Create the tokenizer called name for model.
+
+    Falls back to the heuristic tokenizer (with a warning) when tiktoken
+    is requested but not installed.
+
+    Args:
+        name: "heuristic" or "tiktoken".
+        model: Model name, used to pick the tiktoken encoding.
+
+    Returns:
+        Tokenizer: The tokenizer.
+
+    Raises:
+        ValueError: If name is unknown.
+    """
+    if name not in TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer: {name}. Must be one of {TOKENIZERS}")
+    if name == "tiktoken":
+        if _tiktoken_available():
+            return TiktokenTokenizer(model)
+        logger.warning(
+            "LLM_TOKENIZER=tiktoken but the tiktoken package is not installed; "
+            "falling back to the heuristic tokenizer"
+        )
+    return HeuristicTokenizer()
+
+
+def parse_model_budgets(value: str) -> dict[str, int]:
+    """Parse per-model budgets written as "model=tokens,model=tokens".
+
+    Args:
+        value: Comma-separated model=tokens pairs; empty for none.
+
+    Returns:
+        dict[str, int]: Budget per model name.
+
+    Raises:
+        ValueError: If a pair is malformed or a budget is not positive.
+    """
+    budgets: dict[str, int] = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        model, sep, tokens = pair.rpartition("=")
+        if not sep or not model.strip():
+            raise ValueError(f"Invalid model budget {pair.strip()!r}, expected model=tokens")
+        try:
+            budget = int(tokens)
+        except ValueError:
+            raise ValueError(f"Invalid token count in {pair.strip()!r}") from None
+        if budget < 1:
+            raise ValueError(f"Token budget must be positive in {pair.strip()!r}")
+        budgets[model.strip()] = budget
+    return budgets
+
+
+class TokenBudgetBatcher:
+    """Packs items into batches by estimated token count. Thread-safe."""
+
+    def __init__(
+        self,
+        token_budget: int,
+        *,
+        tokenizer: Tokenizer | None = None,
+        max_items: int = 30,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            token_budget: Target tokens of item text per batch.
+            tokenizer: Token counter; defaults to HeuristicTokenizer.
+            max_items: Upper bound of items per batch, whatever their size.
+
+        Raises:
+            ValueError: If token_budget or max_items is less than 1.
+        """
+        if token_budget < 1:
+            raise ValueError("token_budget must be at least 1")
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.tokenizer = tokenizer or HeuristicTokenizer()
+        self.max_items = max_items
+        self._max_budget = token_budget
+        self._min_budget = min(MIN_TOKEN_BUDGET, token_budget)
+        self._budget = float(token_budget)
+        self._lock = Lock()
+
+    @property
+    def token_budget(self) -> int:
+        """Current tokens per batch (shrinks after failed batches)."""
+        with self._lock:
+            return int(self._budget)
+
+    def cost(self, text: str) -> int:
+        """Estimated tokens of one item, including its list formatting."""
+        return self.tokenizer.count(text) + _ITEM_OVERHEAD_TOKENS
+
+    def pack(self, items: Sequence[T], text: Callable[[T], str]) -> list[list[T]]:
+        """Split items into consecutive batches within the budget.
+
+        An item larger than the whole budget gets a batch of its own.
+
+        Args:
+            items: Items in order.
+            text: Returns the prompt text of an item.
+
+        Returns:
+            list[list[T]]: Batches in item order.
+        """
+        budget = self.token_budget
+        batches: list[list[T]] = []
+        current: list[T] = []
+        used = 0
+        for item in items:
+            cost = self.cost(text(item))
+            if current and (used + cost > budget or len(current) >= self.max_items):
+                batches.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def is_full(self, items: Sequence[T], text: Callable[[T], str]) -> bool:
+        """Return True if items fill a batch (for batches built incrementally)."""
+        if len(items) >= self.max_items:
+            return True
+        return sum(self.cost(text(item)) for item in items) >= self.token_budget
+
+    def run(self, batch: list[T], process: Callable[[list[T]], R]) -> list[R]:
+        """Process a batch, splitting it in half while it fails to parse.
+
+        Each ValueError (a truncated or unparseable response) halves the
+        budget for later batches and retries both halves separately.
+
+        Args:
+            batch: Items of one batch.
+            process: Sends a batch to the LLM and returns its result.
+
+        Returns:
+            list[R]: One result per processed (sub-)batch, in item order.
+
+        Raises:
+            ValueError: If a single item still fails.
+        """
+        try:
+            result = process(batch)
+        except ValueError as e:
+            if len(batch) == 1:
+                raise
+            self._shrink()
+            logger.info(
+                "Splitting batch of %d items after a failed response (%s); "
+                "token budget now %d",
+                len(batch),
+                e.__class__.__name__,
+                self.token_budget,
+            )
+            middle = len(batch) // 2
+            return self.run(batch[:middle], process) + self.run(batch[middle:], process)
+        self._recover()
+        return [result]
+
+    def _shrink(self) -> None:
+        with self._lock:
+            self._budget = max(self._budget / 2, float(self._min_budget))
+
+    def _recover(self) -> None:
+        with self._lock:
+            self._budget = min(
+                self._budget + self._max_budget * _RECOVERY_RATIO,
+                float(self._max_budget),
+            )
+
+
+_batchers: dict[tuple[str, int, int, str], TokenBudgetBatcher] = {}
+_batchers_lock = Lock()
+
+
+def get_batcher(
+    model: str, token_budget: int, *, max_items: int = 30, tokenizer: str = "heuristic"
+) -> TokenBudgetBatcher:
+    """Return the process-wide batcher of model.
+
+    Args:
+        model: Model name.
+        token_budget: Target tokens per batch.
+        max_items: Upper bound of items per batch.
+        tokenizer: Tokenizer name (see get_tokenizer).
+
+    Returns:
+        TokenBudgetBatcher: Shared by every run using the model.
+    """
+    key = (model, token_budget, max_items, tokenizer)
+    with _batchers_lock:
+        batcher = _batchers.get(key)
+        if batcher is None:
+            batcher = TokenBudgetBatcher(
+                token_budget,
+                tokenizer=get_tokenizer(tokenizer, model),
+                max_items=max_items,
+            )
+            _batchers[key] = batcher
+        return batcher
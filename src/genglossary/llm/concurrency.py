@@ -0,0 +1,282 @@
+"""Adaptive (AIMD) concurrency limits for LLM endpoints.
+
+All LLM requests to the same server origin share one limiter, whatever
+client, run or pipeline step they come from. A request takes a slot
+before it is sent and gives it back with its outcome:
+
+    - A fast enough success raises the limit additively (about +1 per
+      limit's worth of successes) while the current limit is in use.
+    - HTTP 429, 5xx, timeouts and latency spikes (latency above
+      latency_spike_factor times the moving average) cut the limit by
+      backoff_ratio, at most once per cooldown so one burst of errors
+      counts as one congestion signal.
+    - A Retry-After header on 429/503 pauses every request to the
+      endpoint until it expires, instead of only the one that got it.
+
+The limit is exported as the genglossary_llm_concurrency_limit metric.
+"""
+
+import email.utils
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition, Lock
+
+import httpx
+
+from genglossary.llm.http_pool import url_origin
+from genglossary.metrics import LLM_CONCURRENCY_DECREASES, LLM_CONCURRENCY_LIMIT
+
+# Upper bound for a Retry-After pause
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Weight of the newest sample in the moving average latency
+_LATENCY_SMOOTHING = 0.1
+# Successes needed before latency spikes are detected
+_MIN_LATENCY_SAMPLES = 5
+# Shortest time between two decreases
+_MIN_COOLDOWN_SECONDS = 1.0
+# A spike must also exceed the average by this much, so jitter on very
+# fast responses is not mistaken for congestion
+_MIN_SPIKE_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class ConcurrencySettings:
+    """Bounds and sensitivity of an adaptive limiter.
+
+    Attributes:
+        initial_limit: In-flight requests allowed before any feedback.
+        min_limit: The limit never goes below this.
+        max_limit: The limit never goes above this.
+        latency_spike_factor: A success slower than this multiple of the
+            moving average latency counts as congestion.
+        backoff_ratio: Multiplier applied to the limit on congestion.
+    """
+
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 32
+    latency_spike_factor: float = 2.0
+    backoff_ratio: float = 0.5
+
+
+DEFAULT_CONCURRENCY_SETTINGS = ConcurrencySettings()
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Read the Retry-After header of a response.
+
+    Args:
+        response: HTTP response.
+
+    Returns:
+        float | None: Seconds to wait, capped at MAX_RETRY_AFTER_SECONDS,
+        or None when the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = date.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+class ConcurrencySlot:
+    """One request's slot; record the response before leaving the block."""
+
+    def __init__(self) -> None:
+        self.response: httpx.Response | None = None
+
+    def record(self, response: httpx.Response) -> None:
+        self.response = response
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limiter shared by every request to one endpoint. Thread-safe."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        settings: ConcurrencySettings = DEFAULT_CONCURRENCY_SETTINGS,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            endpoint: Label of the endpoint in metrics.
+            settings: Limit bounds and sensitivity.
+
+        Raises:
+            ValueError: If the bounds are inconsistent.
+        """
+        if not 1 <= settings.min_limit <= settings.initial_limit <= settings.max_limit:
+            raise ValueError(
+                "Concurrency limits must satisfy 1 <= min <= initial <= max"
+            )
+        self.endpoint = endpoint
+        self._settings = settings
+        self._condition = Condition(Lock())
+        self._limit = float(settings.initial_limit)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._latency_ewma: float | None = None
+        self._latency_samples = 0
+        LLM_CONCURRENCY_LIMIT.labels(endpoint).set(settings.initial_limit)
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    def stats(self) -> dict[str, object]:
+        """Describe the limiter.
+
+        Returns:
+            dict: endpoint, limit, in_flight, latency_ms (moving average,
+            None before the first success) and paused_for_seconds.
+        """
+        with self._condition:
+            return {
+                "endpoint": self.endpoint,
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "latency_ms": (
+                    None if self._latency_ewma is None else self._latency_ewma * 1000
+                ),
+                "paused_for_seconds": max(0.0, self._paused_until - time.monotonic()),
+            }
+
+    @contextmanager
+    def slot(self) -> Iterator[ConcurrencySlot]:
+        """Hold a slot for one HTTP request.
+
+        Blocks while the limit is reached or the endpoint is paused by a
+        Retry-After. Call slot.record(response) inside the block; an
+        exception leaving the block is recorded instead.
+        """
+        self._acquire()
+        slot = ConcurrencySlot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except httpx.TimeoutException:
+            self._release(congestion="timeout")
+            raise
+        except BaseException:
+            self._release()
+            raise
+        else:
+            self._release_with_response(slot.response, time.monotonic() - start)
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def _release_with_response(
+        self, response: httpx.Response | None, seconds: float
+    ) -> None:
+        if response is None:
+            self._release()
+            return
+        status = response.status_code
+        if status == 429 or status >= 500:
+            retry_after = parse_retry_after(response) if status in (429, 503) else None
+            self._release(
+                congestion="rate_limited" if status == 429 else "server_error",
+                retry_after=retry_after,
+            )
+            return
+        self._release(latency=seconds)
+
+    def _release(
+        self,
+        *,
+        congestion: str | None = None,
+        latency: float | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        with self._condition:
+            window_full = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if latency is not None:
+                if self._is_latency_spike(latency):
+                    congestion = "latency"
+                self._latency_ewma = (
+                    latency
+                    if self._latency_ewma is None
+                    else _LATENCY_SMOOTHING * latency
+                    + (1 - _LATENCY_SMOOTHING) * self._latency_ewma
+                )
+                self._latency_samples += 1
+            if congestion is not None:
+                self._decrease(congestion, now)
+            elif latency is not None and window_full:
+                # Additive increase: about +1 per limit's worth of successes
+                self._limit = min(
+                    self._limit + 1 / int(self._limit), float(self._settings.max_limit)
+                )
+            LLM_CONCURRENCY_LIMIT.labels(self.endpoint).set(int(self._limit))
+            self._condition.notify_all()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        # Caller holds the lock
+        return (
+            self._latency_ewma is not None
+            and self._latency_samples >= _MIN_LATENCY_SAMPLES
+            and latency > self._latency_ewma * self._settings.latency_spike_factor
+            and latency - self._latency_ewma > _MIN_SPIKE_SECONDS
+        )
+
+    def _decrease(self, reason: str, now: float) -> None:
+        # Caller holds the lock
+        cooldown = max(self._latency_ewma or 0.0, _MIN_COOLDOWN_SECONDS)
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(
+            self._limit * self._settings.backoff_ratio,
+            float(self._settings.min_limit),
+        )
+        LLM_CONCURRENCY_DECREASES.labels(self.endpoint, reason).inc()
+
+
+_limiters: dict[tuple[str, ConcurrencySettings], AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = Lock()
+
+
+def get_concurrency_limiter(
+    base_url: str, settings: ConcurrencySettings = DEFAULT_CONCURRENCY_SETTINGS
+) -> AdaptiveConcurrencyLimiter:
+    """Return the process-wide limiter of the server at base_url.
+
+    Args:
+        base_url: Server URL; only its origin selects the limiter.
+        settings: Limit bounds, used when the limiter is created.
+
+    Returns:
+        AdaptiveConcurrencyLimiter: Shared by all clients of the server.
+    """
+    origin = url_origin(base_url)
+    with _limiters_lock:
+        limiter = _limiters.get((origin, settings))
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(origin, settings)
+            _limiters[(origin, settings)] = limiter
+        return limiter
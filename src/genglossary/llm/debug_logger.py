@@ -1,17 +1,168 @@
 """LLM debug logger for recording prompts and responses to files."""
 
+import gzip
+import json
+import logging
+import os
 from datetime import datetime
 from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMATS = ("jsonl", "files")
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_QUEUE_SIZE = 1000
+
+# Records written per batch before the file is flushed
+_WRITE_BATCH_SIZE = 100
+# Upper bound for close() so shutdown never hangs on a stuck writer
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+class _JsonlWriter:
+    """Background thread appending records to size-rotated JSONL files.
+
+    Records go through a bounded queue; when it is full, log() blocks the
+    calling thread until the writer catches up instead of growing memory.
+    Files are named YYYYMMDD-HHmmss-NNN.jsonl (.jsonl.gz when compressed)
+    and created with owner-only permissions. max_bytes limits the
+    uncompressed size of each file.
+    """
+
+    def __init__(
+        self, debug_dir: Path, max_bytes: int, compress: bool, queue_size: int
+    ) -> None:
+        self._debug_dir = debug_dir
+        self._max_bytes = max_bytes
+        self._compress = compress
+        self._queue: Queue[dict[str, Any] | None] = Queue(maxsize=queue_size)
+        self._file: BinaryIO | gzip.GzipFile | None = None
+        # The file under the GzipFile, which does not close it
+        self._raw_file: BinaryIO | None = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self._thread = Thread(target=self._run, name="llm-debug-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, record: dict[str, Any]) -> None:
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Write all queued records, then close the current file."""
+        try:
+            self._queue.put(None, timeout=_CLOSE_TIMEOUT_SECONDS)
+        except Full:
+            logger.warning("LLM debug writer did not drain its queue; records lost")
+            return
+        self._thread.join(timeout=_CLOSE_TIMEOUT_SECONDS)
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            batch = [self._queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                done = True
+            # Only the last item can be the None sentinel
+            records = [record for record in batch if record is not None]
+            try:
+                for record in records:
+                    self._write(record)
+                if self._file is not None and not self._compress:
+                    self._file.flush()
+            except Exception:
+                logger.warning("Failed to write LLM debug log", exc_info=True)
+        self._close_file()
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        if self._file is not None and self._file_bytes + len(line) > self._max_bytes:
+            self._close_file()
+        if self._file is None:
+            self._open_file()
+        assert self._file is not None
+        self._file.write(line)
+        self._file_bytes += len(line)
+
+    def _open_file(self) -> None:
+        self._file_index += 1
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        suffix = ".jsonl.gz" if self._compress else ".jsonl"
+        path = self._debug_dir / f"{stamp}-{self._file_index:03d}{suffix}"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        raw = os.fdopen(fd, "ab")
+        self._raw_file = raw
+        self._file = gzip.GzipFile(fileobj=raw, mode="ab") if self._compress else raw
+        self._file_bytes = 0
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        file, self._file = self._file, None
+        raw, self._raw_file = self._raw_file, None
+        file.close()
+        if raw is not None and raw is not file:
+            raw.close()
 
 
 class LlmDebugLogger:
     """Logs LLM request/response pairs to debug files.
 
-    When debug_dir is None, all operations are no-ops.
+    Two formats are supported:
+        - "files": one text file per call, written on the calling thread.
+        - "jsonl": JSON lines appended by a background thread to
+          size-rotated files, optionally gzip-compressed. Call close() to
+          flush pending records.
+
+    When debug_dir is None, all operations are no-ops. Safe to call from
+    several threads; each call gets its own sequence number.
     """
 
-    def __init__(self, debug_dir: str | None) -> None:
+    def __init__(
+        self,
+        debug_dir: str | None,
+        *,
+        log_format: str = "files",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compress: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the logger.
+
+        Args:
+            debug_dir: Output directory, or None to disable logging.
+            log_format: "files" or "jsonl".
+            max_bytes: Size at which a JSONL file is rotated.
+            compress: Gzip-compress JSONL files.
+            queue_size: Maximum records waiting for the JSONL writer.
+
+        Raises:
+            ValueError: If log_format is unknown or a size is not positive.
+        """
+        if log_format not in LOG_FORMATS:
+            raise ValueError(
+                f"Unknown log format: {log_format}. Must be one of {LOG_FORMATS}"
+            )
+        if max_bytes < 1 or queue_size < 1:
+            raise ValueError("max_bytes and queue_size must be at least 1")
+
         self._debug_dir = debug_dir
+        self._log_format = log_format
+        self._max_bytes = max_bytes
+        self._compress = compress
+        self._queue_size = queue_size
+        self._lock = Lock()
+        self._writer: _JsonlWriter | None = None
+        self._closed = False
         self.counter = 1
 
         if debug_dir is not None:
@@ -19,7 +170,8 @@ class LlmDebugLogger:
 
     def reset_counter(self) -> None:
         """Reset the sequential counter to 1."""
-        self.counter = 1
+        with self._lock:
+            self.counter = 1
 
     def log(
         self,
@@ -30,7 +182,7 @@ class LlmDebugLogger:
         response: str,
         duration: float,
     ) -> None:
-        """Write a debug log file with request and response.
+        """Record one request and response.
 
         Args:
             model: LLM model name.
@@ -43,13 +195,63 @@ class LlmDebugLogger:
             return
 
         now = datetime.now()
+        with self._lock:
+            if self._closed:
+                return
+            counter = self.counter
+            self.counter += 1
+            if self._log_format == "jsonl" and self._writer is None:
+                self._writer = _JsonlWriter(
+                    Path(self._debug_dir),
+                    self._max_bytes,
+                    self._compress,
+                    self._queue_size,
+                )
+            writer = self._writer
+
+        if writer is not None:
+            writer.put({
+                "seq": counter,
+                "timestamp": now.isoformat(timespec="milliseconds"),
+                "model": model,
+                "method": method,
+                "duration": duration,
+                "request": request,
+                "response": response,
+            })
+            return
+
+        self._write_file(now, counter, model, method, request, response, duration)
+
+    def close(self) -> None:
+        """Flush pending JSONL records and stop the writer.
+
+        Later log() calls are ignored. Safe to call more than once.
+        """
+        with self._lock:
+            self._closed = True
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+    def _write_file(
+        self,
+        now: datetime,
+        counter: int,
+        model: str,
+        method: str,
+        request: str,
+        response: str,
+        duration: float,
+    ) -> None:
+        """Write one call as its own text file (the "files" format)."""
         timestamp = now.strftime("%Y-%m-%dT%H:%M:%S")
         date_part = now.strftime("%Y%m%d")
         time_part = now.strftime("%H%M%S")
-        counter_str = f"{self.counter:04d}"
+        counter_str = f"{counter:04d}"
 
         filename = f"{date_part}-{time_part}-{counter_str}.txt"
-        filepath = Path(self._debug_dir) / filename
+        filepath = Path(self._debug_dir or ".") / filename
 
         content = (
             f"# Timestamp: {timestamp}\n"
@@ -66,4 +268,3 @@ class LlmDebugLogger:
 
         filepath.write_text(content, encoding="utf-8")
         filepath.chmod(0o600)
-        self.counter += 1
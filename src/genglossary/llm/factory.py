@@ -2,7 +2,11 @@
 
 from genglossary.config import Config
 from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.batching import TokenBudgetBatcher, get_batcher, parse_model_budgets
+from genglossary.llm.concurrency import ConcurrencySettings
 from genglossary.llm.debug_logger import LlmDebugLogger
+from genglossary.llm.http_pool import HttpPoolSettings
+from genglossary.llm.load_balancer import LoadBalancedLLMClient, split_base_urls
 from genglossary.llm.ollama_client import OllamaClient
 from genglossary.llm.openai_compatible_client import OpenAICompatibleClient
 
@@ -21,44 +25,132 @@ def create_llm_client(
         provider: LLM provider ("ollama" or "openai").
         model: Model name (provider-specific default if None).
         base_url: Base URL for the API (optional). Falls back to config default.
+            Several comma-separated URLs give a LoadBalancedLLMClient with
+            one client per server (policy and health checks from Config).
         timeout: Request timeout in seconds.
         llm_debug: Enable debug logging of prompts and responses.
         debug_dir: Directory for debug log files (required when llm_debug=True).
+            The log format, rotation size and compression come from Config
+            (LLM_DEBUG_FORMAT, LLM_DEBUG_MAX_BYTES, LLM_DEBUG_COMPRESS).
+
+    Connection pool limits and HTTP/2 come from Config (LLM_HTTP_*,
+    OPENAI_HTTP2); clients for the same server share one pool. The bounds
+    of each server's adaptive concurrency limiter come from
+    LLM_CONCURRENCY_* and LLM_LATENCY_SPIKE_FACTOR.
 
     Returns:
         Configured LLM client instance.
 
     Raises:
-        ValueError: If provider is unknown.
+        ValueError: If provider is unknown or no base URL is given.
     """
-    client: BaseLLMClient
+    clients: list[BaseLLMClient]
 
     if provider == "ollama":
         config = Config()
-        client = OllamaClient(
-            base_url=base_url or config.ollama_base_url,
-            model=model or "dengcao/Qwen3-30B-A3B-Instruct-2507:latest",
-            timeout=timeout,
-        )
+        clients = [
+            OllamaClient(
+                base_url=url,
+                model=model or "dengcao/Qwen3-30B-A3B-Instruct-2507:latest",
+                timeout=timeout,
+                pool_settings=_pool_settings(config),
+                concurrency_settings=_concurrency_settings(config),
+            )
+            for url in split_base_urls(base_url or config.ollama_base_url)
+        ]
     elif provider == "openai":
         config = Config()
-        client = OpenAICompatibleClient(
-            base_url=base_url or config.openai_base_url,
-            api_key=config.openai_api_key,
-            model=model or config.openai_model,
-            timeout=timeout,
-            api_version=config.azure_openai_api_version,
-        )
+        clients = [
+            OpenAICompatibleClient(
+                base_url=url,
+                api_key=config.openai_api_key,
+                model=model or config.openai_model,
+                timeout=timeout,
+                api_version=config.azure_openai_api_version,
+                http2=config.openai_http2,
+                pool_settings=_pool_settings(config),
+                concurrency_settings=_concurrency_settings(config),
+            )
+            for url in split_base_urls(base_url or config.openai_base_url)
+        ]
     else:
         raise ValueError(
             f"Unknown provider: {provider}. Must be 'ollama' or 'openai'."
         )
 
+    client: BaseLLMClient
+    if len(clients) == 1:
+        client = clients[0]
+    else:
+        client = LoadBalancedLLMClient(
+            clients,
+            policy=config.llm_lb_policy,
+            health_check_interval=config.llm_health_check_interval,
+            eject_base_seconds=config.llm_eject_base_seconds,
+            eject_max_seconds=config.llm_eject_max_seconds,
+        )
+
     if llm_debug:
         if not debug_dir:
             raise ValueError(
                 "debug_dir is required when llm_debug is enabled."
             )
-        client._debug_logger = LlmDebugLogger(debug_dir=debug_dir)
+        config = Config()
+        client._debug_logger = LlmDebugLogger(
+            debug_dir=debug_dir,
+            log_format=config.llm_debug_format,
+            max_bytes=config.llm_debug_max_bytes,
+            compress=config.llm_debug_compress,
+        )
 
     return client
+
+
+def create_batcher(
+    model: str, config: Config | None = None
+) -> TokenBudgetBatcher | None:
+    """Get the token-budget batcher for model's classification and review.
+
+    The budget is the model's entry in LLM_BATCH_TOKEN_BUDGETS, or
+    LLM_BATCH_TOKEN_BUDGET otherwise.
+
+    Args:
+        model: Model name.
+        config: Configuration; loaded from the environment if None.
+
+    Returns:
+        TokenBudgetBatcher | None: The model's shared batcher, or None when
+        the budget is 0 (fixed-size batches).
+    """
+    if config is None:
+        config = Config()
+    budget = parse_model_budgets(config.llm_batch_token_budgets).get(
+        model, config.llm_batch_token_budget
+    )
+    if budget == 0:
+        return None
+    return get_batcher(
+        model,
+        budget,
+        max_items=config.llm_batch_max_items,
+        tokenizer=config.llm_tokenizer,
+    )
+
+
+def _pool_settings(config: Config) -> HttpPoolSettings:
+    """Build shared connection pool limits from Config."""
+    return HttpPoolSettings(
+        max_connections=config.llm_http_max_connections,
+        max_keepalive_connections=config.llm_http_max_keepalive,
+        keepalive_expiry=config.llm_http_keepalive_expiry,
+    )
+
+
+def _concurrency_settings(config: Config) -> ConcurrencySettings:
+    """Build adaptive concurrency limiter bounds from Config."""
+    return ConcurrencySettings(
+        initial_limit=config.llm_concurrency_initial_limit,
+        min_limit=config.llm_concurrency_min_limit,
+        max_limit=config.llm_concurrency_max_limit,
+        latency_spike_factor=config.llm_latency_spike_factor,
+    )
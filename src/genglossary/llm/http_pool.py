@@ -0,0 +1,449 @@
+"""Shared HTTP connection pools for LLM clients.
+
+Every LLM client used to own a private httpx.Client, so each run, each
+regenerate request and each /api/ollama/models call opened fresh TCP
+(and TLS) connections, and the pools were only released when __del__
+happened to run. Clients now lease a transport from a process-wide
+registry instead: leases for the same server origin share one connection
+pool with explicit limits, so connections are reused across runs and
+endpoints.
+
+Closing a client releases its lease without closing the shared pool.
+When the client still has requests in flight (run cancellation), only
+those requests are aborted: each lease tracks the connection every one
+of its requests is using and shuts that socket down, so the request fails
+with a transport error while requests of other leases on the same pool
+carry on. Over HTTP/2 one connection multiplexes several requests, so
+other leases' requests on it fail too and go through their normal retry.
+"""
+
+import importlib.util
+import logging
+import socket
+import ssl
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock, local
+from urllib.parse import urlsplit
+
+import httpcore
+import httpx
+
+from genglossary.metrics import (
+    LLM_HTTP_CLIENTS,
+    LLM_HTTP_IN_FLIGHT,
+    LLM_HTTP_POOL_EVENTS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    """Connection limits of a shared pool.
+
+    Attributes:
+        max_connections: Maximum open connections to one origin.
+        max_keepalive_connections: Idle connections kept for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+
+DEFAULT_POOL_SETTINGS = HttpPoolSettings()
+
+_PoolKey = tuple[str, bool, HttpPoolSettings]
+
+
+def url_origin(base_url: str) -> str:
+    """Return scheme://host[:port] of a URL; connections are per origin."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc.rpartition('@')[2]}".lower()
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class _InFlightRequest:
+    """The connection one request of a lease is using, so it can be aborted."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stream: "_AbortableStream | None" = None
+        self._aborted = False
+
+    def attach(self, stream: "_AbortableStream") -> None:
+        """Record the connection before each read or write on it."""
+        with self._lock:
+            if self._aborted:
+                raise httpcore.ReadError("request aborted: client closed")
+            self._stream = stream
+
+    def abort(self) -> None:
+        """Fail the request by shutting its connection down."""
+        with self._lock:
+            self._aborted = True
+            stream = self._stream
+        if stream is not None:
+            stream.shutdown()
+
+
+# The request being sent by this thread; sync httpcore does its socket I/O
+# in the thread that sends the request
+_current = local()
+
+
+class _AbortableStream(httpcore.NetworkStream):
+    """Network stream that reports itself to the request using it."""
+
+    def __init__(self, stream: httpcore.NetworkStream) -> None:
+        self._stream = stream
+
+    def _attach(self) -> None:
+        request: _InFlightRequest | None = getattr(_current, "request", None)
+        if request is not None:
+            request.attach(self)
+
+    def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        self._attach()
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        self._attach()
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: str | None = None,
+        timeout: float | None = None,
+    ) -> httpcore.NetworkStream:
+        self._attach()
+        return _AbortableStream(
+            self._stream.start_tls(ssl_context, server_hostname, timeout)
+        )
+
+    def get_extra_info(self, info: str) -> object:
+        return self._stream.get_extra_info(info)
+
+    def shutdown(self) -> None:
+        """Wake up a blocked read in another thread; the connection is dropped."""
+        sock = self._stream.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            # socket.socket.shutdown, not SSLSocket's, which drops the TLS
+            # state under the thread still reading
+            socket.socket.shutdown(sock, socket.SHUT_RDWR)
+        except OSError:
+            pass  # Already closed
+
+
+class _AbortableBackend(httpcore.NetworkBackend):
+    """httpcore's sync backend with abortable streams."""
+
+    def __init__(self) -> None:
+        self._backend = httpcore.SyncBackend()
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[tuple] | None = None,
+    ) -> httpcore.NetworkStream:
+        return _AbortableStream(
+            self._backend.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+        )
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[tuple] | None = None,
+    ) -> httpcore.NetworkStream:
+        return _AbortableStream(
+            self._backend.connect_unix_socket(path, timeout, socket_options)
+        )
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+# httpcore errors and the httpx errors they are raised as, most specific
+# first (the same mapping httpx.HTTPTransport applies)
+_HTTPCORE_ERRORS: tuple[tuple[type[Exception], type[httpx.TransportError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextmanager
+def _map_httpcore_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception as e:
+        for httpcore_error, httpx_error in _HTTPCORE_ERRORS:
+            if isinstance(e, httpcore_error):
+                raise httpx_error(str(e)) from e
+        raise
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    """Response body read from an httpcore stream."""
+
+    def __init__(self, stream: Iterable[bytes]) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        with _map_httpcore_errors():
+            yield from self._stream
+
+    def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+
+class _PoolTransport(httpx.BaseTransport):
+    """httpx transport over an httpcore pool with abortable connections.
+
+    Sends requests the way httpx.HTTPTransport does for a direct connection
+    with default TLS verification; httpx.HTTPTransport itself cannot be
+    given a network backend.
+    """
+
+    def __init__(self, http2: bool, settings: HttpPoolSettings) -> None:
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_AbortableBackend(),
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.SyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_errors():
+            core_response = self._pool.handle_request(core_request)
+        assert isinstance(core_response.stream, Iterable)
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_ResponseStream(core_response.stream),
+            extensions=core_response.extensions,
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class _SharedPool:
+    """One transport and the number of requests running on it."""
+
+    def __init__(self, origin: str, http2: bool, settings: HttpPoolSettings) -> None:
+        self.origin = origin
+        self.transport = _PoolTransport(http2, settings)
+        self.in_flight = 0
+
+
+class PooledTransport(httpx.BaseTransport):
+    """A client's lease on a shared pool.
+
+    Pass it as the transport of an httpx.Client. Closing the client
+    closes the lease, never the shared pool (see the module docstring).
+    """
+
+    def __init__(self, registry: "HttpTransportRegistry", key: _PoolKey) -> None:
+        self._registry = registry
+        self._key = key
+        self._lock = Lock()
+        self._requests: set[_InFlightRequest] = set()
+        self._closed = False
+
+    @property
+    def origin(self) -> str:
+        return self._key[0]
+
+    @property
+    def http2(self) -> bool:
+        return self._key[1]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        pool = self._registry._begin_request(self._key)
+        in_flight = _InFlightRequest()
+        with self._lock:
+            if self._closed:
+                in_flight.abort()
+            self._requests.add(in_flight)
+        previous = getattr(_current, "request", None)
+        _current.request = in_flight
+        try:
+            response = pool.transport.handle_request(request)
+            # Read the body here so the request counts as in flight until
+            # the whole response arrived (clients do not stream responses)
+            response.read()
+            return response
+        finally:
+            _current.request = previous
+            with self._lock:
+                self._requests.discard(in_flight)
+            self._registry._end_request(pool)
+
+    def close(self) -> None:
+        """Release the lease and abort its requests still in flight."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            aborted = list(self._requests)
+        for in_flight in aborted:
+            in_flight.abort()
+        self._registry._release(self._key, aborted=len(aborted))
+
+
+class HttpTransportRegistry:
+    """Thread-safe registry of shared pools keyed by server origin.
+
+    Pools are created on first lease and kept open across leases so idle
+    connections can be reused; keepalive_expiry bounds how long they stay
+    open. Call close() at process shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pools: dict[_PoolKey, _SharedPool] = {}
+        self._leases: dict[_PoolKey, int] = {}
+
+    def lease(
+        self,
+        base_url: str,
+        *,
+        http2: bool = False,
+        settings: HttpPoolSettings = DEFAULT_POOL_SETTINGS,
+    ) -> PooledTransport:
+        """Lease a transport for requests to base_url.
+
+        Args:
+            base_url: Server URL; only its origin selects the pool.
+            http2: Prefer HTTP/2. Needs the optional h2 package; without
+                it a warning is logged and HTTP/1.1 is used.
+            settings: Connection limits, used when the pool is created.
+
+        Returns:
+            PooledTransport: The lease, to pass to httpx.Client(transport=...).
+        """
+        if http2 and not _http2_available():
+            logger.warning(
+                "HTTP/2 requested but the h2 package is not installed; "
+                "using HTTP/1.1 (pip install h2)"
+            )
+            http2 = False
+
+        key = (url_origin(base_url), http2, settings)
+        with self._lock:
+            if key in self._pools:
+                LLM_HTTP_POOL_EVENTS.labels(key[0], "reused").inc()
+            else:
+                self._create_pool(key)
+            self._leases[key] = self._leases.get(key, 0) + 1
+            LLM_HTTP_CLIENTS.labels(key[0]).inc()
+        return PooledTransport(self, key)
+
+    def stats(self) -> list[dict[str, object]]:
+        """Describe the open pools.
+
+        Returns:
+            list[dict]: origin, http2, leases and in_flight per pool.
+        """
+        with self._lock:
+            return [
+                {
+                    "origin": key[0],
+                    "http2": key[1],
+                    "leases": self._leases.get(key, 0),
+                    "in_flight": pool.in_flight,
+                }
+                for key, pool in self._pools.items()
+            ]
+
+    def close(self) -> None:
+        """Close every pool. Leases opened later get new pools."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.transport.close()
+
+    def _create_pool(self, key: _PoolKey) -> _SharedPool:
+        # Caller holds self._lock
+        pool = _SharedPool(*key)
+        self._pools[key] = pool
+        LLM_HTTP_POOL_EVENTS.labels(key[0], "created").inc()
+        return pool
+
+    def _begin_request(self, key: _PoolKey) -> _SharedPool:
+        with self._lock:
+            pool = self._pools.get(key) or self._create_pool(key)
+            pool.in_flight += 1
+        LLM_HTTP_IN_FLIGHT.labels(pool.origin).inc()
+        return pool
+
+    def _end_request(self, pool: _SharedPool) -> None:
+        with self._lock:
+            pool.in_flight -= 1
+        LLM_HTTP_IN_FLIGHT.labels(pool.origin).dec()
+
+    def _release(self, key: _PoolKey, *, aborted: int = 0) -> None:
+        with self._lock:
+            leases = self._leases.pop(key, 1) - 1
+            if leases > 0:
+                self._leases[key] = leases
+            LLM_HTTP_CLIENTS.labels(key[0]).dec()
+        if aborted:
+            LLM_HTTP_POOL_EVENTS.labels(key[0], "aborted").inc(aborted)
+
+
+_registry = HttpTransportRegistry()
+
+
+def get_http_transport_registry() -> HttpTransportRegistry:
+    """Return the process-wide transport registry."""
+    return _registry
@@ -0,0 +1,404 @@
+"""Load-balanced LLM client spreading requests over several endpoints.
+
+A base URL setting (OLLAMA_BASE_URL, OPENAI_BASE_URL or a project's
+llm_base_url) may list several comma-separated servers. The factory then
+wraps one client per server in a LoadBalancedLLMClient, so the
+concurrent requests of a run spread across all of them.
+
+Each request goes to the healthy endpoint chosen by the routing policy:
+
+    - "least_outstanding": fewest requests in flight.
+    - "latency": requests in flight weighted by the endpoint's moving
+      average latency, so faster servers get more work.
+
+An endpoint whose request fails with a transport error, 429 or 5xx
+(after the endpoint client's own retries) is ejected for a backoff
+period that doubles with each consecutive failure, and the request
+fails over to another endpoint. Other 4xx responses (e.g. a prompt
+that is too long, or a bad API key) are the request's fault: they are
+raised at once and the endpoint stays in rotation. A background thread
+checks is_available() on every endpoint periodically; an ejected
+endpoint is reinstated once its backoff has passed and it answers the
+health check, or when a request sent to it as a last resort succeeds.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Callable, Sequence, Type, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel
+
+from genglossary.llm.base import BaseLLMClient, LlmCallObserver
+from genglossary.metrics import (
+    LLM_ENDPOINT_EJECTIONS,
+    LLM_ENDPOINT_HEALTHY,
+    LLM_ENDPOINT_OUTSTANDING,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+LB_POLICIES = ("least_outstanding", "latency")
+
+# Weight of the newest sample in the moving average latency
+_LATENCY_SMOOTHING = 0.3
+
+
+def is_endpoint_failure(error: httpx.HTTPError) -> bool:
+    """Check if an error means the endpoint, not the request, is at fault.
+
+    Args:
+        error: Error raised by an endpoint client.
+
+    Returns:
+        bool: True for transport errors, 429 and 5xx responses.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def split_base_urls(value: str) -> list[str]:
+    """Split a comma-separated base URL setting into URLs.
+
+    Args:
+        value: One URL, or several separated by commas.
+
+    Returns:
+        list[str]: The non-empty URLs, stripped.
+    """
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+@dataclass
+class _Endpoint:
+    """Routing state of one endpoint. Guarded by the balancer's lock."""
+
+    client: BaseLLMClient
+    label: str
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ewma: float | None = None
+    ejected_until: float | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+
+class _EndpointObserver:
+    """Forwards an endpoint client's retries to the balancer's observer.
+
+    Calls are reported by the balancer itself, so record_llm_call is
+    dropped here to avoid counting each call twice.
+    """
+
+    def __init__(self, observer: LlmCallObserver) -> None:
+        self._observer = observer
+
+    def record_llm_call(
+        self, seconds: float, prompt_chars: int, response_chars: int, failed: bool
+    ) -> None:
+        pass
+
+    def record_llm_retry(self, reason: str) -> None:
+        self._observer.record_llm_retry(reason)
+
+    def record_json_parse_failure(self) -> None:
+        self._observer.record_json_parse_failure()
+
+
+class LoadBalancedLLMClient(BaseLLMClient):
+    """LLM client routing each call to one of several endpoint clients.
+
+    Safe to use from several threads. The model and provider labels are
+    taken from the first endpoint.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[BaseLLMClient],
+        *,
+        policy: str = "least_outstanding",
+        health_check_interval: float = 30.0,
+        eject_base_seconds: float = 5.0,
+        eject_max_seconds: float = 300.0,
+    ) -> None:
+        """Initialize the balancer.
+
+        Args:
+            endpoints: One client per server, all for the same model.
+            policy: "least_outstanding" or "latency".
+            health_check_interval: Seconds between health checks; 0
+                disables the background checker.
+            eject_base_seconds: Ejection time after the first failure.
+            eject_max_seconds: Upper bound of the ejection time.
+
+        Raises:
+            ValueError: If endpoints is empty or policy is unknown.
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if policy not in LB_POLICIES:
+            raise ValueError(
+                f"Unknown load balancing policy: {policy}. Must be one of {LB_POLICIES}"
+            )
+
+        self._endpoints = [
+            _Endpoint(client=client, label=_endpoint_label(client))
+            for client in endpoints
+        ]
+        self._policy = policy
+        self._eject_base_seconds = eject_base_seconds
+        self._eject_max_seconds = eject_max_seconds
+        self._lock = Lock()
+        self._closed = Event()
+        self._call_observer: LlmCallObserver | None = None
+        self.model = getattr(endpoints[0], "model", "unknown")
+        self.provider = getattr(endpoints[0], "provider", "unknown")
+
+        for endpoint in self._endpoints:
+            LLM_ENDPOINT_HEALTHY.labels(endpoint.label).set(1)
+
+        self._health_thread: Thread | None = None
+        if health_check_interval > 0:
+            self._health_thread = Thread(
+                target=self._health_check_loop,
+                args=(health_check_interval,),
+                name="llm-health-check",
+                daemon=True,
+            )
+            self._health_thread.start()
+
+    @property
+    def call_observer(self) -> LlmCallObserver | None:  # type: ignore[override]
+        return self._call_observer
+
+    @call_observer.setter
+    def call_observer(self, observer: LlmCallObserver | None) -> None:
+        self._call_observer = observer
+        forwarder = None if observer is None else _EndpointObserver(observer)
+        for endpoint in self._endpoints:
+            endpoint.client.call_observer = forwarder
+
+    def generate(self, prompt: str) -> str:
+        """Generate text on the selected endpoint.
+
+        Raises:
+            httpx.HTTPError: If every endpoint failed.
+        """
+        return self._call(lambda client: client.generate(prompt))
+
+    def generate_structured(self, prompt: str, response_model: Type[T]) -> T:
+        """Generate structured output on the selected endpoint.
+
+        Raises:
+            httpx.HTTPError: If every endpoint failed.
+            ValueError: If the response could not be parsed.
+        """
+        return self._call(
+            lambda client: client.generate_structured(prompt, response_model)
+        )
+
+    def is_available(self) -> bool:
+        """Return True if any endpoint is available."""
+        return any(endpoint.client.is_available() for endpoint in self._endpoints)
+
+    def stats(self) -> list[dict[str, object]]:
+        """Describe every endpoint.
+
+        Returns:
+            list[dict]: endpoint, healthy, outstanding, requests, failures,
+            latency_ms (moving average, None before the first success)
+            and ejected_for_seconds per endpoint.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "endpoint": endpoint.label,
+                    "healthy": endpoint.healthy,
+                    "outstanding": endpoint.outstanding,
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "latency_ms": (
+                        None
+                        if endpoint.latency_ewma is None
+                        else endpoint.latency_ewma * 1000
+                    ),
+                    "ejected_for_seconds": (
+                        None
+                        if endpoint.ejected_until is None
+                        else max(0.0, endpoint.ejected_until - now)
+                    ),
+                }
+                for endpoint in self._endpoints
+            ]
+
+    def close(self) -> None:
+        """Stop the health checker and close every endpoint client.
+
+        Can be called from another thread to cancel ongoing requests.
+        """
+        self._closed.set()
+        for endpoint in self._endpoints:
+            endpoint.client.close()
+        super().close()
+
+    def _call(self, request: Callable[[BaseLLMClient], R]) -> R:
+        """Run request on endpoints in policy order until one succeeds."""
+        tried: set[int] = set()
+        last_error: httpx.HTTPError | None = None
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                assert last_error is not None
+                raise last_error
+            tried.add(id(endpoint))
+            start = time.perf_counter()
+            try:
+                result = request(endpoint.client)
+            except httpx.HTTPError as e:
+                self._release(endpoint, None)
+                # Replaying a rejected request elsewhere would only eject
+                # every endpoint in turn
+                if self._closed.is_set() or not is_endpoint_failure(e):
+                    raise
+                self._eject(endpoint, f"request failed: {e!r}")
+                last_error = e
+                continue
+            except BaseException:
+                # Not an endpoint problem (e.g. unparseable JSON)
+                self._release(endpoint, None)
+                raise
+            self._release(endpoint, time.perf_counter() - start)
+            return result
+
+    def _acquire(self, tried: set[int]) -> _Endpoint | None:
+        """Pick an endpoint not tried yet and count the request on it.
+
+        Healthy endpoints come first. When none is left, ejected ones are
+        used as a last resort, soonest reinstatement first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self._endpoints if id(e) not in tried]
+            if not candidates:
+                return None
+            available = [
+                e
+                for e in candidates
+                if e.ejected_until is None or e.ejected_until <= now
+            ]
+            if available:
+                endpoint = min(available, key=self._score)
+            else:
+                endpoint = min(candidates, key=lambda e: e.ejected_until or 0.0)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+        LLM_ENDPOINT_OUTSTANDING.labels(endpoint.label).inc()
+        return endpoint
+
+    def _score(self, endpoint: _Endpoint) -> tuple[float, int]:
+        # Caller holds self._lock. Ties go to the endpoint used least.
+        if self._policy == "latency":
+            # Unmeasured endpoints score 0 so they get sampled first
+            load = (endpoint.outstanding + 1) * (endpoint.latency_ewma or 0.0)
+        else:
+            load = float(endpoint.outstanding)
+        return load, endpoint.requests
+
+    def _release(self, endpoint: _Endpoint, seconds: float | None) -> None:
+        """Finish a request; seconds is None when it took no latency sample.
+
+        Only a success sets seconds; failures are recorded by _eject.
+        """
+        reinstated = False
+        with self._lock:
+            endpoint.outstanding -= 1
+            if seconds is not None:
+                endpoint.latency_ewma = (
+                    seconds
+                    if endpoint.latency_ewma is None
+                    else _LATENCY_SMOOTHING * seconds
+                    + (1 - _LATENCY_SMOOTHING) * endpoint.latency_ewma
+                )
+                endpoint.consecutive_failures = 0
+                reinstated = not endpoint.healthy
+                endpoint.ejected_until = None
+        LLM_ENDPOINT_OUTSTANDING.labels(endpoint.label).dec()
+        if reinstated:
+            self._on_reinstated(endpoint)
+
+    def _eject(self, endpoint: _Endpoint, reason: str) -> None:
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            backoff = min(
+                self._eject_base_seconds * 2 ** (endpoint.consecutive_failures - 1),
+                self._eject_max_seconds,
+            )
+            endpoint.ejected_until = time.monotonic() + backoff
+        LLM_ENDPOINT_EJECTIONS.labels(endpoint.label).inc()
+        LLM_ENDPOINT_HEALTHY.labels(endpoint.label).set(0)
+        logger.warning(
+            f"Ejected LLM endpoint {endpoint.label} for {backoff:.0f}s ({reason})"
+        )
+
+    def _on_reinstated(self, endpoint: _Endpoint) -> None:
+        LLM_ENDPOINT_HEALTHY.labels(endpoint.label).set(1)
+        logger.info("Reinstated LLM endpoint %s", endpoint.label)
+
+    def _check_health(self) -> None:
+        """Check every endpoint once; eject or reinstate as needed."""
+        for endpoint in self._endpoints:
+            if self._closed.is_set():
+                return
+            try:
+                available = endpoint.client.is_available()
+            except Exception:
+                available = False
+            if not available:
+                with self._lock:
+                    # An ejected endpoint stays out until its backoff ends
+                    due = endpoint.ejected_until is None or (
+                        endpoint.ejected_until <= time.monotonic()
+                    )
+                if due:
+                    self._eject(endpoint, "health check failed")
+                continue
+            with self._lock:
+                reinstate = (
+                    endpoint.ejected_until is not None
+                    and endpoint.ejected_until <= time.monotonic()
+                )
+                if reinstate:
+                    endpoint.ejected_until = None
+                    endpoint.consecutive_failures = 0
+            if reinstate:
+                self._on_reinstated(endpoint)
+
+    def _health_check_loop(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            self._check_health()
+
+
+def _endpoint_label(client: BaseLLMClient) -> str:
+    """Label of an endpoint in stats and metrics: its URL without credentials."""
+    base_url = getattr(client, "base_url", None)
+    if not base_url:
+        return type(client).__name__
+    parts = urlsplit(base_url)
+    host = parts.netloc.rpartition("@")[2]
+    return f"{parts.scheme}://{host}{parts.path}".rstrip("/")
@@ -5,7 +5,18 @@ from typing import Type, TypeVar
 import httpx
 from pydantic import BaseModel
 
-from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.base import BaseLLMClient, ResponseTruncatedError
+from genglossary.llm.concurrency import (
+    DEFAULT_CONCURRENCY_SETTINGS,
+    ConcurrencySettings,
+    get_concurrency_limiter,
+)
+from genglossary.llm.http_pool import (
+    DEFAULT_POOL_SETTINGS,
+    HttpPoolSettings,
+    get_http_transport_registry,
+)
+from genglossary.metrics import LLM_PROMPT_CHARS, record_llm_request
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -17,12 +28,17 @@ class OllamaClient(BaseLLMClient):
     Supports text generation, structured output, and health checks.
     """
 
+    # Provider label for metrics
+    provider = "ollama"
+
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         model: str = "dengcao/Qwen3-30B-A3B-Instruct-2507:latest",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        pool_settings: HttpPoolSettings = DEFAULT_POOL_SETTINGS,
+        concurrency_settings: ConcurrencySettings = DEFAULT_CONCURRENCY_SETTINGS,
     ):
         """Initialize OllamaClient.
 
@@ -31,12 +47,21 @@ class OllamaClient(BaseLLMClient):
             model: Model name to use.
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
+            pool_settings: Limits of the shared connection pool.
+            concurrency_settings: Bounds of the server's adaptive
+                concurrency limiter, shared with other clients.
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.Client(timeout=timeout)
+        self._limiter = get_concurrency_limiter(self.base_url, concurrency_settings)
+        self.client = httpx.Client(
+            timeout=timeout,
+            transport=get_http_transport_registry().lease(
+                self.base_url, settings=pool_settings
+            ),
+        )
 
     def generate(self, prompt: str) -> str:
         """Generate text response from Ollama.
@@ -74,6 +99,7 @@ class OllamaClient(BaseLLMClient):
             Validated response model instance.
 
         Raises:
+            ResponseTruncatedError: If the response hit the output token limit.
             ValueError: If JSON parsing or validation fails after all retries.
             httpx.HTTPError: If the request fails after all retries.
         """
@@ -82,8 +108,12 @@ class OllamaClient(BaseLLMClient):
         payload = {"model": self.model, "prompt": json_prompt, "stream": False}
 
         def _generate() -> str:
-            response = self._request_with_retry(url, payload)
-            return response.json()["response"]
+            data = self._request_with_retry(url, payload).json()
+            if data.get("done_reason") == "length":
+                raise ResponseTruncatedError(
+                    f"Response truncated at the output token limit of {self.model}"
+                )
+            return data["response"]
 
         return self._retry_json_parsing(_generate, response_model, max_json_retries)
 
@@ -129,30 +159,70 @@ class OllamaClient(BaseLLMClient):
         Raises:
             httpx.HTTPError: If all retries are exhausted.
         """
+        start = time.perf_counter()
+        prompt_chars = len(payload.get("prompt", ""))
         for attempt in range(self.max_retries + 1):
+            LLM_PROMPT_CHARS.labels(self.provider, self.model).inc(prompt_chars)
             try:
-                response = self.client.post(url, json=payload)
+                with self._limiter.slot() as slot:
+                    response = self.client.post(url, json=payload)
+                    slot.record(response)
                 response.raise_for_status()
-                return response
-            except httpx.HTTPError:
+            except httpx.HTTPError as e:
                 if attempt < self.max_retries:
+                    self._record_retry(_retry_reason(e))
                     sleep_time = 2 ** attempt
                     time.sleep(sleep_time)
                 else:
+                    record_llm_request(
+                        self.provider, self.model, time.perf_counter() - start, "error"
+                    )
                     raise
+            else:
+                self._record_success(response, time.perf_counter() - start)
+                return response
 
         # This should never be reached, but for type safety
         raise httpx.HTTPError("Maximum retries exceeded")
 
+    def _record_success(self, response: httpx.Response, seconds: float) -> None:
+        """Record a successful request, with token counts if Ollama reports them."""
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            data = {}
+        record_llm_request(
+            self.provider,
+            self.model,
+            seconds,
+            "success",
+            prompt_tokens=data.get("prompt_eval_count"),
+            completion_tokens=data.get("eval_count"),
+        )
+
     def close(self) -> None:
         """Close the HTTP client to cancel ongoing requests.
 
         This can be called from another thread to force-cancel ongoing
-        LLM API calls by closing the underlying HTTP connection.
+        LLM API calls. The shared connection pool stays open unless
+        requests are in flight (see genglossary.llm.http_pool).
         """
         if hasattr(self, 'client'):
             self.client.close()
+        super().close()
 
     def __del__(self):
         """Clean up HTTP client on deletion."""
         self.close()
+
+
+def _retry_reason(error: httpx.HTTPError) -> str:
+    """Classify a retried request failure for metrics."""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return "transport"
+    status = error.response.status_code
+    if status == 429:
+        return "rate_limited"
+    return "server_error" if status >= 500 else "client_error"
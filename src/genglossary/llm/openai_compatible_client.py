@@ -5,7 +5,19 @@ from typing import Type, TypeVar
 import httpx
 from pydantic import BaseModel
 
-from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.base import BaseLLMClient, ResponseTruncatedError
+from genglossary.llm.concurrency import (
+    DEFAULT_CONCURRENCY_SETTINGS,
+    ConcurrencySettings,
+    get_concurrency_limiter,
+    parse_retry_after,
+)
+from genglossary.llm.http_pool import (
+    DEFAULT_POOL_SETTINGS,
+    HttpPoolSettings,
+    get_http_transport_registry,
+)
+from genglossary.metrics import LLM_PROMPT_CHARS, record_llm_request
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -20,6 +32,9 @@ class OpenAICompatibleClient(BaseLLMClient):
     method, and optional API version parameter (for Azure).
     """
 
+    # Provider label for metrics
+    provider = "openai"
+
     def __init__(
         self,
         base_url: str = "https://api.openai.com/v1",
@@ -29,6 +44,9 @@ class OpenAICompatibleClient(BaseLLMClient):
         max_retries: int = 3,
         api_version: str | None = None,
         max_tokens: int = 4096,
+        http2: bool = False,
+        pool_settings: HttpPoolSettings = DEFAULT_POOL_SETTINGS,
+        concurrency_settings: ConcurrencySettings = DEFAULT_CONCURRENCY_SETTINGS,
     ):
         """Initialize OpenAICompatibleClient.
 
@@ -41,6 +59,10 @@ class OpenAICompatibleClient(BaseLLMClient):
             api_version: Azure OpenAI API version (e.g., "2024-02-15-preview").
             max_tokens: Maximum tokens in response. Some servers (like llama.cpp)
                 have low defaults that can truncate responses.
+            http2: Use HTTP/2 when the optional h2 package is installed.
+            pool_settings: Limits of the shared connection pool.
+            concurrency_settings: Bounds of the server's adaptive
+                concurrency limiter, shared with other clients.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
@@ -49,7 +71,13 @@ class OpenAICompatibleClient(BaseLLMClient):
         self.max_retries = max_retries
         self.api_version = api_version
         self.max_tokens = max_tokens
-        self.client = httpx.Client(timeout=timeout)
+        self._limiter = get_concurrency_limiter(self.base_url, concurrency_settings)
+        self.client = httpx.Client(
+            timeout=timeout,
+            transport=get_http_transport_registry().lease(
+                self.base_url, http2=http2, settings=pool_settings
+            ),
+        )
 
     @property
     def _endpoint_url(self) -> str:
@@ -109,6 +137,7 @@ class OpenAICompatibleClient(BaseLLMClient):
             Validated response model instance.
 
         Raises:
+            ResponseTruncatedError: If the response hit max_tokens.
             ValueError: If JSON parsing or validation fails after all retries.
             httpx.HTTPError: If the request fails after all retries.
         """
@@ -122,8 +151,12 @@ class OpenAICompatibleClient(BaseLLMClient):
         }
 
         def _generate() -> str:
-            response = self._request_with_retry(payload)
-            return response.json()["choices"][0]["message"]["content"]
+            choice = self._request_with_retry(payload).json()["choices"][0]
+            if choice.get("finish_reason") == "length":
+                raise ResponseTruncatedError(
+                    f"Response truncated at max_tokens={self.max_tokens}"
+                )
+            return choice["message"]["content"]
 
         return self._retry_json_parsing(_generate, response_model, max_json_retries)
 
@@ -147,7 +180,8 @@ class OpenAICompatibleClient(BaseLLMClient):
     def _request_with_retry(self, payload: dict) -> httpx.Response:
         """Make HTTP request with exponential backoff retry.
 
-        Handles rate limits with Retry-After header if present.
+        Handles rate limits with Retry-After header if present (the wait
+        is shared by all requests to the server, see genglossary.llm.concurrency).
         Retries on 429 (rate limit) and 5xx (server errors).
         Does not retry on 401 (authentication error) or 400 (bad request).
 
@@ -162,52 +196,92 @@ class OpenAICompatibleClient(BaseLLMClient):
         """
         params = {"api-version": self.api_version} if self.api_version else {}
 
+        start = time.perf_counter()
+        prompt_chars = sum(len(m.get("content", "")) for m in payload.get("messages", []))
+
+        def fail() -> None:
+            record_llm_request(
+                self.provider, self.model, time.perf_counter() - start, "error"
+            )
+
         for attempt in range(self.max_retries + 1):
+            LLM_PROMPT_CHARS.labels(self.provider, self.model).inc(prompt_chars)
             try:
-                response = self.client.post(
-                    self._endpoint_url,
-                    json=payload,
-                    headers=self._headers,
-                    params=params,
-                )
+                with self._limiter.slot() as slot:
+                    response = self.client.post(
+                        self._endpoint_url,
+                        json=payload,
+                        headers=self._headers,
+                        params=params,
+                    )
+                    slot.record(response)
 
                 # Handle rate limiting (429) - retry with backoff
                 if response.status_code == 429 and attempt < self.max_retries:
-                    retry_after = int(response.headers.get("Retry-After", 2**attempt))
-                    time.sleep(min(retry_after, 60))  # Cap at 60 seconds
+                    self._record_retry("rate_limited")
+                    # A Retry-After pauses every request to the server in
+                    # the limiter, so only back off here without one
+                    if parse_retry_after(response) is None:
+                        time.sleep(2**attempt)
                     continue
 
                 response.raise_for_status()
+                self._record_success(response, time.perf_counter() - start)
                 return response
 
             except httpx.HTTPStatusError as e:
                 # Don't retry on client errors (4xx except 429)
                 if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
+                    fail()
                     raise
 
                 # Retry on server errors (5xx)
                 if e.response.status_code >= 500 and attempt < self.max_retries:
+                    self._record_retry("server_error")
                     time.sleep(2**attempt)
                     continue
+                fail()
                 raise
 
             except httpx.HTTPError:
                 if attempt < self.max_retries:
+                    self._record_retry("transport")
                     time.sleep(2**attempt)
                     continue
+                fail()
                 raise
 
         # This should never be reached, but for type safety
         raise httpx.HTTPError("Maximum retries exceeded")
 
+    def _record_success(self, response: httpx.Response, seconds: float) -> None:
+        """Record a successful request, with token usage if the server reports it."""
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        usage = data.get("usage") if isinstance(data, dict) else None
+        if not isinstance(usage, dict):
+            usage = {}
+        record_llm_request(
+            self.provider,
+            self.model,
+            seconds,
+            "success",
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+        )
+
     def close(self) -> None:
         """Close the HTTP client to cancel ongoing requests.
 
         This can be called from another thread to force-cancel ongoing
-        LLM API calls by closing the underlying HTTP connection.
+        LLM API calls. The shared connection pool stays open unless
+        requests are in flight (see genglossary.llm.http_pool).
         """
         if hasattr(self, "client"):
             self.client.close()
+        super().close()
 
     def __del__(self):
         """Clean up HTTP client on deletion."""
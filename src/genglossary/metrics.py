@@ -0,0 +1,490 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+A deliberately small subset of the Prometheus client model: counters,
+gauges and histograms with labels, kept in process memory and rendered on
+demand by the API's /metrics endpoint. Every update takes one short lock,
+so instrumenting hot paths (HTTP requests, LLM calls, SQLite transactions)
+costs well under a microsecond.
+
+Metrics used by GenGlossary are defined at the bottom of this module so
+the full catalogue is visible in one place.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from threading import Lock
+from typing import Generic, TypeVar
+
+# Content type of the text exposition format served at /metrics
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default latency buckets in seconds (HTTP routes, SQLite lock waits)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# LLM calls take seconds to minutes
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+# One exposed sample: (name suffix, ((label, value), ...), value)
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+def _format_labels(pairs: Sequence[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}"
+
+
+ChildT = TypeVar("ChildT")
+
+
+class _Metric(ABC, Generic[ChildT]):
+    """Base class: a named metric family with fixed label names."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        self._children: dict[tuple[str, ...], ChildT] = {}
+
+    def labels(self, *values: str, **kwargs: str) -> ChildT:
+        """Return the child for a combination of label values.
+
+        Accepts label values positionally (in labelnames order) or by name.
+
+        Raises:
+            ValueError: If the label values do not match labelnames.
+        """
+        if kwargs:
+            if values:
+                raise ValueError("Pass label values positionally or by name, not both")
+            try:
+                values = tuple(str(kwargs[name]) for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for {self.name}") from None
+            if len(kwargs) != len(self.labelnames):
+                raise ValueError(f"Unexpected labels for {self.name}")
+        elif len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _items(self) -> list[tuple[tuple[str, ...], ChildT]]:
+        """Snapshot of (label values, child), sorted for stable output."""
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _default_child(self) -> ChildT:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels; use labels() first")
+        return self.labels()
+
+    @abstractmethod
+    def _new_child(self) -> ChildT:
+        """Create the child for a new combination of label values."""
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """Yield the family's samples for exposition."""
+
+    def render(self) -> str:
+        """Render the family in the text exposition format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(
+            f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        )
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Drop all recorded values (for tests)."""
+        with self._lock:
+            self._children.clear()
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing count (name conventionally ends in _total)."""
+
+    TYPE = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled counter."""
+        self._default_child().inc(amount)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._items():
+            yield "", tuple(zip(self.labelnames, key)), child.value
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    TYPE = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled gauge."""
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement an unlabelled gauge."""
+        self._default_child().dec(amount)
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self._default_child().set(value)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._items():
+            yield "", tuple(zip(self.labelnames, key)), child.value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: tuple[float, ...]) -> None:
+        self._lock = Lock()
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * len(upper_bounds)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            # The last bound is +Inf, so every value finds a bucket
+            self.counts[bisect_left(self._upper_bounds, value)] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution of observed values in cumulative buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        bounds = sorted(float(b) for b in buckets)
+        if not bounds or bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.upper_bounds = tuple(bounds)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        """Observe a value on an unlabelled histogram."""
+        self._default_child().observe(value)
+
+    def samples(self) -> Iterable[Sample]:
+        for key, child in self._items():
+            with child._lock:
+                counts = list(child.counts)
+                total, count = child.sum, child.count
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.upper_bounds, counts):
+                cumulative += bucket_count
+                yield "_bucket", (*labels, ("le", _format_value(bound))), cumulative
+            yield "_sum", labels, total
+            yield "_count", labels, count
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric family.
+
+        Raises:
+            ValueError: If a family with the same name is registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render every family in the text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+    def get_sample_value(
+        self, name: str, labels: dict[str, str] | None = None
+    ) -> float | None:
+        """Return the value of one exposed sample, or None if absent.
+
+        Args:
+            name: Sample name (e.g. "x_total", "x_bucket", "x_count").
+            labels: Exact label set of the sample.
+        """
+        wanted = labels or {}
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            if not name.startswith(metric.name):
+                continue
+            for suffix, pairs, value in metric.samples():
+                if metric.name + suffix == name and dict(pairs) == wanted:
+                    return value
+        return None
+
+    def clear(self) -> None:
+        """Drop all recorded values, keeping the families (for tests)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+# --- HTTP API ---
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "genglossary_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route"],
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "genglossary_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+)
+SSE_SUBSCRIBERS = REGISTRY.gauge(
+    "genglossary_sse_subscribers",
+    "Open Server-Sent Events log streams.",
+)
+EVENT_STREAM_SUBSCRIBERS = REGISTRY.gauge(
+    "genglossary_event_stream_subscribers",
+    "Open project event streams.",
+)
+
+# --- LLM ---
+
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "genglossary_llm_request_duration_seconds",
+    "LLM HTTP request latency including client retries.",
+    ["provider", "model"],
+    buckets=LLM_BUCKETS,
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "genglossary_llm_requests_total",
+    "LLM HTTP requests by outcome (success or error, after retries).",
+    ["provider", "model", "outcome"],
+)
+LLM_RETRIES = REGISTRY.counter(
+    "genglossary_llm_retries_total",
+    "LLM retries by reason (rate_limited, server_error, client_error, transport, invalid_json).",
+    ["provider", "model", "reason"],
+)
+LLM_PROMPT_CHARS = REGISTRY.counter(
+    "genglossary_llm_prompt_chars_total",
+    "Prompt characters sent to the LLM (every attempt).",
+    ["provider", "model"],
+)
+LLM_TOKENS = REGISTRY.counter(
+    "genglossary_llm_tokens_total",
+    "Tokens reported by the LLM server (type: prompt or completion).",
+    ["provider", "model", "type"],
+)
+
+LLM_HTTP_CLIENTS = REGISTRY.gauge(
+    "genglossary_llm_http_clients",
+    "LLM clients holding a lease on a shared HTTP connection pool.",
+    ["origin"],
+)
+LLM_HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "genglossary_llm_http_in_flight",
+    "LLM HTTP requests currently running on a shared connection pool.",
+    ["origin"],
+)
+LLM_HTTP_POOL_EVENTS = REGISTRY.counter(
+    "genglossary_llm_http_pool_events_total",
+    "Shared LLM connection pool events (created, reused, aborted).",
+    ["origin", "event"],
+)
+
+LLM_ENDPOINT_OUTSTANDING = REGISTRY.gauge(
+    "genglossary_llm_endpoint_outstanding",
+    "Requests in flight per load-balanced LLM endpoint.",
+    ["endpoint"],
+)
+LLM_ENDPOINT_HEALTHY = REGISTRY.gauge(
+    "genglossary_llm_endpoint_healthy",
+    "1 if a load-balanced LLM endpoint is in rotation, 0 while ejected.",
+    ["endpoint"],
+)
+LLM_ENDPOINT_EJECTIONS = REGISTRY.counter(
+    "genglossary_llm_endpoint_ejections_total",
+    "Times a load-balanced LLM endpoint was ejected after a failure.",
+    ["endpoint"],
+)
+
+LLM_CONCURRENCY_LIMIT = REGISTRY.gauge(
+    "genglossary_llm_concurrency_limit",
+    "Adaptive limit of in-flight requests per LLM server.",
+    ["endpoint"],
+)
+LLM_CONCURRENCY_DECREASES = REGISTRY.counter(
+    "genglossary_llm_concurrency_decreases_total",
+    "Adaptive concurrency limit cuts by reason (rate_limited, server_error, timeout, latency).",
+    ["endpoint", "reason"],
+)
+
+# --- Runs ---
+
+RUNS_ACTIVE = REGISTRY.gauge(
+    "genglossary_runs_active",
+    "Pipeline runs currently executing.",
+)
+RUNS_QUEUED = REGISTRY.gauge(
+    "genglossary_runs_queued",
+    "Pipeline runs created but not yet executing.",
+)
+RUNS_FINISHED = REGISTRY.counter(
+    "genglossary_runs_finished_total",
+    "Finished pipeline runs by scope and final status.",
+    ["scope", "status"],
+)
+
+# --- SQLite ---
+
+SQLITE_LOCK_WAIT = REGISTRY.histogram(
+    "genglossary_sqlite_lock_wait_seconds",
+    "Time spent acquiring the SQLite write lock (BEGIN IMMEDIATE).",
+)
+SQLITE_BUSY_ERRORS = REGISTRY.counter(
+    "genglossary_sqlite_busy_errors_total",
+    "Transactions that failed because the database stayed locked past busy_timeout.",
+)
+
+
+def record_llm_request(
+    provider: str,
+    model: str,
+    seconds: float,
+    outcome: str,
+    prompt_tokens: int | None = None,
+    completion_tokens: int | None = None,
+) -> None:
+    """Record one LLM HTTP request (after client-side retries).
+
+    Args:
+        provider: Provider label ("ollama", "openai").
+        model: Model name.
+        seconds: Elapsed time including retries.
+        outcome: "success" or "error".
+        prompt_tokens: Prompt tokens reported by the server, if any.
+        completion_tokens: Completion tokens reported by the server, if any.
+    """
+    LLM_REQUEST_DURATION.labels(provider, model).observe(seconds)
+    LLM_REQUESTS.labels(provider, model, outcome).inc()
+    # Servers omit or null these fields; count only real positive integers
+    if isinstance(prompt_tokens, int) and prompt_tokens > 0:
+        LLM_TOKENS.labels(provider, model, "prompt").inc(prompt_tokens)
+    if isinstance(completion_tokens, int) and completion_tokens > 0:
+        LLM_TOKENS.labels(provider, model, "completion").inc(completion_tokens)
+
+
+def is_busy_error(error: BaseException) -> bool:
+    """Return True if error is SQLite's "database is locked" / busy error."""
+    message = str(error).lower()
+    return "database is locked" in message or "database is busy" in message
@@ -1,27 +1,34 @@
 """Document model for representing loaded documents."""
 
-from pydantic import BaseModel, computed_field
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, computed_field
 
 
 class Document(BaseModel):
     """Represents a loaded document with its content and metadata.
 
+    Documents are immutable so that the split lines can be cached; occurrence
+    scans and context lookups access them once per matching line.
+
     Attributes:
         file_path: The path to the source file.
         content: The full text content of the document.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     file_path: str
     content: str
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def lines(self) -> list[str]:
         """Split content into lines."""
         return self.content.split("\n")
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def line_count(self) -> int:
         """Return the number of lines in the document."""
         return len(self.lines)
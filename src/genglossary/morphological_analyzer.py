@@ -1,6 +1,70 @@
 """Morphological analyzer using SudachiPy for proper noun extraction."""
 
-from sudachipy import Dictionary, SplitMode
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+
+from sudachipy import Dictionary, SplitMode, Tokenizer
+
+
+class TokenizerPool:
+    """Process-wide pool of SudachiPy tokenizers sharing one dictionary.
+
+    Loading the dictionary is the expensive part, so it happens once per
+    process: on first use, or up front with warm_up(). A tokenizer must not
+    be used by two threads at once, so acquire() lends out an idle one and
+    only creates another when all of them are busy.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._dictionary: Dictionary | None = None
+        self._idle: list[Tokenizer] = []
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of tokenizers created so far."""
+        with self._lock:
+            return self._size
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the dictionary has been loaded."""
+        with self._lock:
+            return self._dictionary is not None
+
+    @contextmanager
+    def acquire(self) -> Iterator[Tokenizer]:
+        """Borrow a tokenizer for the duration of the with block."""
+        with self._lock:
+            if self._idle:
+                tokenizer = self._idle.pop()
+            else:
+                # Held during the first load so concurrent callers wait for
+                # one dictionary instead of loading their own
+                if self._dictionary is None:
+                    self._dictionary = Dictionary()
+                tokenizer = self._dictionary.create()
+                self._size += 1
+        try:
+            yield tokenizer
+        finally:
+            with self._lock:
+                self._idle.append(tokenizer)
+
+    def warm_up(self) -> None:
+        """Load the dictionary and run one tokenization ahead of time."""
+        with self.acquire() as tokenizer:
+            tokenizer.tokenize("辞書を読み込みます。", SplitMode.C)
+
+
+_tokenizer_pool = TokenizerPool()
+
+
+def get_tokenizer_pool() -> TokenizerPool:
+    """Get the process-wide tokenizer pool."""
+    return _tokenizer_pool
 
 
 class MorphologicalAnalyzer:
@@ -8,16 +72,22 @@ class MorphologicalAnalyzer:
 
     Uses SudachiPy with split mode C (long unit) to keep compound nouns together.
     Handles long texts by splitting into chunks to avoid SudachiPy's size limit.
+
+    Instances are cheap: tokenizers come from the shared TokenizerPool, and
+    one analyzer may be used from several threads.
     """
 
     # SudachiPy's maximum input size is 49149 bytes
     # Use a smaller chunk size to leave buffer for safety
     MAX_CHUNK_BYTES = 40000
 
-    def __init__(self) -> None:
-        """Initialize the MorphologicalAnalyzer with SudachiPy dictionary."""
-        self._dictionary = Dictionary()
-        self._tokenizer = self._dictionary.create()
+    def __init__(self, pool: TokenizerPool | None = None) -> None:
+        """Initialize the MorphologicalAnalyzer.
+
+        Args:
+            pool: Tokenizer pool to use. Defaults to the process-wide pool.
+        """
+        self._pool = pool or get_tokenizer_pool()
 
     def extract_proper_nouns(
         self,
@@ -109,16 +179,18 @@ class MorphologicalAnalyzer:
         Returns:
             List of unique terms in order of first occurrence.
         """
-        # Use split mode C for long unit segmentation
-        morphemes = self._tokenizer.tokenize(text, SplitMode.C)
-
         terms: list[str] = []
         seen: set[str] = set()
 
-        if extract_compound_nouns:
-            self._extract_compound_nouns(morphemes, include_common_nouns, terms, seen)
-        else:
-            self._extract_individual_nouns(morphemes, include_common_nouns, terms, seen)
+        # Keep the tokenizer until the morphemes have been read
+        with self._pool.acquire() as tokenizer:
+            # Use split mode C for long unit segmentation
+            morphemes = tokenizer.tokenize(text, SplitMode.C)
+
+            if extract_compound_nouns:
+                self._extract_compound_nouns(morphemes, include_common_nouns, terms, seen)
+            else:
+                self._extract_individual_nouns(morphemes, include_common_nouns, terms, seen)
 
         return terms
 
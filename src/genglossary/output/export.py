@@ -0,0 +1,194 @@
+"""Streaming encoders for exporting a glossary.
+
+An export is produced while the glossary is read: encoders turn an
+iterator of glossary rows (see iter_refined) into text pieces, and
+iter_export_chunks joins them into UTF-8 chunks of about chunk_size
+bytes. Time to the first byte and memory use therefore do not grow with
+the size of the glossary. The same encoders back the
+/refined/export API endpoint and the `genglossary export` command.
+
+Formats:
+    md:    Markdown, the same layout as the former /export-md output.
+    jsonl: One JSON object per term.
+    csv:   Comma-separated, with a header row.
+    tsv:   Tab-separated, with a header row.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from genglossary.db.models import GlossaryTermRow
+
+# Bytes buffered before a chunk is handed to the response or file
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Separators inside a single CSV/TSV cell
+_ALIAS_SEPARATOR = "、"
+_OCCURRENCE_SEPARATOR = "; "
+
+_TABLE_COLUMNS = ["term_name", "definition", "confidence", "aliases", "occurrences"]
+
+AliasesMap = Mapping[str, list[str]]
+Encoder = Callable[[Iterable[GlossaryTermRow], AliasesMap], Iterator[str]]
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """A pluggable export format.
+
+    Attributes:
+        name: Format name used by the API and CLI.
+        media_type: Content-Type of the output.
+        extension: File extension, without the dot.
+        encode: Turns glossary rows and the aliases map into text pieces.
+    """
+
+    name: str
+    media_type: str
+    extension: str
+    encode: Encoder
+
+
+def _encode_markdown(
+    rows: Iterable[GlossaryTermRow], aliases_map: AliasesMap
+) -> Iterator[str]:
+    yield "# 用語集\n"
+    for row in rows:
+        lines = [
+            f"## {row['term_name']}\n",
+            f"**定義**: {row['definition']}\n",
+        ]
+        aliases = aliases_map.get(row["term_name"], [])
+        if aliases:
+            lines.append(f"**別名**: {_ALIAS_SEPARATOR.join(aliases)}\n")
+        lines.append(f"**信頼度**: {row['confidence']:.2f}\n")
+        if row["occurrences"]:
+            lines.append("\n**出現箇所**:\n")
+            for occ in row["occurrences"]:
+                lines.append(f"- {occ.document_path}:{occ.line_number}\n")
+        lines.append("\n---\n\n")
+        yield "".join(lines)
+
+
+def _encode_jsonl(
+    rows: Iterable[GlossaryTermRow], aliases_map: AliasesMap
+) -> Iterator[str]:
+    for row in rows:
+        record = {
+            "term_name": row["term_name"],
+            "definition": row["definition"],
+            "confidence": row["confidence"],
+            "aliases": aliases_map.get(row["term_name"], []),
+            "occurrences": [
+                {
+                    "document_path": occ.document_path,
+                    "line_number": occ.line_number,
+                    "context": occ.context,
+                }
+                for occ in row["occurrences"]
+            ],
+        }
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _table_encoder(delimiter: str) -> Encoder:
+    def encode(
+        rows: Iterable[GlossaryTermRow], aliases_map: AliasesMap
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\r\n")
+
+        def flush() -> str:
+            text = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return text
+
+        writer.writerow(_TABLE_COLUMNS)
+        yield flush()
+        for row in rows:
+            writer.writerow(
+                [
+                    row["term_name"],
+                    row["definition"],
+                    f"{row['confidence']:.2f}",
+                    _ALIAS_SEPARATOR.join(aliases_map.get(row["term_name"], [])),
+                    _OCCURRENCE_SEPARATOR.join(
+                        f"{occ.document_path}:{occ.line_number}"
+                        for occ in row["occurrences"]
+                    ),
+                ]
+            )
+            yield flush()
+
+    return encode
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    fmt.name: fmt
+    for fmt in (
+        ExportFormat("md", "text/markdown; charset=utf-8", "md", _encode_markdown),
+        ExportFormat("jsonl", "application/x-ndjson", "jsonl", _encode_jsonl),
+        ExportFormat("csv", "text/csv; charset=utf-8", "csv", _table_encoder(",")),
+        ExportFormat(
+            "tsv", "text/tab-separated-values; charset=utf-8", "tsv", _table_encoder("\t")
+        ),
+    )
+}
+
+
+def get_export_format(name: str) -> ExportFormat:
+    """Look up an export format by name.
+
+    Args:
+        name: "md", "jsonl", "csv" or "tsv".
+
+    Returns:
+        ExportFormat: The format.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    try:
+        return EXPORT_FORMATS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown export format: {name}. Must be one of {tuple(EXPORT_FORMATS)}"
+        ) from None
+
+
+def iter_export_chunks(
+    rows: Iterable[GlossaryTermRow],
+    fmt: ExportFormat,
+    aliases_map: AliasesMap,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Encode glossary rows into UTF-8 chunks.
+
+    Pieces are buffered until about chunk_size bytes, so neither a
+    response nor a file receives one tiny write per term.
+
+    Args:
+        rows: Glossary rows, typically a lazy iterator over a DB cursor.
+        fmt: Export format.
+        aliases_map: Aliases per primary term name.
+        chunk_size: Approximate size of each chunk in bytes.
+
+    Yields:
+        bytes: Encoded output; the last chunk may be smaller.
+    """
+    pending: list[bytes] = []
+    size = 0
+    for piece in fmt.encode(rows, aliases_map):
+        data = piece.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(pending)
+            pending.clear()
+            size = 0
+    if pending:
+        yield b"".join(pending)
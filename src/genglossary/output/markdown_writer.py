@@ -1,5 +1,6 @@
 """Markdown writer for glossary output."""
 
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -36,11 +37,14 @@ class MarkdownWriter:
         # Create parent directories if they don't exist
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate markdown content
-        content = self._generate_markdown(glossary, synonym_groups=synonym_groups)
-
-        # Write to file
-        output_file.write_text(content, encoding="utf-8")
+        # Write section by section instead of building the whole document
+        with output_file.open("w", encoding="utf-8") as f:
+            for i, section in enumerate(
+                self._iter_sections(glossary, synonym_groups=synonym_groups)
+            ):
+                if i:
+                    f.write("\n")
+                f.write(section)
 
     def _generate_markdown(
         self,
@@ -56,22 +60,34 @@ class MarkdownWriter:
         Returns:
             Complete Markdown content as string.
         """
-        sections = []
+        return "\n".join(self._iter_sections(glossary, synonym_groups=synonym_groups))
+
+    def _iter_sections(
+        self,
+        glossary: Glossary,
+        synonym_groups: list[SynonymGroup] | None = None,
+    ) -> Iterator[str]:
+        """Yield the sections of the Markdown document, to be joined by newlines.
 
+        Args:
+            glossary: The Glossary object to format.
+            synonym_groups: Optional list of synonym groups for alias display.
+
+        Yields:
+            The header, the term list heading, then each term and separator.
+        """
         # Header
-        sections.append(self._format_header(glossary))
+        yield self._format_header(glossary)
 
         # Terms
-        sections.append("## 用語一覧\n")
+        yield "## 用語一覧\n"
 
         # Sort terms alphabetically for consistent output
         sorted_terms = sorted(glossary.terms.values(), key=lambda t: t.name)
 
         for term in sorted_terms:
-            sections.append(self._format_term(term, synonym_groups=synonym_groups))
-            sections.append("---\n")
-
-        return "\n".join(sections)
+            yield self._format_term(term, synonym_groups=synonym_groups)
+            yield "---\n"
 
     def _format_header(self, glossary: Glossary) -> str:
         """Format the glossary header with metadata.
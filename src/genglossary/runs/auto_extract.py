@@ -0,0 +1,148 @@
+"""Coalescing scheduler for the extract run triggered by file uploads."""
+
+import logging
+import time
+from threading import Lock, Timer, current_thread
+
+from genglossary.db.connection import database_connection, transaction
+from genglossary.db.pending_extract_repository import (
+    list_pending_extract_documents,
+    remove_pending_extract_documents,
+)
+from genglossary.runs.manager import RunManager
+
+logger = logging.getLogger(__name__)
+
+
+class AutoExtractScheduler:
+    """Merges uploads into one incremental extract run per quiet period.
+
+    Uploads queue their new documents in pending_extract_documents (in the
+    same transaction that creates them) and call notify. The scheduler
+    waits until no upload has arrived for quiet_seconds, but never longer
+    than max_delay_seconds after the first one, then starts a single
+    extract run for every queued document. If a run is active at that
+    point, it checks again every retry_interval seconds and starts the
+    extract once the run has finished, so uploads made during a run are
+    no longer dropped. The queue is persisted, so documents queued before
+    a restart are picked up by resume.
+
+    Thread-safe: a single instance is shared by all requests for a project.
+    """
+
+    DEFAULT_QUIET_SECONDS = 2.0
+    DEFAULT_MAX_DELAY_SECONDS = 30.0
+    DEFAULT_RETRY_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        manager: RunManager,
+        quiet_seconds: float = DEFAULT_QUIET_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            manager: Run manager that starts the extract runs. Replaced by
+                the API when the project's manager is recreated.
+            quiet_seconds: Seconds without uploads before the run starts.
+            max_delay_seconds: Upper bound of the wait after the first upload.
+            retry_interval: Seconds between checks while a run is active.
+        """
+        self.manager = manager
+        self.quiet_seconds = quiet_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.retry_interval = retry_interval
+        self._lock = Lock()
+        self._timer: Timer | None = None
+        self._first_notified_at: float | None = None
+
+    @property
+    def is_scheduled(self) -> bool:
+        """Whether a flush is waiting to run."""
+        with self._lock:
+            return self._timer is not None
+
+    def notify(self) -> None:
+        """Restart the quiet period after documents were queued."""
+        with self._lock:
+            now = time.monotonic()
+            if self._first_notified_at is None:
+                self._first_notified_at = now
+            remaining = self._first_notified_at + self.max_delay_seconds - now
+            self._arm(max(0.0, min(self.quiet_seconds, remaining)))
+
+    def resume(self) -> None:
+        """Schedule a flush for documents queued before a restart."""
+        with self._lock:
+            if self._timer is None:
+                self._arm(self.quiet_seconds)
+
+    def close(self) -> None:
+        """Cancel the scheduled flush. Queued documents stay in the database."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def flush(self) -> int | None:
+        """Start one incremental extract run for every queued document.
+
+        Returns:
+            int | None: ID of the started run, or None if nothing is queued.
+
+        Raises:
+            RuntimeError: If a run is already running; the documents stay
+                queued.
+        """
+        manager = self.manager
+        with database_connection(manager.db_path) as conn:
+            document_ids = list_pending_extract_documents(conn)
+            if not document_ids:
+                with self._lock:
+                    self._first_notified_at = None
+                return None
+            if manager.get_active_run() is not None:
+                raise RuntimeError("Run already running")
+
+            run_id = manager.start_run(
+                scope="extract", triggered_by="auto", document_ids=document_ids
+            )
+            with self._lock:
+                self._first_notified_at = None
+            # Only the documents handed to the run; later uploads stay queued
+            with transaction(conn):
+                remove_pending_extract_documents(conn, document_ids)
+        logger.info(
+            "Auto-extract run %d started for %d documents", run_id, len(document_ids)
+        )
+        return run_id
+
+    def _arm(self, delay: float) -> None:
+        """(Re)start the flush timer. Caller must hold _lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+        timer = Timer(delay, self._fire)
+        timer.name = "auto-extract"
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _fire(self) -> None:
+        with self._lock:
+            # Cancelled too late, or replaced by a newer notify
+            if self._timer is not current_thread():
+                return
+            self._timer = None
+
+        try:
+            self.flush()
+        except RuntimeError:
+            with self._lock:
+                if self._timer is None:
+                    self._arm(self.retry_interval)
+        except Exception:
+            # Documents stay queued and are retried on the next upload or restart
+            logger.warning("Auto-extract failed to start", exc_info=True)
+
@@ -1,19 +1,23 @@
 """Pipeline executor for running glossary generation steps."""
 
 import sqlite3
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
 from pathlib import Path
 from threading import Event
-from typing import Callable
+from typing import Callable, ContextManager, Iterator
 
 from genglossary.db.connection import transaction
 from genglossary.db.document_repository import (
-    create_documents_batch,
-    delete_all_documents,
+    delete_documents_by_names,
+    has_document_manifest,
     list_all_documents,
+    list_document_manifest,
+    list_document_metadata,
     list_documents_by_ids,
+    upsert_document_file,
 )
 from genglossary.db.issue_repository import create_issues_batch, delete_all_issues, list_all_issues
 from genglossary.db.models import GlossaryTermRow
@@ -24,6 +28,7 @@ from genglossary.db.provisional_repository import (
 )
 from genglossary.db.refined_repository import create_refined_terms_batch, delete_all_refined
 from genglossary.db.runs_repository import update_run_progress
+from genglossary.db.search_repository import find_document_names
 from genglossary.db.synonym_repository import list_groups as list_synonym_groups
 from genglossary.db.term_repository import (
     backup_user_notes,
@@ -32,18 +37,19 @@ from genglossary.db.term_repository import (
     list_all_terms,
     restore_user_notes,
 )
-from genglossary.document_loader import DocumentLoader
+from genglossary.document_loader import DocumentLoader, FileStat
 from genglossary.glossary_generator import GlossaryGenerator
 from genglossary.glossary_refiner import GlossaryRefiner
 from genglossary.glossary_reviewer import GlossaryReviewer
-from genglossary.llm.factory import create_llm_client
+from genglossary.llm.factory import create_batcher, create_llm_client
 from genglossary.models.document import Document
 from genglossary.models.glossary import Glossary, GlossaryIssue
 from genglossary.models.synonym import SynonymGroup
 from genglossary.models.term import ClassifiedTerm, Term, TermOccurrence
+from genglossary.runs.profile import RunProfiler
+from genglossary.runs.streaming import StreamingPipeline
 from genglossary.term_extractor import TermExtractor
-from genglossary.utils.hash import compute_content_hash
-from genglossary.utils.path_utils import to_safe_relative_path
+from genglossary.types import DocumentSearch
 
 
 class PipelineCancelledException(Exception):
@@ -88,21 +94,49 @@ def _cancellable(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(self: "PipelineExecutor", *args, **kwargs):  # type: ignore[no-untyped-def]
-        # Find context in kwargs first
-        context = kwargs.get("context")
-        if context is None:
-            # Search in positional args
-            for arg in args:
-                if isinstance(arg, ExecutionContext):
-                    context = arg
-                    break
-
+        context = _find_context(args, kwargs)
         if context is not None:
             self._check_cancellation(context)  # Raises if cancelled
         return func(self, *args, **kwargs)
     return wrapper
 
 
+def _profiled_step(step: str) -> Callable[[Callable], Callable]:
+    """Decorator that adds a method's wall time to the run profile.
+
+    The decorated method must receive an ExecutionContext like _cancellable.
+    Nothing is recorded when the context has no profiler.
+
+    Args:
+        step: Step name recorded in the profile.
+
+    Returns:
+        Decorator for the step method.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self: "PipelineExecutor", *args, **kwargs):  # type: ignore[no-untyped-def]
+            context = _find_context(args, kwargs)
+            if context is None or context.profiler is None:
+                return func(self, *args, **kwargs)
+            with context.profiler.step(step):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _find_context(args: tuple, kwargs: dict) -> "ExecutionContext | None":
+    """Find the ExecutionContext among a method's arguments."""
+    # Find context in kwargs first
+    context = kwargs.get("context")
+    if context is None:
+        # Search in positional args
+        for arg in args:
+            if isinstance(arg, ExecutionContext):
+                return arg
+    return context
+
+
 @dataclass(frozen=True)
 class ExecutionContext:
     """Immutable execution context for thread-safe pipeline execution.
@@ -117,6 +151,7 @@ class ExecutionContext:
     run_id: int
     log_callback: Callable[[dict], None]
     cancel_event: Event
+    profiler: RunProfiler | None = None
 
 
 class PipelineExecutor:
@@ -129,7 +164,9 @@ class PipelineExecutor:
         This class is designed to be thread-safe through the use of ExecutionContext.
         The LLM client is shared across executions (for efficiency), but all
         execution-specific state is contained in the ExecutionContext passed to
-        each execute() call.
+        each execute() call. The exception is the context's profiler, which is
+        attached to the LLM client while execute() runs; RunManager creates
+        one executor per run, so profiled executions never overlap.
     """
 
     def __init__(
@@ -138,6 +175,8 @@ class PipelineExecutor:
         model: str = "",
         base_url: str | None = None,
         review_batch_size: int = GlossaryReviewer.DEFAULT_BATCH_SIZE,
+        llm_concurrency: int = 1,
+        streaming: bool = False,
         llm_debug: bool = False,
         debug_dir: str | None = None,
     ):
@@ -147,8 +186,14 @@ class PipelineExecutor:
             provider: LLM provider name (default: 'ollama').
             model: LLM model name (default: '').
             base_url: Base URL for the LLM API (optional).
-            review_batch_size: Number of terms per batch for review step.
-                Defaults to GlossaryReviewer.DEFAULT_BATCH_SIZE (20).
+            review_batch_size: Number of terms per batch for review step
+                when token-budget batching is disabled
+                (LLM_BATCH_TOKEN_BUDGET=0). Defaults to
+                GlossaryReviewer.DEFAULT_BATCH_SIZE (10).
+            llm_concurrency: Maximum number of concurrent LLM calls per step
+                (default: 1, sequential).
+            streaming: Run the full pipeline with overlapping generate,
+                review and refine stages (default: False).
             llm_debug: Enable LLM debug logging (default: False).
             debug_dir: Directory for debug log files.
         """
@@ -159,7 +204,10 @@ class PipelineExecutor:
             llm_debug=llm_debug,
             debug_dir=debug_dir,
         )
+        self._batcher = create_batcher(getattr(self._llm_client, "model", model))
         self._review_batch_size = review_batch_size
+        self._llm_concurrency = llm_concurrency
+        self._streaming = streaming
 
     def close(self) -> None:
         """Close the LLM client to cancel any ongoing requests.
@@ -222,6 +270,23 @@ class PipelineExecutor:
             self._log(context, "info", "Execution cancelled")
             raise PipelineCancelledException()
 
+    @staticmethod
+    @contextmanager
+    def _write_transaction(
+        conn: sqlite3.Connection, context: ExecutionContext
+    ) -> Iterator[None]:
+        """transaction() whose duration counts as DB write time in the profile.
+
+        Args:
+            conn: Project database connection.
+            context: Execution context (for the run profile).
+        """
+        timer: ContextManager[None] = (
+            nullcontext() if context.profiler is None else context.profiler.db_write()
+        )
+        with timer, transaction(conn):
+            yield
+
     @staticmethod
     def _documents_from_db_rows(rows: list[sqlite3.Row]) -> list[Document]:
         """Convert DB rows to Document objects.
@@ -237,6 +302,28 @@ class PipelineExecutor:
             for row in rows
         ]
 
+    @staticmethod
+    def _create_document_search(
+        conn: sqlite3.Connection, documents: list[Document]
+    ) -> DocumentSearch | None:
+        """Create a full-text document search for context retrieval.
+
+        The search returns documents table names, so it is only usable when
+        the loaded documents are exactly those rows (filesystem-loaded
+        documents keep absolute paths).
+
+        Args:
+            conn: Project database connection.
+            documents: Documents the pipeline step works on.
+
+        Returns:
+            DocumentSearch | None: Search function, or None if not applicable.
+        """
+        names = {row["file_name"] for row in list_document_metadata(conn)}
+        if not documents or any(doc.file_path not in names for doc in documents):
+            return None
+        return lambda terms: find_document_names(conn, terms)
+
     @staticmethod
     def _glossary_from_db_rows(rows: list[GlossaryTermRow]) -> Glossary:
         """Convert provisional DB rows to Glossary object.
@@ -343,6 +430,26 @@ class PipelineExecutor:
             PipelineCancelledException: If execution is cancelled.
             ValueError: If scope is unknown.
         """
+        if context.profiler is None:
+            self._execute_scope(conn, scope, context, doc_root, document_ids)
+            return
+
+        self._llm_client.call_observer = context.profiler
+        try:
+            self._execute_scope(conn, scope, context, doc_root, document_ids)
+        finally:
+            self._llm_client.call_observer = None
+            context.profiler.finish()
+
+    def _execute_scope(
+        self,
+        conn: sqlite3.Connection,
+        scope: str | PipelineScope,
+        context: ExecutionContext,
+        doc_root: str,
+        document_ids: list[int] | None,
+    ) -> None:
+        """Clear tables, run the handler for the scope and restore user notes."""
         # Normalize to PipelineScope enum
         scope_enum = scope if isinstance(scope, PipelineScope) else PipelineScope(scope)
 
@@ -356,7 +463,7 @@ class PipelineExecutor:
         if not incremental:
             if scope_enum == PipelineScope.EXTRACT:
                 user_notes_backup = backup_user_notes(conn)
-            self._clear_tables_for_scope(conn, scope_enum)
+            self._clear_tables_for_scope(conn, context, scope_enum)
 
         # Execute based on scope using dispatch table with direct method references
         scope_handlers = {
@@ -379,18 +486,23 @@ class PipelineExecutor:
 
         # Restore user_notes after full extract
         if user_notes_backup:
-            with transaction(conn):
+            with self._write_transaction(conn, context):
                 restore_user_notes(conn, user_notes_backup)
 
         self._log(context, "info", "Pipeline execution completed")
 
+    @_profiled_step("load_documents")
     def _load_documents(
         self, conn: sqlite3.Connection, context: ExecutionContext, doc_root: str = "."
     ) -> list[Document]:
         """Load documents from database or filesystem.
 
-        DB-first approach: Try to load from DB first (GUI mode), fall back to
-        filesystem if needed (CLI mode).
+        GUI mode: documents uploaded to the DB are used as they are.
+        CLI mode (explicit doc_root, and either an empty DB or documents
+        previously loaded from doc_root): the DB is synchronized with
+        doc_root first. Files whose size and mtime match the document
+        manifest are not read again; new and modified files are read in a
+        thread pool; files gone from doc_root are deleted.
 
         Args:
             conn: Project database connection.
@@ -403,42 +515,68 @@ class PipelineExecutor:
         Raises:
             RuntimeError: If no documents found.
         """
-        # Try loading from database first (GUI mode)
         doc_rows = list_all_documents(conn)
+        if (
+            doc_root
+            and doc_root != "."
+            and (not doc_rows or has_document_manifest(conn))
+            and self._sync_documents_from_filesystem(conn, context, doc_root)
+        ):
+            doc_rows = list_all_documents(conn)
+
         if doc_rows:
             self._log(context, "info", "Loading documents from database...")
             return self._documents_from_db_rows(doc_rows)
 
-        # Fall back to filesystem if DB is empty (CLI mode)
-        if doc_root and doc_root != ".":
-            self._log(context, "info", f"Loading documents from filesystem: {doc_root}")
-            loader = DocumentLoader()
-            documents = loader.load_directory(doc_root)
-
-            if documents:
-                # Save loaded documents to DB using batch insert
-                # Use relative path from doc_root as file_name to:
-                # - Avoid same basename collisions (e.g., docs/README.md vs examples/README.md)
-                # - Prevent server path leakage via API/logs (security)
-                # - Improve portability when moving DB between environments
-                # - Reject files outside doc_root for security (path traversal prevention)
-                with transaction(conn):
-                    delete_all_documents(conn)
-                    docs_data = [
-                        (
-                            to_safe_relative_path(document.file_path, doc_root),
-                            document.content,
-                            compute_content_hash(document.content),
-                        )
-                        for document in documents
-                    ]
-                    create_documents_batch(conn, docs_data)
-                return documents
-
         # No documents found
         self._log(context, "error", "No documents found")
         raise RuntimeError("Cannot execute pipeline without documents")
 
+    def _sync_documents_from_filesystem(
+        self, conn: sqlite3.Connection, context: ExecutionContext, doc_root: str
+    ) -> bool:
+        """Bring the documents table up to date with doc_root.
+
+        File names are relative paths from doc_root, which avoids basename
+        collisions, keeps server paths out of the API and logs, and rejects
+        files outside doc_root.
+
+        Args:
+            conn: Project database connection.
+            context: Execution context for logging.
+            doc_root: Root directory for documents.
+
+        Returns:
+            bool: True if any document was added, updated or deleted.
+        """
+        self._log(context, "info", f"Loading documents from filesystem: {doc_root}")
+        manifest = {
+            row["file_name"]: FileStat(row["size"], row["mtime_ns"])
+            for row in list_document_manifest(conn)
+        }
+        scan = DocumentLoader().scan_directory(doc_root, manifest)
+        self._log(
+            context,
+            "info",
+            f"Documents: {len(scan.changed)} read, {len(scan.unchanged)} unchanged, "
+            f"{len(scan.removed)} removed",
+        )
+        if not scan.changed and not scan.removed:
+            return False
+
+        with self._write_transaction(conn, context):
+            delete_documents_by_names(conn, scan.removed)
+            for scanned in scan.changed:
+                upsert_document_file(
+                    conn,
+                    scanned.file_name,
+                    scanned.content,
+                    scanned.content_hash,
+                    scanned.stat.size,
+                    scanned.stat.mtime_ns,
+                )
+        return True
+
     def _load_provisional_glossary(
         self, conn: sqlite3.Connection, context: ExecutionContext, step_name: str
     ) -> Glossary:
@@ -475,6 +613,7 @@ class PipelineExecutor:
 
         Extract is excluded from the full pipeline. Terms must already exist
         in the database (via prior extract run or auto-extract on file add).
+        In streaming mode the three steps overlap (see _do_streaming).
 
         Args:
             conn: Project database connection.
@@ -503,6 +642,13 @@ class PipelineExecutor:
         # Load synonym groups
         synonym_groups = self._load_synonym_groups(conn, context)
 
+        if self._streaming:
+            self._do_streaming(
+                conn, context, documents, extracted_terms, user_notes_map,
+                synonym_groups=synonym_groups,
+            )
+            return
+
         # Step 3: Generate glossary
         glossary = self._do_generate(
             conn, context, documents, extracted_terms, user_notes_map,
@@ -730,6 +876,7 @@ class PipelineExecutor:
                 user_notes_map[row["term_text"]] = notes
         return user_notes_map
 
+    @_profiled_step("extract")
     def _do_extract(
         self,
         conn: sqlite3.Connection,
@@ -759,6 +906,7 @@ class PipelineExecutor:
             llm_client=self._llm_client,
             excluded_term_repo=conn,
             required_term_repo=conn,
+            batcher=self._batcher,
         )
 
         # Create progress callback for batch progress
@@ -781,7 +929,7 @@ class PipelineExecutor:
             unique_terms.append(classified_term)
 
         # Save all unique terms in a single transaction using batch insert
-        with transaction(conn):
+        with self._write_transaction(conn, context):
             terms_data = [
                 (classified_term.term, classified_term.category.value)
                 for classified_term in unique_terms
@@ -791,6 +939,7 @@ class PipelineExecutor:
         self._log(context, "info", f"Extracted {len(unique_terms)} unique terms (from {len(extracted_terms)} total)")
         return unique_terms
 
+    @_profiled_step("generate")
     def _do_generate(
         self,
         conn: sqlite3.Connection,
@@ -819,7 +968,10 @@ class PipelineExecutor:
         self._check_cancellation(context)
 
         self._log(context, "info", "Generating glossary...")
-        generator = GlossaryGenerator(llm_client=self._llm_client)
+        generator = GlossaryGenerator(
+            llm_client=self._llm_client,
+            document_search=self._create_document_search(conn, documents),
+        )
         progress_cb = self._create_progress_callback(conn, context, "provisional")
         try:
             glossary = generator.generate(
@@ -834,12 +986,13 @@ class PipelineExecutor:
             raise
 
         # Save provisional glossary using batch insert
-        with transaction(conn):
+        with self._write_transaction(conn, context):
             self._save_glossary_terms_batch(conn, glossary, create_provisional_terms_batch)
 
         self._log(context, "info", f"Generated {len(glossary.terms)} terms")
         return glossary
 
+    @_profiled_step("review")
     def _do_review(
         self,
         conn: sqlite3.Connection,
@@ -867,7 +1020,10 @@ class PipelineExecutor:
 
         self._log(context, "info", "Reviewing glossary...")
         reviewer = GlossaryReviewer(
-            llm_client=self._llm_client, batch_size=self._review_batch_size
+            llm_client=self._llm_client,
+            batch_size=self._review_batch_size,
+            max_concurrency=self._llm_concurrency,
+            batcher=self._batcher,
         )
 
         progress_cb = self._create_progress_callback(conn, context, "issues")
@@ -875,11 +1031,8 @@ class PipelineExecutor:
         # Send initial step update before processing
         # This ensures UI shows "Issues" step immediately, even if glossary is empty
         # Use batch count (same as GlossaryReviewer) for consistent progress semantics
-        term_count = len(glossary.terms)
-        total_batches = (
-            (term_count + self._review_batch_size - 1) // self._review_batch_size
-            if term_count > 0
-            else 0
+        total_batches = len(
+            reviewer.split_into_batches(glossary, user_notes_map, synonym_groups)
         )
         progress_cb(0, total_batches, "")
 
@@ -904,7 +1057,7 @@ class PipelineExecutor:
             raise PipelineCancelledException()
 
         # Save issues using batch insert
-        with transaction(conn):
+        with self._write_transaction(conn, context):
             issues_data: list[tuple[str, str, str, bool, str | None]] = [
                 (
                     issue.term_name,
@@ -920,6 +1073,7 @@ class PipelineExecutor:
         self._log(context, "info", f"Found {len(issues)} issues")
         return issues
 
+    @_profiled_step("refine")
     def _do_refine(
         self,
         conn: sqlite3.Connection,
@@ -951,7 +1105,11 @@ class PipelineExecutor:
             self._check_cancellation(context)
 
             self._log(context, "info", "Refining glossary...")
-            refiner = GlossaryRefiner(llm_client=self._llm_client)
+            refiner = GlossaryRefiner(
+                llm_client=self._llm_client,
+                document_search=self._create_document_search(conn, documents),
+                max_concurrency=self._llm_concurrency,
+            )
             progress_cb = self._create_progress_callback(conn, context, "refined")
             try:
                 glossary = refiner.refine(
@@ -969,19 +1127,130 @@ class PipelineExecutor:
             self._log(context, "info", "No issues found, copying provisional to refined")
 
         # Save refined glossary using batch insert
-        with transaction(conn):
+        with self._write_transaction(conn, context):
             self._save_glossary_terms_batch(conn, glossary, create_refined_terms_batch)
 
         return glossary
 
-    def _clear_tables_for_scope(self, conn: sqlite3.Connection, scope: PipelineScope) -> None:
+    @_profiled_step("streaming")
+    def _do_streaming(
+        self,
+        conn: sqlite3.Connection,
+        context: ExecutionContext,
+        documents: list[Document],
+        extracted_terms: list[str],
+        user_notes_map: dict[str, str] | None = None,
+        synonym_groups: list[SynonymGroup] | None = None,
+    ) -> None:
+        """Execute generate → review → refine as a stream and save to DB.
+
+        Produces the same tables as _do_generate, _do_review and _do_refine
+        run in sequence. The provisional glossary is saved as soon as
+        generation finishes; issues and the refined glossary are saved once
+        everything has been processed.
+
+        Args:
+            conn: Project database connection.
+            context: Execution context for logging and cancellation.
+            documents: Source documents.
+            extracted_terms: Terms to generate definitions for.
+            user_notes_map: Optional mapping of term_text to user_notes.
+            synonym_groups: Optional list of synonym groups.
+
+        Raises:
+            PipelineCancelledException: If execution is cancelled.
+        """
+        self._check_cancellation(context)
+
+        self._log(context, "info", "Generating, reviewing and refining glossary (streaming)...")
+        document_search = self._create_document_search(conn, documents)
+        refiner = GlossaryRefiner(llm_client=self._llm_client)
+        # Documents without any extracted term cannot provide refine context
+        context_documents = documents
+        if document_search is not None:
+            candidates = document_search(extracted_terms)
+            context_documents = [doc for doc in documents if doc.file_path in candidates]
+        pipeline = StreamingPipeline(
+            generator=GlossaryGenerator(
+                llm_client=self._llm_client,
+                document_search=document_search,
+            ),
+            reviewer=GlossaryReviewer(
+                llm_client=self._llm_client,
+                batch_size=self._review_batch_size,
+                batcher=self._batcher,
+            ),
+            refiner=refiner,
+            max_concurrency=self._llm_concurrency,
+        )
+
+        review_cb = self._create_progress_callback(conn, context, "issues")
+
+        def on_generated(glossary: Glossary) -> None:
+            with self._write_transaction(conn, context):
+                self._save_glossary_terms_batch(
+                    conn, glossary, create_provisional_terms_batch
+                )
+            self._log(context, "info", f"Generated {len(glossary.terms)} terms")
+
+        try:
+            result = pipeline.run(
+                extracted_terms, documents,
+                refiner.build_context_index(context_documents),
+                cancel_event=context.cancel_event,
+                user_notes_map=user_notes_map,
+                synonym_groups=synonym_groups,
+                generate_progress_callback=self._create_progress_callback(
+                    conn, context, "provisional"
+                ),
+                review_progress_callback=lambda current, total: review_cb(
+                    current, total, ""
+                ),
+                refine_progress_callback=self._create_progress_callback(
+                    conn, context, "refined"
+                ),
+                generated_callback=on_generated,
+            )
+        except Exception as e:
+            self._log(context, "error", f"Streaming pipeline failed: {e}")
+            raise
+
+        if result is None:
+            self._check_cancellation(context)  # Raises
+            raise PipelineCancelledException()
+
+        with self._write_transaction(conn, context):
+            create_issues_batch(conn, [
+                (
+                    issue.term_name,
+                    issue.issue_type,
+                    issue.description,
+                    issue.should_exclude,
+                    issue.exclusion_reason,
+                )
+                for issue in result.issues
+            ])
+            self._save_glossary_terms_batch(
+                conn, result.refined, create_refined_terms_batch
+            )
+
+        self._log(context, "info", f"Found {len(result.issues)} issues")
+        self._log(context, "info", f"Refined {len(result.refined.terms)} terms")
+
+    def _clear_tables_for_scope(
+        self,
+        conn: sqlite3.Connection,
+        context: ExecutionContext,
+        scope: PipelineScope,
+    ) -> None:
         """Clear relevant tables before execution.
 
         Args:
             conn: Project database connection.
+            context: Execution context (for the run profile).
             scope: Execution scope (PipelineScope enum).
         """
         clear_funcs = _SCOPE_CLEAR_FUNCTIONS.get(scope, [])
-        with transaction(conn):
+        with self._write_transaction(conn, context):
             for clear_func in clear_funcs:
                 clear_func(conn)
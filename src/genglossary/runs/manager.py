@@ -17,6 +17,7 @@ from genglossary.db.connection import (
     immediate_transaction,
     transaction,
 )
+from genglossary.db.run_profile_repository import save_run_profile
 from genglossary.db.runs_repository import (
     RunUpdateResult,
     create_run,
@@ -26,12 +27,14 @@ from genglossary.db.runs_repository import (
     update_run_status,
     update_run_status_if_active,
 )
+from genglossary.metrics import RUNS_ACTIVE, RUNS_FINISHED, RUNS_QUEUED
 from genglossary.runs.error_sanitizer import sanitize_error_message
 from genglossary.runs.executor import (
     ExecutionContext,
     PipelineCancelledException,
     PipelineExecutor,
 )
+from genglossary.runs.profile import RunProfiler
 
 
 class RunManager:
@@ -118,6 +121,7 @@ class RunManager:
             cancel_event = Event()
             with self._cancel_events_lock:
                 self._cancel_events[run_id] = cancel_event
+            RUNS_QUEUED.inc()
 
         # Start background thread (outside lock)
         try:
@@ -129,6 +133,8 @@ class RunManager:
         except Exception as e:
             # Reset thread reference (it was never started)
             self._thread = None
+            RUNS_QUEUED.dec()
+            RUNS_FINISHED.labels(scope, "failed").inc()
 
             # Try to update DB status, but don't mask the original exception
             status_update_failed = False
@@ -180,6 +186,8 @@ class RunManager:
         conn = None
         final_status: str | None = None
         status_update_failed: bool = False
+        RUNS_QUEUED.dec()
+        RUNS_ACTIVE.inc()
 
         try:
             conn, context = self._setup_run(run_id)
@@ -214,6 +222,8 @@ class RunManager:
                 },
             )
         finally:
+            RUNS_ACTIVE.dec()
+            RUNS_FINISHED.labels(scope, final_status or "failed").inc()
             # Cleanup run resources (cancel event, completion signal, subscribers)
             self._cleanup_run_resources(
                 run_id,
@@ -255,6 +265,7 @@ class RunManager:
                 run_id=run_id,
                 log_callback=log_callback,
                 cancel_event=cancel_event,
+                profiler=RunProfiler(),
             )
             return conn, context
         except Exception:
@@ -291,6 +302,8 @@ class RunManager:
             provider=self.llm_provider,
             model=self.llm_model,
             base_url=self.llm_base_url or None,
+            llm_concurrency=config.llm_max_concurrency,
+            streaming=config.pipeline_streaming,
             llm_debug=config.llm_debug,
             debug_dir=debug_dir,
         )
@@ -319,8 +332,43 @@ class RunManager:
                     f"Failed to close executor for run {run_id}", exc_info=True
                 )
 
+        self._save_profile(conn, run_id, context, config)
         return pipeline_error, pipeline_traceback
 
+    def _save_profile(
+        self,
+        conn: sqlite3.Connection,
+        run_id: int,
+        context: ExecutionContext,
+        config: Config,
+    ) -> None:
+        """Persist the run's performance profile.
+
+        Profiles are saved for failed and cancelled runs too. Errors are
+        logged and otherwise ignored so they never change the run status.
+
+        Args:
+            conn: Database connection.
+            run_id: Run ID.
+            context: Execution context holding the profiler.
+            config: Configuration the run was started with.
+        """
+        if context.profiler is None:
+            return
+        try:
+            with transaction(conn):
+                save_run_profile(
+                    conn,
+                    run_id,
+                    context.profiler.snapshot(),
+                    llm_provider=self.llm_provider,
+                    llm_model=self.llm_model,
+                    llm_concurrency=config.llm_max_concurrency,
+                    streaming=config.pipeline_streaming,
+                )
+        except Exception:
+            logger.warning("Failed to save profile for run %d", run_id, exc_info=True)
+
     def cancel_run(self, run_id: int) -> None:
         """Cancel a running run by setting its cancellation event.
 
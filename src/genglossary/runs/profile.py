@@ -0,0 +1,166 @@
+"""Per-run performance profiling.
+
+A RunProfiler is attached to one pipeline run. The executor times each
+step and database write with it, and the LLM client reports every call
+to it (see LlmCallObserver), so the finished RunProfile shows where the
+run's time went. Profiles are stored in the run_profiles table.
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from statistics import fmean
+from threading import Lock
+from typing import Any, Iterator
+
+from genglossary.utils.stats import percentile
+
+
+@dataclass(frozen=True)
+class RunProfile:
+    """Performance summary of one pipeline run.
+
+    Attributes:
+        wall_seconds: Total execution time of the pipeline.
+        step_seconds: Wall time per step, in execution order.
+        llm_calls: Number of generate()/generate_structured() calls.
+        llm_failures: Calls that raised after the client's own retries.
+        llm_retries: Retried requests (HTTP errors and invalid JSON).
+        llm_retry_reasons: Retried requests per reason (e.g. rate_limited,
+            server_error, invalid_json); sums to llm_retries.
+        json_parse_failures: Responses that were not the expected JSON.
+        prompt_chars: Total characters of prompts sent.
+        response_chars: Total characters of responses received.
+        llm_latency_mean_ms: Mean call latency, None without calls.
+        llm_latency_p95_ms: 95th percentile call latency, None without calls.
+        db_write_seconds: Time spent in write transactions.
+    """
+
+    wall_seconds: float
+    step_seconds: dict[str, float] = field(default_factory=dict)
+    llm_calls: int = 0
+    llm_failures: int = 0
+    llm_retries: int = 0
+    llm_retry_reasons: dict[str, int] = field(default_factory=dict)
+    json_parse_failures: int = 0
+    prompt_chars: int = 0
+    response_chars: int = 0
+    llm_latency_mean_ms: float | None = None
+    llm_latency_p95_ms: float | None = None
+    db_write_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize with the steps as a list of {step, wall_seconds}."""
+        return {
+            "wall_seconds": self.wall_seconds,
+            "steps": [
+                {"step": step, "wall_seconds": seconds}
+                for step, seconds in self.step_seconds.items()
+            ],
+            "llm_calls": self.llm_calls,
+            "llm_failures": self.llm_failures,
+            "llm_retries": self.llm_retries,
+            "llm_retry_reasons": dict(self.llm_retry_reasons),
+            "json_parse_failures": self.json_parse_failures,
+            "prompt_chars": self.prompt_chars,
+            "response_chars": self.response_chars,
+            "llm_latency_mean_ms": self.llm_latency_mean_ms,
+            "llm_latency_p95_ms": self.llm_latency_p95_ms,
+            "db_write_seconds": self.db_write_seconds,
+        }
+
+
+class RunProfiler:
+    """Thread-safe collector of performance data for one run.
+
+    Implements LlmCallObserver, so it can be set as an LLM client's
+    call_observer. Review and refinement call the LLM from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._step_seconds: dict[str, float] = {}
+        self._latencies: list[float] = []
+        self._llm_failures = 0
+        self._llm_retries: Counter[str] = Counter()
+        self._json_parse_failures = 0
+        self._prompt_chars = 0
+        self._response_chars = 0
+        self._db_write_seconds = 0.0
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a pipeline step. Repeated steps accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._step_seconds[name] = self._step_seconds.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def db_write(self) -> Iterator[None]:
+        """Time a database write."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._db_write_seconds += elapsed
+
+    def finish(self) -> None:
+        """Stop the wall clock. Later calls have no effect."""
+        with self._lock:
+            if self._finished is None:
+                self._finished = time.perf_counter()
+
+    def record_llm_call(
+        self, seconds: float, prompt_chars: int, response_chars: int, failed: bool
+    ) -> None:
+        """Record one LLM call."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self._prompt_chars += prompt_chars
+            self._response_chars += response_chars
+            if failed:
+                self._llm_failures += 1
+
+    def record_llm_retry(self, reason: str) -> None:
+        """Record one retried LLM request."""
+        with self._lock:
+            self._llm_retries[reason] += 1
+
+    def record_json_parse_failure(self) -> None:
+        """Record one unparseable LLM response."""
+        with self._lock:
+            self._json_parse_failures += 1
+
+    def snapshot(self) -> RunProfile:
+        """Summarize the data collected so far.
+
+        Returns:
+            RunProfile: The profile; wall time runs up to finish() or now.
+        """
+        with self._lock:
+            end = self._finished if self._finished is not None else time.perf_counter()
+            latencies = list(self._latencies)
+            p95 = percentile(latencies, 95)
+            return RunProfile(
+                wall_seconds=end - self._started,
+                step_seconds=dict(self._step_seconds),
+                llm_calls=len(latencies),
+                llm_failures=self._llm_failures,
+                llm_retries=self._llm_retries.total(),
+                llm_retry_reasons=dict(sorted(self._llm_retries.items())),
+                json_parse_failures=self._json_parse_failures,
+                prompt_chars=self._prompt_chars,
+                response_chars=self._response_chars,
+                llm_latency_mean_ms=fmean(latencies) * 1000 if latencies else None,
+                llm_latency_p95_ms=None if p95 is None else p95 * 1000,
+                db_write_seconds=self._db_write_seconds,
+            )
@@ -0,0 +1,402 @@
+"""Streaming execution of the generate → review → refine steps."""
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Empty, SimpleQueue
+from threading import Event
+
+from genglossary.glossary_generator import GlossaryGenerator
+from genglossary.glossary_refiner import GlossaryRefiner
+from genglossary.glossary_reviewer import GlossaryReviewer
+from genglossary.models.document import Document
+from genglossary.models.glossary import Glossary, GlossaryIssue
+from genglossary.models.synonym import SynonymGroup
+from genglossary.models.term import ClassifiedTerm, Term
+from genglossary.types import ProgressCallback, TermProgressCallback
+from genglossary.utils.callback import safe_callback
+from genglossary.utils.ngram_index import NgramIndex
+
+
+@dataclass(frozen=True)
+class StreamingResult:
+    """Outputs of a streaming run, equal to those of the staged steps."""
+
+    provisional: Glossary
+    issues: list[GlossaryIssue]
+    refined: Glossary
+
+
+class StreamingPipeline:
+    """Runs generate, review and refine as overlapping stages.
+
+    Definitions are generated on the calling thread. As soon as a review
+    batch fills up it is reviewed on a worker thread, and the issues it
+    yields are refined on worker threads while generation continues.
+    Refinement work is dispatched before review work, and generation
+    pauses while MAX_QUEUED_BATCHES review batches wait for a worker, so
+    each stage is bounded by the one after it.
+
+    The results match running the steps one after another: batches hold
+    the same terms in the same order, issues are released to refinement
+    in batch order, and issues for the same term are resolved in order,
+    each starting from the previous refinement.
+
+    Progress callbacks are only invoked on the calling thread.
+    """
+
+    # Full review batches allowed to wait for a worker before generation pauses
+    MAX_QUEUED_BATCHES = 2
+
+    # How often to re-check cancel_event while waiting on workers
+    CANCEL_POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        generator: GlossaryGenerator,
+        reviewer: GlossaryReviewer,
+        refiner: GlossaryRefiner,
+        max_concurrency: int = 1,
+    ) -> None:
+        """Initialize the StreamingPipeline.
+
+        Args:
+            generator: Generator used for definitions (step 2).
+            reviewer: Reviewer used for issues (step 3). Its batcher (or
+                batch_size) determines the review batches.
+            refiner: Refiner used for refinement (step 4).
+            max_concurrency: Number of worker threads shared by review and
+                refinement. Defaults to 1.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.generator = generator
+        self.reviewer = reviewer
+        self.refiner = refiner
+        self.max_concurrency = max_concurrency
+
+    def run(
+        self,
+        terms: list[str] | list[ClassifiedTerm],
+        documents: list[Document],
+        context_index: NgramIndex,
+        cancel_event: Event | None = None,
+        user_notes_map: dict[str, str] | None = None,
+        synonym_groups: list[SynonymGroup] | None = None,
+        generate_progress_callback: TermProgressCallback | None = None,
+        review_progress_callback: ProgressCallback | None = None,
+        refine_progress_callback: TermProgressCallback | None = None,
+        generated_callback: Callable[[Glossary], None] | None = None,
+    ) -> StreamingResult | None:
+        """Run the three steps as a pipeline.
+
+        Args:
+            terms: Terms to generate definitions for.
+            documents: Documents containing the terms.
+            context_index: Refinement context index (see
+                GlossaryRefiner.build_context_index).
+            cancel_event: Optional threading.Event for cancellation.
+            user_notes_map: Optional mapping of term_text to user notes.
+            synonym_groups: Optional list of synonym groups.
+            generate_progress_callback: Called with (current, total, term_name)
+                after each term is generated.
+            review_progress_callback: Called with (completed, total) after each
+                review batch. total is an estimate until generation finishes.
+            refine_progress_callback: Called with (current, total, term_name)
+                after each issue is resolved or skipped. total grows as
+                issues are found.
+            generated_callback: Called with the provisional glossary once
+                generation has finished (or was cancelled), before the
+                remaining review and refinement work is awaited.
+
+        Returns:
+            StreamingResult, or None if cancelled.
+        """
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="stream"
+        )
+        state = _StreamingRun(
+            self,
+            pool,
+            context_index,
+            cancel_event,
+            user_notes_map,
+            synonym_groups,
+            review_progress_callback,
+            refine_progress_callback,
+        )
+        try:
+            return state.execute(
+                terms, documents, generate_progress_callback, generated_callback
+            )
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _StreamingRun:
+    """Mutable state of a single StreamingPipeline.run call.
+
+    Only touched from the calling thread; workers communicate through the
+    futures they return.
+    """
+
+    def __init__(
+        self,
+        pipeline: StreamingPipeline,
+        pool: ThreadPoolExecutor,
+        context_index: NgramIndex,
+        cancel_event: Event | None,
+        user_notes_map: dict[str, str] | None,
+        synonym_groups: list[SynonymGroup] | None,
+        review_progress_callback: ProgressCallback | None,
+        refine_progress_callback: TermProgressCallback | None,
+    ) -> None:
+        self.pipeline = pipeline
+        self.pool = pool
+        self.context_index = context_index
+        self.cancel_event = cancel_event
+        self.user_notes_map = user_notes_map
+        self.synonym_groups = synonym_groups
+        self.review_progress_callback = review_progress_callback
+        self.refine_progress_callback = refine_progress_callback
+        self.batch_size = pipeline.reviewer.batch_size
+
+        self.finished: SimpleQueue[Future] = SimpleQueue()
+        self.in_flight: dict[Future, tuple[str, int | str]] = {}
+
+        # Generate → review
+        self.generation_done = False
+        self.expected_terms = 0
+        self.filling: list[Term] = []
+        self.queued_batches: deque[tuple[int, list[Term]]] = deque()
+        self.batch_count = 0
+
+        # Review → refine
+        self.reviews_completed = 0
+        self.review_results: dict[int, list[GlossaryIssue]] = {}
+        self.next_release = 0
+        self.issues: list[GlossaryIssue] = []
+
+        # Refine
+        self.latest: dict[str, Term] = {}
+        self.excluded: set[str] = set()
+        self.waiting: dict[str, deque[GlossaryIssue]] = {}
+        self.deferred: dict[str, list[GlossaryIssue]] = {}
+        self.ready_terms: deque[str] = deque()
+        self.busy_terms: set[str] = set()
+        self.refine_total = 0
+        self.refine_done = 0
+
+    def cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def execute(
+        self,
+        terms: list[str] | list[ClassifiedTerm],
+        documents: list[Document],
+        generate_progress_callback: TermProgressCallback | None,
+        generated_callback: Callable[[Glossary], None] | None,
+    ) -> StreamingResult | None:
+        def on_generate_progress(current: int, total: int, term_name: str) -> None:
+            self.expected_terms = total
+            safe_callback(generate_progress_callback, current, total, term_name)
+
+        provisional = self.pipeline.generator.generate(
+            terms,
+            documents,
+            term_progress_callback=on_generate_progress,
+            cancel_event=self.cancel_event,
+            user_notes_map=self.user_notes_map,
+            synonym_groups=self.synonym_groups,
+            term_callback=self.on_term,
+        )
+        self.generation_done = True
+        if generated_callback is not None:
+            generated_callback(provisional)
+        if self.cancelled():
+            return None
+
+        if self.filling:
+            self.queue_batch()
+        # Issues naming terms that were never generated are skipped
+        for name, issues in self.deferred.items():
+            self.skip_issues(name, len(issues))
+        self.deferred.clear()
+
+        while self.in_flight or self.queued_batches or self.ready_terms:
+            if not self.pump(block=True):
+                return None
+
+        refined = Glossary(
+            terms={
+                name: self.latest[name]
+                for name in provisional.terms
+                if name not in self.excluded
+            }
+        )
+        return StreamingResult(
+            provisional=provisional, issues=self.issues, refined=refined
+        )
+
+    def on_term(self, term: Term) -> None:
+        """Hand a freshly generated term to the review stage."""
+        self.latest[term.name] = term
+        for issue in self.deferred.pop(term.name, []):
+            self.add_refine_work(issue)
+        self.filling.append(term)
+        if self.pipeline.reviewer.batch_is_full(
+            self.filling, self.user_notes_map, self.synonym_groups
+        ):
+            self.queue_batch()
+
+        self.pump(block=False)
+        # Backpressure: let review catch up before generating further
+        while len(self.queued_batches) >= self.pipeline.MAX_QUEUED_BATCHES:
+            if not self.pump(block=True):
+                return
+
+    def queue_batch(self) -> None:
+        self.queued_batches.append((self.batch_count, self.filling))
+        self.batch_count += 1
+        self.filling = []
+
+    def pump(self, block: bool) -> bool:
+        """Dispatch work and process finished work.
+
+        Args:
+            block: Wait (up to the poll interval) for a worker to finish.
+
+        Returns:
+            False if cancelled, True otherwise.
+        """
+        while True:
+            if self.cancelled():
+                return False
+            self.dispatch()
+            try:
+                future = self.finished.get(
+                    timeout=self.pipeline.CANCEL_POLL_INTERVAL_SECONDS
+                ) if block else self.finished.get_nowait()
+            except Empty:
+                return True
+            self.on_finished(future)
+            block = False
+
+    def dispatch(self) -> None:
+        """Fill free workers, refinement before review."""
+        while len(self.in_flight) < self.pipeline.max_concurrency:
+            if self.ready_terms:
+                name = self.ready_terms.popleft()
+                pending = self.waiting.get(name)
+                if not pending:
+                    continue
+                issue = pending.popleft()
+                self.busy_terms.add(name)
+                self.submit(("refine", name), self.refine_one, self.latest[name], issue)
+            elif self.queued_batches:
+                batch_idx, batch = self.queued_batches.popleft()
+                self.submit(("review", batch_idx), self.review_one, batch)
+            else:
+                return
+
+    def submit(self, key: tuple[str, int | str], fn: Callable, *args: object) -> None:
+        future = self.pool.submit(fn, *args)
+        self.in_flight[future] = key
+        future.add_done_callback(self.finished.put)
+
+    def review_one(self, batch: list[Term]) -> list[GlossaryIssue] | None:
+        return self.pipeline.reviewer.review(
+            Glossary(terms={term.name: term for term in batch}),
+            cancel_event=self.cancel_event,
+            user_notes_map=self.user_notes_map,
+            synonym_groups=self.synonym_groups,
+        )
+
+    def refine_one(self, term: Term, issue: GlossaryIssue) -> Term:
+        refined = self.pipeline.refiner.refine(
+            Glossary(terms={term.name: term}),
+            [issue],
+            [],
+            cancel_event=self.cancel_event,
+            user_notes_map=self.user_notes_map,
+            synonym_groups=self.synonym_groups,
+            context_index=self.context_index,
+        )
+        return refined.terms.get(term.name, term)
+
+    def on_finished(self, future: Future) -> None:
+        kind, key = self.in_flight.pop(future)
+        result = future.result()
+        if kind == "review":
+            assert isinstance(key, int)
+            self.on_reviewed(key, result or [])
+        else:
+            assert isinstance(key, str)
+            self.on_refined(key, result)
+
+    def on_reviewed(self, batch_idx: int, issues: list[GlossaryIssue]) -> None:
+        self.reviews_completed += 1
+        if self.generation_done:
+            total = self.batch_count
+        else:
+            total = max(
+                -(-self.expected_terms // self.batch_size), self.batch_count
+            )
+        safe_callback(self.review_progress_callback, self.reviews_completed, total)
+
+        # Release issues in batch order so same-term chains match staged mode
+        self.review_results[batch_idx] = issues
+        while self.next_release in self.review_results:
+            for issue in self.review_results.pop(self.next_release):
+                self.issues.append(issue)
+                self.accept_issue(issue)
+            self.next_release += 1
+
+    def accept_issue(self, issue: GlossaryIssue) -> None:
+        name = issue.term_name
+        if issue.should_exclude:
+            self.excluded.add(name)
+            self.skip_issues(name, len(self.waiting.pop(name, ())))
+            self.skip_issues(name, len(self.deferred.pop(name, ())))
+            return
+
+        self.refine_total += 1
+        if name in self.excluded:
+            self.skip_issues(name, 1)
+        elif name in self.latest:
+            self.add_refine_work(issue)
+        elif self.generation_done:
+            self.skip_issues(name, 1)
+        else:
+            self.deferred.setdefault(name, []).append(issue)
+
+    def add_refine_work(self, issue: GlossaryIssue) -> None:
+        name = issue.term_name
+        pending = self.waiting.setdefault(name, deque())
+        pending.append(issue)
+        if len(pending) == 1 and name not in self.busy_terms:
+            self.ready_terms.append(name)
+
+    def on_refined(self, name: str, term: Term) -> None:
+        self.busy_terms.discard(name)
+        self.latest[name] = term
+        if self.waiting.get(name):
+            self.ready_terms.append(name)
+        self.refine_done += 1
+        safe_callback(
+            self.refine_progress_callback, self.refine_done, self.refine_total, name
+        )
+
+    def skip_issues(self, name: str, count: int) -> None:
+        for _ in range(count):
+            self.refine_done += 1
+            safe_callback(
+                self.refine_progress_callback,
+                self.refine_done,
+                self.refine_total,
+                name,
+            )
@@ -6,6 +6,7 @@ from typing import Literal, overload
 from pydantic import BaseModel
 
 from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.batching import TokenBudgetBatcher
 from genglossary.models.document import Document
 from genglossary.models.term import ClassifiedTerm, TermCategory
 from genglossary.morphological_analyzer import MorphologicalAnalyzer
@@ -113,6 +114,7 @@ class TermExtractor:
         llm_client: BaseLLMClient,
         excluded_term_repo: sqlite3.Connection | None = None,
         required_term_repo: sqlite3.Connection | None = None,
+        batcher: TokenBudgetBatcher | None = None,
     ) -> None:
         """Initialize the TermExtractor.
 
@@ -124,8 +126,13 @@ class TermExtractor:
             required_term_repo: Optional database connection for required terms.
                 If provided, required terms will be merged into candidates and
                 protected from common_noun exclusion.
+            batcher: Optional token-budget batcher. If provided, terms are
+                packed into classification batches by token count (batch_size
+                is ignored) and batches whose response is truncated or
+                unparseable are split and retried.
         """
         self.llm_client = llm_client
+        self._batcher = batcher
         self._morphological_analyzer = MorphologicalAnalyzer()
         self._excluded_term_repo = excluded_term_repo
         self._required_term_repo = required_term_repo
@@ -265,6 +272,7 @@ class TermExtractor:
             progress_callback: Optional callback called after each batch is classified.
                 Receives (current_batch, total_batches) where current is 1-indexed.
             batch_size: Number of terms to classify per LLM call (default: 10).
+                Ignored when the extractor has a batcher.
             return_categories: If True, return list[ClassifiedTerm] with category info.
                 If False (default), return list[str] excluding common_noun.
 
@@ -328,6 +336,7 @@ class TermExtractor:
             progress_callback: Optional callback for progress updates.
                 Called with (current_batch, total_batches) during classification.
             batch_size: Number of terms to classify per LLM call (default: 10).
+                Ignored when the extractor has a batcher.
 
         Returns:
             TermExtractionAnalysis with candidates, approved, rejected terms,
@@ -568,6 +577,7 @@ JSON形式で回答してください: {{"approved_terms": ["用語1", "用語2"
             candidates: List of candidate terms to classify.
             documents: List of documents for context.
             batch_size: Number of terms to classify per LLM call (default: 10).
+                Ignored when the extractor has a batcher.
             progress_callback: Optional callback for progress updates.
                 Called with (current_batch, total_batches) after each batch.
 
@@ -579,27 +589,49 @@ JSON形式で回答してください: {{"approved_terms": ["用語1", "用語2"
         # Track seen terms for deduplication across batches
         seen_terms: set[str] = set()
 
-        # Calculate total batches
-        total_batches = (len(candidates) + batch_size - 1) // batch_size if candidates else 0
+        if self._batcher is not None:
+            batches = self._batcher.pack(candidates, str)
+        else:
+            batches = [
+                candidates[i : i + batch_size]
+                for i in range(0, len(candidates), batch_size)
+            ]
+        total_batches = len(batches)
 
         # Classify terms in batches
-        batch_num = 0
-        for i in range(0, len(candidates), batch_size):
-            batch_num += 1
-            batch = candidates[i : i + batch_size]
-            prompt = self._create_batch_classification_prompt(batch, documents)
-            response = self.llm_client.generate_structured(
-                prompt, BatchTermClassificationResponse
-            )
-
+        for batch_num, batch in enumerate(batches, start=1):
             # Aggregate classifications from batch response with deduplication
-            self._process_batch_response(response, classified, seen_terms)
+            for response in self._classify_batch(batch, documents):
+                self._process_batch_response(response, classified, seen_terms)
 
             # Call progress callback if provided (safe_callback handles None and exceptions)
             safe_callback(progress_callback, batch_num, total_batches)
 
         return TermClassificationResponse(classified_terms=classified)
 
+    def _classify_batch(
+        self, batch: list[str], documents: list[Document]
+    ) -> list[BatchTermClassificationResponse]:
+        """Classify one batch of terms.
+
+        Args:
+            batch: Terms of the batch.
+            documents: List of documents for context.
+
+        Returns:
+            One response, or one per sub-batch if the batcher had to split it.
+        """
+
+        def classify(terms: list[str]) -> BatchTermClassificationResponse:
+            prompt = self._create_batch_classification_prompt(terms, documents)
+            return self.llm_client.generate_structured(
+                prompt, BatchTermClassificationResponse
+            )
+
+        if self._batcher is None:
+            return [classify(batch)]
+        return self._batcher.run(batch, classify)
+
     def _create_classification_prompt(
         self, candidates: list[str], documents: list[Document]
     ) -> str:
@@ -7,3 +7,6 @@ ProgressCallback = Callable[[int, int], None]
 
 # Type alias for progress callback with term name: (current, total, term_name) -> None
 TermProgressCallback = Callable[[int, int, str], None]
+
+# Type alias for document search: (terms) -> names of documents containing any term
+DocumentSearch = Callable[[list[str]], set[str]]
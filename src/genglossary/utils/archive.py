@@ -0,0 +1,181 @@
+"""Readers for uploaded document archives.
+
+A bulk upload arrives as one request body in one of three formats: a zip
+archive, a (optionally compressed) tar archive, or NDJSON with one
+{"file_name": ..., "content": ...} object per line. iter_archive_members
+yields the files of any of them one at a time, so the caller never holds
+more than one file's bytes in memory, and refuses a member larger than
+the size limit before reading it past the limit (zip bombs included).
+
+Directories, links and special files are skipped, as are macOS resource
+fork entries (__MACOSX/).
+"""
+
+import json
+import tarfile
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO
+
+# Content-Type (without parameters) -> upload format
+UPLOAD_CONTENT_TYPES = {
+    "application/zip": "zip",
+    "application/x-zip-compressed": "zip",
+    "application/x-tar": "tar",
+    "application/gzip": "tar",
+    "application/x-gzip": "tar",
+    "application/x-compressed-tar": "tar",
+    "application/x-ndjson": "ndjson",
+}
+
+# JSON escaping can make a line several times longer than its content
+_NDJSON_LINE_FACTOR = 8
+
+# Zip entries without the UTF-8 flag are usually cp932 on Japanese Windows
+_LEGACY_ZIP_ENCODINGS = ("utf-8", "cp932")
+
+
+class ArchiveError(ValueError):
+    """The upload is malformed or a member exceeds the size limit."""
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """One file of an upload.
+
+    Attributes:
+        name: Path of the file inside the archive (not yet validated).
+        data: Raw file contents.
+    """
+
+    name: str
+    data: bytes
+
+
+def upload_format(content_type: str) -> str | None:
+    """Map a Content-Type header to an upload format.
+
+    Args:
+        content_type: Content-Type header value, parameters allowed.
+
+    Returns:
+        str | None: "zip", "tar" or "ndjson", or None if unsupported.
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return UPLOAD_CONTENT_TYPES.get(media_type)
+
+
+def iter_archive_members(
+    fileobj: IO[bytes], fmt: str, *, max_member_bytes: int
+) -> Iterator[ArchiveMember]:
+    """Yield the regular files of an upload in archive order.
+
+    Args:
+        fileobj: Upload body, positioned at the start. Zip needs it seekable.
+        fmt: "zip", "tar" or "ndjson" (see upload_format).
+        max_member_bytes: Largest allowed file size.
+
+    Yields:
+        ArchiveMember: One file at a time.
+
+    Raises:
+        ArchiveError: If the upload is malformed or a file is too large.
+        ValueError: If fmt is unknown.
+    """
+    if fmt == "zip":
+        yield from _iter_zip(fileobj, max_member_bytes)
+    elif fmt == "tar":
+        yield from _iter_tar(fileobj, max_member_bytes)
+    elif fmt == "ndjson":
+        yield from _iter_ndjson(fileobj, max_member_bytes)
+    else:
+        raise ValueError(f"Unknown upload format: {fmt}")
+
+
+def _too_large(name: str, max_member_bytes: int) -> ArchiveError:
+    return ArchiveError(f"{name}: Content too large. Max: {max_member_bytes} bytes")
+
+
+def _is_resource_fork(name: str) -> bool:
+    return name.startswith("__MACOSX/")
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    if info.flag_bits & 0x800:
+        return info.filename
+    # zipfile decoded the raw name as cp437; recover the original bytes
+    raw = info.filename.encode("cp437")
+    for encoding in _LEGACY_ZIP_ENCODINGS:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+def _iter_zip(fileobj: IO[bytes], max_member_bytes: int) -> Iterator[ArchiveMember]:
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(f"Invalid zip archive: {e}") from None
+    with archive:
+        for info in archive.infolist():
+            name = _zip_member_name(info)
+            if info.is_dir() or _is_resource_fork(name):
+                continue
+            if info.file_size > max_member_bytes:
+                raise _too_large(name, max_member_bytes)
+            try:
+                with archive.open(info) as member:
+                    # file_size is only the declared size; never trust it
+                    data = member.read(max_member_bytes + 1)
+            except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+                raise ArchiveError(f"{name}: Cannot read zip entry: {e}") from None
+            if len(data) > max_member_bytes:
+                raise _too_large(name, max_member_bytes)
+            yield ArchiveMember(name, data)
+
+
+def _iter_tar(fileobj: IO[bytes], max_member_bytes: int) -> Iterator[ArchiveMember]:
+    try:
+        # Stream mode reads members in order without seeking
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for info in archive:
+                if not info.isfile() or _is_resource_fork(info.name):
+                    continue
+                if info.size > max_member_bytes:
+                    raise _too_large(info.name, max_member_bytes)
+                member = archive.extractfile(info)
+                assert member is not None
+                yield ArchiveMember(info.name, member.read())
+    except tarfile.TarError as e:
+        raise ArchiveError(f"Invalid tar archive: {e}") from None
+
+
+def _iter_ndjson(fileobj: IO[bytes], max_member_bytes: int) -> Iterator[ArchiveMember]:
+    line_limit = max_member_bytes * _NDJSON_LINE_FACTOR
+    line_number = 0
+    while line := fileobj.readline(line_limit + 1):
+        line_number += 1
+        if len(line) > line_limit:
+            raise ArchiveError(f"Line {line_number}: Line too long")
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ArchiveError(f"Line {line_number}: Invalid JSON: {e}") from None
+        if not (
+            isinstance(item, dict)
+            and isinstance(item.get("file_name"), str)
+            and isinstance(item.get("content"), str)
+        ):
+            raise ArchiveError(
+                f"Line {line_number}: Expected an object with string "
+                "file_name and content"
+            )
+        data = item["content"].encode("utf-8")
+        if len(data) > max_member_bytes:
+            raise _too_large(item["file_name"], max_member_bytes)
+        yield ArchiveMember(item["file_name"], data)
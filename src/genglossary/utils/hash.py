@@ -13,3 +13,18 @@ def compute_content_hash(content: str) -> str:
         str: Hexadecimal hash string.
     """
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compute_bytes_hash(data: bytes) -> str:
+    """Compute SHA256 hash of raw bytes.
+
+    For UTF-8 text this equals compute_content_hash of the decoded
+    string, without encoding it a second time.
+
+    Args:
+        data: Raw bytes to hash.
+
+    Returns:
+        str: Hexadecimal hash string.
+    """
+    return hashlib.sha256(data).hexdigest()
@@ -0,0 +1,99 @@
+"""Character n-gram inverted index for substring lookup in text lines."""
+
+from bisect import bisect_left
+from collections import defaultdict
+
+from genglossary.utils.text import compile_term_pattern
+
+
+def _ngrams(text: str, n: int) -> set[str]:
+    """Return the distinct character n-grams of text."""
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def _contains(postings: list[int], line_id: int) -> bool:
+    """Binary-search a sorted postings list."""
+    pos = bisect_left(postings, line_id)
+    return pos < len(postings) and postings[pos] == line_id
+
+
+class NgramIndex:
+    """Inverted index from character bigrams to the lines containing them.
+
+    Works without word segmentation, so Japanese terms embedded in a
+    sentence are found as easily as space-separated ASCII words. A lookup
+    intersects the postings of the term's bigrams, starting from the
+    rarest, and only verifies the surviving candidate lines.
+
+    Matching is case-insensitive. CJK terms match as substrings; other
+    terms must stand alone as ASCII words (see compile_term_pattern).
+    """
+
+    # Gram length; bigrams keep two-character Japanese terms indexable
+    N = 2
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._texts: list[str] = []
+        self._payloads: list[str] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        """Return the number of indexed lines."""
+        return len(self._texts)
+
+    def add(self, text: str, payload: str) -> None:
+        """Index a line of text.
+
+        Args:
+            text: The text to index.
+            payload: Value returned when the line matches a lookup.
+        """
+        line_id = len(self._texts)
+        normalized = text.casefold()
+        self._texts.append(normalized)
+        self._payloads.append(payload)
+        # Line ids only grow, so every postings list stays sorted
+        for gram in _ngrams(normalized, self.N):
+            self._postings[gram].append(line_id)
+
+    def search(self, term: str, limit: int) -> list[str]:
+        """Find up to limit lines containing the term, in insertion order.
+
+        Args:
+            term: The term to look up.
+            limit: Maximum number of payloads to return.
+
+        Returns:
+            list[str]: Payloads of matching lines.
+        """
+        normalized = term.casefold()
+        if not normalized.strip() or limit <= 0:
+            return []
+
+        # Texts are casefolded too, so the pattern can be case-sensitive
+        pattern = compile_term_pattern(normalized)
+
+        grams = _ngrams(normalized, self.N)
+        if not grams:
+            # Single character: no gram to look up, scan every line
+            candidates: list[int] = list(range(len(self._texts)))
+            others: list[list[int]] = []
+        else:
+            postings = [self._postings.get(gram) for gram in grams]
+            found = [p for p in postings if p is not None]
+            if len(found) < len(postings):
+                return []
+            found.sort(key=len)
+            candidates, *others = found
+
+        results: list[str] = []
+        for line_id in candidates:
+            if not all(_contains(p, line_id) for p in others):
+                continue
+            if not pattern.search(self._texts[line_id]):
+                continue
+            results.append(self._payloads[line_id])
+            if len(results) >= limit:
+                break
+        return results
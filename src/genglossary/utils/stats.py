@@ -0,0 +1,20 @@
+"""Small statistics helpers."""
+
+import math
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile.
+
+    Args:
+        values: Sample values (any order).
+        pct: Percentile in (0, 100].
+
+    Returns:
+        float | None: The percentile, or None for an empty sample.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
@@ -1,5 +1,7 @@
 """Text utility functions for CJK and Unicode processing."""
 
+import re
+
 # Unicode ranges for CJK character detection
 CJK_RANGES: list[tuple[str, str]] = [
     ("\u4e00", "\u9fff"),  # CJK Unified Ideographs
@@ -31,3 +33,26 @@ def contains_cjk(text: str) -> bool:
         True if the text contains CJK characters.
     """
     return any(is_cjk_char(char) for char in text)
+
+
+def compile_term_pattern(term: str, ignore_case: bool = False) -> re.Pattern[str]:
+    """Compile a regex that finds a term in text.
+
+    CJK terms match anywhere (there are no word boundaries). Other terms
+    must not be preceded or followed by ASCII word characters, so "API"
+    does not match inside "APIKey".
+
+    Args:
+        term: The term to search for.
+        ignore_case: Whether to match case-insensitively.
+
+    Returns:
+        Compiled regex pattern.
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    escaped_term = re.escape(term)
+
+    if contains_cjk(term):
+        return re.compile(escaped_term, flags)
+
+    return re.compile(rf"(?<![a-zA-Z0-9_]){escaped_term}(?![a-zA-Z0-9_])", flags)
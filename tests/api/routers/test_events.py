@@ -0,0 +1,85 @@
+"""Tests for the project event stream endpoint."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from genglossary.api.routers.events import _format_event, stream_project_events
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.runs_repository import create_run, get_run
+from genglossary.db.schema import initialize_db
+from genglossary.events import ProjectEvent, ProjectEventHub
+
+
+@pytest.fixture
+def project_db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "project.db")
+    conn = get_connection(path)
+    initialize_db(conn)
+    conn.close()
+    return path
+
+
+def _parse(message: str) -> tuple[str, dict]:
+    lines = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    return lines["event"], json.loads(lines["data"])
+
+
+def test_format_run_event_uses_run_response_shape(project_db_path: str) -> None:
+    conn = get_connection(project_db_path)
+    with transaction(conn):
+        run_id = create_run(conn, scope="extract")
+    row = get_run(conn, run_id)
+    conn.close()
+
+    event, data = _parse(_format_event(ProjectEvent("progress", dict(row))))
+
+    assert event == "progress"
+    assert data["id"] == run_id
+    assert data["scope"] == "extract"
+    assert set(data) >= {"status", "progress_current", "progress_total", "current_step"}
+
+
+def test_format_invalidate_event() -> None:
+    message = _format_event(ProjectEvent("invalidate", {"resources": ["terms"]}))
+
+    assert message == 'event: invalidate\ndata: {"resources": ["terms"]}\n\n'
+
+
+def test_stream_sends_current_run_then_hub_events(project_db_path: str) -> None:
+    """The stream starts with the current run and relays the hub's events."""
+    hub = ProjectEventHub(project_db_path, poll_interval=60)
+    manager = MagicMock()
+    manager.get_current_or_latest_run.return_value = {
+        "id": 7,
+        "scope": "full",
+        "status": "running",
+        "started_at": None,
+        "finished_at": None,
+        "triggered_by": "api",
+        "error_message": None,
+        "progress_current": 0,
+        "progress_total": 0,
+        "current_step": None,
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }
+
+    response = stream_project_events(project_id=1, hub=hub, manager=manager)
+
+    async def consume() -> list[str]:
+        body = response.body_iterator
+        messages = [await body.__anext__()]
+        hub.publish(ProjectEvent("invalidate", {"resources": ["refined"]}))
+        messages.append(await body.__anext__())
+        await body.aclose()
+        return messages
+
+    messages = asyncio.run(consume())
+
+    assert response.media_type == "text/event-stream"
+    assert _parse(messages[0]) == ("run", manager.get_current_or_latest_run.return_value)
+    assert _parse(messages[1]) == ("invalidate", {"resources": ["refined"]})
+    assert hub.subscriber_count == 0
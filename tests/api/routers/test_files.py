@@ -1,5 +1,8 @@
 """Tests for Files API endpoints."""
 
+import io
+import json
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from genglossary.db.connection import get_connection, transaction
 from genglossary.db.document_repository import create_document
+from genglossary.db.pending_extract_repository import list_pending_extract_documents
 from genglossary.db.project_repository import create_project
 from genglossary.db.registry_schema import initialize_registry
 
@@ -81,6 +85,61 @@ def test_list_files_returns_all_documents(test_project_setup, client: TestClient
     assert data[1]["file_name"] == "doc2.md"
 
 
+def test_list_files_returns_etag_and_304_when_unchanged(
+    test_project_setup, client: TestClient
+):
+    """Test GET /api/projects/{id}/files supports conditional requests."""
+    project_id = test_project_setup["project_id"]
+    project_db_path = test_project_setup["project_db_path"]
+
+    conn = get_connection(project_db_path)
+    with transaction(conn):
+        create_document(conn, "doc1.txt", "Content 1", "hash1")
+    conn.close()
+
+    response = client.get(f"/api/projects/{project_id}/files")
+    etag = response.headers["ETag"]
+
+    cached = client.get(
+        f"/api/projects/{project_id}/files", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    conn = get_connection(project_db_path)
+    with transaction(conn):
+        create_document(conn, "doc2.txt", "Content 2", "hash2")
+    conn.close()
+
+    changed = client.get(
+        f"/api/projects/{project_id}/files", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 2
+
+
+def test_list_files_keyset_pagination(test_project_setup, client: TestClient):
+    """Test GET /api/projects/{id}/files pages with limit and after_id."""
+    project_id = test_project_setup["project_id"]
+    project_db_path = test_project_setup["project_db_path"]
+
+    conn = get_connection(project_db_path)
+    with transaction(conn):
+        for i in range(3):
+            create_document(conn, f"doc{i}.txt", "Content", f"hash{i}")
+    conn.close()
+
+    first = client.get(f"/api/projects/{project_id}/files", params={"limit": 2})
+    assert [f["file_name"] for f in first.json()] == ["doc0.txt", "doc1.txt"]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(
+        f"/api/projects/{project_id}/files", params={"limit": 2, "after_id": cursor}
+    )
+    assert [f["file_name"] for f in second.json()] == ["doc2.txt"]
+    assert "X-Next-Cursor" not in second.headers
+
+
 def test_get_file_by_id_returns_document_with_content(test_project_setup, client: TestClient):
     """Test GET /api/projects/{id}/files/{file_id} returns document with content."""
     project_id = test_project_setup["project_id"]
@@ -1202,168 +1261,313 @@ class TestWindowsInvalidCharacters:
         assert response.status_code == 400
 
 
+def _pending_extract_ids(project_db_path: str) -> list[int]:
+    conn = get_connection(project_db_path)
+    try:
+        return list_pending_extract_documents(conn)
+    finally:
+        conn.close()
+
+
 class TestCreateFilesBulkAutoExtract:
-    """Tests for auto-extract trigger on bulk file creation."""
+    """Tests for auto-extract scheduling on bulk file creation."""
 
-    def test_create_files_bulk_triggers_extract(
-        self, test_project_setup, client: TestClient
-    ):
-        """ファイル追加成功後にExtractが自動的に開始される"""
-        from genglossary.api.dependencies import get_run_manager
+    @pytest.fixture
+    def mock_scheduler(self, client: TestClient):
+        from genglossary.api.dependencies import get_auto_extract_scheduler
 
+        scheduler = MagicMock()
+        client.app.dependency_overrides[get_auto_extract_scheduler] = lambda: scheduler
+        yield scheduler
+        client.app.dependency_overrides.pop(get_auto_extract_scheduler, None)
+
+    def test_create_files_bulk_schedules_extract(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """ファイル追加成功後に新規ドキュメントが自動抽出キューに入る"""
         project_id = test_project_setup["project_id"]
 
         payload = {
             "files": [
                 {"file_name": "file1.txt", "content": "Content 1"},
+                {"file_name": "file2.txt", "content": "Content 2"},
             ]
         }
 
-        mock_manager = MagicMock()
-        mock_manager.start_run.return_value = 42  # run_id
-
-        client.app.dependency_overrides[get_run_manager] = lambda: mock_manager
-        try:
-            response = client.post(
-                f"/api/projects/{project_id}/files/bulk", json=payload
-            )
-        finally:
-            client.app.dependency_overrides.pop(get_run_manager, None)
+        response = client.post(f"/api/projects/{project_id}/files/bulk", json=payload)
 
         assert response.status_code == 201
         data = response.json()
-
-        # Response should include extract_started flag
-        assert data["extract_started"] is True
+        assert data["extract_scheduled"] is True
+        assert data["extract_started"] is False
         assert data["extract_skipped_reason"] is None
+        mock_scheduler.notify.assert_called_once()
 
-        # Files should be in the response
+        # Queued in the database, so a restart does not lose them
+        response_ids = [f["id"] for f in data["files"]]
+        assert sorted(_pending_extract_ids(test_project_setup["project_db_path"])) == sorted(
+            response_ids
+        )
+
+    def test_create_files_bulk_handles_schedule_error(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """スケジュールに失敗してもファイル保存は成功し、内部エラーは返さない"""
+        project_id = test_project_setup["project_id"]
+        mock_scheduler.notify.side_effect = RuntimeError("can't start new thread")
+
+        payload = {"files": [{"file_name": "file1.txt", "content": "Content 1"}]}
+        response = client.post(f"/api/projects/{project_id}/files/bulk", json=payload)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["extract_scheduled"] is False
+        assert data["extract_skipped_reason"] is not None
+        assert "can't start new thread" not in data["extract_skipped_reason"]
         assert len(data["files"]) == 1
-        assert data["files"][0]["file_name"] == "file1.txt"
+        # Still queued for the next upload or restart
+        assert _pending_extract_ids(test_project_setup["project_db_path"]) == [
+            data["files"][0]["id"]
+        ]
 
-        # RunManager.start_run should have been called with extract scope and document_ids
-        mock_manager.start_run.assert_called_once()
-        call_kwargs = mock_manager.start_run.call_args.kwargs
-        assert call_kwargs["scope"] == "extract"
-        assert call_kwargs["triggered_by"] == "auto"
-        assert call_kwargs["document_ids"] is not None
+    def test_create_files_bulk_conflict_queues_nothing(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """既存ファイルとの衝突時はキューにも何も追加しない"""
+        project_id = test_project_setup["project_id"]
+        conn = get_connection(test_project_setup["project_db_path"])
+        with transaction(conn):
+            create_document(conn, "file1.txt", "Content", "hash")
+        conn.close()
+
+        payload = {"files": [{"file_name": "file1.txt", "content": "Content 1"}]}
+        response = client.post(f"/api/projects/{project_id}/files/bulk", json=payload)
+
+        assert response.status_code == 409
+        mock_scheduler.notify.assert_not_called()
+        assert _pending_extract_ids(test_project_setup["project_db_path"]) == []
 
-    def test_create_files_bulk_skips_extract_when_run_active(
+    def test_uploads_are_merged_into_one_extract_run(
         self, test_project_setup, client: TestClient
     ):
-        """既にRunが実行中の場合、ファイル保存は成功しExtractはスキップされる"""
-        from genglossary.api.dependencies import get_run_manager
+        """連続したアップロードは1回のExtractにまとめられる"""
+        from genglossary.api.dependencies import get_auto_extract_scheduler
+        from genglossary.runs.auto_extract import AutoExtractScheduler
+
+        project_id = test_project_setup["project_id"]
+        manager = MagicMock()
+        manager.db_path = test_project_setup["project_db_path"]
+        manager.get_active_run.return_value = None
+        manager.start_run.return_value = 42
+        # Long quiet period: the test flushes by hand
+        scheduler = AutoExtractScheduler(manager, quiet_seconds=60)
+        client.app.dependency_overrides[get_auto_extract_scheduler] = lambda: scheduler
+        try:
+            ids = []
+            for name in ("a.txt", "b.txt", "c.txt"):
+                response = client.post(
+                    f"/api/projects/{project_id}/files/bulk",
+                    json={"files": [{"file_name": name, "content": name}]},
+                )
+                ids.append(response.json()["files"][0]["id"])
+
+            manager.start_run.assert_not_called()
+            assert scheduler.flush() == 42
+        finally:
+            scheduler.close()
+            client.app.dependency_overrides.pop(get_auto_extract_scheduler, None)
 
-        project_id = test_project_setup["project_id"]
+        manager.start_run.assert_called_once_with(
+            scope="extract", triggered_by="auto", document_ids=ids
+        )
+        assert _pending_extract_ids(test_project_setup["project_db_path"]) == []
 
-        payload = {
-            "files": [
-                {"file_name": "file1.txt", "content": "Content 1"},
-            ]
-        }
 
-        mock_manager = MagicMock()
-        mock_manager.start_run.side_effect = RuntimeError(
-            "Run already running: 10"
+def _zip_body(files: dict[str, str | bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestUploadFiles:
+    """Tests for POST /api/projects/{id}/files/upload (streamed archives)."""
+
+    @pytest.fixture
+    def mock_scheduler(self, client: TestClient):
+        from genglossary.api.dependencies import get_auto_extract_scheduler
+
+        scheduler = MagicMock()
+        client.app.dependency_overrides[get_auto_extract_scheduler] = lambda: scheduler
+        yield scheduler
+        client.app.dependency_overrides.pop(get_auto_extract_scheduler, None)
+
+    def _upload(self, client: TestClient, project_id: int, body: bytes, content_type: str):
+        return client.post(
+            f"/api/projects/{project_id}/files/upload",
+            content=body,
+            headers={"Content-Type": content_type},
         )
 
-        client.app.dependency_overrides[get_run_manager] = lambda: mock_manager
-        try:
-            response = client.post(
-                f"/api/projects/{project_id}/files/bulk", json=payload
-            )
-        finally:
-            client.app.dependency_overrides.pop(get_run_manager, None)
+    def test_upload_zip_creates_documents_and_schedules_extract(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """zip内のファイルを登録し、まとめて自動抽出キューに入れる"""
+        project_id = test_project_setup["project_id"]
+        body = _zip_body(
+            {"docs/a.md": "# 騎士団", "docs/b.txt": "本文", "docs/img.png": b"\x89PNG"}
+        )
+
+        response = self._upload(client, project_id, body, "application/zip")
 
         assert response.status_code == 201
         data = response.json()
+        assert [f["file_name"] for f in data["files"]] == ["docs/a.md", "docs/b.txt"]
+        assert data["skipped_files"] == ["docs/img.png"]
+        assert data["extract_scheduled"] is True
+        mock_scheduler.notify.assert_called_once()
+        assert _pending_extract_ids(test_project_setup["project_db_path"]) == [
+            f["id"] for f in data["files"]
+        ]
 
-        # Extract should be skipped but files saved
-        assert data["extract_started"] is False
-        # Sanitized message: no raw exception details exposed
-        assert data["extract_skipped_reason"] is not None
-        assert "Run already running: 10" not in data["extract_skipped_reason"]
+        detail = client.get(f"/api/projects/{project_id}/files/{data['files'][0]['id']}")
+        assert detail.json()["content"] == "# 騎士団"
+        # Hash of raw bytes equals the hash computed for JSON uploads
+        from genglossary.utils.hash import compute_content_hash
 
-        # Files should still be created
-        assert len(data["files"]) == 1
-        assert data["files"][0]["file_name"] == "file1.txt"
+        assert data["files"][0]["content_hash"] == compute_content_hash("# 騎士団")
 
-    def test_create_files_bulk_handles_unexpected_extract_error(
-        self, test_project_setup, client: TestClient
-    ):
-        """start_runが予期しない例外を投げてもファイル保存は成功しextract_startedはfalseになる"""
-        from genglossary.api.dependencies import get_run_manager
+    def test_upload_ndjson(self, test_project_setup, client: TestClient, mock_scheduler):
+        """NDJSON（1行1ファイル）で登録できる"""
+        project_id = test_project_setup["project_id"]
+        body = "\n".join(
+            json.dumps({"file_name": f"file{i}.txt", "content": f"Content {i}"})
+            for i in range(50)
+        ).encode()
+
+        response = self._upload(client, project_id, body, "application/x-ndjson")
 
+        assert response.status_code == 201
+        assert len(response.json()["files"]) == 50
+
+    def test_upload_rolls_back_on_invalid_file_name(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """不正なファイル名が1つでもあれば何も登録しない"""
         project_id = test_project_setup["project_id"]
+        body = _zip_body({"ok.md": "A", "../evil.md": "B"})
 
-        payload = {
-            "files": [
-                {"file_name": "file1.txt", "content": "Content 1"},
-            ]
-        }
+        response = self._upload(client, project_id, body, "application/zip")
 
-        mock_manager = MagicMock()
-        mock_manager.start_run.side_effect = Exception(
-            "Unexpected DB connection failure"
+        assert response.status_code == 400
+        assert "../evil.md" in response.json()["detail"]
+        assert client.get(f"/api/projects/{project_id}/files").json() == []
+        mock_scheduler.notify.assert_not_called()
+        assert _pending_extract_ids(test_project_setup["project_db_path"]) == []
+
+    def test_upload_returns_409_for_existing_file(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """既存ファイルと同名なら409で全体をロールバックする"""
+        project_id = test_project_setup["project_id"]
+        client.post(
+            f"/api/projects/{project_id}/files",
+            json={"file_name": "existing.md", "content": "Existing"},
         )
+        body = _zip_body({"new.md": "New", "existing.md": "Duplicate"})
 
-        client.app.dependency_overrides[get_run_manager] = lambda: mock_manager
-        try:
-            response = client.post(
-                f"/api/projects/{project_id}/files/bulk", json=payload
-            )
-        finally:
-            client.app.dependency_overrides.pop(get_run_manager, None)
+        response = self._upload(client, project_id, body, "application/zip")
 
-        assert response.status_code == 201
-        data = response.json()
+        assert response.status_code == 409
+        assert response.json()["detail"] == "File already exists: existing.md"
+        files = client.get(f"/api/projects/{project_id}/files").json()
+        assert [f["file_name"] for f in files] == ["existing.md"]
 
-        # Extract should be skipped with sanitized message
-        assert data["extract_started"] is False
-        assert data["extract_skipped_reason"] is not None
-        # Raw exception message must not leak to client
-        assert "Unexpected DB connection failure" not in data["extract_skipped_reason"]
+    def test_upload_rejects_duplicate_names_after_normalization(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """正規化後に同名になるファイルは400"""
+        project_id = test_project_setup["project_id"]
+        body = "\n".join(
+            json.dumps({"file_name": name, "content": "A"})
+            for name in ["a/b.md", "a//b.md"]
+        ).encode()
 
-        # Files should still be created
-        assert len(data["files"]) == 1
-        assert data["files"][0]["file_name"] == "file1.txt"
+        response = self._upload(client, project_id, body, "application/x-ndjson")
 
-    def test_create_files_bulk_passes_document_ids_to_start_run(
-        self, test_project_setup, client: TestClient
+        assert response.status_code == 400
+        assert "Duplicate file names" in response.json()["detail"]
+
+    def test_upload_rejects_non_utf8_content(
+        self, test_project_setup, client: TestClient, mock_scheduler
     ):
-        """bulk upload時にstart_runに新規ドキュメントIDリストが渡される"""
-        from genglossary.api.dependencies import get_run_manager
+        """UTF-8でないファイルは400"""
+        project_id = test_project_setup["project_id"]
+        body = _zip_body({"sjis.txt": "用語".encode("cp932")})
+
+        response = self._upload(client, project_id, body, "application/zip")
 
+        assert response.status_code == 400
+        assert "not valid UTF-8" in response.json()["detail"]
+
+    def test_upload_rejects_file_too_large(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """3MBを超えるファイルは400"""
         project_id = test_project_setup["project_id"]
+        body = _zip_body({"big.md": "x" * (3 * 1024 * 1024 + 1)})
 
-        payload = {
-            "files": [
-                {"file_name": "file1.txt", "content": "Content 1"},
-                {"file_name": "file2.txt", "content": "Content 2"},
-            ]
-        }
+        response = self._upload(client, project_id, body, "application/zip")
 
-        mock_manager = MagicMock()
-        mock_manager.start_run.return_value = 42
+        assert response.status_code == 400
+        assert "big.md: Content too large" in response.json()["detail"]
 
-        client.app.dependency_overrides[get_run_manager] = lambda: mock_manager
-        try:
-            response = client.post(
-                f"/api/projects/{project_id}/files/bulk", json=payload
-            )
-        finally:
-            client.app.dependency_overrides.pop(get_run_manager, None)
+    def test_upload_rejects_too_many_files(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """ファイル数の上限を超えると400"""
+        project_id = test_project_setup["project_id"]
+        body = _zip_body({f"{i}.md": "A" for i in range(3)})
 
-        assert response.status_code == 201
+        with patch("genglossary.api.routers.files.MAX_UPLOAD_FILES", 2):
+            response = self._upload(client, project_id, body, "application/zip")
+
+        assert response.status_code == 400
+        assert "Too many files" in response.json()["detail"]
+
+    def test_upload_returns_413_when_body_too_large(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """アップロード全体のサイズ上限を超えると413"""
+        project_id = test_project_setup["project_id"]
+        body = _zip_body({"a.md": "A" * 1000})
+
+        with patch("genglossary.api.routers.files.MAX_UPLOAD_BYTES", 100):
+            response = self._upload(client, project_id, body, "application/zip")
+
+        assert response.status_code == 413
+
+    def test_upload_returns_415_for_unsupported_type(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """未対応のContent-Typeは415"""
+        project_id = test_project_setup["project_id"]
+
+        response = self._upload(client, project_id, b"{}", "application/json")
 
-        # Verify start_run was called with document_ids
-        mock_manager.start_run.assert_called_once()
-        call_kwargs = mock_manager.start_run.call_args
-
-        # document_ids should contain the IDs of the newly created files
-        document_ids = call_kwargs.kwargs.get("document_ids")
-        assert document_ids is not None
-        assert len(document_ids) == 2
-        # IDs should match the created file IDs from response
-        response_ids = [f["id"] for f in response.json()["files"]]
-        assert sorted(document_ids) == sorted(response_ids)
+        assert response.status_code == 415
+
+    def test_upload_without_supported_files_skips_extract(
+        self, test_project_setup, client: TestClient, mock_scheduler
+    ):
+        """登録対象がなければExtractを開始しない"""
+        project_id = test_project_setup["project_id"]
+        body = _zip_body({"img.png": b"\x89PNG"})
+
+        response = self._upload(client, project_id, body, "application/zip")
+
+        assert response.status_code == 201
+        assert response.json()["files"] == []
+        assert response.json()["extract_scheduled"] is False
+        mock_scheduler.notify.assert_not_called()
@@ -141,3 +141,18 @@ def test_get_issues_returns_404_for_missing_project(client: TestClient):
     response = client.get("/api/projects/999/issues")
 
     assert response.status_code == 404
+
+
+def test_list_issues_etag_depends_on_query(test_project_setup, client: TestClient):
+    """Test GET /issues gives each filter its own ETag."""
+    project_id = test_project_setup["project_id"]
+    url = f"/api/projects/{project_id}/issues"
+
+    all_etag = client.get(url).headers["ETag"]
+    unclear = client.get(url, params={"issue_type": "unclear"})
+
+    assert unclear.headers["ETag"] != all_etag
+    stale = client.get(
+        url, params={"issue_type": "unclear"}, headers={"If-None-Match": all_etag}
+    )
+    assert stale.status_code == 200
@@ -0,0 +1,42 @@
+"""Tests for the /metrics endpoint."""
+
+from fastapi.testclient import TestClient
+
+from genglossary.metrics import REGISTRY
+
+
+def _requests(route: str, status: str = "200") -> float:
+    return REGISTRY.get_sample_value(
+        "genglossary_http_requests_total",
+        {"method": "GET", "route": route, "status": status},
+    ) or 0
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_returns_prometheus_text(self, client: TestClient) -> None:
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE genglossary_http_request_duration_seconds histogram" in response.text
+        assert "# TYPE genglossary_llm_requests_total counter" in response.text
+        assert "# TYPE genglossary_runs_active gauge" in response.text
+
+    def test_records_requests_by_route_template(self, client: TestClient) -> None:
+        route = "/api/projects/{project_id}/terms"
+        before = _requests(route, "404")
+
+        client.get("/api/projects/99999/terms")
+
+        assert _requests(route, "404") == before + 1
+        assert 'route="/api/projects/{project_id}/terms"' in client.get("/metrics").text
+
+    def test_unmatched_paths_share_one_label(self, client: TestClient) -> None:
+        before = _requests("<unmatched>", "404")
+
+        client.get("/no/such/path/1")
+        client.get("/no/such/path/2")
+
+        assert _requests("<unmatched>", "404") == before + 2
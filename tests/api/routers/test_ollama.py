@@ -164,3 +164,42 @@ def test_list_models_whitespace_url(client: TestClient):
     assert response.status_code == 400
     data = response.json()
     assert "empty" in data["detail"].lower()
+
+
+@respx.mock
+def test_list_models_releases_shared_connection_pool(client: TestClient):
+    """Test that the request returns its lease on the shared connection pool."""
+    from genglossary.llm.http_pool import get_http_transport_registry
+
+    respx.get("http://localhost:11434/api/tags").mock(
+        return_value=httpx.Response(200, json={"models": []})
+    )
+
+    def leases() -> int:
+        return sum(
+            int(s["leases"])
+            for s in get_http_transport_registry().stats()
+            if s["origin"] == "http://localhost:11434"
+        )
+
+    before = leases()
+    response = client.get("/api/ollama/models")
+
+    assert response.status_code == 200
+    assert leases() == before
+
+
+@respx.mock
+def test_list_models_queries_first_of_several_servers(client: TestClient):
+    """Test that a load-balanced base URL lists the first server's models."""
+    respx.get("http://localhost:11434/api/tags").mock(
+        return_value=httpx.Response(200, json={"models": [{"name": "llama3.2"}]})
+    )
+
+    response = client.get(
+        "/api/ollama/models",
+        params={"base_url": "http://localhost:11434,http://127.0.0.1:11435"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"models": [{"name": "llama3.2"}]}
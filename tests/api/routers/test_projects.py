@@ -497,6 +497,31 @@ class TestUpdateProject:
         data = response.json()
         assert data["llm_base_url"] == "https://api.openai.com/v1"
 
+    def test_updates_llm_base_url_with_several_servers(
+        self, test_project_in_registry, client: TestClient
+    ):
+        """Test that comma-separated base URLs are accepted and normalized."""
+        project_id = test_project_in_registry["project_id"]
+
+        payload = {"llm_base_url": "http://gpu1:11434 , http://gpu2:11434,"}
+
+        response = client.patch(f"/api/projects/{project_id}", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["llm_base_url"] == "http://gpu1:11434,http://gpu2:11434"
+
+    def test_returns_422_for_invalid_url_in_list(
+        self, test_project_in_registry, client: TestClient
+    ):
+        """Test returns 422 when any of several base URLs is invalid."""
+        project_id = test_project_in_registry["project_id"]
+
+        payload = {"llm_base_url": "http://gpu1:11434,gpu2:11434"}
+
+        response = client.patch(f"/api/projects/{project_id}", json=payload)
+
+        assert response.status_code == 422
+
     def test_returns_422_for_invalid_base_url(
         self, test_project_in_registry, client: TestClient
     ):
@@ -373,7 +373,7 @@ def test_regenerate_provisional_llm_unavailable_returns_503(
     assert "unavailable" in response.json()["detail"].lower()
 
 
-@patch("genglossary.api.routers.provisional.DocumentLoader")
+@patch("genglossary.corpus.DocumentLoader")
 def test_regenerate_provisional_invalid_doc_root_returns_400(
     mock_loader_class, test_project_setup, client: TestClient
 ):
@@ -400,7 +400,7 @@ def test_regenerate_provisional_invalid_doc_root_returns_400(
     assert "not found" in response.json()["detail"].lower()
 
 
-@patch("genglossary.api.routers.provisional.create_llm_client")
+@patch("genglossary.api.dependencies.create_llm_client")
 def test_regenerate_provisional_invalid_llm_provider_returns_400(
     mock_create_llm, test_project_setup, client: TestClient
 ):
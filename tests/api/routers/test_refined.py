@@ -1,5 +1,6 @@
 """Tests for Refined API endpoints."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -89,6 +90,28 @@ def test_list_refined_returns_all_terms(test_project_setup, client: TestClient):
     assert data[1]["id"] == term2_id
 
 
+def test_list_refined_can_omit_occurrences(test_project_setup, client: TestClient):
+    """Test GET /api/projects/{id}/refined?include_occurrences=false skips occurrences."""
+    project_id = test_project_setup["project_id"]
+    project_db_path = test_project_setup["project_db_path"]
+
+    conn = get_connection(project_db_path)
+    occ = TermOccurrence(document_path="doc1.txt", line_number=1, context="context1")
+    with transaction(conn):
+        create_refined_term(conn, "量子コンピュータ", "定義", 0.95, [occ])
+    conn.close()
+
+    response = client.get(
+        f"/api/projects/{project_id}/refined", params={"include_occurrences": "false"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["term_name"] == "量子コンピュータ"
+    assert data[0]["occurrences"] == []
+
+
 def test_get_refined_by_id_returns_term(test_project_setup, client: TestClient):
     """Test GET /api/projects/{id}/refined/{term_id} returns specific term."""
     project_id = test_project_setup["project_id"]
@@ -159,6 +182,65 @@ def test_export_markdown_returns_empty_for_no_terms(
     assert response.headers["content-type"] == "text/markdown; charset=utf-8"
 
 
+def _add_terms(project_db_path: str, count: int = 2) -> None:
+    conn = get_connection(project_db_path)
+    occ = TermOccurrence(document_path="doc1.txt", line_number=1, context="context")
+    with transaction(conn):
+        for i in range(count):
+            create_refined_term(conn, f"用語{i}", f"定義,{i}", 0.9, [occ])
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "fmt,media_type",
+    [
+        ("md", "text/markdown; charset=utf-8"),
+        ("jsonl", "application/x-ndjson"),
+        ("csv", "text/csv; charset=utf-8"),
+        ("tsv", "text/tab-separated-values; charset=utf-8"),
+    ],
+)
+def test_export_streams_each_format(
+    test_project_setup, client: TestClient, fmt: str, media_type: str
+):
+    """Test GET /api/projects/{id}/refined/export?format=... streams a download."""
+    _add_terms(test_project_setup["project_db_path"])
+
+    response = client.get(
+        f"/api/projects/{test_project_setup['project_id']}/refined/export",
+        params={"format": fmt},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="glossary.{fmt}"'
+    )
+    assert "用語0" in response.text
+    assert "用語1" in response.text
+
+
+def test_export_jsonl_has_one_line_per_term(test_project_setup, client: TestClient):
+    """Test JSONL export emits one JSON object per term."""
+    _add_terms(test_project_setup["project_db_path"], count=3)
+
+    response = client.get(
+        f"/api/projects/{test_project_setup['project_id']}/refined/export?format=jsonl"
+    )
+
+    lines = response.text.splitlines()
+    assert [json.loads(line)["term_name"] for line in lines] == ["用語0", "用語1", "用語2"]
+
+
+def test_export_rejects_unknown_format(test_project_setup, client: TestClient):
+    """Test GET /api/projects/{id}/refined/export rejects unknown formats."""
+    response = client.get(
+        f"/api/projects/{test_project_setup['project_id']}/refined/export?format=xlsx"
+    )
+
+    assert response.status_code == 422
+
+
 def test_get_refined_returns_404_for_missing_project(client: TestClient):
     """Test GET /api/projects/{id}/refined returns 404 for missing project."""
     response = client.get("/api/projects/999/refined")
@@ -251,3 +333,30 @@ def test_list_refined_returns_empty_aliases_when_no_synonym_groups(
     assert response.status_code == 200
     data = response.json()
     assert data[0]["aliases"] == []
+
+
+def test_list_refined_etag_changes_with_synonym_groups(
+    test_project_setup, client: TestClient
+):
+    """Test the ETag of GET /refined also tracks synonym groups (aliases)."""
+    project_id = test_project_setup["project_id"]
+    project_db_path = test_project_setup["project_db_path"]
+    url = f"/api/projects/{project_id}/refined"
+
+    conn = get_connection(project_db_path)
+    occ = TermOccurrence(document_path="doc.txt", line_number=1, context="context")
+    with transaction(conn):
+        create_refined_term(conn, "田中太郎", "主人公", 0.95, [occ])
+    conn.close()
+
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    conn = get_connection(project_db_path)
+    with transaction(conn):
+        create_group(conn, "田中太郎", ["田中太郎", "田中"])
+    conn.close()
+
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()[0]["aliases"] == ["田中"]
@@ -10,7 +10,9 @@ from fastapi.testclient import TestClient
 from genglossary.db.connection import get_connection, transaction
 from genglossary.db.project_repository import create_project
 from genglossary.db.registry_schema import initialize_registry
+from genglossary.db.run_profile_repository import save_run_profile
 from genglossary.db.runs_repository import create_run, update_run_status
+from genglossary.runs.profile import RunProfile
 
 
 @pytest.fixture
@@ -263,6 +265,75 @@ class TestGetRun:
         assert response.status_code == 404
 
 
+class TestGetRunProfile:
+    """Tests for GET /api/projects/{id}/runs/{run_id}/profile endpoint."""
+
+    def test_get_profile_returns_saved_profile(
+        self, test_project_setup, client: TestClient
+    ) -> None:
+        """保存済みのプロファイルを返す"""
+        project_id = test_project_setup["project_id"]
+
+        conn = get_connection(test_project_setup["project_db_path"])
+        with transaction(conn):
+            run_id = create_run(conn, scope="full")
+            save_run_profile(
+                conn,
+                run_id,
+                RunProfile(
+                    wall_seconds=3.0,
+                    step_seconds={"generate": 2.0, "review": 1.0},
+                    llm_calls=5,
+                    llm_latency_mean_ms=120.0,
+                    llm_latency_p95_ms=300.0,
+                ),
+                llm_provider="ollama",
+                llm_model="llama3.2",
+                llm_concurrency=2,
+                streaming=False,
+            )
+        conn.close()
+
+        response = client.get(f"/api/projects/{project_id}/runs/{run_id}/profile")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["run_id"] == run_id
+        assert data["llm_model"] == "llama3.2"
+        assert data["steps"] == [
+            {"step": "generate", "wall_seconds": 2.0},
+            {"step": "review", "wall_seconds": 1.0},
+        ]
+        assert data["llm_calls"] == 5
+        assert data["llm_latency_p95_ms"] == 300.0
+
+    def test_get_profile_returns_404_without_profile(
+        self, test_project_setup, client: TestClient
+    ) -> None:
+        """プロファイル未保存のRunには404を返す"""
+        project_id = test_project_setup["project_id"]
+
+        conn = get_connection(test_project_setup["project_db_path"])
+        with transaction(conn):
+            run_id = create_run(conn, scope="full")
+        conn.close()
+
+        response = client.get(f"/api/projects/{project_id}/runs/{run_id}/profile")
+
+        assert response.status_code == 404
+
+    def test_get_profile_returns_404_for_missing_run(
+        self, test_project_setup, client: TestClient
+    ) -> None:
+        """存在しないRunには404を返す"""
+        project_id = test_project_setup["project_id"]
+
+        response = client.get(f"/api/projects/{project_id}/runs/999/profile")
+
+        assert response.status_code == 404
+        assert "Run 999 not found" in response.json()["detail"]
+
+
 class TestGetCurrentRun:
     """Tests for GET /api/projects/{id}/runs/current endpoint."""
 
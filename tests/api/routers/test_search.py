@@ -0,0 +1,95 @@
+"""Tests for Search API endpoint."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.document_repository import create_document
+from genglossary.db.project_repository import create_project
+from genglossary.db.provisional_repository import create_provisional_term
+from genglossary.db.registry_schema import initialize_registry
+from genglossary.db.schema import initialize_db
+
+
+@pytest.fixture
+def test_project_setup(tmp_path: Path, monkeypatch):
+    """Setup test project with a document and a provisional term."""
+    registry_path = tmp_path / "registry.db"
+    project_db_path = tmp_path / "project.db"
+    doc_root = tmp_path / "docs"
+    doc_root.mkdir()
+
+    monkeypatch.setenv("GENGLOSSARY_REGISTRY_PATH", str(registry_path))
+
+    registry_conn = get_connection(str(registry_path))
+    initialize_registry(registry_conn)
+    with transaction(registry_conn):
+        project_id = create_project(
+            registry_conn,
+            name="Test Project",
+            doc_root=str(doc_root),
+            db_path=str(project_db_path),
+        )
+    registry_conn.close()
+
+    conn = get_connection(str(project_db_path))
+    initialize_db(conn)
+    with transaction(conn):
+        create_document(conn, "story.md", "アソリウス島騎士団は魔神と戦う。", "h1")
+        create_provisional_term(conn, "騎士団", "島を守る騎士の集団", 0.5, [])
+    conn.close()
+
+    return {"project_id": project_id}
+
+
+def test_search_returns_hits_with_snippets(test_project_setup, client: TestClient):
+    """Test GET /api/projects/{id}/search returns hits across sources."""
+    project_id = test_project_setup["project_id"]
+
+    response = client.get(
+        f"/api/projects/{project_id}/search", params={"q": "騎士団"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(hit["source"], hit["title"]) for hit in data] == [
+        ("documents", "story.md"),
+        ("provisional", "騎士団"),
+    ]
+    assert "<mark>騎士団</mark>" in data[0]["snippet"]
+
+
+def test_search_filters_by_source(test_project_setup, client: TestClient):
+    """Test that the source query parameter restricts the searched tables."""
+    project_id = test_project_setup["project_id"]
+
+    response = client.get(
+        f"/api/projects/{project_id}/search",
+        params={"q": "騎士団", "source": "provisional"},
+    )
+
+    assert response.status_code == 200
+    assert [hit["source"] for hit in response.json()] == ["provisional"]
+
+
+def test_search_unknown_source_returns_400(test_project_setup, client: TestClient):
+    """Test that an unknown source is rejected."""
+    project_id = test_project_setup["project_id"]
+
+    response = client.get(
+        f"/api/projects/{project_id}/search",
+        params={"q": "騎士団", "source": "issues"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_search_requires_query(test_project_setup, client: TestClient):
+    """Test that q is required."""
+    project_id = test_project_setup["project_id"]
+
+    response = client.get(f"/api/projects/{project_id}/search")
+
+    assert response.status_code == 422
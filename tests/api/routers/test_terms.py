@@ -263,3 +263,38 @@ def test_delete_term_returns_404_for_missing_term(
     response = client.delete(f"/api/projects/{project_id}/terms/999")
 
     assert response.status_code == 404
+
+
+def test_list_terms_returns_etag_and_304_when_unchanged(
+    test_project_setup, client: TestClient
+):
+    """Test GET /terms answers a matching If-None-Match with 304."""
+    project_id = test_project_setup["project_id"]
+    url = f"/api/projects/{project_id}/terms"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    any_etag = client.get(url, headers={"If-None-Match": "*"})
+    assert any_etag.status_code == 304
+
+
+def test_list_terms_etag_changes_after_write(test_project_setup, client: TestClient):
+    """Test the ETag of GET /terms changes when a term is added."""
+    project_id = test_project_setup["project_id"]
+    url = f"/api/projects/{project_id}/terms"
+    etag = client.get(url).headers["ETag"]
+
+    client.post(url, json={"term_text": "量子ビット", "category": "技術"})
+
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 1
@@ -67,6 +67,26 @@ def test_cors_exposes_request_id_header(client):
     assert "x-request-id" in exposed
 
 
+def test_cors_exposes_pagination_cursor_header(client):
+    """Test CORS exposes X-Next-Cursor so the GUI can page through files."""
+    response = client.get(
+        "/health",
+        headers={"Origin": "http://localhost:5173"},
+    )
+    exposed = response.headers["access-control-expose-headers"].lower()
+    assert "x-next-cursor" in exposed
+
+
+def test_cors_exposes_etag_header(client):
+    """Test CORS exposes ETag so the GUI can send If-None-Match."""
+    response = client.get(
+        "/health",
+        headers={"Origin": "http://localhost:5173"},
+    )
+    exposed = response.headers["access-control-expose-headers"].lower()
+    assert "etag" in exposed
+
+
 def test_request_id_header_attached_as_uuid(client):
     """Test X-Request-ID header is attached and is UUID format."""
     response = client.get("/health")
@@ -100,3 +120,58 @@ def test_redoc_accessible(client):
     response = client.get("/redoc")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
+
+
+def test_startup_warms_up_tokenizer_pool(monkeypatch):
+    """Test that starting the app loads the SudachiPy dictionary in the background."""
+    from threading import Event
+
+    from fastapi.testclient import TestClient
+
+    from genglossary.api import app as app_module
+
+    warmed_up = Event()
+
+    class FakePool:
+        def warm_up(self) -> None:
+            warmed_up.set()
+
+    monkeypatch.setattr(app_module, "get_tokenizer_pool", lambda: FakePool())
+
+    with TestClient(app_module.create_app()):
+        assert warmed_up.wait(timeout=5)
+
+
+def test_startup_survives_warm_up_failure(monkeypatch):
+    """Test that a failing warm-up does not prevent the app from serving."""
+    from fastapi.testclient import TestClient
+
+    from genglossary.api import app as app_module
+
+    class BrokenPool:
+        def warm_up(self) -> None:
+            raise RuntimeError("dictionary not installed")
+
+    monkeypatch.setattr(app_module, "get_tokenizer_pool", lambda: BrokenPool())
+
+    with TestClient(app_module.create_app()) as client:
+        assert client.get("/health").status_code == 200
+
+
+def test_shutdown_closes_shared_http_pools(monkeypatch):
+    """Test that stopping the app closes the LLM connection pools."""
+    from fastapi.testclient import TestClient
+
+    from genglossary.api import app as app_module
+
+    closed = []
+
+    class FakeRegistry:
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(app_module, "get_http_transport_registry", lambda: FakeRegistry())
+
+    with TestClient(app_module.create_app()):
+        assert closed == []
+    assert closed == [True]
@@ -0,0 +1,122 @@
+"""Tests for the response compression middleware."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from genglossary.api.middleware.compression import (
+    CompressionMiddleware,
+    accepted_encodings,
+)
+
+LARGE_BODY = "用語集" * 1000
+
+
+@pytest.fixture
+def app_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    def large() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    def small() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    @app.get("/export")
+    def export() -> StreamingResponse:
+        return StreamingResponse(iter([LARGE_BODY, "ok", LARGE_BODY]), media_type="text/plain")
+
+    @app.get("/events")
+    def events() -> StreamingResponse:
+        return StreamingResponse(
+            iter(["data: " + LARGE_BODY + "\n\n"]), media_type="text/event-stream"
+        )
+
+    return TestClient(app)
+
+
+def _get(client: TestClient, path: str, accept_encoding: str):
+    # httpx decodes bodies transparently; read the raw bytes instead
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as r:
+        return r, b"".join(r.iter_raw())
+
+
+class TestAcceptedEncodings:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_parses_codings_and_skips_zero_quality(self) -> None:
+        assert accepted_encodings("gzip, deflate;q=0.5, br;q=0, *;q=0") == {
+            "gzip",
+            "deflate",
+        }
+
+    def test_empty_header(self) -> None:
+        assert accepted_encodings("") == set()
+
+    def test_coding_names_are_case_insensitive(self) -> None:
+        assert accepted_encodings("GZip") == {"gzip"}
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_gzip_when_accepted(self, app_client: TestClient) -> None:
+        response, raw = _get(app_client, "/large", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert gzip.decompress(raw).decode() == LARGE_BODY
+        assert len(raw) < len(LARGE_BODY.encode())
+
+    def test_streaming_response_is_compressed_chunk_by_chunk(
+        self, app_client: TestClient
+    ) -> None:
+        response, raw = _get(app_client, "/export", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(raw).decode() == LARGE_BODY + "ok" + LARGE_BODY
+
+    def test_gzip_without_brotli(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "genglossary.api.middleware.compression._brotli_available", lambda: False
+        )
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        app.get("/large")(lambda: PlainTextResponse(LARGE_BODY))
+
+        response, raw = _get(TestClient(app), "/large", "br, gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw).decode() == LARGE_BODY
+
+    def test_brotli_when_installed(self, app_client: TestClient) -> None:
+        brotli = pytest.importorskip("brotli")
+
+        response, raw = _get(app_client, "/large", "br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(raw).decode() == LARGE_BODY
+
+    def test_identity_when_not_accepted(self, app_client: TestClient) -> None:
+        response, raw = _get(app_client, "/large", "identity")
+
+        assert "content-encoding" not in response.headers
+        assert raw.decode() == LARGE_BODY
+
+    def test_small_response_is_not_compressed(self, app_client: TestClient) -> None:
+        response, raw = _get(app_client, "/small", "gzip")
+
+        assert "content-encoding" not in response.headers
+        assert raw == b"ok"
+
+    def test_event_stream_is_not_compressed(self, app_client: TestClient) -> None:
+        response, _ = _get(app_client, "/events", "gzip")
+
+        assert "content-encoding" not in response.headers
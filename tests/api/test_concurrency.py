@@ -0,0 +1,108 @@
+"""Tests that blocking work in handlers does not stall the event loop."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.project_repository import create_project
+from genglossary.db.provisional_repository import create_provisional_term
+from genglossary.db.registry_schema import initialize_registry
+from genglossary.db.schema import initialize_db
+
+# How long the simulated LLM call blocks its worker thread
+SLOW_LLM_SECONDS = 1.0
+
+
+@pytest.fixture
+def project_with_term(tmp_path: Path, monkeypatch) -> tuple[int, int]:
+    """Create a project containing one provisional term.
+
+    Returns:
+        tuple[int, int]: (project_id, term_id)
+    """
+    registry_path = tmp_path / "registry.db"
+    project_db_path = tmp_path / "project.db"
+    doc_root = tmp_path / "docs"
+    doc_root.mkdir()
+    monkeypatch.setenv("GENGLOSSARY_REGISTRY_PATH", str(registry_path))
+
+    registry_conn = get_connection(str(registry_path))
+    initialize_registry(registry_conn)
+    with transaction(registry_conn):
+        project_id = create_project(
+            registry_conn,
+            name="Test Project",
+            doc_root=str(doc_root),
+            db_path=str(project_db_path),
+        )
+    registry_conn.close()
+
+    conn = get_connection(str(project_db_path))
+    initialize_db(conn)
+    with transaction(conn):
+        term_id = create_provisional_term(conn, "用語", "旧定義", 0.5, [])
+    conn.close()
+
+    return project_id, term_id
+
+
+def _slow_regenerate(*args, **kwargs) -> tuple[str, float]:
+    """Stand-in for a synchronous LLM call."""
+    time.sleep(SLOW_LLM_SECONDS)
+    return "新しい定義", 0.9
+
+
+async def _timed_get(
+    client: httpx.AsyncClient, url: str, start: float
+) -> tuple[int, float]:
+    """GET url and return (status_code, seconds since start)."""
+    response = await client.get(url)
+    return response.status_code, time.perf_counter() - start
+
+
+def test_slow_regenerate_does_not_block_other_requests(project_with_term) -> None:
+    """Health checks and list endpoints answer while a regenerate is in flight."""
+    from genglossary.api.app import create_app
+
+    project_id, term_id = project_with_term
+    app = create_app()
+
+    async def scenario() -> tuple[int, list[tuple[int, float]]]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            start = time.perf_counter()
+            regenerate = asyncio.create_task(
+                client.post(
+                    f"/api/projects/{project_id}/provisional/{term_id}/regenerate"
+                )
+            )
+            # Let the regenerate request reach the slow call. If the handler
+            # blocked the event loop, this sleep would not return until the
+            # LLM call finished.
+            await asyncio.sleep(0.2)
+            others = await asyncio.gather(
+                _timed_get(client, "/health", start),
+                _timed_get(client, f"/api/projects/{project_id}/provisional", start),
+                _timed_get(client, f"/api/projects/{project_id}/files", start),
+            )
+            response = await regenerate
+            return response.status_code, list(others)
+
+    with patch(
+        "genglossary.api.routers.provisional._regenerate_definition",
+        side_effect=_slow_regenerate,
+    ):
+        regenerate_status, others = asyncio.run(scenario())
+
+    assert regenerate_status == 200
+    for status_code, elapsed in others:
+        assert status_code == 200
+        # Answered while the regenerate call was still sleeping
+        assert elapsed < SLOW_LLM_SECONDS * 0.8
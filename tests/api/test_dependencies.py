@@ -2,6 +2,7 @@
 
 import sqlite3
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -333,3 +334,204 @@ def test_run_manager_recreates_when_llm_base_url_changes(tmp_path: Path):
 
         assert manager2.llm_base_url == "http://192.168.1.100:8080/v1"
         assert manager2 is not manager1
+
+
+def test_project_llm_client_is_shared_until_settings_change(tmp_path: Path):
+    """同じ設定のプロジェクトではLLMクライアントを再利用し、設定変更時に作り直す"""
+    from genglossary.api.dependencies import (
+        _llm_client_registry,
+        use_project_llm_client,
+    )
+    from genglossary.models.project import Project
+
+    project = Project(
+        id=1,
+        name="Test Project",
+        doc_root=str(tmp_path / "docs"),
+        db_path=str(tmp_path / "project.db"),
+        llm_provider="ollama",
+        llm_model="llama3.2",
+    )
+    _llm_client_registry.clear()
+
+    with use_project_llm_client(project) as client1:
+        pass
+    with use_project_llm_client(project) as client2:
+        assert client1 is client2
+
+    changed = project.model_copy(update={"llm_model": "llama3"})
+    with use_project_llm_client(changed) as client3:
+        assert client3 is not client1
+        assert client3.model == "llama3"
+
+    _llm_client_registry.clear()
+
+
+@patch("genglossary.api.dependencies.create_llm_client")
+def test_replaced_llm_client_is_closed_after_last_request(
+    mock_create: MagicMock, tmp_path: Path
+):
+    """設定変更で置き換えたLLMクライアントは、使用中のリクエストが終わってから閉じる"""
+    from genglossary.api.dependencies import (
+        _llm_client_registry,
+        use_project_llm_client,
+    )
+    from genglossary.models.project import Project
+
+    mock_create.side_effect = lambda *args, **kwargs: MagicMock()
+    project = Project(
+        id=1, name="P1", doc_root="", db_path=str(tmp_path / "p1.db"), llm_model="a"
+    )
+    changed = project.model_copy(update={"llm_model": "b"})
+    _llm_client_registry.clear()
+
+    with use_project_llm_client(project) as old:
+        with use_project_llm_client(changed) as new:
+            # Still used by the outer request
+            old.close.assert_not_called()
+        old.close.assert_not_called()
+    old.close.assert_called_once()
+    new.close.assert_not_called()
+
+    # Replacing an idle client closes it at once
+    with use_project_llm_client(project):
+        pass
+    new.close.assert_called_once()
+
+    _llm_client_registry.clear()
+
+
+@patch("genglossary.api.dependencies.create_llm_client")
+def test_close_project_llm_clients_closes_registered_clients(
+    mock_create: MagicMock, tmp_path: Path
+):
+    """アプリ終了時に登録済みのLLMクライアントをすべて閉じる"""
+    from genglossary.api.dependencies import (
+        _llm_client_registry,
+        close_project_llm_clients,
+        use_project_llm_client,
+    )
+    from genglossary.models.project import Project
+
+    mock_create.side_effect = lambda *args, **kwargs: MagicMock()
+    idle_project = Project(id=1, name="P1", doc_root="", db_path=str(tmp_path / "p1.db"))
+    busy_project = Project(id=2, name="P2", doc_root="", db_path=str(tmp_path / "p2.db"))
+    _llm_client_registry.clear()
+
+    with use_project_llm_client(idle_project) as idle:
+        pass
+    with use_project_llm_client(busy_project) as busy:
+        close_project_llm_clients()
+
+        idle.close.assert_called_once()
+        busy.close.assert_not_called()
+    busy.close.assert_called_once()
+    assert _llm_client_registry == {}
+
+
+def test_corpus_cache_is_singleton_per_project(tmp_path: Path):
+    """コーパスキャッシュはプロジェクトごとに1つ"""
+    from genglossary.api.dependencies import _corpus_cache_registry, get_corpus_cache
+    from genglossary.models.project import Project
+
+    project1 = Project(
+        id=1, name="P1", doc_root="", db_path=str(tmp_path / "p1.db")
+    )
+    project2 = Project(
+        id=2, name="P2", doc_root="", db_path=str(tmp_path / "p2.db")
+    )
+    _corpus_cache_registry.clear()
+
+    assert get_corpus_cache(project1) is get_corpus_cache(project1)
+    assert get_corpus_cache(project1) is not get_corpus_cache(project2)
+
+    _corpus_cache_registry.clear()
+
+
+def test_event_hub_is_singleton_per_project(tmp_path: Path):
+    """イベントハブはプロジェクトごとに1つ"""
+    from genglossary.api.dependencies import _event_hub_registry, get_event_hub
+    from genglossary.models.project import Project
+
+    project1 = Project(
+        id=1, name="P1", doc_root="", db_path=str(tmp_path / "p1.db")
+    )
+    project2 = Project(
+        id=2, name="P2", doc_root="", db_path=str(tmp_path / "p2.db")
+    )
+    _event_hub_registry.clear()
+
+    assert get_event_hub(project1) is get_event_hub(project1)
+    assert get_event_hub(project1) is not get_event_hub(project2)
+    assert get_event_hub(project1).db_path == project1.db_path
+
+    _event_hub_registry.clear()
+
+
+def test_auto_extract_scheduler_follows_run_manager(tmp_path: Path):
+    """自動抽出スケジューラはプロジェクトごとに1つで、最新のRunManagerを使う"""
+    from genglossary.api.dependencies import (
+        _auto_extract_registry,
+        get_auto_extract_scheduler,
+    )
+    from genglossary.models.project import Project
+
+    project = Project(id=1, name="P1", doc_root="", db_path=str(tmp_path / "p1.db"))
+    manager1 = MagicMock()
+    manager2 = MagicMock()
+    _auto_extract_registry.clear()
+
+    with patch("genglossary.runs.auto_extract.AutoExtractScheduler.resume") as resume:
+        scheduler = get_auto_extract_scheduler(project, manager1)
+        assert get_auto_extract_scheduler(project, manager2) is scheduler
+
+    # Documents queued before a restart are resumed once
+    resume.assert_called_once()
+    assert scheduler.manager is manager2
+
+    _auto_extract_registry.clear()
+
+
+def test_resume_auto_extract_starts_projects_with_queued_documents(tmp_path: Path):
+    """起動時にキューの残っているプロジェクトだけ自動抽出を再開する"""
+    import os
+
+    from genglossary.api.dependencies import (
+        _auto_extract_registry,
+        _run_manager_registry,
+        resume_auto_extract,
+    )
+    from genglossary.db.document_repository import create_document
+    from genglossary.db.pending_extract_repository import add_pending_extract_documents
+    from genglossary.db.schema import initialize_db
+
+    registry_conn = get_connection(os.environ["GENGLOSSARY_REGISTRY_PATH"])
+    initialize_registry(registry_conn)
+    db_paths = []
+    for name in ("queued", "idle", "missing"):
+        db_path = str(tmp_path / f"{name}.db")
+        db_paths.append(db_path)
+        with transaction(registry_conn):
+            create_project(registry_conn, name=name, doc_root=str(tmp_path), db_path=db_path)
+    registry_conn.close()
+
+    for db_path, queued in zip(db_paths[:2], (True, False)):
+        conn = get_connection(db_path)
+        initialize_db(conn)
+        with transaction(conn):
+            create_document(conn, "a.md", "本文", "h1")
+            if queued:
+                add_pending_extract_documents(conn, [1])
+        conn.close()
+
+    _run_manager_registry.clear()
+    _auto_extract_registry.clear()
+    with patch("genglossary.runs.auto_extract.AutoExtractScheduler.resume") as resume:
+        resume_auto_extract()
+
+    assert set(_auto_extract_registry) == {db_paths[0]}
+    assert _auto_extract_registry[db_paths[0]].manager is _run_manager_registry[db_paths[0]]
+    resume.assert_called_once()
+
+    _run_manager_registry.clear()
+    _auto_extract_registry.clear()
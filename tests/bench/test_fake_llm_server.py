@@ -0,0 +1,161 @@
+"""Tests for the fake LLM server."""
+
+import httpx
+import pytest
+
+from genglossary.bench.fake_llm_server import (
+    MALFORMED_RESPONSE,
+    FakeLLMServer,
+    FakeLLMSettings,
+    build_response,
+)
+from genglossary.glossary_generator import DefinitionResponse
+from genglossary.glossary_reviewer import ReviewResponse
+from genglossary.llm.ollama_client import OllamaClient
+from genglossary.llm.openai_compatible_client import OpenAICompatibleClient
+from genglossary.term_extractor import BatchTermClassificationResponse
+
+
+def _structured(prompt: str, response_model) -> str:
+    """Build a prompt the way BaseLLMClient._build_json_prompt does."""
+    return OllamaClient()._build_json_prompt(prompt, response_model)
+
+
+class TestFakeLLMSettings:
+    """Tests for FakeLLMSettings validation."""
+
+    def test_rejects_negative_latency(self) -> None:
+        with pytest.raises(ValueError, match="must not be negative"):
+            FakeLLMSettings(latency_ms=-1)
+
+    def test_rejects_rate_above_one(self) -> None:
+        with pytest.raises(ValueError, match="error_rate must be between 0 and 1"):
+            FakeLLMSettings(error_rate=1.5)
+
+
+class TestBuildResponse:
+    """Tests for build_response."""
+
+    def test_classifies_every_term(self) -> None:
+        prompt = _structured(
+            "<terms>\n- アソリウス島\n- 騎士団長\n</terms>",
+            BatchTermClassificationResponse,
+        )
+
+        response = BatchTermClassificationResponse.model_validate_json(
+            build_response(prompt, FakeLLMSettings())
+        )
+
+        assert [c["term"] for c in response.classifications] == ["アソリウス島", "騎士団長"]
+
+    def test_definition_mentions_term(self) -> None:
+        prompt = _structured("用語: <term>聖印</term>", DefinitionResponse)
+
+        response = DefinitionResponse.model_validate_json(
+            build_response(prompt, FakeLLMSettings())
+        )
+
+        assert "聖印" in response.definition
+        assert 0.0 <= response.confidence <= 1.0
+
+    def test_review_is_deterministic_and_rate_driven(self) -> None:
+        glossary = "\n".join(f"- 用語{i}: 定義 (信頼度: 80%)" for i in range(50))
+        prompt = _structured(f"<glossary>{glossary}</glossary>", ReviewResponse)
+
+        everything = build_response(prompt, FakeLLMSettings(issue_rate=1.0, exclude_rate=0.0))
+        nothing = build_response(prompt, FakeLLMSettings(issue_rate=0.0, exclude_rate=0.0))
+
+        assert len(ReviewResponse.model_validate_json(everything).issues) == 50
+        assert ReviewResponse.model_validate_json(nothing).issues == []
+        assert build_response(prompt, FakeLLMSettings()) == build_response(
+            prompt, FakeLLMSettings()
+        )
+
+    def test_unknown_schema_gets_conforming_value(self) -> None:
+        from pydantic import BaseModel
+
+        class Custom(BaseModel):
+            name: str
+            score: float
+            tags: list[str]
+
+        text = build_response(_structured("anything", Custom), FakeLLMSettings())
+
+        assert Custom.model_validate_json(text).tags == []
+
+    def test_plain_prompt_gets_text(self) -> None:
+        assert build_response("こんにちは", FakeLLMSettings())
+
+
+class TestFakeLLMServer:
+    """Tests for FakeLLMServer over HTTP."""
+
+    def test_ollama_client_round_trip(self) -> None:
+        with FakeLLMServer() as server:
+            client = OllamaClient(base_url=server.url, model="fake-llm")
+            try:
+                assert client.is_available()
+                result = client.generate_structured(
+                    "用語: <term>聖印</term>", DefinitionResponse
+                )
+            finally:
+                client.close()
+
+        assert "聖印" in result.definition
+        assert server.counts["requests"] == 1
+
+    def test_openai_client_round_trip(self) -> None:
+        with FakeLLMServer() as server:
+            client = OpenAICompatibleClient(
+                base_url=server.url, api_key="test", model="fake-llm"
+            )
+            try:
+                assert client.is_available()
+                result = client.generate_structured(
+                    "用語: <term>聖印</term>", DefinitionResponse
+                )
+            finally:
+                client.close()
+
+        assert "聖印" in result.definition
+
+    def test_chat_endpoints(self) -> None:
+        with FakeLLMServer() as server:
+            ollama = httpx.post(
+                f"{server.url}/api/chat",
+                json={"model": "m", "messages": [{"role": "user", "content": "hi"}]},
+            )
+            openai = httpx.post(
+                f"{server.url}/v1/chat/completions",
+                json={"model": "m", "messages": [{"role": "user", "content": "hi"}]},
+            )
+
+        assert ollama.json()["message"]["role"] == "assistant"
+        assert openai.json()["choices"][0]["message"]["content"]
+        assert openai.json()["usage"]["prompt_tokens"] == 2
+
+    def test_injects_errors(self) -> None:
+        with FakeLLMServer(FakeLLMSettings(error_rate=1.0)) as server:
+            response = httpx.post(f"{server.url}/api/generate", json={"prompt": "x"})
+
+        assert response.status_code == 503
+        assert server.counts["errors"] == 1
+
+    def test_injects_malformed_json(self) -> None:
+        with FakeLLMServer(FakeLLMSettings(malformed_rate=1.0)) as server:
+            response = httpx.post(f"{server.url}/api/generate", json={"prompt": "x"})
+
+        assert response.json()["response"] == MALFORMED_RESPONSE
+        assert server.counts["malformed"] == 1
+
+    def test_applies_latency(self) -> None:
+        with FakeLLMServer(FakeLLMSettings(latency_ms=50)) as server:
+            response = httpx.post(f"{server.url}/api/generate", json={"prompt": "x"})
+
+        assert response.elapsed.total_seconds() >= 0.05
+
+    def test_unknown_path_returns_404(self) -> None:
+        with FakeLLMServer() as server:
+            response = httpx.get(f"{server.url}/unknown")
+
+        assert response.status_code == 404
@@ -0,0 +1,73 @@
+"""pytest-benchmark suite for the pipeline stages.
+
+Skipped by default; run with:
+    uv run pytest -m benchmark tests/bench/test_pipeline_benchmarks.py
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from genglossary.bench.fake_llm_server import FakeLLMServer, FakeLLMSettings  # noqa: E402
+from genglossary.bench.runner import create_bench_client  # noqa: E402
+from genglossary.bench.synthetic_corpus import generate_corpus  # noqa: E402
+from genglossary.glossary_generator import GlossaryGenerator  # noqa: E402
+from genglossary.glossary_refiner import GlossaryRefiner  # noqa: E402
+from genglossary.glossary_reviewer import GlossaryReviewer  # noqa: E402
+from genglossary.term_extractor import TermExtractor  # noqa: E402
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = ["small", "medium"]
+
+
+@pytest.fixture(scope="module", params=["ollama", "openai"])
+def llm_client(request):
+    """LLM client talking to a fake server with a small, jittery latency."""
+    with FakeLLMServer(FakeLLMSettings(latency_ms=5, jitter_ms=2)) as server:
+        client = create_bench_client(request.param, server.url)
+        yield client
+        client.close()
+
+
+@pytest.fixture(scope="module", params=SIZES)
+def corpus(request):
+    return generate_corpus(request.param)
+
+
+@pytest.fixture(scope="module")
+def pipeline_inputs(llm_client, corpus):
+    """Outputs of each stage, used as the inputs of the next."""
+    terms = TermExtractor(llm_client=llm_client).extract_terms(
+        corpus, return_categories=True
+    )
+    provisional = GlossaryGenerator(llm_client=llm_client).generate(terms, corpus)
+    issues = GlossaryReviewer(llm_client=llm_client).review(provisional) or []
+    return terms, provisional, issues
+
+
+def test_extract(benchmark, llm_client, corpus) -> None:
+    extractor = TermExtractor(llm_client=llm_client)
+    terms = benchmark(extractor.extract_terms, corpus, return_categories=True)
+    assert terms
+
+
+def test_generate(benchmark, llm_client, corpus, pipeline_inputs) -> None:
+    terms, _, _ = pipeline_inputs
+    generator = GlossaryGenerator(llm_client=llm_client)
+    glossary = benchmark(generator.generate, terms, corpus)
+    assert glossary.term_count > 0
+
+
+def test_review(benchmark, llm_client, pipeline_inputs) -> None:
+    _, provisional, _ = pipeline_inputs
+    reviewer = GlossaryReviewer(llm_client=llm_client, max_concurrency=4)
+    issues = benchmark(reviewer.review, provisional)
+    assert issues is not None
+
+
+def test_refine(benchmark, llm_client, corpus, pipeline_inputs) -> None:
+    _, provisional, issues = pipeline_inputs
+    refiner = GlossaryRefiner(llm_client=llm_client, max_concurrency=4)
+    refined = benchmark(refiner.refine, provisional, issues, corpus)
+    assert refined.term_count > 0
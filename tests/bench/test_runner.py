@@ -0,0 +1,115 @@
+"""Tests for the benchmark runner."""
+
+from pathlib import Path
+
+import pytest
+
+from genglossary.bench.fake_llm_server import FakeLLMSettings
+from genglossary.bench.runner import (
+    STAGES,
+    BenchmarkResult,
+    StageMetrics,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmarks,
+    write_baseline,
+)
+
+
+def _metrics(stage: str = "generate", **overrides) -> StageMetrics:
+    values = dict(
+        stage=stage,
+        items=10,
+        wall_seconds=1.0,
+        cpu_seconds=0.5,
+        peak_rss_mb=100.0,
+        llm_calls=10,
+        llm_failures=0,
+        latency_p50_ms=20.0,
+        latency_p95_ms=40.0,
+    )
+    values.update(overrides)
+    return StageMetrics(**values)
+
+
+def _result(**overrides) -> BenchmarkResult:
+    return BenchmarkResult(
+        size="small", documents=1, characters=100, stages=[_metrics(**overrides)]
+    )
+
+
+class TestRunBenchmarks:
+    """Tests for run_benchmarks against the fake server."""
+
+    @pytest.mark.parametrize("provider", ["ollama", "openai"])
+    def test_measures_every_stage(self, provider: str) -> None:
+        results = run_benchmarks(
+            ["small"], FakeLLMSettings(), provider=provider, max_concurrency=2
+        )
+
+        assert len(results) == 1
+        stages = results[0].stages
+        assert [m.stage for m in stages] == list(STAGES)
+        for metrics in stages:
+            assert metrics.items > 0
+            assert metrics.llm_calls > 0
+            assert metrics.llm_failures == 0
+            assert metrics.latency_p50_ms is not None
+            assert metrics.latency_p95_ms >= metrics.latency_p50_ms
+            assert metrics.cpu_seconds >= 0
+
+    def test_recovers_from_malformed_json(self) -> None:
+        results = run_benchmarks(
+            ["small"], FakeLLMSettings(malformed_rate=0.05, seed=3)
+        )
+
+        assert all(m.items > 0 for m in results[0].stages)
+
+
+class TestBaseline:
+    """Tests for baseline files and regression comparison."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "out" / "baseline.json"
+
+        write_baseline(path, [_result()], parameters={"provider": "ollama"})
+        data = load_baseline(path)
+
+        assert data["parameters"] == {"provider": "ollama"}
+        stage = data["results"]["small"]["stages"]["generate"]
+        assert stage["throughput"] == 10.0
+        assert stage["latency_p95_ms"] == 40.0
+
+    def test_rejects_unknown_version(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        path.write_text('{"version": 99}', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Unsupported baseline file"):
+            load_baseline(path)
+
+    def test_no_regression_within_tolerance(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        write_baseline(path, [_result()], parameters={})
+
+        current = [_result(wall_seconds=1.1, latency_p95_ms=45.0)]
+
+        assert compare_to_baseline(current, load_baseline(path), tolerance=0.2) == []
+
+    def test_detects_regressions(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        write_baseline(path, [_result()], parameters={})
+
+        current = [_result(wall_seconds=2.0, latency_p95_ms=80.0, cpu_seconds=1.0)]
+        regressions = compare_to_baseline(current, load_baseline(path), tolerance=0.2)
+
+        assert len(regressions) == 3
+        assert regressions[0].startswith("small/generate: throughput")
+
+    def test_skips_sizes_missing_from_baseline(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        write_baseline(path, [_result()], parameters={})
+        current = [
+            BenchmarkResult(size="large", documents=1, characters=1, stages=[_metrics()])
+        ]
+
+        assert compare_to_baseline(current, load_baseline(path)) == []
@@ -0,0 +1,40 @@
+"""Tests for synthetic corpus generation."""
+
+import pytest
+
+from genglossary.bench.synthetic_corpus import CORPUS_SIZES, generate_corpus
+from genglossary.morphological_analyzer import MorphologicalAnalyzer
+
+
+class TestGenerateCorpus:
+    """Tests for generate_corpus."""
+
+    def test_same_seed_same_corpus(self) -> None:
+        assert generate_corpus("small", seed=1) == generate_corpus("small", seed=1)
+
+    def test_different_seed_different_corpus(self) -> None:
+        assert generate_corpus("small", seed=1) != generate_corpus("small", seed=2)
+
+    def test_sizes_grow(self) -> None:
+        lengths = [
+            sum(len(d.content) for d in generate_corpus(size)) for size in CORPUS_SIZES
+        ]
+
+        assert lengths == sorted(lengths)
+        assert len(generate_corpus("medium")) == CORPUS_SIZES["medium"].documents
+
+    def test_unknown_size_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown corpus size"):
+            generate_corpus("huge")
+
+    def test_yields_term_candidates(self) -> None:
+        documents = generate_corpus("small")
+
+        candidates = MorphologicalAnalyzer().extract_proper_nouns(
+            documents[0].content,
+            extract_compound_nouns=True,
+            include_common_nouns=True,
+            min_length=2,
+        )
+
+        assert any(c.endswith("騎士団") for c in candidates)
@@ -29,6 +29,30 @@ def isolate_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("GENGLOSSARY_REGISTRY_PATH", str(test_data_dir / "registry.db"))
 
 
+@pytest.fixture(autouse=True)
+def isolate_concurrency_limiters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test fresh adaptive concurrency limiters.
+
+    Limiters are shared per LLM server for the whole process, so limit
+    cuts and Retry-After pauses would otherwise leak between tests.
+    """
+    from genglossary.llm import concurrency
+
+    monkeypatch.setattr(concurrency, "_limiters", {})
+
+
+@pytest.fixture(autouse=True)
+def isolate_batchers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test fresh token-budget batchers.
+
+    Batchers are shared per model for the whole process, so a budget
+    halved by one test would otherwise shrink the batches of the next.
+    """
+    from genglossary.llm import batching
+
+    monkeypatch.setattr(batching, "_batchers", {})
+
+
 # --- Mock Response Models ---
 
 
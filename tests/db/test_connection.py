@@ -330,3 +330,32 @@ class TestImmediateTransaction:
 
         conn1.close()
         conn2.close()
+
+    def test_immediate_transaction_records_lock_metrics(
+        self, tmp_path: Path
+    ) -> None:
+        """書き込みロック待ち時間とbusyエラーがメトリクスに記録される"""
+        from genglossary.metrics import REGISTRY
+
+        def sample(name: str) -> float:
+            return REGISTRY.get_sample_value(name) or 0
+
+        db_path = str(tmp_path / "lock_metrics.db")
+        conn1 = get_connection(db_path)
+        conn2 = get_connection(db_path)
+        conn2.execute("PRAGMA busy_timeout = 50")
+        waits = sample("genglossary_sqlite_lock_wait_seconds_count")
+        busy = sample("genglossary_sqlite_busy_errors_total")
+
+        with immediate_transaction(conn1):
+            with pytest.raises(sqlite3.OperationalError):
+                with immediate_transaction(conn2):
+                    pass  # pragma: no cover
+
+        assert sample("genglossary_sqlite_lock_wait_seconds_count") == waits + 2
+        assert sample("genglossary_sqlite_busy_errors_total") == busy + 1
+        # The blocked attempt waited for busy_timeout before failing
+        assert sample("genglossary_sqlite_lock_wait_seconds_sum") >= 0.04
+
+        conn1.close()
+        conn2.close()
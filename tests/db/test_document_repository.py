@@ -7,10 +7,18 @@ import pytest
 from genglossary.db.document_repository import (
     create_document,
     create_documents_batch,
+    delete_all_documents,
+    delete_documents_by_names,
     get_document,
     get_document_by_name,
+    get_documents_fingerprint,
+    has_document_manifest,
+    insert_document,
     list_all_documents,
+    list_document_manifest,
+    list_document_metadata,
     list_documents_by_ids,
+    upsert_document_file,
 )
 from genglossary.db.schema import initialize_db
 
@@ -87,6 +95,36 @@ class TestCreateDocument:
             )
 
 
+class TestInsertDocument:
+    """Test insert_document function."""
+
+    def test_insert_document_returns_metadata_only(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that insert_document stores content but returns metadata."""
+        row = insert_document(
+            db_with_schema,
+            file_name="doc.txt",
+            content="Hello World",
+            content_hash="abc123",
+        )
+
+        assert row.keys() == ["id", "file_name", "content_hash"]
+        assert row["file_name"] == "doc.txt"
+        stored = get_document(db_with_schema, row["id"])
+        assert stored is not None
+        assert stored["content"] == "Hello World"
+
+    def test_insert_document_unique_constraint(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that file_name must be unique."""
+        insert_document(db_with_schema, "doc.txt", "Content 1", "abc123")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_document(db_with_schema, "doc.txt", "Content 2", "def456")
+
+
 class TestGetDocument:
     """Test get_document function."""
 
@@ -175,6 +213,90 @@ class TestListAllDocuments:
         assert docs[0]["id"] < docs[1]["id"]
 
 
+class TestListDocumentMetadata:
+    """Test list_document_metadata function."""
+
+    def test_list_document_metadata_excludes_content(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that only metadata columns are returned."""
+        create_document(db_with_schema, "doc1.txt", "Content 1", "abc123")
+
+        docs = list_document_metadata(db_with_schema)
+
+        assert len(docs) == 1
+        assert set(docs[0].keys()) == {"id", "file_name", "content_hash"}
+        assert docs[0]["file_name"] == "doc1.txt"
+
+    def test_list_document_metadata_uses_covering_index(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that the query plan never reads the documents table rows."""
+        cursor = db_with_schema.execute(
+            "EXPLAIN QUERY PLAN SELECT id, file_name, content_hash"
+            " FROM documents WHERE id > 0 ORDER BY id LIMIT 10"
+        )
+        plan = " ".join(row[3] for row in cursor.fetchall())
+
+        assert "COVERING INDEX idx_documents_metadata" in plan
+
+    def test_list_document_metadata_keyset_pagination(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that after_id and limit page through documents in id order."""
+        ids = [
+            create_document(db_with_schema, f"doc{i}.txt", "C", f"h{i}")["id"]
+            for i in range(5)
+        ]
+
+        first = list_document_metadata(db_with_schema, limit=2)
+        second = list_document_metadata(
+            db_with_schema, after_id=first[-1]["id"], limit=2
+        )
+        rest = list_document_metadata(db_with_schema, after_id=second[-1]["id"])
+
+        assert [r["id"] for r in first + second + rest] == ids
+
+
+class TestGetDocumentsFingerprint:
+    """Test get_documents_fingerprint function."""
+
+    def test_fingerprint_is_stable_without_changes(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that the fingerprint does not change if the table is unchanged."""
+        create_document(db_with_schema, "doc1.txt", "Content 1", "abc123")
+
+        assert get_documents_fingerprint(db_with_schema) == get_documents_fingerprint(
+            db_with_schema
+        )
+
+    def test_fingerprint_changes_on_content_hash_change(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that replacing a document's content changes the fingerprint."""
+        doc = create_document(db_with_schema, "doc1.txt", "Content 1", "abc123")
+        before = get_documents_fingerprint(db_with_schema)
+
+        db_with_schema.execute(
+            "UPDATE documents SET content_hash = ? WHERE id = ?", ("zzz", doc["id"])
+        )
+
+        assert get_documents_fingerprint(db_with_schema) != before
+
+    def test_fingerprint_changes_on_delete(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that deleting a document changes the fingerprint."""
+        create_document(db_with_schema, "doc1.txt", "Content 1", "abc123")
+        doc2 = create_document(db_with_schema, "doc2.txt", "Content 2", "def456")
+        before = get_documents_fingerprint(db_with_schema)
+
+        db_with_schema.execute("DELETE FROM documents WHERE id = ?", (doc2["id"],))
+
+        assert get_documents_fingerprint(db_with_schema) != before
+
+
 class TestGetDocumentByName:
     """Test get_document_by_name function."""
 
@@ -319,3 +441,63 @@ class TestCreateDocumentsBatch:
 
         with pytest.raises(sql.IntegrityError):
             create_documents_batch(db_with_schema, documents)
+
+
+class TestDocumentManifest:
+    """Test manifest functions used by incremental filesystem loads."""
+
+    def test_upsert_creates_document_and_manifest(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test upsert_document_file inserts a document with its manifest."""
+        upsert_document_file(db_with_schema, "a.md", "alpha", "h1", 5, 100)
+
+        manifest = list_document_manifest(db_with_schema)
+        assert [tuple(row) for row in manifest] == [("a.md", "h1", 5, 100)]
+        assert get_document_by_name(db_with_schema, "a.md")["content"] == "alpha"
+        assert has_document_manifest(db_with_schema)
+
+    def test_upsert_keeps_id_and_rewrites_changed_content(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test upsert_document_file updates in place by file_name."""
+        upsert_document_file(db_with_schema, "a.md", "alpha", "h1", 5, 100)
+        doc_id = get_document_by_name(db_with_schema, "a.md")["id"]
+
+        upsert_document_file(db_with_schema, "a.md", "alpha2", "h2", 6, 200)
+
+        row = get_document_by_name(db_with_schema, "a.md")
+        assert row["id"] == doc_id
+        assert row["content"] == "alpha2"
+        assert tuple(list_document_manifest(db_with_schema)[0]) == ("a.md", "h2", 6, 200)
+
+    def test_gui_documents_have_no_manifest(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test documents created through the API are not in the manifest."""
+        create_document(db_with_schema, "gui.md", "content", "hash")
+
+        assert list_document_manifest(db_with_schema) == []
+        assert not has_document_manifest(db_with_schema)
+
+    def test_delete_documents_by_names(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test delete_documents_by_names removes documents and manifest rows."""
+        upsert_document_file(db_with_schema, "a.md", "a", "ha", 1, 1)
+        upsert_document_file(db_with_schema, "b.md", "b", "hb", 1, 1)
+
+        delete_documents_by_names(db_with_schema, ["a.md"])
+
+        assert [row["file_name"] for row in list_all_documents(db_with_schema)] == ["b.md"]
+        assert [row["file_name"] for row in list_document_manifest(db_with_schema)] == ["b.md"]
+
+    def test_delete_all_documents_clears_manifest(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test delete_all_documents also clears the manifest."""
+        upsert_document_file(db_with_schema, "a.md", "a", "ha", 1, 1)
+
+        delete_all_documents(db_with_schema)
+
+        assert not has_document_manifest(db_with_schema)
@@ -0,0 +1,57 @@
+"""Tests for the auto-extract queue."""
+
+import sqlite3
+
+import pytest
+
+from genglossary.db.connection import transaction
+from genglossary.db.document_repository import create_document, delete_document
+from genglossary.db.pending_extract_repository import (
+    add_pending_extract_documents,
+    list_pending_extract_documents,
+    remove_pending_extract_documents,
+)
+from genglossary.db.schema import initialize_db
+
+
+@pytest.fixture
+def db_with_documents(in_memory_db: sqlite3.Connection) -> sqlite3.Connection:
+    initialize_db(in_memory_db)
+    with transaction(in_memory_db):
+        for i in range(3):
+            create_document(in_memory_db, f"doc{i}.md", f"本文{i}", f"hash{i}")
+    return in_memory_db
+
+
+class TestPendingExtractDocuments:
+    """Tests for pending_extract_documents."""
+
+    def test_add_and_list(self, db_with_documents: sqlite3.Connection) -> None:
+        with transaction(db_with_documents):
+            add_pending_extract_documents(db_with_documents, [2, 1])
+            add_pending_extract_documents(db_with_documents, [3])
+
+        assert list_pending_extract_documents(db_with_documents) == [1, 2, 3]
+
+    def test_add_ignores_already_queued(self, db_with_documents: sqlite3.Connection) -> None:
+        with transaction(db_with_documents):
+            add_pending_extract_documents(db_with_documents, [1, 2])
+            add_pending_extract_documents(db_with_documents, [2])
+
+        assert list_pending_extract_documents(db_with_documents) == [1, 2]
+
+    def test_remove_only_given_documents(self, db_with_documents: sqlite3.Connection) -> None:
+        with transaction(db_with_documents):
+            add_pending_extract_documents(db_with_documents, [1, 2, 3])
+        with transaction(db_with_documents):
+            remove_pending_extract_documents(db_with_documents, [1, 3])
+
+        assert list_pending_extract_documents(db_with_documents) == [2]
+
+    def test_deleted_document_leaves_queue(self, db_with_documents: sqlite3.Connection) -> None:
+        with transaction(db_with_documents):
+            add_pending_extract_documents(db_with_documents, [1, 2])
+        with transaction(db_with_documents):
+            delete_document(db_with_documents, 1)
+
+        assert list_pending_extract_documents(db_with_documents) == [2]
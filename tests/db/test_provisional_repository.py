@@ -73,7 +73,15 @@ class TestCreateProvisionalTerm:
         assert row["term_name"] == "量子コンピュータ"
         assert row["definition"] == "量子力学の原理を利用したコンピュータ"
         assert row["confidence"] == 0.95
-        assert row["occurrences"] is not None
+
+        cursor.execute(
+            "SELECT document_path, line_number, context"
+            " FROM glossary_provisional_occurrences WHERE term_id = ?",
+            (term_id,),
+        )
+        assert [tuple(r) for r in cursor.fetchall()] == [
+            ("/path/to/doc.txt", 1, "Context")
+        ]
 
     def test_create_provisional_term_unique_constraint(
         self, db_with_schema: sqlite3.Connection
@@ -187,6 +195,47 @@ class TestListAllProvisional:
         assert len(terms) == 2
         assert all(isinstance(term["occurrences"][0], TermOccurrence) for term in terms)
 
+    def test_list_all_provisional_preserves_occurrence_order(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that occurrences come back in insertion order per term."""
+        occurrences = [
+            TermOccurrence(document_path="b.txt", line_number=5, context="後"),
+            TermOccurrence(document_path="a.txt", line_number=1, context="前"),
+        ]
+        create_provisional_terms_batch(
+            db_with_schema,
+            [
+                ("量子コンピュータ", "定義1", 0.95, occurrences),
+                ("量子ビット", "定義2", 0.90, []),
+            ],
+        )
+
+        terms = list_all_provisional(db_with_schema)
+
+        assert terms[0]["occurrences"] == occurrences
+        assert terms[1]["occurrences"] == []
+
+    def test_list_all_provisional_without_occurrences(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that include_occurrences=False returns empty occurrence lists."""
+        create_provisional_term(
+            db_with_schema,
+            term_name="量子コンピュータ",
+            definition="定義1",
+            confidence=0.95,
+            occurrences=[
+                TermOccurrence(document_path="doc.txt", line_number=1, context="C")
+            ],
+        )
+
+        terms = list_all_provisional(db_with_schema, include_occurrences=False)
+
+        assert len(terms) == 1
+        assert terms[0]["term_name"] == "量子コンピュータ"
+        assert terms[0]["occurrences"] == []
+
 
 class TestUpdateProvisionalTerm:
     """Test update_provisional_term function."""
@@ -9,6 +9,7 @@ from genglossary.db.refined_repository import (
     create_refined_terms_batch,
     delete_all_refined,
     get_refined_term,
+    iter_refined,
     list_all_refined,
     update_refined_term,
 )
@@ -73,7 +74,15 @@ class TestCreateRefinedTerm:
         assert row["term_name"] == "量子コンピュータ"
         assert row["definition"] == "量子力学の原理を利用したコンピュータ"
         assert row["confidence"] == 0.98
-        assert row["occurrences"] is not None
+
+        cursor.execute(
+            "SELECT document_path, line_number, context"
+            " FROM glossary_refined_occurrences WHERE term_id = ?",
+            (term_id,),
+        )
+        assert [tuple(r) for r in cursor.fetchall()] == [
+            ("/path/to/doc.txt", 1, "Context")
+        ]
 
     def test_create_refined_term_unique_constraint(
         self, db_with_schema: sqlite3.Connection
@@ -188,6 +197,36 @@ class TestListAllRefined:
         assert all(isinstance(term["occurrences"][0], TermOccurrence) for term in terms)
 
 
+class TestIterRefined:
+    """Test iter_refined function."""
+
+    def test_iter_refined_matches_list_all_refined(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        """Test that iter_refined yields the same rows as list_all_refined."""
+        occ = TermOccurrence(document_path="doc.txt", line_number=1, context="c")
+        create_refined_terms_batch(
+            db_with_schema,
+            [("A", "a", 0.9, [occ, occ]), ("B", "b", 0.8, []), ("C", "c", 0.7, [occ])],
+        )
+
+        assert list(iter_refined(db_with_schema)) == list_all_refined(db_with_schema)
+
+    def test_iter_refined_is_lazy(self, db_with_schema: sqlite3.Connection) -> None:
+        """Test that iter_refined yields terms before reading the whole table."""
+        create_refined_terms_batch(
+            db_with_schema, [(f"term{i}", "d", 0.5, []) for i in range(3)]
+        )
+
+        terms = iter_refined(db_with_schema)
+
+        assert next(terms)["term_name"] == "term0"
+
+    def test_iter_refined_empty(self, db_with_schema: sqlite3.Connection) -> None:
+        """Test that iter_refined yields nothing for an empty table."""
+        assert list(iter_refined(db_with_schema)) == []
+
+
 class TestUpdateRefinedTerm:
     """Test update_refined_term function."""
 
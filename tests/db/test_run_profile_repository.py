@@ -0,0 +1,104 @@
+"""Tests for run_profile_repository module."""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from genglossary.db.connection import get_connection
+from genglossary.db.run_profile_repository import get_run_profile, save_run_profile
+from genglossary.db.runs_repository import create_run
+from genglossary.db.schema import initialize_db
+from genglossary.runs.profile import RunProfile
+
+
+@pytest.fixture
+def project_db(tmp_path: Path) -> Iterator[sqlite3.Connection]:
+    connection = get_connection(str(tmp_path / "project.db"))
+    initialize_db(connection)
+    yield connection
+    connection.close()
+
+
+def _profile(**overrides) -> RunProfile:
+    values = dict(
+        wall_seconds=12.5,
+        step_seconds={"generate": 8.0, "review": 3.0, "refine": 1.5},
+        llm_calls=40,
+        llm_failures=1,
+        llm_retries=3,
+        llm_retry_reasons={"rate_limited": 2, "server_error": 1},
+        json_parse_failures=2,
+        prompt_chars=12000,
+        response_chars=4000,
+        llm_latency_mean_ms=250.0,
+        llm_latency_p95_ms=600.0,
+        db_write_seconds=0.2,
+    )
+    values.update(overrides)
+    return RunProfile(**values)
+
+
+def _save(conn: sqlite3.Connection, run_id: int, profile: RunProfile) -> None:
+    save_run_profile(
+        conn,
+        run_id,
+        profile,
+        llm_provider="ollama",
+        llm_model="llama3.2",
+        llm_concurrency=4,
+        streaming=True,
+    )
+
+
+class TestRunProfileRepository:
+    """Tests for save_run_profile and get_run_profile."""
+
+    def test_round_trip(self, project_db: sqlite3.Connection) -> None:
+        """保存したプロファイルをステップ順に取得できる"""
+        run_id = create_run(project_db, scope="full")
+
+        _save(project_db, run_id, _profile())
+        profile = get_run_profile(project_db, run_id)
+
+        assert profile is not None
+        assert profile["llm_provider"] == "ollama"
+        assert profile["llm_model"] == "llama3.2"
+        assert profile["llm_concurrency"] == 4
+        assert profile["streaming"] is True
+        assert profile["wall_seconds"] == 12.5
+        assert [s["step"] for s in profile["steps"]] == ["generate", "review", "refine"]
+        assert profile["llm_calls"] == 40
+        assert profile["json_parse_failures"] == 2
+        assert profile["llm_retries"] == 3
+        assert profile["llm_retry_reasons"] == {"rate_limited": 2, "server_error": 1}
+        assert profile["llm_latency_p95_ms"] == 600.0
+        assert profile["created_at"]
+
+    def test_missing_profile_returns_none(self, project_db: sqlite3.Connection) -> None:
+        """プロファイルのないRunはNoneを返す"""
+        run_id = create_run(project_db, scope="full")
+
+        assert get_run_profile(project_db, run_id) is None
+
+    def test_save_replaces_existing_profile(self, project_db: sqlite3.Connection) -> None:
+        """再保存するとステップも含めて置き換わる"""
+        run_id = create_run(project_db, scope="extract")
+        _save(project_db, run_id, _profile())
+
+        _save(
+            project_db,
+            run_id,
+            _profile(
+                step_seconds={"extract": 1.0},
+                llm_retry_reasons={"invalid_json": 3},
+                llm_latency_mean_ms=None,
+            ),
+        )
+        profile = get_run_profile(project_db, run_id)
+
+        assert profile is not None
+        assert profile["steps"] == [{"step": "extract", "wall_seconds": 1.0}]
+        assert profile["llm_retry_reasons"] == {"invalid_json": 3}
+        assert profile["llm_latency_mean_ms"] is None
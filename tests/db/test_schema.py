@@ -1,10 +1,17 @@
 """Tests for database schema initialization and migration."""
 
+import logging
 import sqlite3
 
 import pytest
 
-from genglossary.db.schema import get_schema_version, initialize_db
+from genglossary.db.schema import (
+    FTS_TABLES,
+    SCHEMA_VERSION,
+    fts_available,
+    get_schema_version,
+    initialize_db,
+)
 
 
 class TestSchemaInitialization:
@@ -19,23 +26,36 @@ class TestSchemaInitialization:
             """
             SELECT name FROM sqlite_master
             WHERE type='table' AND name NOT LIKE 'sqlite_%'
+              AND name NOT LIKE '%\\_fts\\_%' ESCAPE '\\'  -- FTS5 shadow tables
             ORDER BY name
             """
         )
         tables = [row[0] for row in cursor.fetchall()]
 
         expected_tables = [
+            "document_manifest",
             "documents",
+            "documents_fts",
             "glossary_issues",
             "glossary_provisional",
+            "glossary_provisional_fts",
+            "glossary_provisional_occurrences",
             "glossary_refined",
+            "glossary_refined_fts",
+            "glossary_refined_occurrences",
             "metadata",
+            "pending_extract_documents",
+            "run_profile_retries",
+            "run_profile_steps",
+            "run_profiles",
             "runs",
             "schema_version",
+            "table_versions",
             "term_synonym_groups",
             "term_synonym_members",
             "terms_excluded",
             "terms_extracted",
+            "terms_extracted_fts",
             "terms_required",
         ]
         assert tables == expected_tables
@@ -45,7 +65,7 @@ class TestSchemaInitialization:
         initialize_db(in_memory_db)
 
         version = get_schema_version(in_memory_db)
-        assert version == 9  # v9: glossary_issues exclude columns added
+        assert version == 18  # v18: run profile retry reasons
 
     def test_initialize_db_is_idempotent(self, in_memory_db: sqlite3.Connection) -> None:
         """Test that initialize_db can be called multiple times safely."""
@@ -57,23 +77,36 @@ class TestSchemaInitialization:
             """
             SELECT name FROM sqlite_master
             WHERE type='table' AND name NOT LIKE 'sqlite_%'
+              AND name NOT LIKE '%\\_fts\\_%' ESCAPE '\\'  -- FTS5 shadow tables
             ORDER BY name
             """
         )
         tables = [row[0] for row in cursor.fetchall()]
 
         expected_tables = [
+            "document_manifest",
             "documents",
+            "documents_fts",
             "glossary_issues",
             "glossary_provisional",
+            "glossary_provisional_fts",
+            "glossary_provisional_occurrences",
             "glossary_refined",
+            "glossary_refined_fts",
+            "glossary_refined_occurrences",
             "metadata",
+            "pending_extract_documents",
+            "run_profile_retries",
+            "run_profile_steps",
+            "run_profiles",
             "runs",
             "schema_version",
+            "table_versions",
             "term_synonym_groups",
             "term_synonym_members",
             "terms_excluded",
             "terms_extracted",
+            "terms_extracted_fts",
             "terms_required",
         ]
         assert tables == expected_tables
@@ -315,45 +348,32 @@ class TestGlossaryProvisionalTable:
         assert "term_name" in columns
         assert "definition" in columns
         assert "confidence" in columns
-        assert "occurrences" in columns
+        assert "occurrences" not in columns  # v10: moved to child table
         assert "created_at" in columns
         assert "run_id" not in columns  # v2: run_id should be removed
 
-    def test_glossary_provisional_stores_json_occurrences(
+    def test_glossary_provisional_occurrences_table_has_required_columns(
         self, in_memory_db: sqlite3.Connection
     ) -> None:
-        """Test that occurrences can be stored as JSON."""
+        """Test that the occurrence child table exists with required columns."""
         initialize_db(in_memory_db)
 
         cursor = in_memory_db.cursor()
+        cursor.execute("PRAGMA table_info(glossary_provisional_occurrences)")
+        columns = {row[1] for row in cursor.fetchall()}
 
-        # Insert provisional glossary entry
-        occurrences_json = '[{"line_number": 1, "context": "量子コンピュータは..."}]'
-        cursor.execute(
-            """
-            INSERT INTO glossary_provisional
-            (term_name, definition, confidence, occurrences)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                "量子コンピュータ",
-                "量子力学の原理を利用したコンピュータ",
-                0.95,
-                occurrences_json,
-            ),
-        )
-
-        cursor.execute(
-            "SELECT occurrences FROM glossary_provisional WHERE term_name = ?",
-            ("量子コンピュータ",),
-        )
-        stored_json = cursor.fetchone()[0]
-        assert stored_json == occurrences_json
+        assert columns == {
+            "term_id",
+            "position",
+            "document_path",
+            "line_number",
+            "context",
+        }
 
-    def test_glossary_provisional_default_occurrences(
+    def test_glossary_provisional_occurrences_cascade_on_delete(
         self, in_memory_db: sqlite3.Connection
     ) -> None:
-        """Test that occurrences has default value '[]' in v2."""
+        """Test that deleting a term removes its occurrences."""
         initialize_db(in_memory_db)
 
         cursor = in_memory_db.cursor()
@@ -364,10 +384,17 @@ class TestGlossaryProvisionalTable:
             """,
             ("量子コンピュータ", "量子力学の原理を利用したコンピュータ", 0.95),
         )
-        cursor.execute("SELECT occurrences FROM glossary_provisional WHERE id = 1")
-        occurrences = cursor.fetchone()[0]
+        cursor.execute(
+            """
+            INSERT INTO glossary_provisional_occurrences
+            (term_id, position, document_path, line_number, context)
+            VALUES (1, 0, 'doc.txt', 1, '量子コンピュータは...')
+            """
+        )
+        cursor.execute("DELETE FROM glossary_provisional WHERE id = 1")
+        cursor.execute("SELECT COUNT(*) FROM glossary_provisional_occurrences")
 
-        assert occurrences == "[]"
+        assert cursor.fetchone()[0] == 0
 
     def test_glossary_provisional_unique_constraint(
         self, in_memory_db: sqlite3.Connection
@@ -469,7 +496,7 @@ class TestGlossaryRefinedTable:
         assert "term_name" in columns
         assert "definition" in columns
         assert "confidence" in columns
-        assert "occurrences" in columns
+        assert "occurrences" not in columns  # v10: moved to child table
         assert "created_at" in columns
         assert "run_id" not in columns  # v2: run_id should be removed
 
@@ -482,19 +509,13 @@ class TestGlossaryRefinedTable:
         cursor = in_memory_db.cursor()
 
         # Insert first refined entry
-        occurrences_json = '[{"line_number": 1, "context": "量子コンピュータは..."}]'
         cursor.execute(
             """
             INSERT INTO glossary_refined
-            (term_name, definition, confidence, occurrences)
-            VALUES (?, ?, ?, ?)
+            (term_name, definition, confidence)
+            VALUES (?, ?, ?)
             """,
-            (
-                "量子コンピュータ",
-                "量子力学の原理を利用したコンピュータ",
-                0.95,
-                occurrences_json,
-            ),
+            ("量子コンピュータ", "量子力学の原理を利用したコンピュータ", 0.95),
         )
 
         # Try to insert duplicate
@@ -502,35 +523,23 @@ class TestGlossaryRefinedTable:
             cursor.execute(
                 """
                 INSERT INTO glossary_refined
-                (term_name, definition, confidence, occurrences)
-                VALUES (?, ?, ?, ?)
+                (term_name, definition, confidence)
+                VALUES (?, ?, ?)
                 """,
-                (
-                    "量子コンピュータ",
-                    "別の定義",
-                    0.90,
-                    occurrences_json,
-                ),
+                ("量子コンピュータ", "別の定義", 0.90),
             )
 
-    def test_glossary_refined_default_occurrences(
+    def test_glossary_refined_occurrences_table_exists(
         self, in_memory_db: sqlite3.Connection
     ) -> None:
-        """Test that occurrences has default value '[]' in v2."""
+        """Test that the refined occurrence child table exists."""
         initialize_db(in_memory_db)
 
         cursor = in_memory_db.cursor()
-        cursor.execute(
-            """
-            INSERT INTO glossary_refined (term_name, definition, confidence)
-            VALUES (?, ?, ?)
-            """,
-            ("量子コンピュータ", "量子力学の原理を利用したコンピュータ", 0.95),
-        )
-        cursor.execute("SELECT occurrences FROM glossary_refined WHERE id = 1")
-        occurrences = cursor.fetchone()[0]
+        cursor.execute("PRAGMA table_info(glossary_refined_occurrences)")
+        columns = {row[1] for row in cursor.fetchall()}
 
-        assert occurrences == "[]"
+        assert {"term_id", "position", "document_path", "line_number", "context"} <= columns
 
     def test_glossary_refined_default_created_at(
         self, in_memory_db: sqlite3.Connection
@@ -549,6 +558,53 @@ class TestGlossaryRefinedTable:
         assert created_at is not None
 
 
+class TestMigrateDocumentsV3:
+    """Test migrating a v3 database to the current schema."""
+
+    def test_migrate_v3_documents_table(self, in_memory_db: sqlite3.Connection) -> None:
+        """Test that a v3 documents table (file_path) migrates with its indexes."""
+        in_memory_db.executescript(
+            """
+            CREATE TABLE schema_version (
+                version INTEGER PRIMARY KEY,
+                applied_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            INSERT INTO schema_version (version) VALUES (3);
+            CREATE TABLE documents (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            INSERT INTO documents (file_path, content_hash)
+                VALUES ('intro.md', 'h1');
+            """
+        )
+
+        initialize_db(in_memory_db)
+
+        cursor = in_memory_db.cursor()
+        cursor.execute("SELECT id, file_name, content, content_hash FROM documents")
+        assert [tuple(row) for row in cursor.fetchall()] == [(1, "intro.md", "", "h1")]
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = ?",
+            ("idx_documents_metadata",),
+        )
+        assert cursor.fetchone() is not None
+        assert get_schema_version(in_memory_db) == SCHEMA_VERSION
+
+        # Triggers of the recreated table keep the index in sync
+        in_memory_db.execute(
+            "INSERT INTO documents (file_name, content, content_hash) VALUES (?, ?, ?)",
+            ("new.md", "量子コンピュータ", "h2"),
+        )
+        cursor.execute(
+            "SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?",
+            ('"コンピュータ"',),
+        )
+        assert [row[0] for row in cursor.fetchall()] == [2]
+
+
 class TestMigrateTermsUserNotesV7:
     """Test v7 migration: add user_notes column to terms_extracted."""
 
@@ -589,3 +645,173 @@ class TestMigrateTermsUserNotesV7:
         cursor.execute("SELECT user_notes FROM terms_extracted WHERE term_text = ?", ("量子コンピュータ",))
         user_notes = cursor.fetchone()[0]
         assert user_notes == ""
+
+
+class TestMigrateGlossaryOccurrencesV10:
+    """Test v10 migration: move JSON occurrences into child tables."""
+
+    def test_migrate_moves_json_occurrences_to_child_table(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that existing JSON occurrences are preserved in order."""
+        # Create v9 glossary_provisional (with JSON occurrences column)
+        in_memory_db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS glossary_provisional (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                term_name TEXT NOT NULL UNIQUE,
+                definition TEXT NOT NULL,
+                confidence REAL DEFAULT 0.0,
+                occurrences TEXT DEFAULT '[]',
+                created_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            """
+        )
+        occurrences_json = (
+            '[{"document_path": "a.md", "line_number": 3, "context": "一つ目"},'
+            ' {"document_path": "b.md", "line_number": 1, "context": "二つ目"}]'
+        )
+        in_memory_db.execute(
+            """
+            INSERT INTO glossary_provisional
+            (term_name, definition, confidence, occurrences)
+            VALUES (?, ?, ?, ?)
+            """,
+            ("量子コンピュータ", "定義", 0.9, occurrences_json),
+        )
+        in_memory_db.execute(
+            """
+            INSERT INTO glossary_provisional (term_name, definition, confidence)
+            VALUES (?, ?, ?)
+            """,
+            ("量子ビット", "定義", 0.8),
+        )
+        in_memory_db.commit()
+
+        initialize_db(in_memory_db)
+
+        cursor = in_memory_db.cursor()
+        cursor.execute("PRAGMA table_info(glossary_provisional)")
+        assert "occurrences" not in {row[1] for row in cursor.fetchall()}
+
+        cursor.execute(
+            """
+            SELECT term_id, position, document_path, line_number, context
+            FROM glossary_provisional_occurrences ORDER BY term_id, position
+            """
+        )
+        rows = [tuple(row) for row in cursor.fetchall()]
+        assert rows == [
+            (1, 0, "a.md", 3, "一つ目"),
+            (1, 1, "b.md", 1, "二つ目"),
+        ]
+
+
+class TestFullTextSearchTablesV12:
+    """Test v12 full-text search tables and sync triggers."""
+
+    @staticmethod
+    def _match(conn: sqlite3.Connection, fts_table: str, phrase: str) -> list[int]:
+        cursor = conn.execute(
+            f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ? ORDER BY rowid",
+            (f'"{phrase}"',),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def test_triggers_keep_documents_index_in_sync(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that insert, update and delete are reflected in the index."""
+        initialize_db(in_memory_db)
+        in_memory_db.execute(
+            "INSERT INTO documents (file_name, content, content_hash) VALUES (?, ?, ?)",
+            ("a.md", "量子コンピュータの研究", "h1"),
+        )
+        assert self._match(in_memory_db, "documents_fts", "コンピュータ") == [1]
+
+        in_memory_db.execute("UPDATE documents SET content = '古典計算機' WHERE id = 1")
+        assert self._match(in_memory_db, "documents_fts", "コンピュータ") == []
+        assert self._match(in_memory_db, "documents_fts", "計算機") == [1]
+
+        in_memory_db.execute("DELETE FROM documents WHERE id = 1")
+        assert self._match(in_memory_db, "documents_fts", "計算機") == []
+
+    def test_glossary_index_covers_term_and_definition(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that glossary FTS tables index both term name and definition."""
+        initialize_db(in_memory_db)
+        in_memory_db.execute(
+            "INSERT INTO glossary_refined (term_name, definition) VALUES (?, ?)",
+            ("量子ビット", "量子情報の最小単位"),
+        )
+
+        assert self._match(in_memory_db, "glossary_refined_fts", "量子ビット") == [1]
+        assert self._match(in_memory_db, "glossary_refined_fts", "最小単位") == [1]
+
+    def test_migration_indexes_existing_rows(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that upgrading a v11 database builds the index from existing rows."""
+        initialize_db(in_memory_db)
+        # Simulate a v11 database: no FTS tables or triggers
+        for fts_table in FTS_TABLES:
+            in_memory_db.execute(f"DROP TABLE {fts_table}")
+            for suffix in ("ai", "ad", "au"):
+                in_memory_db.execute(f"DROP TRIGGER {fts_table}_{suffix}")
+        in_memory_db.execute(
+            "INSERT INTO terms_extracted (term_text) VALUES (?)", ("アソリウス島",)
+        )
+        in_memory_db.commit()
+
+        initialize_db(in_memory_db)
+
+        assert self._match(in_memory_db, "terms_extracted_fts", "アソリウス") == [1]
+
+    def test_initialize_without_fts5_trigram_support(
+        self,
+        in_memory_db: sqlite3.Connection,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that SQLite builds without trigram FTS can still open databases."""
+        monkeypatch.setattr(
+            "genglossary.db.schema._build_fts_sql",
+            lambda fts_table, *args: (
+                f"CREATE VIRTUAL TABLE {fts_table} USING fts5(x, tokenize='missing');"
+            ),
+        )
+        monkeypatch.setattr("genglossary.db.schema._fts_unsupported_logged", False)
+
+        with caplog.at_level(logging.WARNING, logger="genglossary.db.schema"):
+            initialize_db(in_memory_db)
+            initialize_db(in_memory_db)
+
+        assert fts_available(in_memory_db) is False
+        assert get_schema_version(in_memory_db) == SCHEMA_VERSION
+        assert caplog.text.count("falls back to LIKE scans") == 1
+        in_memory_db.execute(
+            "INSERT INTO documents (file_name, content, content_hash) VALUES (?, ?, ?)",
+            ("a.md", "本文", "h1"),
+        )
+
+    def test_fts_available_after_initialize(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that a normal initialization creates every FTS table."""
+        initialize_db(in_memory_db)
+
+        assert fts_available(in_memory_db) is True
+
+    def test_reinitialize_skips_existing_indexes(
+        self, in_memory_db: sqlite3.Connection
+    ) -> None:
+        """Test that reopening a database does not rerun the FTS DDL."""
+        initialize_db(in_memory_db)
+        statements: list[str] = []
+        in_memory_db.set_trace_callback(statements.append)
+
+        initialize_db(in_memory_db)
+
+        in_memory_db.set_trace_callback(None)
+        assert not [s for s in statements if "_fts" in s and "CREATE" in s]
@@ -0,0 +1,191 @@
+"""Tests for search_repository module."""
+
+import sqlite3
+
+import pytest
+
+from genglossary.db.document_repository import create_document
+from genglossary.db.provisional_repository import create_provisional_term
+from genglossary.db.refined_repository import create_refined_term
+from genglossary.db.schema import fts_available, initialize_db
+from genglossary.db.search_repository import find_document_names, search
+from genglossary.db.term_repository import create_term
+
+
+def _add_corpus(in_memory_db: sqlite3.Connection) -> None:
+    create_document(
+        in_memory_db,
+        "knights.md",
+        "アソリウス島騎士団は魔神討伐の最前線で戦っている。\nEdelt Kingdom",
+        "h1",
+    )
+    create_document(in_memory_db, "island.md", "アソリウス島は辺境にある。", "h2")
+    create_term(in_memory_db, "アソリウス島騎士団")
+    create_provisional_term(in_memory_db, "騎士団", "島を守る騎士の集団", 0.5, [])
+    create_refined_term(in_memory_db, "魔神", "騎士団が討伐する存在", 0.8, [])
+
+
+@pytest.fixture
+def db_with_corpus(in_memory_db: sqlite3.Connection) -> sqlite3.Connection:
+    """Provide a database with documents and glossary rows.
+
+    Args:
+        in_memory_db: Base in-memory database fixture.
+
+    Returns:
+        sqlite3.Connection: Populated database.
+    """
+    initialize_db(in_memory_db)
+    _add_corpus(in_memory_db)
+    return in_memory_db
+
+
+@pytest.fixture
+def db_without_fts(
+    in_memory_db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+) -> sqlite3.Connection:
+    """Provide the corpus in a database initialized without FTS5 trigram support."""
+    monkeypatch.setattr(
+        "genglossary.db.schema._build_fts_sql",
+        lambda fts_table, *args: (
+            f"CREATE VIRTUAL TABLE {fts_table} USING fts5(x, tokenize='missing');"
+        ),
+    )
+    initialize_db(in_memory_db)
+    _add_corpus(in_memory_db)
+    return in_memory_db
+
+
+class TestSearch:
+    """Test search function."""
+
+    def test_search_returns_hits_from_all_sources(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that a Japanese query matches every source without segmentation."""
+        hits = search(db_with_corpus, "騎士団")
+
+        assert {(hit["source"], hit["title"]) for hit in hits} == {
+            ("documents", "knights.md"),
+            ("terms", "アソリウス島騎士団"),
+            ("provisional", "騎士団"),
+            ("refined", "魔神"),
+        }
+
+    def test_search_highlights_snippet(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that snippets mark the matched text."""
+        hits = search(db_with_corpus, "魔神討伐", sources=["documents"])
+
+        assert len(hits) == 1
+        assert "<mark>魔神討伐</mark>" in hits[0]["snippet"]
+
+    def test_search_requires_all_tokens(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that whitespace-separated tokens are combined with AND."""
+        hits = search(db_with_corpus, "アソリウス 辺境", sources=["documents"])
+
+        assert [hit["title"] for hit in hits] == ["island.md"]
+
+    def test_search_is_case_insensitive_for_ascii(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that ASCII queries ignore case."""
+        hits = search(db_with_corpus, "edelt", sources=["documents"])
+
+        assert [hit["title"] for hit in hits] == ["knights.md"]
+
+    def test_search_short_query_falls_back_to_scan(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that queries shorter than a trigram still match with snippets."""
+        hits = search(db_with_corpus, "辺境", sources=["documents"])
+
+        assert [hit["title"] for hit in hits] == ["island.md"]
+        assert "<mark>辺境</mark>" in hits[0]["snippet"]
+
+    def test_search_treats_query_syntax_literally(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that FTS5 operators and LIKE wildcards in input are not interpreted."""
+        assert search(db_with_corpus, 'OR "騎士', sources=["documents"]) == []
+        assert search(db_with_corpus, "%", sources=["documents"]) == []
+
+    def test_search_reflects_deleted_rows(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that deleted rows no longer match."""
+        db_with_corpus.execute("DELETE FROM documents WHERE file_name = 'knights.md'")
+
+        assert search(db_with_corpus, "騎士団", sources=["documents"]) == []
+
+    def test_search_limits_hits_per_source(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that limit applies to each source."""
+        hits = search(db_with_corpus, "アソリウス", sources=["documents"], limit=1)
+
+        assert len(hits) == 1
+
+    def test_search_empty_query_returns_nothing(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that a blank query returns no hits."""
+        assert search(db_with_corpus, "   ") == []
+
+    def test_search_rejects_unknown_source(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that an unknown source raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown search source"):
+            search(db_with_corpus, "騎士団", sources=["issues"])
+
+
+class TestFindDocumentNames:
+    """Test find_document_names function."""
+
+    def test_returns_documents_containing_any_term(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that documents matching any of the terms are returned."""
+        names = find_document_names(db_with_corpus, ["魔神討伐", "辺境"])
+
+        assert names == {"knights.md", "island.md"}
+
+    def test_ignores_file_name_matches(
+        self, db_with_corpus: sqlite3.Connection
+    ) -> None:
+        """Test that only document content is searched."""
+        assert find_document_names(db_with_corpus, ["knights"]) == set()
+
+
+class TestWithoutFts:
+    """Test the LIKE fallback for databases without FTS tables."""
+
+    def test_fts_is_unavailable(self, db_without_fts: sqlite3.Connection) -> None:
+        """Test that the failed FTS setup leaves no FTS tables behind."""
+        assert fts_available(db_without_fts) is False
+
+    def test_search_scans_content_tables(
+        self, db_without_fts: sqlite3.Connection
+    ) -> None:
+        """Test that long queries are answered by a scan instead of failing."""
+        hits = search(db_without_fts, "騎士団")
+
+        assert {(hit["source"], hit["title"]) for hit in hits} == {
+            ("documents", "knights.md"),
+            ("terms", "アソリウス島騎士団"),
+            ("provisional", "騎士団"),
+            ("refined", "魔神"),
+        }
+        assert all("<mark>" in hit["snippet"] for hit in hits)
+
+    def test_find_document_names_scans_documents(
+        self, db_without_fts: sqlite3.Connection
+    ) -> None:
+        """Test that context retrieval still finds candidate documents."""
+        names = find_document_names(db_without_fts, ["魔神討伐", "辺境"])
+
+        assert names == {"knights.md", "island.md"}
@@ -10,6 +10,7 @@ from genglossary.db.synonym_repository import (
     add_member,
     create_group,
     delete_group,
+    get_aliases_map,
     get_synonyms_for_term,
     list_groups,
     remove_member,
@@ -381,3 +382,18 @@ class TestGetSynonymsForTerm:
         synonyms = get_synonyms_for_term(db_with_schema, "田中")
 
         assert set(synonyms) == {"田中太郎", "田中部長"}
+
+
+class TestGetAliasesMap:
+    """Test get_aliases_map function."""
+
+    def test_maps_primary_to_other_members(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        create_group(db_with_schema, "田中太郎", ["田中太郎", "田中", "田中部長"])
+        create_group(db_with_schema, "サーバー", ["サーバー"])
+
+        assert get_aliases_map(db_with_schema) == {"田中太郎": ["田中", "田中部長"]}
+
+    def test_empty_when_no_groups(self, db_with_schema: sqlite3.Connection) -> None:
+        assert get_aliases_map(db_with_schema) == {}
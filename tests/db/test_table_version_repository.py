@@ -0,0 +1,107 @@
+"""Tests for table change counters."""
+
+import sqlite3
+
+import pytest
+
+from genglossary.db.connection import transaction
+from genglossary.db.runs_repository import create_run
+from genglossary.db.schema import VERSIONED_TABLES, initialize_db
+from genglossary.db.table_version_repository import get_table_versions
+from genglossary.db.term_repository import create_term, delete_term, update_term
+
+
+@pytest.fixture
+def db_with_schema(in_memory_db: sqlite3.Connection) -> sqlite3.Connection:
+    initialize_db(in_memory_db)
+    return in_memory_db
+
+
+def _version(conn: sqlite3.Connection, table: str = "terms_extracted") -> int:
+    return get_table_versions(conn, [table])[table]
+
+
+class TestTableVersions:
+    """Tests for the triggers that maintain table_versions."""
+
+    def test_every_versioned_table_has_a_counter(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        versions = get_table_versions(db_with_schema, VERSIONED_TABLES)
+
+        assert set(versions) == set(VERSIONED_TABLES)
+
+    def test_insert_update_delete_bump_counter(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        start = _version(db_with_schema)
+
+        with transaction(db_with_schema):
+            term_id = create_term(db_with_schema, "量子ビット", "技術")
+        assert _version(db_with_schema) == start + 1
+
+        with transaction(db_with_schema):
+            update_term(db_with_schema, term_id, "量子ビット", "物理")
+        assert _version(db_with_schema) == start + 2
+
+        with transaction(db_with_schema):
+            delete_term(db_with_schema, term_id)
+        assert _version(db_with_schema) == start + 3
+
+    def test_other_tables_are_unaffected(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        before = _version(db_with_schema, "glossary_refined")
+
+        with transaction(db_with_schema):
+            create_term(db_with_schema, "量子ビット")
+
+        assert _version(db_with_schema, "glossary_refined") == before
+
+    def test_rollback_restores_counter(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        start = _version(db_with_schema)
+
+        with pytest.raises(RuntimeError):
+            with transaction(db_with_schema):
+                create_term(db_with_schema, "量子ビット")
+                raise RuntimeError("abort")
+
+        assert _version(db_with_schema) == start
+
+    def test_reinitialize_keeps_counter(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        with transaction(db_with_schema):
+            create_term(db_with_schema, "量子ビット")
+        before = _version(db_with_schema)
+
+        initialize_db(db_with_schema)
+
+        assert _version(db_with_schema) == before
+
+    def test_unknown_table_is_omitted(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        assert get_table_versions(db_with_schema, ["no_such_table"]) == {}
+
+    def test_reinitialize_adds_counters_for_new_tables(
+        self, db_with_schema: sqlite3.Connection
+    ) -> None:
+        # A v15 database has no counter (and no triggers) for runs
+        db_with_schema.executescript(
+            """
+DROP TRIGGER runs_version_ai;
+DROP TRIGGER runs_version_ad;
+DROP TRIGGER runs_version_au;
+DELETE FROM table_versions WHERE table_name = 'runs';
+"""
+        )
+
+        initialize_db(db_with_schema)
+        start = _version(db_with_schema, "runs")
+        with transaction(db_with_schema):
+            create_run(db_with_schema, scope="full")
+
+        assert _version(db_with_schema, "runs") == start + 1
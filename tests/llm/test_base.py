@@ -54,3 +54,75 @@ def test_concrete_implementation_can_be_instantiated():
     client = ConcreteLLMClient()
     assert client.generate("test") == "test response"
     assert client.is_available() is True
+
+
+class RecordingObserver:
+    """Call observer that keeps everything it receives."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int, bool]] = []
+        self.retries: list[str] = []
+        self.json_failures = 0
+
+    def record_llm_call(
+        self, seconds: float, prompt_chars: int, response_chars: int, failed: bool
+    ) -> None:
+        self.calls.append((prompt_chars, response_chars, failed))
+
+    def record_llm_retry(self, reason: str) -> None:
+        self.retries.append(reason)
+
+    def record_json_parse_failure(self) -> None:
+        self.json_failures += 1
+
+
+class ScriptedLLMClient(BaseLLMClient):
+    """Client returning scripted raw responses through _retry_json_parsing."""
+
+    def __init__(self, responses: list[str]) -> None:
+        self.responses = list(responses)
+
+    def generate(self, prompt: str) -> str:
+        if not self.responses:
+            raise RuntimeError("no response")
+        return self.responses.pop(0)
+
+    def generate_structured(self, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        return self._retry_json_parsing(lambda: self.responses.pop(0), response_model)
+
+    def is_available(self) -> bool:
+        return True
+
+
+def test_call_observer_receives_calls_and_failures():
+    client = ScriptedLLMClient(["abc"])
+    observer = RecordingObserver()
+    client.call_observer = observer
+
+    assert client.generate("hello") == "abc"
+    with pytest.raises(RuntimeError):
+        client.generate("again")
+
+    assert observer.calls == [(5, 3, False), (5, 0, True)]
+
+
+def test_call_observer_counts_json_failures_and_retries(monkeypatch):
+    monkeypatch.setattr("genglossary.llm.base.time.sleep", lambda _: None)
+    client = ScriptedLLMClient(["not json", '{"text": "ok"}'])
+    observer = RecordingObserver()
+    client.call_observer = observer
+
+    result = client.generate_structured("prompt", SampleResponse)
+
+    assert result.text == "ok"
+    assert observer.json_failures == 1
+    assert observer.retries == ["invalid_json"]
+    assert len(observer.calls) == 1
+    assert observer.calls[0][2] is False
+
+
+def test_no_observer_by_default():
+    client = ScriptedLLMClient(["abc"])
+
+    assert client.call_observer is None
+    assert client.generate("hello") == "abc"
@@ -0,0 +1,220 @@
+"""Tests for token-budget batching."""
+
+import logging
+
+import pytest
+
+from genglossary.llm.base import ResponseTruncatedError
+from genglossary.llm.batching import (
+    MIN_TOKEN_BUDGET,
+    HeuristicTokenizer,
+    TokenBudgetBatcher,
+    get_batcher,
+    get_tokenizer,
+    parse_model_budgets,
+)
+
+
+class CharTokenizer:
+    """One token per character, for predictable budgets."""
+
+    def count(self, text: str) -> int:
+        return len(text)
+
+
+def _batcher(token_budget: int, **kwargs) -> TokenBudgetBatcher:
+    return TokenBudgetBatcher(token_budget, tokenizer=CharTokenizer(), **kwargs)
+
+
+class TestHeuristicTokenizer:
+    """Tests for HeuristicTokenizer."""
+
+    def test_counts_each_japanese_character(self) -> None:
+        assert HeuristicTokenizer().count("アソリウス島騎士団") == 9
+
+    def test_counts_ascii_words_by_length(self) -> None:
+        # "tokenization" = 3, "is" = 1, "fun" = 1, "!" = 1
+        assert HeuristicTokenizer().count("tokenization is fun!") == 6
+
+    def test_japanese_costs_more_than_chars_over_four(self) -> None:
+        text = "聖印を持つ騎士団長が魔神討伐に向かった。"
+
+        assert HeuristicTokenizer().count(text) > len(text) // 4
+
+    def test_empty_text(self) -> None:
+        assert HeuristicTokenizer().count("") == 0
+
+
+class TestGetTokenizer:
+    """Tests for get_tokenizer."""
+
+    def test_tiktoken_falls_back_when_not_installed(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setattr(
+            "genglossary.llm.batching._tiktoken_available", lambda: False
+        )
+
+        with caplog.at_level(logging.WARNING):
+            tokenizer = get_tokenizer("tiktoken", "gpt-4o")
+
+        assert isinstance(tokenizer, HeuristicTokenizer)
+        assert "tiktoken package is not installed" in caplog.text
+
+    def test_rejects_unknown_tokenizer(self) -> None:
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            get_tokenizer("sentencepiece", "llama3")
+
+
+class TestParseModelBudgets:
+    """Tests for parse_model_budgets."""
+
+    def test_parses_pairs(self) -> None:
+        assert parse_model_budgets(" gpt-4o=6000, llama3:8b=1200,") == {
+            "gpt-4o": 6000,
+            "llama3:8b": 1200,
+        }
+
+    def test_empty(self) -> None:
+        assert parse_model_budgets("") == {}
+
+    @pytest.mark.parametrize("value", ["gpt-4o", "=100", "gpt-4o=0", "gpt-4o=many"])
+    def test_rejects_malformed_pairs(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            parse_model_budgets(value)
+
+
+class TestPack:
+    """Tests for TokenBudgetBatcher.pack."""
+
+    def test_packs_items_up_to_budget(self) -> None:
+        # Each item costs its length + 2 (list formatting)
+        batcher = _batcher(20)
+
+        batches = batcher.pack(["aaaa", "bbbb", "cccc", "dd"], str)
+
+        assert batches == [["aaaa", "bbbb", "cccc"], ["dd"]]
+
+    def test_short_items_make_large_batches_and_long_ones_small(self) -> None:
+        batcher = _batcher(100)
+
+        assert len(batcher.pack(["x"] * 30, str)) == 1
+        assert len(batcher.pack(["y" * 60] * 3, str)) == 3
+
+    def test_item_larger_than_budget_gets_own_batch(self) -> None:
+        batcher = _batcher(10)
+
+        assert batcher.pack(["a", "z" * 50, "b"], str) == [["a"], ["z" * 50], ["b"]]
+
+    def test_max_items_caps_batch(self) -> None:
+        batcher = _batcher(1000, max_items=2)
+
+        assert batcher.pack(["a", "b", "c"], str) == [["a", "b"], ["c"]]
+
+    def test_uses_item_text(self) -> None:
+        batcher = _batcher(20)
+        items = [{"text": "a" * 16}, {"text": "b"}]
+
+        batches = batcher.pack(items, lambda item: item["text"])
+
+        assert batches == [[items[0]], [items[1]]]
+
+    def test_is_full(self) -> None:
+        batcher = _batcher(10, max_items=3)
+
+        assert not batcher.is_full(["ab"], str)
+        assert batcher.is_full(["abcd", "efgh"], str)
+        assert batcher.is_full(["a", "b", "c"], str)
+
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="token_budget"):
+            TokenBudgetBatcher(0)
+        with pytest.raises(ValueError, match="max_items"):
+            TokenBudgetBatcher(100, max_items=0)
+
+
+class TestRun:
+    """Tests for splitting failed batches."""
+
+    def test_success_returns_single_result(self) -> None:
+        batcher = _batcher(1000)
+
+        assert batcher.run(["a", "b"], lambda batch: "".join(batch)) == ["ab"]
+
+    def test_failed_batch_is_split_until_it_succeeds(self) -> None:
+        batcher = _batcher(1000)
+        calls: list[list[str]] = []
+
+        def process(batch: list[str]) -> str:
+            calls.append(batch)
+            if len(batch) > 2:
+                raise ResponseTruncatedError("truncated")
+            return "".join(batch)
+
+        results = batcher.run(["a", "b", "c", "d", "e"], process)
+
+        assert results == ["ab", "c", "de"]
+        assert calls[0] == ["a", "b", "c", "d", "e"]
+
+    def test_single_item_failure_is_raised(self) -> None:
+        batcher = _batcher(1000)
+
+        def process(batch: list[str]) -> str:
+            if "bad" in batch:
+                raise ValueError("Failed to parse structured output")
+            return "".join(batch)
+
+        with pytest.raises(ValueError, match="Failed to parse"):
+            batcher.run(["a", "bad"], process)
+
+    def test_other_errors_are_not_split(self) -> None:
+        batcher = _batcher(1000)
+        calls: list[list[str]] = []
+
+        def process(batch: list[str]) -> str:
+            calls.append(batch)
+            raise RuntimeError("LLM API error")
+
+        with pytest.raises(RuntimeError):
+            batcher.run(["a", "b"], process)
+
+        assert len(calls) == 1
+        assert batcher.token_budget == 1000
+
+    def test_split_shrinks_budget_and_successes_restore_it(self) -> None:
+        batcher = _batcher(1600)
+
+        def process(batch: list[str]) -> str:
+            if len(batch) > 1:
+                raise ValueError("bad json")
+            return batch[0]
+
+        batcher.run(["a", "b"], process)
+        # Halved once, then two successes restore 1/16 of 1600 each
+        assert batcher.token_budget == 1000
+
+        for _ in range(20):
+            batcher.run(["a"], process)
+        assert batcher.token_budget == 1600
+
+    def test_budget_never_shrinks_below_minimum(self) -> None:
+        batcher = _batcher(1000)
+
+        def process(batch: list[str]) -> str:
+            raise ValueError("bad json")
+
+        with pytest.raises(ValueError):
+            batcher.run(["x"] * 64, process)
+
+        assert batcher.token_budget == MIN_TOKEN_BUDGET
+
+
+class TestGetBatcher:
+    """Tests for the per-model batcher registry."""
+
+    def test_one_batcher_per_model_and_settings(self) -> None:
+        first = get_batcher("llama3", 1000)
+
+        assert get_batcher("llama3", 1000) is first
+        assert get_batcher("qwen3", 1000) is not first
+        assert get_batcher("llama3", 2000) is not first
@@ -0,0 +1,242 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import respx
+
+from genglossary.llm.concurrency import (
+    MAX_RETRY_AFTER_SECONDS,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencySettings,
+    get_concurrency_limiter,
+    parse_retry_after,
+)
+from genglossary.llm.openai_compatible_client import OpenAICompatibleClient
+from genglossary.metrics import REGISTRY
+
+
+def _limiter(**settings) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter("http://llm.test", ConcurrencySettings(**settings))
+
+
+def _respond(limiter: AdaptiveConcurrencyLimiter, status: int, **headers: str) -> None:
+    with limiter.slot() as slot:
+        slot.record(httpx.Response(status, headers=headers))
+
+
+class FakeClock:
+    """Replaces time.monotonic in the limiter module."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.now = 1000.0
+        monkeypatch.setattr("genglossary.llm.concurrency.time.monotonic", lambda: self.now)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+
+    def test_http_date(self) -> None:
+        date = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = httpx.Response(429, headers={"Retry-After": format_datetime(date, usegmt=True)})
+
+        assert 25 < parse_retry_after(response) <= 30
+
+    def test_missing_or_invalid(self) -> None:
+        assert parse_retry_after(httpx.Response(429)) is None
+        assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+
+    def test_capped(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "3600"})
+
+        assert parse_retry_after(response) == MAX_RETRY_AFTER_SECONDS
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_blocks_requests_beyond_limit(self) -> None:
+        limiter = _limiter(initial_limit=2)
+        release = threading.Event()
+        started: list[int] = []
+
+        def request(i: int) -> None:
+            with limiter.slot() as slot:
+                started.append(i)
+                release.wait(timeout=5)
+                slot.record(httpx.Response(200))
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+
+        assert len(started) == 2
+        assert limiter.stats()["in_flight"] == 2
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert len(started) == 3
+
+    def test_additive_increase_while_limit_is_used(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        FakeClock(monkeypatch)
+        limiter = _limiter(initial_limit=1, max_limit=3)
+
+        _respond(limiter, 200)
+        assert limiter.limit == 2
+
+        # One request at a time no longer fills the window
+        for _ in range(5):
+            _respond(limiter, 200)
+        assert limiter.limit == 2
+
+    def test_limit_stays_below_max(self) -> None:
+        limiter = _limiter(initial_limit=1, max_limit=1)
+
+        _respond(limiter, 200)
+
+        assert limiter.limit == 1
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_multiplicative_decrease_on_rate_limit_and_server_error(
+        self, status: int
+    ) -> None:
+        limiter = _limiter(initial_limit=8)
+
+        _respond(limiter, status)
+
+        assert limiter.limit == 4
+
+    def test_decrease_on_timeout(self) -> None:
+        limiter = _limiter(initial_limit=8)
+
+        with pytest.raises(httpx.ReadTimeout):
+            with limiter.slot():
+                raise httpx.ReadTimeout("slow")
+
+        assert limiter.limit == 4
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_other_errors_leave_limit_unchanged(self) -> None:
+        limiter = _limiter(initial_limit=8)
+
+        with pytest.raises(httpx.ConnectError):
+            with limiter.slot():
+                raise httpx.ConnectError("refused")
+
+        assert limiter.limit == 8
+
+    def test_one_decrease_per_cooldown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = FakeClock(monkeypatch)
+        limiter = _limiter(initial_limit=16, min_limit=2)
+
+        _respond(limiter, 429)
+        _respond(limiter, 503)
+        assert limiter.limit == 8
+
+        clock.now += 2
+        _respond(limiter, 500)
+        assert limiter.limit == 4
+
+        for _ in range(5):
+            clock.now += 2
+            _respond(limiter, 500)
+        assert limiter.limit == 2
+
+    def test_latency_spike_cuts_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = FakeClock(monkeypatch)
+        limiter = _limiter(initial_limit=8, max_limit=8, latency_spike_factor=2.0)
+
+        def request(seconds: float) -> None:
+            with limiter.slot() as slot:
+                clock.now += seconds
+                slot.record(httpx.Response(200))
+
+        for _ in range(5):
+            request(1.0)
+        request(1.9)  # slower, but not a spike
+        assert limiter.limit == 8
+
+        request(2.5)
+
+        assert limiter.limit == 4
+        assert REGISTRY.get_sample_value(
+            "genglossary_llm_concurrency_decreases_total",
+            {"endpoint": "http://llm.test", "reason": "latency"},
+        ) >= 1
+
+    def test_retry_after_pauses_every_request(self) -> None:
+        limiter = _limiter(initial_limit=4)
+        _respond(limiter, 429, **{"Retry-After": "0.3"})
+
+        assert limiter.stats()["paused_for_seconds"] > 0
+        start = time.monotonic()
+        _respond(limiter, 200)
+
+        assert time.monotonic() - start >= 0.25
+
+    def test_exports_limit_metric(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(
+            "http://metric.test", ConcurrencySettings(initial_limit=6)
+        )
+
+        _respond(limiter, 429)
+
+        assert REGISTRY.get_sample_value(
+            "genglossary_llm_concurrency_limit", {"endpoint": "http://metric.test"}
+        ) == 3
+
+    def test_rejects_inconsistent_bounds(self) -> None:
+        with pytest.raises(ValueError, match="Concurrency limits"):
+            _limiter(initial_limit=40, max_limit=32)
+
+
+class TestGetConcurrencyLimiter:
+    """Tests for the per-server limiter registry."""
+
+    def test_one_limiter_per_origin(self) -> None:
+        first = get_concurrency_limiter("http://gpu1:11434")
+        same = get_concurrency_limiter("http://gpu1:11434/v1")
+        other = get_concurrency_limiter("http://gpu2:11434")
+
+        assert first is same
+        assert first is not other
+        assert first.endpoint == "http://gpu1:11434"
+
+
+class TestClientIntegration:
+    """Tests that LLM clients go through the server's limiter."""
+
+    @respx.mock
+    def test_retry_after_is_handled_by_limiter(self, mocker) -> None:
+        sleep = mocker.patch("genglossary.llm.openai_compatible_client.time.sleep")
+        respx.post("http://limited.test/v1/chat/completions").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0.1"}),
+                httpx.Response(
+                    200, json={"choices": [{"message": {"content": "ok"}}]}
+                ),
+            ]
+        )
+        client = OpenAICompatibleClient(
+            base_url="http://limited.test/v1",
+            concurrency_settings=ConcurrencySettings(initial_limit=8),
+        )
+
+        assert client.generate("hi") == "ok"
+
+        sleep.assert_not_called()
+        assert client._limiter is get_concurrency_limiter(
+            "http://limited.test", ConcurrencySettings(initial_limit=8)
+        )
+        assert client._limiter.limit == 4
+        client.close()
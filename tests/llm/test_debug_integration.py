@@ -137,6 +137,25 @@ class TestFactoryDebugIntegration:
 
             assert client._debug_logger is not None
 
+    def test_factory_applies_debug_settings_from_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ファクトリがLLM_DEBUG_*の設定をdebug_loggerに渡す"""
+        from genglossary.llm.factory import create_llm_client
+
+        monkeypatch.setenv("LLM_DEBUG_FORMAT", "files")
+        with patch("genglossary.llm.factory.OllamaClient") as mock_ollama:
+            mock_ollama.return_value = StubLLMClient()
+
+            client = create_llm_client(
+                provider="ollama",
+                llm_debug=True,
+                debug_dir=str(tmp_path / "llm-debug"),
+            )
+            client.generate("prompt")
+
+        assert len(list((tmp_path / "llm-debug").glob("*.txt"))) == 1
+
     def test_factory_no_debug_logger_when_disabled(self) -> None:
         """llm_debug=Falseの場合、debug_loggerが設定されない"""
         from genglossary.llm.factory import create_llm_client
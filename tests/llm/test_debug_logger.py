@@ -1,6 +1,9 @@
 """Tests for LLM debug logger."""
 
+import gzip
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -198,3 +201,126 @@ class TestLlmDebugLoggerFilePermissions:
         assert len(files) == 1
         file_mode = files[0].stat().st_mode & 0o777
         assert file_mode == 0o600
+
+
+def _log(logger: LlmDebugLogger, request: str = "r") -> None:
+    logger.log(
+        model="m", method="generate", request=request, response="resp", duration=0.5
+    )
+
+
+def _read_jsonl(debug_dir: Path) -> list[dict]:
+    records = []
+    for path in sorted(debug_dir.iterdir()):
+        opener = gzip.open if path.name.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+class TestLlmDebugLoggerJsonl:
+    """Tests for the buffered JSONL format."""
+
+    def test_invalid_format_raises(self, tmp_path: Path) -> None:
+        """未知のフォーマットはValueError"""
+        debug_dir = tmp_path / "llm-debug"
+        with pytest.raises(ValueError, match="Unknown log format"):
+            LlmDebugLogger(debug_dir=str(debug_dir), log_format="xml")
+
+    def test_records_written_on_close(self, tmp_path: Path) -> None:
+        """close()で未書き込みのレコードがJSON Linesとして書き出される"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(debug_dir=str(debug_dir), log_format="jsonl")
+
+        _log(logger, "日本語のプロンプト")
+        _log(logger, "second")
+        logger.close()
+
+        files = list(debug_dir.iterdir())
+        assert len(files) == 1
+        assert files[0].name.endswith(".jsonl")
+        records = _read_jsonl(debug_dir)
+        assert [r["seq"] for r in records] == [1, 2]
+        assert records[0]["request"] == "日本語のプロンプト"
+        assert records[0]["response"] == "resp"
+        assert records[0]["model"] == "m"
+        assert records[0]["method"] == "generate"
+        assert records[0]["duration"] == 0.5
+        assert "timestamp" in records[0]
+
+    def test_sequence_numbers_unique_across_threads(self, tmp_path: Path) -> None:
+        """複数スレッドから記録してもシーケンス番号が重複しない"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(
+            debug_dir=str(debug_dir), log_format="jsonl", queue_size=4
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: _log(logger, str(i)), range(200)))
+        logger.close()
+
+        records = _read_jsonl(debug_dir)
+        assert sorted(r["seq"] for r in records) == list(range(1, 201))
+
+    def test_rotates_files_by_size(self, tmp_path: Path) -> None:
+        """max_bytesを超えると新しいファイルに切り替わる"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(
+            debug_dir=str(debug_dir), log_format="jsonl", max_bytes=300
+        )
+
+        for i in range(10):
+            _log(logger, "x" * 100)
+        logger.close()
+
+        files = sorted(debug_dir.iterdir())
+        assert len(files) > 1
+        assert all(f.stat().st_size <= 300 for f in files)
+        assert len(_read_jsonl(debug_dir)) == 10
+
+    def test_compressed_files_are_gzip(self, tmp_path: Path) -> None:
+        """compress=Trueの場合、.jsonl.gzとして書き出される"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(
+            debug_dir=str(debug_dir), log_format="jsonl", compress=True
+        )
+
+        _log(logger)
+        logger.close()
+
+        files = list(debug_dir.iterdir())
+        assert len(files) == 1
+        assert files[0].name.endswith(".jsonl.gz")
+        assert [r["seq"] for r in _read_jsonl(debug_dir)] == [1]
+
+    def test_jsonl_file_has_owner_only_permissions(self, tmp_path: Path) -> None:
+        """JSONLファイルもオーナーのみ読み書き可能 (0o600)"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(debug_dir=str(debug_dir), log_format="jsonl")
+
+        _log(logger)
+        logger.close()
+
+        files = list(debug_dir.iterdir())
+        assert files[0].stat().st_mode & 0o777 == 0o600
+
+    def test_log_after_close_is_ignored(self, tmp_path: Path) -> None:
+        """close()後の記録は無視され、close()は何度呼んでもよい"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(debug_dir=str(debug_dir), log_format="jsonl")
+
+        _log(logger)
+        logger.close()
+        _log(logger)
+        logger.close()
+
+        assert [r["seq"] for r in _read_jsonl(debug_dir)] == [1]
+
+    def test_no_file_without_records(self, tmp_path: Path) -> None:
+        """記録がなければファイルもスレッドも作られない"""
+        debug_dir = tmp_path / "llm-debug"
+        logger = LlmDebugLogger(debug_dir=str(debug_dir), log_format="jsonl")
+
+        logger.close()
+
+        assert list(debug_dir.iterdir()) == []
@@ -4,7 +4,10 @@ from unittest.mock import patch
 
 import pytest
 
-from genglossary.llm.factory import create_llm_client
+from genglossary.llm.concurrency import ConcurrencySettings
+from genglossary.llm.batching import HeuristicTokenizer
+from genglossary.llm.factory import create_batcher, create_llm_client
+from genglossary.llm.http_pool import HttpPoolSettings
 
 
 class TestCreateLLMClientBaseUrl:
@@ -63,3 +66,78 @@ class TestCreateLLMClientBaseUrl:
             mock_openai.assert_called_once()
             call_kwargs = mock_openai.call_args.kwargs
             assert call_kwargs["base_url"] == "https://api.openai.com/v1"
+
+
+class TestCreateLLMClientHttpPool:
+    """Tests for connection pool settings propagation."""
+
+    def test_pool_settings_and_http2_come_from_config(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """接続プールの上限とHTTP/2設定がConfigから渡される"""
+        monkeypatch.setenv("LLM_HTTP_MAX_CONNECTIONS", "4")
+        monkeypatch.setenv("LLM_HTTP_MAX_KEEPALIVE", "2")
+        monkeypatch.setenv("LLM_HTTP_KEEPALIVE_EXPIRY", "90")
+        monkeypatch.setenv("OPENAI_HTTP2", "true")
+
+        with patch("genglossary.llm.factory.OpenAICompatibleClient") as mock_openai:
+            create_llm_client(provider="openai")
+
+        call_kwargs = mock_openai.call_args.kwargs
+        assert call_kwargs["http2"] is True
+        assert call_kwargs["pool_settings"] == HttpPoolSettings(
+            max_connections=4, max_keepalive_connections=2, keepalive_expiry=90.0
+        )
+
+    def test_concurrency_settings_come_from_config(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """適応的な同時実行上限の設定がConfigから渡される"""
+        monkeypatch.setenv("LLM_CONCURRENCY_INITIAL_LIMIT", "2")
+        monkeypatch.setenv("LLM_CONCURRENCY_MAX_LIMIT", "6")
+        monkeypatch.setenv("LLM_LATENCY_SPIKE_FACTOR", "3")
+
+        with patch("genglossary.llm.factory.OllamaClient") as mock_ollama:
+            create_llm_client(provider="ollama")
+
+        assert mock_ollama.call_args.kwargs["concurrency_settings"] == ConcurrencySettings(
+            initial_limit=2, min_limit=1, max_limit=6, latency_spike_factor=3.0
+        )
+
+
+class TestCreateBatcher:
+    """Tests for create_batcher."""
+
+    def test_budget_and_limits_come_from_config(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """予算・件数上限・トークナイザがConfigから渡される"""
+        monkeypatch.setenv("LLM_BATCH_TOKEN_BUDGET", "800")
+        monkeypatch.setenv("LLM_BATCH_MAX_ITEMS", "12")
+
+        batcher = create_batcher("llama3:8b")
+
+        assert batcher is not None
+        assert batcher.token_budget == 800
+        assert batcher.max_items == 12
+        assert isinstance(batcher.tokenizer, HeuristicTokenizer)
+
+    def test_per_model_budget_overrides_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """モデル別の予算が既定の予算より優先される"""
+        monkeypatch.setenv("LLM_BATCH_TOKEN_BUDGETS", "gpt-4o=6000, llama3:8b=700")
+
+        assert create_batcher("llama3:8b").token_budget == 700
+        assert create_batcher("qwen3").token_budget == 1500
+
+    def test_zero_budget_disables_batcher(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """予算0では固定件数のバッチに戻る"""
+        monkeypatch.setenv("LLM_BATCH_TOKEN_BUDGET", "0")
+
+        assert create_batcher("llama3:8b") is None
+
+    def test_batcher_is_shared_per_model(self) -> None:
+        """同じモデルには同じバッチャーが返される"""
+        assert create_batcher("llama3:8b") is create_batcher("llama3:8b")
+        assert create_batcher("llama3:8b") is not create_batcher("qwen3")
@@ -0,0 +1,373 @@
+"""Tests for LoadBalancedLLMClient."""
+
+import threading
+import time
+from typing import Type
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.factory import create_llm_client
+from genglossary.llm.load_balancer import LoadBalancedLLMClient, split_base_urls
+from genglossary.llm.ollama_client import OllamaClient
+from genglossary.metrics import REGISTRY
+
+
+class SampleResponse(BaseModel):
+    text: str
+
+
+class FakeEndpoint(BaseLLMClient):
+    """Endpoint client with scripted behavior."""
+
+    provider = "fake"
+
+    def __init__(self, base_url: str, *, delay: float = 0.0) -> None:
+        self.base_url = base_url
+        self.model = "fake-model"
+        self.delay = delay
+        self.error: Exception | None = None
+        self.available = True
+        self.gate: threading.Event | None = None
+        self.calls = 0
+        self.closed = False
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"{self.base_url}:{prompt}"
+
+    def generate_structured(self, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        return response_model(text=self.generate(prompt))
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def _connect_error() -> httpx.ConnectError:
+    return httpx.ConnectError("refused", request=httpx.Request("POST", "http://x"))
+
+
+def _balancer(*endpoints: FakeEndpoint, **kwargs) -> LoadBalancedLLMClient:
+    kwargs.setdefault("health_check_interval", 0)
+    return LoadBalancedLLMClient(list(endpoints), **kwargs)
+
+
+def _stats_by_endpoint(client: LoadBalancedLLMClient) -> dict[str, dict]:
+    return {s["endpoint"]: s for s in client.stats()}
+
+
+class TestSplitBaseUrls:
+    """Tests for split_base_urls."""
+
+    def test_splits_and_strips(self) -> None:
+        assert split_base_urls(" http://a:11434 , http://b:11434/,") == [
+            "http://a:11434",
+            "http://b:11434/",
+        ]
+
+    def test_single_url(self) -> None:
+        assert split_base_urls("http://a:11434") == ["http://a:11434"]
+
+
+class TestRouting:
+    """Tests for request routing policies."""
+
+    def test_least_outstanding_spreads_concurrent_calls(self) -> None:
+        endpoints = [FakeEndpoint(f"http://gpu{i}:11434") for i in range(3)]
+        gate = threading.Event()
+        for endpoint in endpoints:
+            endpoint.gate = gate
+        client = _balancer(*endpoints)
+
+        threads = [
+            threading.Thread(target=client.generate, args=(str(i),)) for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while sum(e.calls for e in endpoints) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [s["outstanding"] for s in client.stats()] == [1, 1, 1]
+        gate.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert [s["outstanding"] for s in client.stats()] == [0, 0, 0]
+
+    def test_latency_policy_prefers_faster_endpoint(self) -> None:
+        slow = FakeEndpoint("http://slow:11434", delay=0.05)
+        fast = FakeEndpoint("http://fast:11434")
+        client = _balancer(slow, fast, policy="latency")
+
+        for i in range(6):
+            client.generate(str(i))
+
+        # Each endpoint is sampled once, then the fast one takes the rest
+        assert slow.calls == 1
+        assert fast.calls == 5
+        assert _stats_by_endpoint(client)["http://slow:11434"]["latency_ms"] >= 50
+
+    def test_generate_structured_is_routed(self) -> None:
+        client = _balancer(FakeEndpoint("http://a:11434"))
+
+        result = client.generate_structured("hi", SampleResponse)
+
+        assert result.text == "http://a:11434:hi"
+
+    def test_reports_model_and_provider_of_first_endpoint(self) -> None:
+        client = _balancer(FakeEndpoint("http://a:11434"), FakeEndpoint("http://b:11434"))
+
+        assert client.model == "fake-model"
+        assert client.provider == "fake"
+
+    def test_rejects_unknown_policy(self) -> None:
+        with pytest.raises(ValueError, match="Unknown load balancing policy"):
+            _balancer(FakeEndpoint("http://a:11434"), policy="random")
+
+    def test_rejects_empty_endpoints(self) -> None:
+        with pytest.raises(ValueError, match="At least one endpoint"):
+            LoadBalancedLLMClient([], health_check_interval=0)
+
+
+class TestEjection:
+    """Tests for failover, ejection and reinstatement."""
+
+    def test_failed_endpoint_is_ejected_and_request_fails_over(self) -> None:
+        broken = FakeEndpoint("http://broken:11434")
+        broken.error = _connect_error()
+        healthy = FakeEndpoint("http://healthy:11434")
+        client = _balancer(broken, healthy)
+        ejections = REGISTRY.get_sample_value(
+            "genglossary_llm_endpoint_ejections_total",
+            {"endpoint": "http://broken:11434"},
+        ) or 0.0
+
+        assert client.generate("hi") == "http://healthy:11434:hi"
+
+        stats = _stats_by_endpoint(client)["http://broken:11434"]
+        assert stats["healthy"] is False
+        assert stats["failures"] == 1
+        assert stats["ejected_for_seconds"] > 0
+        assert REGISTRY.get_sample_value(
+            "genglossary_llm_endpoint_ejections_total",
+            {"endpoint": "http://broken:11434"},
+        ) == ejections + 1
+
+    def test_ejected_endpoint_is_skipped_during_backoff(self) -> None:
+        broken = FakeEndpoint("http://broken:11434")
+        broken.error = _connect_error()
+        healthy = FakeEndpoint("http://healthy:11434")
+        client = _balancer(broken, healthy)
+        client.generate("first")
+
+        for i in range(3):
+            client.generate(str(i))
+
+        assert broken.calls == 1
+
+    def test_backoff_doubles_per_consecutive_failure(self) -> None:
+        broken = FakeEndpoint("http://broken:11434")
+        broken.error = _connect_error()
+        client = _balancer(
+            broken, FakeEndpoint("http://ok:11434"), eject_base_seconds=10
+        )
+
+        client._eject(client._endpoints[0], "test")
+        client._eject(client._endpoints[0], "test")
+
+        ejected_for = _stats_by_endpoint(client)["http://broken:11434"]["ejected_for_seconds"]
+        assert 19 < ejected_for <= 20
+
+    def test_success_after_backoff_reinstates_endpoint(self) -> None:
+        flaky = FakeEndpoint("http://flaky:11434")
+        flaky.error = _connect_error()
+        client = _balancer(flaky, eject_base_seconds=0.01)
+        with pytest.raises(httpx.ConnectError):
+            client.generate("hi")
+
+        time.sleep(0.02)
+        flaky.error = None
+
+        assert client.generate("hi") == "http://flaky:11434:hi"
+        assert client.stats()[0]["healthy"] is True
+
+    def test_raises_last_error_when_all_endpoints_fail(self) -> None:
+        first = FakeEndpoint("http://a:11434")
+        second = FakeEndpoint("http://b:11434")
+        first.error = _connect_error()
+        second.error = httpx.ReadTimeout("slow")
+        client = _balancer(first, second)
+
+        with pytest.raises(httpx.HTTPError):
+            client.generate("hi")
+
+        assert first.calls == 1
+        assert second.calls == 1
+
+    def test_client_error_neither_ejects_nor_fails_over(self) -> None:
+        request = httpx.Request("POST", "http://a:11434/api/generate")
+        rejecting = FakeEndpoint("http://a:11434")
+        rejecting.error = httpx.HTTPStatusError(
+            "400 Bad Request",
+            request=request,
+            response=httpx.Response(400, request=request),
+        )
+        other = FakeEndpoint("http://b:11434")
+        client = _balancer(rejecting, other)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.generate("too long")
+
+        assert other.calls == 0
+        stats = _stats_by_endpoint(client)
+        assert stats["http://a:11434"]["healthy"] is True
+        assert stats["http://a:11434"]["failures"] == 0
+        assert stats["http://a:11434"]["outstanding"] == 0
+        assert stats["http://b:11434"]["requests"] == 0
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_rate_limit_and_server_errors_fail_over(self, status: int) -> None:
+        request = httpx.Request("POST", "http://a:11434/api/generate")
+        busy = FakeEndpoint("http://a:11434")
+        busy.error = httpx.HTTPStatusError(
+            str(status), request=request, response=httpx.Response(status, request=request)
+        )
+        client = _balancer(busy, FakeEndpoint("http://b:11434"))
+
+        assert client.generate("hi") == "http://b:11434:hi"
+        assert _stats_by_endpoint(client)["http://a:11434"]["healthy"] is False
+
+    def test_non_http_errors_do_not_eject(self) -> None:
+        endpoint = FakeEndpoint("http://a:11434")
+        endpoint.error = ValueError("Failed to parse structured output")
+        client = _balancer(endpoint, FakeEndpoint("http://b:11434"))
+
+        with pytest.raises(ValueError):
+            client.generate("hi")
+
+        assert all(s["healthy"] for s in client.stats())
+
+    def test_no_failover_after_close(self) -> None:
+        first = FakeEndpoint("http://a:11434")
+        first.error = _connect_error()
+        second = FakeEndpoint("http://b:11434")
+        client = _balancer(first, second)
+        client.close()
+
+        with pytest.raises(httpx.ConnectError):
+            client.generate("hi")
+
+        assert second.calls == 0
+
+
+class TestHealthCheck:
+    """Tests for periodic health checks."""
+
+    def test_unavailable_endpoint_is_ejected(self) -> None:
+        down = FakeEndpoint("http://down:11434")
+        down.available = False
+        client = _balancer(down, FakeEndpoint("http://up:11434"))
+
+        client._check_health()
+
+        assert _stats_by_endpoint(client)["http://down:11434"]["healthy"] is False
+
+    def test_available_endpoint_is_reinstated_after_backoff(self) -> None:
+        endpoint = FakeEndpoint("http://a:11434")
+        endpoint.available = False
+        client = _balancer(endpoint, eject_base_seconds=0.01)
+        client._check_health()
+
+        endpoint.available = True
+        client._check_health()
+        assert client.stats()[0]["healthy"] is False  # backoff not over yet
+        time.sleep(0.02)
+        client._check_health()
+
+        assert client.stats()[0]["healthy"] is True
+
+    def test_background_checker_runs_and_stops_on_close(self) -> None:
+        endpoint = FakeEndpoint("http://a:11434")
+        endpoint.available = False
+        client = LoadBalancedLLMClient([endpoint], health_check_interval=0.01)
+
+        deadline = time.monotonic() + 5
+        while client.stats()[0]["healthy"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.close()
+
+        assert client.stats()[0]["healthy"] is False
+        assert client._health_thread is not None
+        client._health_thread.join(timeout=5)
+        assert not client._health_thread.is_alive()
+        assert endpoint.closed is True
+
+
+class TestCallObserver:
+    """Tests that calls are observed once and retries are forwarded."""
+
+    def test_observer_sees_each_call_once_and_endpoint_retries(self) -> None:
+        events: list[str] = []
+
+        class Observer:
+            def record_llm_call(self, seconds, prompt_chars, response_chars, failed):
+                events.append("call")
+
+            def record_llm_retry(self, reason):
+                events.append(f"retry:{reason}")
+
+            def record_json_parse_failure(self):
+                events.append("parse_failure")
+
+        endpoint = FakeEndpoint("http://a:11434")
+        client = _balancer(endpoint)
+        client.call_observer = Observer()
+
+        endpoint._record_retry("server_error")
+        client.generate("hi")
+
+        assert events == ["retry:server_error", "call"]
+
+
+class TestFactory:
+    """Tests for creating a balancer from comma-separated base URLs."""
+
+    def test_comma_separated_base_url_creates_balancer(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("LLM_HEALTH_CHECK_INTERVAL", "0")
+        monkeypatch.setenv("LLM_LB_POLICY", "latency")
+
+        client = create_llm_client(
+            "ollama", base_url="http://gpu1:11434, http://gpu2:11434"
+        )
+
+        assert isinstance(client, LoadBalancedLLMClient)
+        assert [s["endpoint"] for s in client.stats()] == [
+            "http://gpu1:11434",
+            "http://gpu2:11434",
+        ]
+        assert all(isinstance(e.client, OllamaClient) for e in client._endpoints)
+        assert client._policy == "latency"
+        client.close()
+
+    def test_single_base_url_creates_plain_client(self) -> None:
+        with patch("genglossary.llm.factory.LoadBalancedLLMClient") as mock_lb:
+            client = create_llm_client("ollama", base_url="http://gpu1:11434")
+
+        assert isinstance(client, OllamaClient)
+        mock_lb.assert_not_called()
+        client.close()
@@ -4,6 +4,7 @@ import httpx
 import respx
 from pydantic import BaseModel
 
+from genglossary.llm.base import ResponseTruncatedError
 from genglossary.llm.ollama_client import OllamaClient
 
 
@@ -110,6 +111,26 @@ def test_generate_structured_invalid_json(ollama_client):
         ollama_client.generate_structured("test prompt", SampleResponse)
 
 
+@respx.mock
+def test_generate_structured_truncated_response_is_not_retried(ollama_client):
+    """Test that a response cut off at the token limit fails at once."""
+    route = respx.post("http://localhost:11434/api/generate").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "model": "llama2",
+                "response": '{"answer": "4',
+                "done": True,
+                "done_reason": "length",
+            }
+        )
+    )
+
+    with pytest.raises(ResponseTruncatedError):
+        ollama_client.generate_structured("test prompt", SampleResponse)
+    assert route.call_count == 1
+
+
 @respx.mock
 def test_retry_logic_with_exponential_backoff(ollama_client):
     """Test retry logic with exponential backoff."""
@@ -251,3 +272,56 @@ def test_list_models_timeout_error(ollama_client):
 
     with pytest.raises(httpx.TimeoutException):
         ollama_client.list_models()
+
+
+def _metric(name: str, **labels: str) -> float:
+    from genglossary.metrics import REGISTRY
+
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@respx.mock
+def test_request_metrics_record_retries_and_tokens(mocker):
+    """Test that retries, outcome, prompt chars and tokens are recorded."""
+    mocker.patch("genglossary.llm.ollama_client.time.sleep")
+    client = OllamaClient(base_url="http://localhost:11434", model="metrics-model")
+    route = respx.post("http://localhost:11434/api/generate")
+    route.side_effect = [
+        httpx.Response(503, json={"error": "busy"}),
+        httpx.Response(
+            200,
+            json={"response": "ok", "done": True, "prompt_eval_count": 12, "eval_count": 3},
+        ),
+    ]
+    labels = {"provider": "ollama", "model": "metrics-model"}
+    retries = _metric("genglossary_llm_retries_total", **labels, reason="server_error")
+    successes = _metric("genglossary_llm_requests_total", **labels, outcome="success")
+    chars = _metric("genglossary_llm_prompt_chars_total", **labels)
+    tokens = _metric("genglossary_llm_tokens_total", **labels, type="prompt")
+
+    client.generate("hello")
+
+    assert _metric("genglossary_llm_retries_total", **labels, reason="server_error") == retries + 1
+    assert _metric("genglossary_llm_requests_total", **labels, outcome="success") == successes + 1
+    # The prompt is sent on both attempts
+    assert _metric("genglossary_llm_prompt_chars_total", **labels) == chars + 10
+    assert _metric("genglossary_llm_tokens_total", **labels, type="prompt") == tokens + 12
+
+
+@respx.mock
+def test_request_metrics_record_errors(mocker):
+    """Test that exhausted retries are recorded as an error outcome."""
+    mocker.patch("genglossary.llm.ollama_client.time.sleep")
+    client = OllamaClient(
+        base_url="http://localhost:11434", model="metrics-error-model", max_retries=1
+    )
+    respx.post("http://localhost:11434/api/generate").mock(
+        return_value=httpx.Response(500, json={"error": "boom"})
+    )
+    labels = {"provider": "ollama", "model": "metrics-error-model", "outcome": "error"}
+    before = _metric("genglossary_llm_requests_total", **labels)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.generate("hello")
+
+    assert _metric("genglossary_llm_requests_total", **labels) == before + 1
@@ -4,6 +4,7 @@ import httpx
 import respx
 from pydantic import BaseModel
 
+from genglossary.llm.base import ResponseTruncatedError
 from genglossary.llm.openai_compatible_client import OpenAICompatibleClient
 
 
@@ -197,6 +198,25 @@ class TestGenerateStructured:
         with pytest.raises(ValueError, match="Failed to parse structured output"):
             openai_client.generate_structured("test", SampleResponse)
 
+    @respx.mock
+    def test_generate_structured_truncated_response_is_not_retried(self, openai_client):
+        """Test that a response cut off at max_tokens fails at once."""
+        route = respx.post("http://localhost:8080/v1/chat/completions").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "choices": [{
+                        "message": {"content": '{"answer": "te'},
+                        "finish_reason": "length",
+                    }]
+                }
+            )
+        )
+
+        with pytest.raises(ResponseTruncatedError, match="max_tokens"):
+            openai_client.generate_structured("test", SampleResponse)
+        assert route.call_count == 1
+
 
 class TestRetryLogic:
     """Test retry logic and error handling."""
@@ -384,3 +404,77 @@ class TestClose:
         )
         del client.client
         client.close()  # Should not raise
+
+    def test_close_closes_debug_logger(self, mocker):
+        """Test that close() flushes the debug logger."""
+        client = OpenAICompatibleClient(
+            base_url="http://localhost:8080/v1",
+            api_key="test-key",
+        )
+        debug_logger = mocker.Mock()
+        client._debug_logger = debug_logger
+        client.close()
+        debug_logger.close.assert_called_once()
+
+
+class TestMetrics:
+    """Test request metrics."""
+
+    @staticmethod
+    def _metric(name: str, **labels: str) -> float:
+        from genglossary.metrics import REGISTRY
+
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @respx.mock
+    def test_records_rate_limit_retry_and_usage(self, mocker):
+        """Test that 429 retries and reported token usage are recorded."""
+        mocker.patch("genglossary.llm.openai_compatible_client.time.sleep")
+        client = OpenAICompatibleClient(
+            base_url="http://localhost:8080/v1", model="metrics-model"
+        )
+        route = respx.post("http://localhost:8080/v1/chat/completions")
+        route.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "ok"}}],
+                    "usage": {"prompt_tokens": 7, "completion_tokens": 2},
+                },
+            ),
+        ]
+        labels = {"provider": "openai", "model": "metrics-model"}
+        retries = self._metric("genglossary_llm_retries_total", **labels, reason="rate_limited")
+        completion = self._metric("genglossary_llm_tokens_total", **labels, type="completion")
+
+        client.generate("hello")
+
+        assert self._metric(
+            "genglossary_llm_retries_total", **labels, reason="rate_limited"
+        ) == retries + 1
+        assert self._metric(
+            "genglossary_llm_tokens_total", **labels, type="completion"
+        ) == completion + 2
+
+    @respx.mock
+    def test_records_client_error_without_retry(self):
+        """Test that a 4xx error is recorded as an error without retries."""
+        client = OpenAICompatibleClient(
+            base_url="http://localhost:8080/v1", model="metrics-4xx-model"
+        )
+        respx.post("http://localhost:8080/v1/chat/completions").mock(
+            return_value=httpx.Response(401, json={"error": "unauthorized"})
+        )
+        labels = {"provider": "openai", "model": "metrics-4xx-model"}
+        errors = self._metric("genglossary_llm_requests_total", **labels, outcome="error")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.generate("hello")
+
+        assert self._metric(
+            "genglossary_llm_requests_total", **labels, outcome="error"
+        ) == errors + 1
+        assert self._metric(
+            "genglossary_llm_retries_total", **labels, reason="server_error"
+        ) == 0
@@ -0,0 +1,128 @@
+"""Tests for streaming glossary export encoders."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from genglossary.db.models import GlossaryTermRow
+from genglossary.models.term import TermOccurrence
+from genglossary.output.export import (
+    EXPORT_FORMATS,
+    get_export_format,
+    iter_export_chunks,
+)
+
+
+def _row(term_name: str, definition: str = "定義", occurrences=None) -> GlossaryTermRow:
+    return GlossaryTermRow(
+        id=1,
+        term_name=term_name,
+        definition=definition,
+        confidence=0.95,
+        occurrences=occurrences or [],
+    )
+
+
+def _export(rows, name: str, aliases_map=None) -> str:
+    chunks = iter_export_chunks(rows, get_export_format(name), aliases_map or {})
+    return b"".join(chunks).decode("utf-8")
+
+
+OCC = TermOccurrence(document_path="doc1.txt", line_number=3, context="量子コンピュータは")
+
+
+class TestGetExportFormat:
+    """Tests for get_export_format."""
+
+    def test_known_formats(self) -> None:
+        assert set(EXPORT_FORMATS) == {"md", "jsonl", "csv", "tsv"}
+        assert get_export_format("jsonl").media_type == "application/x-ndjson"
+
+    def test_rejects_unknown_format(self) -> None:
+        with pytest.raises(ValueError, match="Unknown export format"):
+            get_export_format("xlsx")
+
+
+class TestEncoders:
+    """Tests for the output of each format."""
+
+    def test_markdown(self) -> None:
+        content = _export(
+            [_row("量子コンピュータ", occurrences=[OCC])],
+            "md",
+            {"量子コンピュータ": ["QC", "量子計算機"]},
+        )
+
+        assert content == (
+            "# 用語集\n"
+            "## 量子コンピュータ\n"
+            "**定義**: 定義\n"
+            "**別名**: QC、量子計算機\n"
+            "**信頼度**: 0.95\n"
+            "\n**出現箇所**:\n"
+            "- doc1.txt:3\n"
+            "\n---\n\n"
+        )
+
+    def test_jsonl(self) -> None:
+        content = _export([_row("A", occurrences=[OCC]), _row("B")], "jsonl", {"A": ["a"]})
+
+        records = [json.loads(line) for line in content.splitlines()]
+        assert [r["term_name"] for r in records] == ["A", "B"]
+        assert records[0]["aliases"] == ["a"]
+        assert records[0]["occurrences"] == [
+            {"document_path": "doc1.txt", "line_number": 3, "context": "量子コンピュータは"}
+        ]
+        assert "量子" in content  # not escaped
+
+    @pytest.mark.parametrize("name,delimiter", [("csv", ","), ("tsv", "\t")])
+    def test_table_formats_quote_special_characters(
+        self, name: str, delimiter: str
+    ) -> None:
+        definition = 'カンマ,タブ\t改行\n"引用"'
+
+        content = _export([_row("A", definition, [OCC, OCC])], name)
+
+        rows = list(csv.reader(io.StringIO(content), delimiter=delimiter))
+        assert rows[0] == ["term_name", "definition", "confidence", "aliases", "occurrences"]
+        assert rows[1] == ["A", definition, "0.95", "", "doc1.txt:3; doc1.txt:3"]
+
+    def test_empty_glossary(self) -> None:
+        assert _export([], "md") == "# 用語集\n"
+        assert _export([], "jsonl") == ""
+        assert _export([], "csv").startswith("term_name,")
+
+
+class TestIterExportChunks:
+    """Tests for chunking."""
+
+    def test_chunks_are_bounded_and_lazy(self) -> None:
+        consumed = 0
+
+        def rows():
+            nonlocal consumed
+            for i in range(10_000):
+                consumed += 1
+                yield _row(f"term{i}")
+
+        chunks = iter_export_chunks(rows(), get_export_format("jsonl"), {}, chunk_size=1024)
+        first = next(chunks)
+
+        assert 1024 <= len(first) < 2048
+        assert consumed < 100
+
+    def test_multibyte_text_is_not_split(self) -> None:
+        chunks = list(
+            iter_export_chunks(
+                (_row("用語" * 50) for _ in range(20)),
+                get_export_format("md"),
+                {},
+                chunk_size=100,
+            )
+        )
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            chunk.decode("utf-8")
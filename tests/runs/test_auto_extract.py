@@ -0,0 +1,200 @@
+"""Tests for AutoExtractScheduler."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.document_repository import create_document
+from genglossary.db.pending_extract_repository import (
+    add_pending_extract_documents,
+    list_pending_extract_documents,
+)
+from genglossary.db.schema import initialize_db
+from genglossary.runs.auto_extract import AutoExtractScheduler
+
+
+@pytest.fixture
+def project_db_path(tmp_path: Path) -> str:
+    """Create a project database with five documents."""
+    db_path = str(tmp_path / "test_project.db")
+    conn = get_connection(db_path)
+    initialize_db(conn)
+    with transaction(conn):
+        for i in range(5):
+            create_document(conn, f"doc{i}.md", f"本文{i}", f"hash{i}")
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def manager(project_db_path: str) -> Mock:
+    """RunManager stand-in: no active run, start_run returns run ID 7."""
+    mgr = Mock()
+    mgr.db_path = project_db_path
+    mgr.get_active_run.return_value = None
+    mgr.start_run.return_value = 7
+    return mgr
+
+
+@pytest.fixture
+def make_scheduler(manager: Mock) -> Iterator[Callable[..., AutoExtractScheduler]]:
+    schedulers: list[AutoExtractScheduler] = []
+
+    def factory(**kwargs: float) -> AutoExtractScheduler:
+        scheduler = AutoExtractScheduler(manager, **kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield factory
+    for scheduler in schedulers:
+        scheduler.close()
+
+
+def _queue(db_path: str, document_ids: list[int]) -> None:
+    conn = get_connection(db_path)
+    with transaction(conn):
+        add_pending_extract_documents(conn, document_ids)
+    conn.close()
+
+
+def _pending(db_path: str) -> list[int]:
+    conn = get_connection(db_path)
+    try:
+        return list_pending_extract_documents(conn)
+    finally:
+        conn.close()
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestFlush:
+    """Tests for AutoExtractScheduler.flush."""
+
+    def test_flush_without_pending_documents_does_nothing(
+        self, manager: Mock, make_scheduler
+    ) -> None:
+        """キューが空なら何も開始しない"""
+        assert make_scheduler().flush() is None
+        manager.start_run.assert_not_called()
+
+    def test_flush_starts_one_extract_for_all_pending(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """キュー内の全ドキュメントを1回のExtractにまとめる"""
+        _queue(project_db_path, [1, 2])
+        _queue(project_db_path, [3])
+
+        assert make_scheduler().flush() == 7
+
+        manager.start_run.assert_called_once_with(
+            scope="extract", triggered_by="auto", document_ids=[1, 2, 3]
+        )
+        assert _pending(project_db_path) == []
+
+    def test_documents_queued_during_start_stay_pending(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """開始処理中に追加されたドキュメントは次回に回る"""
+        _queue(project_db_path, [1])
+        manager.start_run.side_effect = lambda **kwargs: _queue(project_db_path, [2]) or 7
+
+        make_scheduler().flush()
+
+        assert manager.start_run.call_args.kwargs["document_ids"] == [1]
+        assert _pending(project_db_path) == [2]
+
+    def test_flush_keeps_documents_while_run_active(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """Run実行中はRuntimeErrorとなり、キューは残る"""
+        _queue(project_db_path, [1])
+        manager.get_active_run.return_value = {"id": 3}
+
+        with pytest.raises(RuntimeError):
+            make_scheduler().flush()
+
+        manager.start_run.assert_not_called()
+        assert _pending(project_db_path) == [1]
+
+
+class TestScheduling:
+    """Tests for the debounce timer."""
+
+    def test_notify_debounces_repeated_uploads(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """静止期間内の連続アップロードは1回のExtractになる"""
+        scheduler = make_scheduler(quiet_seconds=0.3)
+        for document_id in (1, 2, 3):
+            _queue(project_db_path, [document_id])
+            scheduler.notify()
+            time.sleep(0.05)
+        manager.start_run.assert_not_called()
+
+        _wait_until(lambda: manager.start_run.called)
+        _wait_until(lambda: not scheduler.is_scheduled)
+
+        manager.start_run.assert_called_once_with(
+            scope="extract", triggered_by="auto", document_ids=[1, 2, 3]
+        )
+
+    def test_max_delay_bounds_the_wait(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """アップロードが続いても最大待ち時間で開始する"""
+        scheduler = make_scheduler(quiet_seconds=60, max_delay_seconds=0.1)
+        _queue(project_db_path, [1])
+        scheduler.notify()
+
+        _wait_until(lambda: manager.start_run.called)
+
+    def test_waits_for_active_run_to_finish(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """Run実行中に追加されたドキュメントはRun終了後に抽出される"""
+        active_checks = iter([{"id": 3}, {"id": 3}])
+        manager.get_active_run.side_effect = lambda: next(active_checks, None)
+        scheduler = make_scheduler(quiet_seconds=0.01, retry_interval=0.02)
+        _queue(project_db_path, [1, 2])
+        scheduler.notify()
+
+        _wait_until(lambda: manager.start_run.called)
+
+        assert manager.get_active_run.call_count == 3
+        manager.start_run.assert_called_once_with(
+            scope="extract", triggered_by="auto", document_ids=[1, 2]
+        )
+
+    def test_resume_extracts_documents_queued_before_restart(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """再起動前にキューに入ったドキュメントをresumeで抽出する"""
+        _queue(project_db_path, [4, 5])
+
+        make_scheduler(quiet_seconds=0.01).resume()
+
+        _wait_until(lambda: manager.start_run.called)
+        assert manager.start_run.call_args.kwargs["document_ids"] == [4, 5]
+
+    def test_close_cancels_scheduled_flush(
+        self, manager: Mock, project_db_path: str, make_scheduler
+    ) -> None:
+        """closeで予定されたExtractを取り消し、キューは残す"""
+        scheduler = make_scheduler(quiet_seconds=0.1)
+        _queue(project_db_path, [1])
+        scheduler.notify()
+        scheduler.close()
+
+        time.sleep(0.3)
+        manager.start_run.assert_not_called()
+        assert _pending(project_db_path) == [1]
@@ -10,6 +10,7 @@ import pytest
 
 from genglossary.db.connection import get_connection
 from genglossary.db.schema import initialize_db
+from genglossary.glossary_reviewer import GlossaryReviewer
 from genglossary.models.glossary import Glossary, GlossaryIssue
 from genglossary.models.term import ClassifiedTerm, Term, TermCategory, TermOccurrence
 from genglossary.runs.executor import ExecutionContext, PipelineExecutor
@@ -57,6 +58,15 @@ def log_callback():
     return callback
 
 
+def _write_docs(root: Path, files: dict[str, str]) -> str:
+    """Create files under root (a CLI doc_root) and return its path."""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return str(root)
+
+
 @pytest.fixture
 def execution_context(cancel_event: Event, log_callback) -> ExecutionContext:
     """Create an ExecutionContext with default settings."""
@@ -190,7 +200,7 @@ class TestPipelineExecutorFull:
                 executor.execute(project_db, "full", context)
 
             # DocumentLoader should not be called when cancelled
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
 
     def test_full_scope_skips_extract_and_loads_terms_from_db(
@@ -331,7 +341,7 @@ class TestPipelineExecutorGenerate:
             executor.execute(project_db, "generate", execution_context)
 
             # DocumentLoader.load_directory should not be called (we load from DB instead)
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
             # TermExtractor should not be called
             mock_extractor.return_value.extract_terms.assert_not_called()
             # Generator should be called
@@ -377,7 +387,7 @@ class TestPipelineExecutorReview:
             executor.execute(project_db, "review", execution_context)
 
             # Earlier stages should not be called
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
             mock_extractor.return_value.extract_terms.assert_not_called()
             mock_generator.return_value.generate.assert_not_called()
 
@@ -476,37 +486,33 @@ class TestPipelineExecutorConfiguration:
         self,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """executorがdoc_rootパラメータを使用することを確認"""
         executor = PipelineExecutor(provider="ollama")
+        doc_root = tmp_path / "custom"
+        doc_root.mkdir()
+        (doc_root / "test.txt").write_text("test")
 
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
              patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
              patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
              patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
 
             # Mock LLM client
             mock_llm_client = MagicMock()
             mock_llm_factory.return_value = mock_llm_client
 
-            # Mock empty DB (force filesystem loading)
-            mock_list_docs.return_value = []
             mock_list_terms.return_value = [{"term_text": "term1"}]
-
-            # Mock components
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/custom/path/test.txt", content="test")
-            ]
             mock_generator.return_value.generate.return_value = Glossary(terms={})
             mock_reviewer.return_value.review.return_value = []
 
-            # Execute with custom doc_root
-            executor.execute(project_db, "full", execution_context, doc_root="/custom/path")
+            # Execute with custom doc_root (empty DB forces filesystem loading)
+            executor.execute(project_db, "full", execution_context, doc_root=str(doc_root))
 
-            # Verify load_directory was called with the custom doc_root
-            mock_loader.return_value.load_directory.assert_called_once_with("/custom/path")
+            # Documents were loaded from the custom doc_root
+            documents = mock_generator.return_value.generate.call_args.args[1]
+            assert [(d.file_path, d.content) for d in documents] == [("test.txt", "test")]
 
     def test_executor_uses_llm_settings(
         self,
@@ -656,80 +662,72 @@ class TestPipelineExecutorDBFirstApproach:
             )
 
             # DocumentLoader.load_directory should NOT be called (DB has documents)
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
     def test_cli_mode_uses_filesystem_when_db_is_empty(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """CLIモード: DBが空でdoc_rootにファイルがある場合はファイルシステムを使用"""
+        from genglossary.db.document_repository import (
+            list_all_documents,
+            list_document_manifest,
+        )
+
+        doc_root = tmp_path / "cli"
+        doc_root.mkdir()
+        (doc_root / "cli_file.txt").write_text("cli content")
+
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
              patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
              patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
-             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms, \
-             patch("genglossary.runs.executor.delete_all_documents") as mock_delete_docs:
+             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
 
             # Mock LLM client
             mock_llm_client = MagicMock()
             mock_llm_factory.return_value = mock_llm_client
 
-            # Mock empty DB
-            mock_list_docs.return_value = []
             mock_list_terms.return_value = [{"term_text": "term1"}]
-
-            # Mock filesystem loading
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/custom/cli/path/cli_file.txt", content="cli content")
-            ]
-
             mock_generator.return_value.generate.return_value = Glossary(terms={})
             mock_reviewer.return_value.review.return_value = []
 
             # Execute with explicit doc_root (CLI mode, empty DB)
             executor.execute(
                 project_db, "full", execution_context,
-                doc_root="/custom/cli/path",
+                doc_root=str(doc_root),
             )
 
-            # list_all_documents should be called first to check DB
-            mock_list_docs.assert_called_once()
-
-            # DocumentLoader.load_directory SHOULD be called (DB was empty)
-            mock_loader.return_value.load_directory.assert_called_once_with("/custom/cli/path")
-
-            # Documents from FS should be saved to DB
-            mock_delete_docs.assert_called_once()
+        # Documents from FS are saved to DB with a manifest entry
+        assert [row["file_name"] for row in list_all_documents(project_db)] == [
+            "cli_file.txt"
+        ]
+        manifest = list_document_manifest(project_db)
+        assert [(row["file_name"], row["size"]) for row in manifest] == [
+            ("cli_file.txt", len("cli content"))
+        ]
 
     def test_raises_error_when_both_db_and_filesystem_are_empty(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """DBもファイルシステムも空の場合はエラーを発生"""
-        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs:
+        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory:
 
             # Mock LLM client
             mock_llm_client = MagicMock()
             mock_llm_factory.return_value = mock_llm_client
 
-            # Mock empty DB
-            mock_list_docs.return_value = []
-
-            # Mock empty filesystem
-            mock_loader.return_value.load_directory.return_value = []
-
-            # Execute should raise RuntimeError
+            # Execute should raise RuntimeError (empty DB and empty directory)
             with pytest.raises(RuntimeError, match="Cannot execute pipeline without documents"):
                 executor.execute(
                     project_db, "full", execution_context,
-                    doc_root="/empty/path",
+                    doc_root=str(tmp_path),
                 )
 
     def test_db_documents_take_priority_over_filesystem(
@@ -765,7 +763,7 @@ class TestPipelineExecutorDBFirstApproach:
             )
 
             # DocumentLoader should NOT be called at all (DB has documents)
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
 
 class TestPipelineExecutorProgressCallback:
@@ -1261,12 +1259,15 @@ class TestPipelineExecutorProgressCallbackIntegration:
                 return []
 
             mock_reviewer_cls.return_value.review.side_effect = capture_review
+            mock_reviewer_cls.return_value.split_into_batches.side_effect = (
+                GlossaryReviewer(llm_client=MagicMock()).split_into_batches
+            )
 
             executor.execute(project_db, "review", context)
 
             # Find logs with step='issues' that were emitted BEFORE review was called
             # The initial update should have current=0, total=batch_count
-            # With 2 terms and default batch_size=20, batch_count=1
+            # With 2 terms and default batch_size=10, batch_count=1
             initial_step_logs = [
                 log for log in logs
                 if log.get("step") == "issues" and log.get("progress_current") == 0
@@ -1430,43 +1431,135 @@ class TestPipelineExecutorDBDocumentsLegacy:
             executor.execute(project_db, "full", execution_context, doc_root=".")
 
             # DocumentLoader.load_directory should NOT be called (DB documents used in GUI mode)
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
     def test_full_scope_uses_filesystem_when_doc_root_is_explicit(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
-        """doc_root が明示的に指定された場合（CLIモード）、ファイルシステムから読み込みDBを上書き"""
-        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
-             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms, \
-             patch("genglossary.runs.executor.delete_all_documents") as mock_delete_docs:
+        """doc_root が明示的に指定された場合（CLIモード）、ファイルシステムから読み込みDBを同期"""
+        from genglossary.db.document_repository import list_all_documents
 
-            # Mock LLM client
-            mock_llm_client = MagicMock()
-            mock_llm_factory.return_value = mock_llm_client
-
-            # Mock filesystem loading
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/custom/path/cli_file.txt", content="cli content")
-            ]
+        doc_root = tmp_path / "docs"
+        doc_root.mkdir()
+        (doc_root / "keep.txt").write_text("keep")
+        (doc_root / "edit.txt").write_text("before")
+        (doc_root / "gone.txt").write_text("gone")
 
+        with patch("genglossary.runs.executor.create_llm_client"), \
+             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
+             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
+             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
             mock_list_terms.return_value = [{"term_text": "term1"}]
             mock_generator.return_value.generate.return_value = Glossary(terms={})
             mock_reviewer.return_value.review.return_value = []
 
-            # Execute full scope with explicit doc_root (CLI mode)
-            executor.execute(project_db, "full", execution_context, doc_root="/custom/path")
+            executor.execute(project_db, "full", execution_context, doc_root=str(doc_root))
+            ids_before = {
+                row["file_name"]: row["id"] for row in list_all_documents(project_db)
+            }
+
+            (doc_root / "edit.txt").write_text("after!")
+            (doc_root / "gone.txt").unlink()
+            (doc_root / "new.txt").write_text("new")
+            executor.execute(project_db, "full", execution_context, doc_root=str(doc_root))
+
+        rows = {row["file_name"]: row for row in list_all_documents(project_db)}
+        assert sorted(rows) == ["edit.txt", "keep.txt", "new.txt"]
+        assert rows["edit.txt"]["content"] == "after!"
+        # Existing documents keep their IDs
+        assert rows["keep.txt"]["id"] == ids_before["keep.txt"]
+        assert rows["edit.txt"]["id"] == ids_before["edit.txt"]
+
+
+class TestPipelineExecutorIncrementalDocuments:
+    """Tests for manifest-based incremental document loading (CLI mode)."""
+
+    @pytest.fixture
+    def doc_root(self, tmp_path: Path) -> Path:
+        root = tmp_path / "docs"
+        root.mkdir()
+        (root / "a.txt").write_text("alpha")
+        (root / "b.md").write_text("beta")
+        return root
+
+    def _load(
+        self,
+        executor: PipelineExecutor,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+        doc_root: Path,
+    ) -> list:
+        return executor._load_documents(project_db, execution_context, str(doc_root))
+
+    def test_unchanged_files_are_not_read_again(
+        self,
+        executor: PipelineExecutor,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+        doc_root: Path,
+    ) -> None:
+        """2回目以降はサイズとmtimeが同じファイルを読み込まない"""
+        from genglossary.document_loader import DocumentLoader
+
+        self._load(executor, project_db, execution_context, doc_root)
+
+        with patch.object(
+            DocumentLoader, "_read_text", wraps=DocumentLoader._read_text
+        ) as read_text:
+            documents = self._load(executor, project_db, execution_context, doc_root)
+
+        read_text.assert_not_called()
+        assert {d.file_path: d.content for d in documents} == {
+            "a.txt": "alpha",
+            "b.md": "beta",
+        }
+
+    def test_touched_file_keeps_document_content(
+        self,
+        executor: PipelineExecutor,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+        doc_root: Path,
+    ) -> None:
+        """内容が同じでmtimeだけ変わったファイルはマニフェストのみ更新"""
+        import os
+
+        from genglossary.db.document_repository import (
+            get_documents_fingerprint,
+            list_document_manifest,
+        )
 
-            # DocumentLoader.load_directory SHOULD be called with custom path
-            mock_loader.return_value.load_directory.assert_called_once_with("/custom/path")
+        self._load(executor, project_db, execution_context, doc_root)
+        fingerprint = get_documents_fingerprint(project_db)
+        os.utime(doc_root / "a.txt", ns=(0, 1_000_000_000))
 
-            # Existing documents should be cleared before adding new ones
-            mock_delete_docs.assert_called_once()
+        self._load(executor, project_db, execution_context, doc_root)
+
+        assert get_documents_fingerprint(project_db) == fingerprint
+        manifest = {row["file_name"]: row for row in list_document_manifest(project_db)}
+        assert manifest["a.txt"]["mtime_ns"] == 1_000_000_000
+
+    def test_gui_documents_are_kept_during_sync(
+        self,
+        executor: PipelineExecutor,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+        doc_root: Path,
+    ) -> None:
+        """マニフェストのないドキュメント（GUIでアップロード）は同期で削除しない"""
+        from genglossary.db.document_repository import create_document
+
+        self._load(executor, project_db, execution_context, doc_root)
+        create_document(project_db, "uploaded.md", "uploaded", "hash")
+        (doc_root / "b.md").unlink()
+
+        documents = self._load(executor, project_db, execution_context, doc_root)
+
+        assert sorted(d.file_path for d in documents) == ["a.txt", "uploaded.md"]
 
 
 class TestPipelineExecutorBugFixes:
@@ -1532,6 +1625,7 @@ class TestPipelineExecutorBugFixes:
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """Bug B: LLM が重複用語を返してもパイプラインがクラッシュしない
 
@@ -1541,14 +1635,10 @@ class TestPipelineExecutorBugFixes:
         - 重複は無視され、ユニークな用語のみ保存される
         """
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.TermExtractor") as mock_extractor, \
-             patch("genglossary.runs.executor.delete_all_documents"):
+             patch("genglossary.runs.executor.TermExtractor") as mock_extractor:
 
             mock_llm_factory.return_value = MagicMock()
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/test/path/test.txt", content="test content")
-            ]
+            doc_root = _write_docs(tmp_path / "docs", {"test.txt": "test content"})
 
             # LLM returns duplicate terms
             mock_extractor.return_value.extract_terms.return_value = [
@@ -1558,7 +1648,7 @@ class TestPipelineExecutorBugFixes:
             ]
 
             # Should NOT raise IntegrityError (using extract scope directly)
-            executor.execute(project_db, "extract", execution_context, doc_root="/test/path")
+            executor.execute(project_db, "extract", execution_context, doc_root=doc_root)
 
             # Verify only unique terms were saved (no crash)
             from genglossary.db.term_repository import list_all_terms
@@ -1574,6 +1664,7 @@ class TestPipelineExecutorBugFixes:
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """Bug C: 異なるディレクトリの同名ファイルでもクラッシュしない
 
@@ -1583,29 +1674,27 @@ class TestPipelineExecutorBugFixes:
         - ファイル名に相対パスを含めるか、衝突回避処理を行う
         """
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
              patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
              patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
              patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
 
             mock_llm_factory.return_value = MagicMock()
-
-            # DB is empty (CLI mode)
-            mock_list_docs.return_value = []
             mock_list_terms.return_value = [{"term_text": "term1"}]
 
             # Multiple files with same basename from different directories
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/test/path/docs/README.md", content="docs readme content"),
-                MagicMock(file_path="/test/path/examples/README.md", content="examples readme content"),
-            ]
+            doc_root = _write_docs(
+                tmp_path / "docs",
+                {
+                    "docs/README.md": "docs readme content",
+                    "examples/README.md": "examples readme content",
+                },
+            )
 
             mock_generator.return_value.generate.return_value = Glossary(terms={})
             mock_reviewer.return_value.review.return_value = []
 
             # Should NOT raise IntegrityError
-            executor.execute(project_db, "full", execution_context, doc_root="/test/path")
+            executor.execute(project_db, "full", execution_context, doc_root=doc_root)
 
             # Verify both documents were saved (no crash)
             from genglossary.db.document_repository import list_all_documents
@@ -1822,17 +1911,14 @@ class TestDuplicateFilteringBeforeGenerate:
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """extract scopeで重複用語がユニークに保存されることを確認"""
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.TermExtractor") as mock_extractor, \
-             patch("genglossary.runs.executor.delete_all_documents"):
+             patch("genglossary.runs.executor.TermExtractor") as mock_extractor:
 
             mock_llm_factory.return_value = MagicMock()
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(file_path="/test/path/test.txt", content="test content")
-            ]
+            doc_root = _write_docs(tmp_path / "docs", {"test.txt": "test content"})
 
             # LLM returns duplicate terms
             mock_extractor.return_value.extract_terms.return_value = [
@@ -1841,7 +1927,7 @@ class TestDuplicateFilteringBeforeGenerate:
                 ClassifiedTerm(term="unique_term", category=TermCategory.TECHNICAL_TERM),
             ]
 
-            executor.execute(project_db, "extract", execution_context, doc_root="/test/path")
+            executor.execute(project_db, "extract", execution_context, doc_root=doc_root)
 
             # Verify only unique terms were saved in DB
             from genglossary.db.term_repository import list_all_terms
@@ -1975,7 +2061,7 @@ class TestPipelineExecutorWithContext:
                 executor.execute(project_db, "full", context, doc_root="/test/path")
 
             # DocumentLoader should not be called when cancelled
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
     def test_executor_no_longer_has_instance_state_after_context(
         self,
@@ -2026,31 +2112,33 @@ class TestPipelineExecutorThreadSafety:
         def run_with_context(context: ExecutionContext, db_path: str) -> None:
             conn = get_connection(db_path)
             try:
-                with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-                     patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
-                     patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-                     patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
-                     patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
-
-                    mock_llm_factory.return_value = MagicMock()
-                    mock_list_docs.return_value = [{"file_name": "test.txt", "content": "test"}]
-                    mock_list_terms.return_value = [{"term_text": "term1"}]
-                    mock_generator.return_value.generate.return_value = Glossary(terms={})
-                    mock_reviewer.return_value.review.return_value = []
-
-                    executor.execute(conn, "full", context)
+                executor.execute(conn, "full", context)
             finally:
                 conn.close()
 
-        # Run two executions concurrently with the same executor
-        thread_1 = Thread(target=run_with_context, args=(context_1, project_db_path))
-        thread_2 = Thread(target=run_with_context, args=(context_2, project_db_path))
+        # Patch once for both threads: patching the same attributes from
+        # two threads at once can restore a mock instead of the original
+        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
+             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
+             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
+             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
+             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
+
+            mock_llm_factory.return_value = MagicMock()
+            mock_list_docs.return_value = [{"file_name": "test.txt", "content": "test"}]
+            mock_list_terms.return_value = [{"term_text": "term1"}]
+            mock_generator.return_value.generate.return_value = Glossary(terms={})
+            mock_reviewer.return_value.review.return_value = []
 
-        thread_1.start()
-        thread_2.start()
+            # Run two executions concurrently with the same executor
+            thread_1 = Thread(target=run_with_context, args=(context_1, project_db_path))
+            thread_2 = Thread(target=run_with_context, args=(context_2, project_db_path))
 
-        thread_1.join(timeout=10)
-        thread_2.join(timeout=10)
+            thread_1.start()
+            thread_2.start()
+
+            thread_1.join(timeout=10)
+            thread_2.join(timeout=10)
 
         # Verify logs are separated by run_id
         assert len(logs_1) > 0, "Context 1 should have logs"
@@ -2096,7 +2184,7 @@ class TestCancellableDecorator:
                 executor._execute_full(project_db, context, doc_root="/test/path")
 
             # DocumentLoader should NOT be called (decorator raised early)
-            mock_loader.return_value.load_directory.assert_not_called()
+            mock_loader.assert_not_called()
 
     def test_cancellable_decorator_allows_execution_when_not_cancelled(
         self,
@@ -2164,144 +2252,95 @@ class TestDocumentFilePathStorage:
     - Consistency: API/schema expects file_name, not full path
     """
 
-    def test_documents_stored_with_relative_path_not_absolute(
+    def _run_full(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
-    ) -> None:
-        """ドキュメントは絶対パスではなく相対パスで保存される
-
-        DocumentLoader は絶対パスを返すが、DB保存時に doc_root からの
-        相対パスに変換される必要がある。
-        """
+        doc_root: str,
+    ) -> list[str]:
         with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
              patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
              patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
              patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
 
             mock_llm_factory.return_value = MagicMock()
-
-            # DB is empty (CLI mode)
-            mock_list_docs.return_value = []
             mock_list_terms.return_value = [{"term_text": "term1"}]
-
-            # DocumentLoader returns absolute paths (simulating real behavior)
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(
-                    file_path="/home/user/project/docs/chapter1/intro.md",
-                    content="intro content"
-                ),
-                MagicMock(
-                    file_path="/home/user/project/docs/chapter2/summary.md",
-                    content="summary content"
-                ),
-            ]
-
             mock_generator.return_value.generate.return_value = Glossary(terms={})
             mock_reviewer.return_value.review.return_value = []
 
-            # Execute with doc_root=/home/user/project/docs
-            executor.execute(
-                project_db, "full", execution_context,
-                doc_root="/home/user/project/docs"
-            )
+            executor.execute(project_db, "full", execution_context, doc_root=doc_root)
 
-            # Verify stored file names are relative paths, not absolute
-            from genglossary.db.document_repository import list_all_documents
-            docs = list_all_documents(project_db)
-            file_names = [row["file_name"] for row in docs]
-
-            # Should be relative paths from doc_root
-            assert "chapter1/intro.md" in file_names
-            assert "chapter2/summary.md" in file_names
+        from genglossary.db.document_repository import list_all_documents
+        return [row["file_name"] for row in list_all_documents(project_db)]
 
-            # Should NOT contain absolute paths
-            for file_name in file_names:
-                assert not file_name.startswith("/"), \
-                    f"file_name should not be absolute path: {file_name}"
-
-    def test_relative_path_preserves_directory_structure(
+    def test_documents_stored_with_relative_path_not_absolute(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
-        """相対パスがディレクトリ構造を保持する（同名ファイル衝突回避）"""
-        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
-             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
-             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
+        """ドキュメントは絶対パスではなく doc_root からの相対パスで保存される"""
+        doc_root = _write_docs(
+            tmp_path / "docs",
+            {"chapter1/intro.md": "intro content", "chapter2/summary.md": "summary content"},
+        )
 
-            mock_llm_factory.return_value = MagicMock()
-            mock_list_docs.return_value = []
-            mock_list_terms.return_value = [{"term_text": "term1"}]
+        file_names = self._run_full(executor, project_db, execution_context, doc_root)
 
-            # Same basename in different directories (absolute paths)
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(
-                    file_path="/project/docs/README.md",
-                    content="docs readme"
-                ),
-                MagicMock(
-                    file_path="/project/examples/README.md",
-                    content="examples readme"
-                ),
-            ]
+        # Should be relative paths from doc_root
+        assert "chapter1/intro.md" in file_names
+        assert "chapter2/summary.md" in file_names
 
-            mock_generator.return_value.generate.return_value = Glossary(terms={})
-            mock_reviewer.return_value.review.return_value = []
+        # Should NOT contain absolute paths
+        for file_name in file_names:
+            assert not file_name.startswith("/"), \
+                f"file_name should not be absolute path: {file_name}"
 
-            # Execute with doc_root=/project
-            executor.execute(
-                project_db, "full", execution_context,
-                doc_root="/project"
-            )
+    def test_relative_path_preserves_directory_structure(
+        self,
+        executor: PipelineExecutor,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+        tmp_path: Path,
+    ) -> None:
+        """相対パスがディレクトリ構造を保持する（同名ファイル衝突回避）"""
+        doc_root = _write_docs(
+            tmp_path / "project",
+            {"docs/README.md": "docs readme", "examples/README.md": "examples readme"},
+        )
 
-            # Verify both files saved with distinct relative paths
-            from genglossary.db.document_repository import list_all_documents
-            docs = list_all_documents(project_db)
-            file_names = [row["file_name"] for row in docs]
+        file_names = self._run_full(executor, project_db, execution_context, doc_root)
 
-            assert len(file_names) == 2
-            assert "docs/README.md" in file_names
-            assert "examples/README.md" in file_names
+        assert len(file_names) == 2
+        assert "docs/README.md" in file_names
+        assert "examples/README.md" in file_names
 
-    def test_files_outside_doc_root_raise_value_error(
+    def test_files_outside_doc_root_are_rejected(
         self,
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
-        """doc_root 外のファイルは ValueError で拒否される
+        """doc_root 外を指すファイルは拒否される
 
         セキュリティ上の理由から、doc_root の外部にあるファイルは
         処理対象にしてはならない。
         """
-        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs:
+        from genglossary.exceptions import PathTraversalError
 
-            mock_llm_factory.return_value = MagicMock()
-            mock_list_docs.return_value = []
+        outside = tmp_path / "outside.txt"
+        outside.write_text("root:x:0:0:root:/root:/bin/bash")
+        doc_root = tmp_path / "docs"
+        doc_root.mkdir()
+        (doc_root / "passwd.txt").symlink_to(outside)
 
-            # File outside doc_root (doc_root=/project/docs, file=/etc/passwd)
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(
-                    file_path="/etc/passwd",
-                    content="root:x:0:0:root:/root:/bin/bash"
-                ),
-            ]
-
-            # Should raise ValueError for file outside doc_root
-            with pytest.raises(ValueError, match="outside root directory"):
+        with patch("genglossary.runs.executor.create_llm_client"):
+            with pytest.raises(PathTraversalError):
                 executor.execute(
-                    project_db, "full", execution_context,
-                    doc_root="/project/docs"
+                    project_db, "full", execution_context, doc_root=str(doc_root)
                 )
 
     def test_relative_path_stored_in_posix_format(
@@ -2309,49 +2348,19 @@ class TestDocumentFilePathStorage:
         executor: PipelineExecutor,
         project_db: sqlite3.Connection,
         execution_context: ExecutionContext,
+        tmp_path: Path,
     ) -> None:
         """相対パスは POSIX 形式（/）で保存される
 
         Windows 環境でも、DB には / を使ったパスで保存することで
         クロスプラットフォームでの互換性を確保する。
         """
-        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
-             patch("genglossary.runs.executor.DocumentLoader") as mock_loader, \
-             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
-             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
-             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
-             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
+        doc_root = _write_docs(tmp_path / "docs", {"subdir/file.md": "content"})
 
-            mock_llm_factory.return_value = MagicMock()
-            mock_list_docs.return_value = []
-            mock_list_terms.return_value = [{"term_text": "term1"}]
-
-            # Absolute paths (could have Windows-style separators internally)
-            mock_loader.return_value.load_directory.return_value = [
-                MagicMock(
-                    file_path="/project/docs/subdir/file.md",
-                    content="content"
-                ),
-            ]
-
-            mock_generator.return_value.generate.return_value = Glossary(terms={})
-            mock_reviewer.return_value.review.return_value = []
-
-            executor.execute(
-                project_db, "full", execution_context,
-                doc_root="/project/docs"
-            )
-
-            # Verify paths use forward slashes (POSIX format)
-            from genglossary.db.document_repository import list_all_documents
-            docs = list_all_documents(project_db)
+        file_names = self._run_full(executor, project_db, execution_context, doc_root)
 
-            for row in docs:
-                file_name = row["file_name"]
-                assert "\\" not in file_name, \
-                    f"file_name should use / not \\: {file_name}"
-                # Should be: subdir/file.md
-                assert file_name == "subdir/file.md"
+        # Should be: subdir/file.md
+        assert file_names == ["subdir/file.md"]
 
 
 class TestPipelineExecutorCancelEventPropagation:
@@ -2431,6 +2440,54 @@ class TestPipelineExecutorCancelEventPropagation:
             assert "cancel_event" in call_kwargs
             assert call_kwargs["cancel_event"] is cancel_event
 
+    def test_llm_concurrency_passed_to_reviewer(
+        self,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+    ) -> None:
+        """llm_concurrency が GlossaryReviewer の max_concurrency に渡されることを確認"""
+        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
+             patch("genglossary.runs.executor.list_all_provisional") as mock_list_prov, \
+             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer_cls:
+
+            mock_llm_factory.return_value = MagicMock()
+            mock_list_prov.return_value = [
+                {"term_name": "term1", "definition": "def1", "confidence": 0.8, "occurrences": []}
+            ]
+            mock_reviewer_cls.return_value.review.return_value = []
+
+            executor = PipelineExecutor(llm_concurrency=4)
+            executor.execute(project_db, "review", execution_context)
+
+            assert mock_reviewer_cls.call_args.kwargs["max_concurrency"] == 4
+
+    def test_llm_concurrency_passed_to_refiner(
+        self,
+        project_db: sqlite3.Connection,
+        execution_context: ExecutionContext,
+    ) -> None:
+        """llm_concurrency が GlossaryRefiner の max_concurrency に渡されることを確認"""
+        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
+             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
+             patch("genglossary.runs.executor.list_all_provisional") as mock_list_prov, \
+             patch("genglossary.runs.executor.list_all_issues") as mock_list_issues, \
+             patch("genglossary.runs.executor.GlossaryRefiner") as mock_refiner_cls:
+
+            mock_llm_factory.return_value = MagicMock()
+            mock_list_docs.return_value = [{"file_name": "test.txt", "content": "test"}]
+            mock_list_prov.return_value = [
+                {"term_name": "term1", "definition": "def1", "confidence": 0.8, "occurrences": []}
+            ]
+            mock_list_issues.return_value = [
+                {"term_name": "term1", "issue_type": "unclear", "description": "Issue", "should_exclude": 0, "exclusion_reason": None}
+            ]
+            mock_refiner_cls.return_value.refine.return_value = Glossary()
+
+            executor = PipelineExecutor(llm_concurrency=4)
+            executor.execute(project_db, "refine", execution_context)
+
+            assert mock_refiner_cls.call_args.kwargs["max_concurrency"] == 4
+
     def test_cancel_event_passed_to_refiner(
         self,
         executor: PipelineExecutor,
@@ -3060,3 +3117,94 @@ class TestExtractWithDocumentIds:
             # backup/restore should NOT be called for incremental extract
             mock_backup.assert_not_called()
             mock_restore.assert_not_called()
+
+
+class TestCreateDocumentSearch:
+    """Tests for full-text document search used by generate/refine."""
+
+    def test_search_returns_db_documents_containing_terms(
+        self, project_db: sqlite3.Connection
+    ) -> None:
+        """DBのドキュメントと一致する場合は全文検索関数を返す"""
+        from genglossary.db.document_repository import create_document
+        from genglossary.models.document import Document
+
+        create_document(project_db, "a.md", "量子コンピュータの研究", "h1")
+        create_document(project_db, "b.md", "古典計算機の歴史", "h2")
+        documents = [
+            Document(file_path="a.md", content="量子コンピュータの研究"),
+            Document(file_path="b.md", content="古典計算機の歴史"),
+        ]
+
+        document_search = PipelineExecutor._create_document_search(
+            project_db, documents
+        )
+
+        assert document_search is not None
+        assert document_search(["コンピュータ"]) == {"a.md"}
+
+    def test_returns_none_for_filesystem_documents(
+        self, project_db: sqlite3.Connection
+    ) -> None:
+        """ファイルシステム由来（絶対パス）のドキュメントでは検索を使わない"""
+        from genglossary.db.document_repository import create_document
+        from genglossary.models.document import Document
+
+        create_document(project_db, "a.md", "量子コンピュータ", "h1")
+        documents = [Document(file_path="/abs/docs/a.md", content="量子コンピュータ")]
+
+        assert PipelineExecutor._create_document_search(project_db, documents) is None
+
+
+class TestPipelineExecutorProfile:
+    """Tests for run profiling in PipelineExecutor."""
+
+    def test_profile_records_steps_and_detaches_observer(
+        self,
+        project_db: sqlite3.Connection,
+        cancel_event: Event,
+        log_callback,
+    ) -> None:
+        """ステップ時間とDB書き込み時間を記録し、終了後にLLMオブザーバーを外す"""
+        from genglossary.runs.profile import RunProfiler
+
+        profiler = RunProfiler()
+        context = ExecutionContext(
+            run_id=1,
+            log_callback=log_callback,
+            cancel_event=cancel_event,
+            profiler=profiler,
+        )
+        observers = []
+
+        with patch("genglossary.runs.executor.create_llm_client") as mock_llm_factory, \
+             patch("genglossary.runs.executor.GlossaryGenerator") as mock_generator, \
+             patch("genglossary.runs.executor.GlossaryReviewer") as mock_reviewer, \
+             patch("genglossary.runs.executor.list_all_documents") as mock_list_docs, \
+             patch("genglossary.runs.executor.list_all_terms") as mock_list_terms:
+            mock_llm_client = MagicMock()
+            mock_llm_factory.return_value = mock_llm_client
+            mock_list_docs.return_value = [{"file_name": "test.txt", "content": "test content"}]
+            mock_list_terms.return_value = [{"term_text": "term1"}]
+
+            def generate(*args, **kwargs) -> Glossary:
+                observers.append(mock_llm_client.call_observer)
+                return Glossary(terms={
+                    "term1": Term(name="term1", definition="定義", confidence=0.9),
+                })
+
+            mock_generator.return_value.generate.side_effect = generate
+            mock_reviewer.return_value.review.return_value = []
+
+            executor = PipelineExecutor()
+            executor.execute(project_db, "full", context)
+
+        assert observers == [profiler]
+        assert mock_llm_client.call_observer is None
+        profile = profiler.snapshot()
+        assert list(profile.step_seconds) == [
+            "load_documents", "generate", "review", "refine",
+        ]
+        assert profile.db_write_seconds > 0
+        # finish() was called: the wall time no longer grows
+        assert profiler.snapshot().wall_seconds == profile.wall_seconds
@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from genglossary.db.connection import get_connection
+from genglossary.db.run_profile_repository import get_run_profile
 from genglossary.db.runs_repository import create_run, get_run
 from genglossary.db.schema import initialize_db
 from genglossary.runs.manager import RunManager
@@ -2504,4 +2505,92 @@ class TestRunManagerDocumentIds:
 
             mock_executor.return_value.execute.assert_called_once()
             call_kwargs = mock_executor.return_value.execute.call_args
-            assert call_kwargs.kwargs.get("document_ids") is None
\ No newline at end of file
+            assert call_kwargs.kwargs.get("document_ids") is None
+
+class TestRunManagerMetrics:
+    """Tests for run gauges and counters."""
+
+    def test_run_updates_active_gauge_and_finished_counter(
+        self, manager: RunManager
+    ) -> None:
+        """実行中はactiveゲージが増え、完了時にfinishedカウンタが増える"""
+        from genglossary.metrics import REGISTRY
+
+        def active() -> float:
+            return REGISTRY.get_sample_value("genglossary_runs_active") or 0.0
+
+        def finished() -> float:
+            return REGISTRY.get_sample_value(
+                "genglossary_runs_finished_total",
+                {"scope": "extract", "status": "completed"},
+            ) or 0.0
+
+        started = Event()
+        release = Event()
+
+        def execute(*args, **kwargs) -> None:
+            started.set()
+            release.wait(timeout=5)
+
+        active_before = active()
+        finished_before = finished()
+        with patch("genglossary.runs.manager.PipelineExecutor") as mock_executor:
+            mock_executor.return_value.execute.side_effect = execute
+            manager.start_run(scope="extract")
+            assert started.wait(timeout=5)
+            assert active() == active_before + 1
+
+            release.set()
+            if manager._thread:
+                manager._thread.join(timeout=5)
+
+        assert active() == active_before
+        assert finished() == finished_before + 1
+
+
+class TestRunManagerProfile:
+    """Tests for persisting run profiles."""
+
+    def test_profile_is_saved_after_run(
+        self, manager: RunManager, project_db: sqlite3.Connection
+    ) -> None:
+        """Run終了後にプロファイルが保存される"""
+        with patch("genglossary.runs.manager.PipelineExecutor") as mock_executor:
+            mock_executor.return_value.execute.return_value = None
+            run_id = manager.start_run(scope="extract")
+            if manager._thread:
+                manager._thread.join(timeout=5)
+
+        profile = get_run_profile(project_db, run_id)
+        assert profile is not None
+        assert profile["llm_provider"] == manager.llm_provider
+        assert profile["wall_seconds"] >= 0
+
+    def test_profile_is_saved_for_failed_run(
+        self, manager: RunManager, project_db: sqlite3.Connection
+    ) -> None:
+        """失敗したRunのプロファイルも保存される"""
+        with patch("genglossary.runs.manager.PipelineExecutor") as mock_executor:
+            mock_executor.return_value.execute.side_effect = RuntimeError("boom")
+            run_id = manager.start_run(scope="full")
+            if manager._thread:
+                manager._thread.join(timeout=5)
+
+        assert get_run(project_db, run_id)["status"] == "failed"
+        assert get_run_profile(project_db, run_id) is not None
+
+    def test_profile_save_error_does_not_fail_run(
+        self, manager: RunManager, project_db: sqlite3.Connection
+    ) -> None:
+        """プロファイル保存の失敗はRunの状態に影響しない"""
+        with patch("genglossary.runs.manager.PipelineExecutor") as mock_executor, \
+             patch(
+                 "genglossary.runs.manager.save_run_profile",
+                 side_effect=sqlite3.OperationalError("disk I/O error"),
+             ):
+            mock_executor.return_value.execute.return_value = None
+            run_id = manager.start_run(scope="extract")
+            if manager._thread:
+                manager._thread.join(timeout=5)
+
+        assert get_run(project_db, run_id)["status"] == "completed"
@@ -0,0 +1,116 @@
+"""Tests for run performance profiling."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from genglossary.runs.profile import RunProfile, RunProfiler
+
+
+class TestRunProfiler:
+    """Tests for RunProfiler."""
+
+    def test_empty_profile(self) -> None:
+        """LLM呼び出しがなければレイテンシはNone"""
+        profile = RunProfiler().snapshot()
+
+        assert profile.llm_calls == 0
+        assert profile.llm_latency_mean_ms is None
+        assert profile.llm_latency_p95_ms is None
+        assert profile.step_seconds == {}
+
+    def test_steps_accumulate_in_order(self) -> None:
+        """ステップ時間は実行順に記録され、同名ステップは合算される"""
+        profiler = RunProfiler()
+
+        with profiler.step("generate"):
+            time.sleep(0.01)
+        with profiler.step("review"):
+            pass
+        with profiler.step("generate"):
+            time.sleep(0.01)
+
+        profile = profiler.snapshot()
+        assert list(profile.step_seconds) == ["generate", "review"]
+        assert profile.step_seconds["generate"] >= 0.02
+
+    def test_step_is_recorded_when_it_raises(self) -> None:
+        """例外で終了したステップも記録される"""
+        profiler = RunProfiler()
+
+        with pytest.raises(RuntimeError):
+            with profiler.step("extract"):
+                raise RuntimeError("boom")
+
+        assert "extract" in profiler.snapshot().step_seconds
+
+    def test_llm_statistics(self) -> None:
+        """LLM呼び出し数・失敗・文字数・平均/p95レイテンシを集計する"""
+        profiler = RunProfiler()
+        for seconds in (0.1, 0.2, 0.3, 0.4):
+            profiler.record_llm_call(seconds, prompt_chars=10, response_chars=5, failed=False)
+        profiler.record_llm_call(1.0, prompt_chars=10, response_chars=0, failed=True)
+        profiler.record_llm_retry("server_error")
+        profiler.record_llm_retry("invalid_json")
+        profiler.record_json_parse_failure()
+
+        profile = profiler.snapshot()
+        assert profile.llm_calls == 5
+        assert profile.llm_failures == 1
+        assert profile.llm_retries == 2
+        assert profile.llm_retry_reasons == {"invalid_json": 1, "server_error": 1}
+        assert profile.json_parse_failures == 1
+        assert profile.prompt_chars == 50
+        assert profile.response_chars == 20
+        assert profile.llm_latency_mean_ms == pytest.approx(400.0)
+        assert profile.llm_latency_p95_ms == pytest.approx(1000.0)
+
+    def test_db_write_time(self) -> None:
+        """DB書き込み時間を合計する"""
+        profiler = RunProfiler()
+
+        with profiler.db_write():
+            time.sleep(0.01)
+
+        assert profiler.snapshot().db_write_seconds >= 0.01
+
+    def test_finish_freezes_wall_time(self) -> None:
+        """finish後は実行時間が増えない"""
+        profiler = RunProfiler()
+        profiler.finish()
+        first = profiler.snapshot().wall_seconds
+        time.sleep(0.01)
+        profiler.finish()
+
+        assert profiler.snapshot().wall_seconds == first
+
+    def test_concurrent_recording(self) -> None:
+        """複数スレッドからの記録を取りこぼさない"""
+        profiler = RunProfiler()
+
+        def record(_: int) -> None:
+            for _ in range(100):
+                profiler.record_llm_call(0.01, prompt_chars=1, response_chars=1, failed=False)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(record, range(8)))
+
+        profile = profiler.snapshot()
+        assert profile.llm_calls == 800
+        assert profile.prompt_chars == 800
+
+
+class TestRunProfile:
+    """Tests for RunProfile."""
+
+    def test_to_dict_lists_steps(self) -> None:
+        profile = RunProfile(wall_seconds=2.0, step_seconds={"generate": 1.5, "review": 0.5})
+
+        data = profile.to_dict()
+
+        assert data["steps"] == [
+            {"step": "generate", "wall_seconds": 1.5},
+            {"step": "review", "wall_seconds": 0.5},
+        ]
+        assert data["wall_seconds"] == 2.0
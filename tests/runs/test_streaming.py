@@ -0,0 +1,292 @@
+"""Tests for the streaming generate → review → refine pipeline."""
+
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Event, Lock
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.document_repository import create_document
+from genglossary.db.issue_repository import list_all_issues
+from genglossary.db.provisional_repository import list_all_provisional
+from genglossary.db.refined_repository import list_all_refined
+from genglossary.db.schema import initialize_db
+from genglossary.db.term_repository import create_term
+from genglossary.glossary_generator import DefinitionResponse, GlossaryGenerator
+from genglossary.glossary_refiner import GlossaryRefiner, RefinementResponse
+from genglossary.glossary_reviewer import GlossaryReviewer, ReviewResponse
+from genglossary.models.document import Document
+from genglossary.runs.executor import (
+    ExecutionContext,
+    PipelineCancelledException,
+    PipelineExecutor,
+)
+from genglossary.runs.streaming import StreamingPipeline
+
+TERMS = [f"用語{i:02d}" for i in range(12)]
+
+
+class FakeLLM:
+    """Deterministic stand-in for an LLM client.
+
+    Definitions and refinements are derived from the prompt, and review
+    reports the issues configured per term, so staged and streaming runs
+    can be compared exactly.
+    """
+
+    def __init__(
+        self,
+        issues: dict[str, list[dict]] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.issues = issues or {}
+        self.delay = delay
+        self.lock = Lock()
+        self.calls: list[tuple[str, float]] = []
+
+    def generate_structured(self, prompt: str, response_model: type[BaseModel]):
+        with self.lock:
+            self.calls.append((response_model.__name__, time.perf_counter()))
+        time.sleep(self.delay)
+        if response_model is DefinitionResponse:
+            term = re.search(r"用語: <term>(.+?)</term>", prompt).group(1)  # type: ignore[union-attr]
+            return response_model(definition=f"{term}の定義", confidence=0.8)
+        if response_model is ReviewResponse:
+            names = re.findall(r"(?:^|<glossary>)- (\S+): ", prompt, re.MULTILINE)
+            return response_model(
+                issues=[
+                    {"term": name, **issue}
+                    for name in names
+                    for issue in self.issues.get(name, [])
+                ]
+            )
+        if response_model is RefinementResponse:
+            current = re.search(r"現在の定義: (.+)", prompt).group(1)  # type: ignore[union-attr]
+            return response_model(refined_definition=f"{current}+改善", confidence=0.9)
+        raise AssertionError(f"unexpected response model {response_model}")
+
+
+def _unclear(description: str = "曖昧") -> dict:
+    return {"issue_type": "unclear", "description": description}
+
+
+def _exclude() -> dict:
+    return {
+        "issue_type": "unnecessary",
+        "description": "一般語",
+        "should_exclude": True,
+        "exclusion_reason": "一般語",
+    }
+
+
+SAMPLE_ISSUES = {
+    "用語01": [_unclear()],
+    "用語03": [_unclear("一回目"), _unclear("二回目")],
+    "用語04": [_exclude()],
+    "用語07": [_unclear()],
+    "用語11": [_unclear()],
+}
+
+
+def _documents() -> list[Document]:
+    return [
+        Document(
+            file_path="doc.md",
+            content="\n".join(f"{term}は重要な概念である。" for term in TERMS),
+        )
+    ]
+
+
+def _pipeline(llm: FakeLLM, max_concurrency: int = 2) -> StreamingPipeline:
+    return StreamingPipeline(
+        generator=GlossaryGenerator(llm_client=llm),  # type: ignore[arg-type]
+        reviewer=GlossaryReviewer(llm_client=llm, batch_size=3),  # type: ignore[arg-type]
+        refiner=GlossaryRefiner(llm_client=llm),  # type: ignore[arg-type]
+        max_concurrency=max_concurrency,
+    )
+
+
+def _run(pipeline: StreamingPipeline, **kwargs):
+    documents = _documents()
+    return pipeline.run(
+        TERMS,
+        documents,
+        pipeline.refiner.build_context_index(documents),
+        **kwargs,
+    )
+
+
+class TestStreamingPipeline:
+    """Tests for StreamingPipeline."""
+
+    def test_max_concurrency_validation(self) -> None:
+        """Test that max_concurrency=0 raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            _pipeline(FakeLLM(), max_concurrency=0)
+
+    @pytest.mark.parametrize("max_concurrency", [1, 3])
+    def test_matches_staged_execution(self, max_concurrency: int) -> None:
+        """Test that results equal generate, review and refine run in sequence."""
+        documents = _documents()
+        llm = FakeLLM(SAMPLE_ISSUES)
+        provisional = GlossaryGenerator(llm_client=llm).generate(TERMS, documents)  # type: ignore[arg-type]
+        issues = GlossaryReviewer(llm_client=llm, batch_size=3).review(provisional)  # type: ignore[arg-type]
+        assert issues is not None
+        refined = GlossaryRefiner(llm_client=llm).refine(provisional, issues, documents)  # type: ignore[arg-type]
+
+        result = _run(_pipeline(FakeLLM(SAMPLE_ISSUES), max_concurrency))
+
+        assert result is not None
+        assert result.provisional.terms == provisional.terms
+        assert result.issues == issues
+        assert result.refined.terms == refined.terms
+        assert list(result.refined.terms) == list(refined.terms)
+        assert result.refined.terms["用語03"].definition == "用語03の定義+改善+改善"
+        assert "用語04" not in result.refined.terms
+
+    def test_review_starts_before_generation_finishes(self) -> None:
+        """Test that stages overlap instead of running as barriers."""
+        llm = FakeLLM(SAMPLE_ISSUES, delay=0.01)
+
+        assert _run(_pipeline(llm)) is not None
+
+        kinds = [kind for kind, _ in sorted(llm.calls, key=lambda c: c[1])]
+        last_definition = max(
+            i for i, kind in enumerate(kinds) if kind == "DefinitionResponse"
+        )
+        assert kinds.index("ReviewResponse") < last_definition
+        assert kinds.index("RefinementResponse") < last_definition
+
+    def test_reports_progress_per_stage(self) -> None:
+        """Test that each stage reports progress up to its total."""
+        generate_cb = MagicMock()
+        review_cb = MagicMock()
+        refine_cb = MagicMock()
+        generated_cb = MagicMock()
+
+        _run(
+            _pipeline(FakeLLM(SAMPLE_ISSUES)),
+            generate_progress_callback=generate_cb,
+            review_progress_callback=review_cb,
+            refine_progress_callback=refine_cb,
+            generated_callback=generated_cb,
+        )
+
+        assert [c.args[:2] for c in generate_cb.call_args_list] == [
+            (i, 12) for i in range(1, 13)
+        ]
+        assert [c.args for c in review_cb.call_args_list] == [
+            (i, 4) for i in range(1, 5)
+        ]
+        assert [c.args[0] for c in refine_cb.call_args_list] == [1, 2, 3, 4, 5]
+        assert refine_cb.call_args_list[-1].args[1] == 5
+        generated_cb.assert_called_once()
+        assert len(generated_cb.call_args.args[0].terms) == 12
+
+    def test_cancel_returns_none_promptly(self) -> None:
+        """Test that cancellation stops all stages without waiting for them."""
+        cancel_event = Event()
+        release = Event()
+        llm = FakeLLM()
+
+        def respond(prompt: str, response_model: type[BaseModel]):
+            if response_model is ReviewResponse:
+                cancel_event.set()
+                release.wait(timeout=5)
+            return FakeLLM.generate_structured(llm, prompt, response_model)
+
+        llm.generate_structured = respond  # type: ignore[method-assign]
+        generated_cb = MagicMock()
+
+        start = time.perf_counter()
+        result = _run(
+            _pipeline(llm),
+            cancel_event=cancel_event,
+            generated_callback=generated_cb,
+        )
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert result is None
+        assert elapsed < 1.0
+        # The partial provisional glossary is still handed over for saving
+        generated_cb.assert_called_once()
+        assert len(generated_cb.call_args.args[0].terms) < len(TERMS)
+
+
+@pytest.fixture
+def project_db(tmp_path: Path) -> sqlite3.Connection:
+    """Create a project database with documents and extracted terms."""
+    connection = get_connection(str(tmp_path / "project.db"))
+    initialize_db(connection)
+    with transaction(connection):
+        for document in _documents():
+            create_document(connection, document.file_path, document.content, "hash")
+        for term in TERMS:
+            create_term(connection, term, "technical_term")
+    yield connection
+    connection.close()
+
+
+def _execute_full(conn: sqlite3.Connection, streaming: bool, cancel_event: Event | None = None) -> None:
+    # Fixed-size review batches, so several batches are in flight
+    with patch(
+        "genglossary.runs.executor.create_llm_client",
+        return_value=FakeLLM(SAMPLE_ISSUES),
+    ), patch("genglossary.runs.executor.create_batcher", return_value=None):
+        executor = PipelineExecutor(
+            review_batch_size=3, llm_concurrency=3, streaming=streaming
+        )
+    context = ExecutionContext(
+        run_id=1, log_callback=lambda _: None, cancel_event=cancel_event or Event()
+    )
+    executor.execute(conn, "full", context)
+
+
+def _tables(conn: sqlite3.Connection) -> tuple[list, list, list]:
+    def glossary(rows: list) -> list:
+        return [
+            (r["term_name"], r["definition"], r["confidence"], r["occurrences"])
+            for r in rows
+        ]
+
+    issues = [
+        (r["term_name"], r["issue_type"], r["description"], r["should_exclude"])
+        for r in list_all_issues(conn)
+    ]
+    return (
+        glossary(list_all_provisional(conn)),
+        issues,
+        glossary(list_all_refined(conn)),
+    )
+
+
+class TestPipelineExecutorStreaming:
+    """Tests for PipelineExecutor in streaming mode."""
+
+    def test_streaming_produces_same_tables_as_staged(
+        self, project_db: sqlite3.Connection
+    ) -> None:
+        """Test that streaming and staged full runs leave identical tables."""
+        _execute_full(project_db, streaming=False)
+        staged = _tables(project_db)
+
+        _execute_full(project_db, streaming=True)
+        streamed = _tables(project_db)
+
+        assert streamed == staged
+        assert len(staged[0]) == len(TERMS)
+        assert len(staged[1]) == 6
+
+    def test_streaming_cancel_raises(self, project_db: sqlite3.Connection) -> None:
+        """Test that a cancelled streaming run raises PipelineCancelledException."""
+        cancel_event = Event()
+        cancel_event.set()
+
+        with pytest.raises(PipelineCancelledException):
+            _execute_full(project_db, streaming=True, cancel_event=cancel_event)
@@ -0,0 +1,53 @@
+"""Tests for CLI bench command."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from genglossary.cli import main
+
+
+class TestBenchCommand:
+    """Test bench command."""
+
+    def test_writes_baseline(self, tmp_path: Path) -> None:
+        """ベンチマーク結果をベースラインJSONとして保存できる"""
+        output = tmp_path / "baseline.json"
+
+        result = CliRunner().invoke(
+            main, ["bench", "--size", "small", "--concurrency", "2", "-o", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "refine" in result.output
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert set(data["results"]["small"]["stages"]) == {
+            "extract", "generate", "review", "refine"
+        }
+        assert data["parameters"]["max_concurrency"] == 2
+
+    def test_fails_on_regression(self, tmp_path: Path) -> None:
+        """ベースラインより遅い場合は終了コード1になる"""
+        output = tmp_path / "baseline.json"
+        runner = CliRunner()
+        runner.invoke(main, ["bench", "--size", "small", "-o", str(output)])
+        data = json.loads(output.read_text(encoding="utf-8"))
+        for stage in data["results"]["small"]["stages"].values():
+            stage["throughput"] *= 1000
+        output.write_text(json.dumps(data), encoding="utf-8")
+
+        result = runner.invoke(
+            main, ["bench", "--size", "small", "--baseline", str(output)]
+        )
+
+        assert result.exit_code == 1
+        assert "劣化を検出しました" in result.output
+
+    def test_rejects_combined_fault_rate_above_one(self) -> None:
+        """エラー率と不正JSON率の合計が1を超えるとエラーになる"""
+        result = CliRunner().invoke(
+            main, ["bench", "--error-rate", "0.6", "--malformed-rate", "0.6"]
+        )
+
+        assert result.exit_code == 1
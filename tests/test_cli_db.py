@@ -7,8 +7,11 @@ from click.testing import CliRunner
 
 from genglossary.cli_db import db
 from genglossary.db.connection import get_connection, transaction
+from genglossary.db.run_profile_repository import save_run_profile
+from genglossary.db.runs_repository import create_run, update_run_status
 from genglossary.db.schema import initialize_db
 from genglossary.db.term_repository import create_term
+from genglossary.runs.profile import RunProfile
 
 
 class TestDbInit:
@@ -63,6 +66,7 @@ class TestDbInit:
             """
             SELECT name FROM sqlite_master
             WHERE type='table' AND name NOT LIKE 'sqlite_%'
+              AND name NOT LIKE '%\\_fts\\_%' ESCAPE '\\'  -- FTS5 shadow tables
             ORDER BY name
             """
         )
@@ -70,17 +74,29 @@ class TestDbInit:
         conn.close()
 
         expected_tables = [
+            "document_manifest",
             "documents",
+            "documents_fts",
             "glossary_issues",
             "glossary_provisional",
+            "glossary_provisional_fts",
+            "glossary_provisional_occurrences",
             "glossary_refined",
+            "glossary_refined_fts",
+            "glossary_refined_occurrences",
             "metadata",
+            "pending_extract_documents",
+            "run_profile_retries",
+            "run_profile_steps",
+            "run_profiles",
             "runs",
             "schema_version",
+            "table_versions",
             "term_synonym_groups",
             "term_synonym_members",
             "terms_excluded",
             "terms_extracted",
+            "terms_extracted_fts",
             "terms_required",
         ]
         assert tables == expected_tables
@@ -437,3 +453,95 @@ class TestDbRefinedExportMd:
         content = output_path.read_text()
         assert "量子コンピュータ" in content
         assert "量子力学の原理を利用したコンピュータ" in content
+
+
+class TestDbRuns:
+    """Test db runs commands."""
+
+    def _create_profiled_run(self, db_path: Path) -> int:
+        conn = get_connection(str(db_path))
+        initialize_db(conn)
+        with transaction(conn):
+            run_id = create_run(conn, scope="full")
+            update_run_status(conn, run_id, "completed")
+            save_run_profile(
+                conn,
+                run_id,
+                RunProfile(
+                    wall_seconds=42.0,
+                    step_seconds={"generate": 30.0, "review": 12.0},
+                    llm_calls=12,
+                    llm_retries=2,
+                    llm_retry_reasons={"invalid_json": 1, "rate_limited": 1},
+                    json_parse_failures=1,
+                    llm_latency_mean_ms=150.0,
+                    llm_latency_p95_ms=400.0,
+                ),
+                llm_provider="ollama",
+                llm_model="llama3.2",
+                llm_concurrency=4,
+                streaming=True,
+            )
+        conn.close()
+        return run_id
+
+    def test_runs_list(self, tmp_path: Path) -> None:
+        """Test that runs list shows run history."""
+        runner = CliRunner()
+        db_path = tmp_path / "test.db"
+        self._create_profiled_run(db_path)
+
+        result = runner.invoke(db, ["runs", "list", "--db-path", str(db_path)])
+
+        assert result.exit_code == 0
+        assert "実行履歴" in result.output
+        assert "completed" in result.output
+
+    def test_runs_show_displays_profile(self, tmp_path: Path) -> None:
+        """Test that runs show displays the performance profile."""
+        runner = CliRunner()
+        db_path = tmp_path / "test.db"
+        run_id = self._create_profiled_run(db_path)
+
+        result = runner.invoke(
+            db, ["runs", "show", str(run_id), "--db-path", str(db_path)]
+        )
+
+        assert result.exit_code == 0
+        assert f"Run #{run_id}" in result.output
+        assert "llama3.2" in result.output
+        assert "42.00 秒" in result.output
+        assert "400.0 ms" in result.output
+        assert "リトライ理由: invalid_json 1, rate_limited 1" in result.output
+        assert "generate" in result.output
+        assert "review" in result.output
+
+    def test_runs_show_without_profile(self, tmp_path: Path) -> None:
+        """Test that runs show handles runs without a profile."""
+        runner = CliRunner()
+        db_path = tmp_path / "test.db"
+        conn = get_connection(str(db_path))
+        initialize_db(conn)
+        with transaction(conn):
+            run_id = create_run(conn, scope="extract")
+        conn.close()
+
+        result = runner.invoke(
+            db, ["runs", "show", str(run_id), "--db-path", str(db_path)]
+        )
+
+        assert result.exit_code == 0
+        assert "プロファイルがありません" in result.output
+
+    def test_runs_show_missing_run(self, tmp_path: Path) -> None:
+        """Test that runs show fails for an unknown run."""
+        runner = CliRunner()
+        db_path = tmp_path / "test.db"
+        conn = get_connection(str(db_path))
+        initialize_db(conn)
+        conn.close()
+
+        result = runner.invoke(db, ["runs", "show", "99", "--db-path", str(db_path)])
+
+        assert result.exit_code != 0
+        assert "Run ID 99 が見つかりません" in result.output
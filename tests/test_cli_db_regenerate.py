@@ -18,8 +18,8 @@ from genglossary.models.term import ClassifiedTerm, TermCategory
 class TestTermsRegenerate:
     """Test db terms regenerate command."""
 
-    @patch("genglossary.cli_db.TermExtractor")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.term_extractor.TermExtractor")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_regenerate_extracts_and_saves_terms(
         self, mock_create_client, mock_extractor_class, tmp_path: Path
     ) -> None:
@@ -74,8 +74,8 @@ class TestTermsRegenerate:
         assert terms[0]["term_text"] == "量子コンピュータ"
         assert terms[1]["term_text"] == "量子力学"
 
-    @patch("genglossary.cli_db.TermExtractor")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.term_extractor.TermExtractor")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_regenerate_clears_existing_terms(
         self, mock_create_client, mock_extractor_class, tmp_path: Path
     ) -> None:
@@ -152,9 +152,9 @@ class TestTermsRegenerate:
 class TestProvisionalRegenerate:
     """Test db provisional regenerate command."""
 
-    @patch("genglossary.cli_db.DocumentLoader")
-    @patch("genglossary.cli_db.GlossaryGenerator")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.document_loader.DocumentLoader")
+    @patch("genglossary.glossary_generator.GlossaryGenerator")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_regenerate_generates_provisional_glossary(
         self, mock_create_client, mock_generator_class, mock_loader_class, tmp_path: Path
     ) -> None:
@@ -232,8 +232,8 @@ class TestProvisionalRegenerate:
 class TestIssuesRegenerate:
     """Test db issues regenerate command."""
 
-    @patch("genglossary.cli_db.GlossaryReviewer")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.glossary_reviewer.GlossaryReviewer")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_regenerate_reviews_provisional_glossary(
         self, mock_create_client, mock_reviewer_class, tmp_path: Path
     ) -> None:
@@ -300,9 +300,9 @@ class TestIssuesRegenerate:
 class TestRefinedRegenerate:
     """Test db refined regenerate command."""
 
-    @patch("genglossary.cli_db.DocumentLoader")
-    @patch("genglossary.cli_db.GlossaryRefiner")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.document_loader.DocumentLoader")
+    @patch("genglossary.glossary_refiner.GlossaryRefiner")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_regenerate_refines_glossary(
         self, mock_create_client, mock_refiner_class, mock_loader_class, tmp_path: Path
     ) -> None:
@@ -35,12 +35,12 @@ def _create_mock_glossary() -> Glossary:
 class TestCliExcludedTermRepo:
     """Test that CLI passes excluded_term_repo to TermExtractor when DB is enabled."""
 
-    @patch("genglossary.cli.DocumentLoader")
-    @patch("genglossary.cli.TermExtractor")
-    @patch("genglossary.cli.GlossaryRefiner")
-    @patch("genglossary.cli.GlossaryReviewer")
-    @patch("genglossary.cli.GlossaryGenerator")
-    @patch("genglossary.cli.create_llm_client")
+    @patch("genglossary.document_loader.DocumentLoader")
+    @patch("genglossary.term_extractor.TermExtractor")
+    @patch("genglossary.glossary_refiner.GlossaryRefiner")
+    @patch("genglossary.glossary_reviewer.GlossaryReviewer")
+    @patch("genglossary.glossary_generator.GlossaryGenerator")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_generate_passes_excluded_term_repo_when_db_enabled(
         self,
         mock_create_client,
@@ -125,12 +125,12 @@ class TestCliExcludedTermRepo:
         # The connection should not be None when DB is enabled
         assert call_kwargs["excluded_term_repo"] is not None
 
-    @patch("genglossary.cli.DocumentLoader")
-    @patch("genglossary.cli.TermExtractor")
-    @patch("genglossary.cli.GlossaryRefiner")
-    @patch("genglossary.cli.GlossaryReviewer")
-    @patch("genglossary.cli.GlossaryGenerator")
-    @patch("genglossary.cli.create_llm_client")
+    @patch("genglossary.document_loader.DocumentLoader")
+    @patch("genglossary.term_extractor.TermExtractor")
+    @patch("genglossary.glossary_refiner.GlossaryRefiner")
+    @patch("genglossary.glossary_reviewer.GlossaryReviewer")
+    @patch("genglossary.glossary_generator.GlossaryGenerator")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_generate_passes_none_when_db_disabled(
         self,
         mock_create_client,
@@ -214,8 +214,8 @@ class TestCliExcludedTermRepo:
 class TestCliDbExcludedTermRepo:
     """Test that CLI DB commands pass excluded_term_repo to TermExtractor."""
 
-    @patch("genglossary.cli_db.TermExtractor")
-    @patch("genglossary.cli_db.create_llm_client")
+    @patch("genglossary.term_extractor.TermExtractor")
+    @patch("genglossary.llm.factory.create_llm_client")
     def test_terms_regenerate_passes_excluded_term_repo(
         self, mock_create_client, mock_extractor_class, tmp_path: Path
     ) -> None:
@@ -0,0 +1,62 @@
+"""Tests for the export CLI command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from genglossary.cli import main
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.refined_repository import create_refined_term
+from genglossary.db.schema import initialize_db
+from genglossary.db.synonym_repository import create_group
+from genglossary.models.term import TermOccurrence
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = tmp_path / "test.db"
+    conn = get_connection(str(path))
+    initialize_db(conn)
+    occ = TermOccurrence(document_path="doc.txt", line_number=2, context="context")
+    with transaction(conn):
+        create_refined_term(conn, "田中太郎", "主人公", 0.95, [occ])
+        create_refined_term(conn, "量子ビット", "量子情報の単位", 0.9, [])
+        create_group(conn, "田中太郎", ["田中太郎", "田中"])
+    conn.close()
+    return str(path)
+
+
+class TestExport:
+    """Tests for genglossary export."""
+
+    def test_writes_jsonl_to_stdout(self, db_path: str) -> None:
+        result = CliRunner().invoke(
+            main, ["export", "--format", "jsonl", "--db-path", db_path]
+        )
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["term_name"] for r in records] == ["田中太郎", "量子ビット"]
+        assert records[0]["aliases"] == ["田中"]
+
+    @pytest.mark.parametrize("fmt", ["md", "csv", "tsv"])
+    def test_writes_file(self, db_path: str, tmp_path: Path, fmt: str) -> None:
+        output = tmp_path / f"glossary.{fmt}"
+
+        result = CliRunner().invoke(
+            main, ["export", "-f", fmt, "-o", str(output), "--db-path", db_path]
+        )
+
+        assert result.exit_code == 0, result.output
+        content = output.read_text(encoding="utf-8")
+        assert "量子ビット" in content
+        assert "田中" in content
+
+    def test_rejects_unknown_format(self, db_path: str) -> None:
+        result = CliRunner().invoke(
+            main, ["export", "--format", "xlsx", "--db-path", db_path]
+        )
+
+        assert result.exit_code == 2
@@ -0,0 +1,123 @@
+"""Import-time regression tests for the CLI.
+
+Commands run in a subprocess with ``python -X importtime`` so that every
+module they load (including lazy imports inside commands) is recorded.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from genglossary.db.connection import get_connection
+from genglossary.db.schema import initialize_db
+
+# Modules that --help and DB-only commands must not load
+HEAVY_MODULES = (
+    "sudachipy",
+    "httpx",
+    "fastapi",
+    "uvicorn",
+    "pydantic",
+    "pydantic_settings",
+    "genglossary.api",
+    "genglossary.llm",
+    "genglossary.term_extractor",
+)
+
+# Import time allowed for a DB-only command, interpreter startup excluded
+IMPORT_BUDGET_MS = 100
+
+_RUN_CLI = (
+    "import sys; from genglossary.cli import main; "
+    "sys.argv = ['genglossary', *sys.argv[1:]]; main()"
+)
+
+
+def _profile_imports(*args: str) -> tuple[set[str], float]:
+    """Run the CLI with -X importtime.
+
+    Returns:
+        The names of all imported modules, and the total import time in
+        milliseconds of everything imported after interpreter startup.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules: set[str] = set()
+    total_us = 0
+    after_startup = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name_field = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        name = name_field.strip()
+        modules.add(name)
+        top_level = not name_field[1:].startswith(" ")
+        if after_startup and top_level:
+            total_us += int(cumulative)
+        if name == "site":
+            after_startup = True
+    return modules, total_us / 1000
+
+
+def _heavy_imports(modules: set[str]) -> list[str]:
+    return sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = tmp_path / "test.db"
+    conn = get_connection(str(path))
+    initialize_db(conn)
+    conn.close()
+    return str(path)
+
+
+class TestCliImports:
+    """Tests that commands load the pipeline and web stack only when needed."""
+
+    def test_help_does_not_import_heavy_modules(self) -> None:
+        modules, _ = _profile_imports("--help")
+
+        assert "genglossary.cli_db" in modules
+        assert _heavy_imports(modules) == []
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            ["db", "info"],
+            ["db", "terms", "list"],
+            ["db", "issues", "list"],
+            ["db", "runs", "list"],
+        ],
+    )
+    def test_db_command_does_not_import_heavy_modules(
+        self, command: list[str], db_path: str
+    ) -> None:
+        modules, _ = _profile_imports(*command, "--db-path", db_path)
+
+        assert _heavy_imports(modules) == []
+
+
+@pytest.mark.benchmark
+def test_db_command_import_time_within_budget(db_path: str) -> None:
+    """DB-only commands start well under the import budget (best of 5)."""
+    best_ms = min(
+        _profile_imports("db", "terms", "list", "--db-path", db_path)[1]
+        for _ in range(5)
+    )
+
+    assert best_ms < IMPORT_BUDGET_MS, f"imports took {best_ms:.1f} ms"
@@ -59,6 +59,155 @@ class TestConfig:
         config = Config()
         assert config.ollama_timeout == 300
 
+    def test_default_llm_max_concurrency(self):
+        """Test that LLM calls are sequential by default."""
+        config = Config()
+        assert config.llm_max_concurrency == 1
+
+    def test_config_from_env_llm_max_concurrency(self, monkeypatch: pytest.MonkeyPatch):
+        """Test loading LLM max concurrency from environment variable."""
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "4")
+        config = Config()
+        assert config.llm_max_concurrency == 4
+
+    def test_invalid_llm_max_concurrency(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that non-positive concurrency is rejected."""
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "0")
+        with pytest.raises(ValueError):
+            Config()
+
+    def test_default_pipeline_streaming(self):
+        """Test that the full pipeline runs step by step by default."""
+        config = Config()
+        assert config.pipeline_streaming is False
+
+    def test_config_from_env_pipeline_streaming(self, monkeypatch: pytest.MonkeyPatch):
+        """Test enabling streaming pipeline from environment variable."""
+        monkeypatch.setenv("PIPELINE_STREAMING", "true")
+        config = Config()
+        assert config.pipeline_streaming is True
+
+    def test_config_from_env_auto_extract_delays(self, monkeypatch: pytest.MonkeyPatch):
+        """Test auto-extract quiet period and max delay from environment variables."""
+        monkeypatch.setenv("AUTO_EXTRACT_QUIET_SECONDS", "0.5")
+        monkeypatch.setenv("AUTO_EXTRACT_MAX_DELAY_SECONDS", "10")
+        config = Config()
+        assert config.auto_extract_quiet_seconds == 0.5
+        assert config.auto_extract_max_delay_seconds == 10.0
+
+    def test_default_llm_debug_settings(self):
+        """Test that debug logs default to uncompressed, rotated JSONL."""
+        config = Config()
+        assert config.llm_debug_format == "jsonl"
+        assert config.llm_debug_max_bytes == 50 * 1024 * 1024
+        assert config.llm_debug_compress is False
+
+    def test_config_from_env_llm_debug_settings(self, monkeypatch: pytest.MonkeyPatch):
+        """Test loading debug log settings from environment variables."""
+        monkeypatch.setenv("LLM_DEBUG_FORMAT", "files")
+        monkeypatch.setenv("LLM_DEBUG_MAX_BYTES", "1024")
+        monkeypatch.setenv("LLM_DEBUG_COMPRESS", "true")
+        config = Config()
+        assert config.llm_debug_format == "files"
+        assert config.llm_debug_max_bytes == 1024
+        assert config.llm_debug_compress is True
+
+    def test_invalid_llm_debug_format(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that unknown debug log formats are rejected."""
+        monkeypatch.setenv("LLM_DEBUG_FORMAT", "xml")
+        with pytest.raises(ValueError, match="llm_debug_format"):
+            Config()
+
+    def test_default_llm_http_pool_settings(self):
+        """Test the default connection pool limits and HTTP/2 setting."""
+        config = Config()
+        assert config.llm_http_max_connections == 20
+        assert config.llm_http_max_keepalive == 10
+        assert config.llm_http_keepalive_expiry == 30.0
+        assert config.openai_http2 is False
+
+    def test_config_from_env_llm_http_pool_settings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test loading connection pool settings from environment variables."""
+        monkeypatch.setenv("LLM_HTTP_MAX_CONNECTIONS", "4")
+        monkeypatch.setenv("LLM_HTTP_MAX_KEEPALIVE", "2")
+        monkeypatch.setenv("LLM_HTTP_KEEPALIVE_EXPIRY", "90")
+        monkeypatch.setenv("OPENAI_HTTP2", "true")
+        config = Config()
+        assert config.llm_http_max_connections == 4
+        assert config.llm_http_max_keepalive == 2
+        assert config.llm_http_keepalive_expiry == 90.0
+        assert config.openai_http2 is True
+
+    def test_invalid_llm_http_max_connections(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a non-positive connection limit is rejected."""
+        monkeypatch.setenv("LLM_HTTP_MAX_CONNECTIONS", "0")
+        with pytest.raises(ValueError):
+            Config()
+
+    def test_default_load_balancing_settings(self):
+        """Test the defaults used when a base URL lists several servers."""
+        config = Config()
+        assert config.llm_lb_policy == "least_outstanding"
+        assert config.llm_health_check_interval == 30.0
+        assert config.llm_eject_base_seconds == 5.0
+        assert config.llm_eject_max_seconds == 300.0
+
+    def test_config_from_env_load_balancing_settings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test loading load balancing settings from environment variables."""
+        monkeypatch.setenv("LLM_LB_POLICY", "latency")
+        monkeypatch.setenv("LLM_HEALTH_CHECK_INTERVAL", "0")
+        monkeypatch.setenv("LLM_EJECT_BASE_SECONDS", "1")
+        monkeypatch.setenv("LLM_EJECT_MAX_SECONDS", "60")
+        config = Config()
+        assert config.llm_lb_policy == "latency"
+        assert config.llm_health_check_interval == 0
+        assert config.llm_eject_base_seconds == 1.0
+        assert config.llm_eject_max_seconds == 60.0
+
+    def test_invalid_llm_lb_policy(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that unknown load balancing policies are rejected."""
+        monkeypatch.setenv("LLM_LB_POLICY", "random")
+        with pytest.raises(ValueError, match="llm_lb_policy"):
+            Config()
+
+    def test_default_adaptive_concurrency_settings(self):
+        """Test the default bounds of the adaptive concurrency limiter."""
+        config = Config()
+        assert config.llm_concurrency_initial_limit == 4
+        assert config.llm_concurrency_min_limit == 1
+        assert config.llm_concurrency_max_limit == 32
+        assert config.llm_latency_spike_factor == 2.0
+
+    def test_invalid_llm_latency_spike_factor(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a spike factor of 1 or less is rejected."""
+        monkeypatch.setenv("LLM_LATENCY_SPIKE_FACTOR", "1")
+        with pytest.raises(ValueError):
+            Config()
+
+    def test_default_batch_token_budget_settings(self):
+        """Test the defaults of token-budget batching."""
+        config = Config()
+        assert config.llm_batch_token_budget == 1500
+        assert config.llm_batch_token_budgets == ""
+        assert config.llm_batch_max_items == 30
+        assert config.llm_tokenizer == "heuristic"
+
+    def test_invalid_llm_batch_token_budgets(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that per-model budgets must be model=tokens pairs."""
+        monkeypatch.setenv("LLM_BATCH_TOKEN_BUDGETS", "llama3:8b=lots")
+        with pytest.raises(ValueError, match="Invalid token count"):
+            Config()
+
+    def test_invalid_llm_tokenizer(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that unknown tokenizers are rejected."""
+        monkeypatch.setenv("LLM_TOKENIZER", "sentencepiece")
+        with pytest.raises(ValueError, match="llm_tokenizer"):
+            Config()
+
     def test_config_from_env_input_dir(self, monkeypatch: pytest.MonkeyPatch):
         """Test loading input directory from environment variable."""
         monkeypatch.setenv("GENGLOSSARY_INPUT_DIR", "/custom/input")
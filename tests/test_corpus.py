@@ -0,0 +1,105 @@
+"""Tests for CorpusCache."""
+
+import sqlite3
+from pathlib import Path
+from typing import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from genglossary.corpus import CorpusCache
+from genglossary.db.connection import get_connection
+from genglossary.db.document_repository import create_document
+from genglossary.db.schema import initialize_db
+from genglossary.models.document import Document
+from genglossary.models.term import TermOccurrence
+
+
+@pytest.fixture
+def conn() -> Generator[sqlite3.Connection, None, None]:
+    """Provide an initialized in-memory project database."""
+    connection = get_connection(":memory:")
+    initialize_db(connection)
+    yield connection
+    connection.close()
+
+
+def _finder(term: str, documents: list[Document]) -> list[TermOccurrence]:
+    """Simple line scanner used as the occurrence finder."""
+    return [
+        TermOccurrence(document_path=doc.file_path, line_number=i, context=line)
+        for doc in documents
+        for i, line in enumerate(doc.lines, start=1)
+        if term in line
+    ]
+
+
+class TestCorpusCache:
+    """Test CorpusCache."""
+
+    def test_documents_are_loaded_once_while_unchanged(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        """Test that repeated calls reuse the same loaded documents."""
+        create_document(conn, "a.md", "量子コンピュータ", "h1")
+        cache = CorpusCache()
+
+        first = cache.get_documents(conn, "")
+        second = cache.get_documents(conn, "")
+
+        assert first is second
+        assert [d.file_path for d in first] == ["a.md"]
+
+    def test_documents_reload_when_content_hash_changes(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        """Test that a content change invalidates the cached corpus."""
+        doc = create_document(conn, "a.md", "旧内容", "h1")
+        cache = CorpusCache()
+        cache.get_documents(conn, "")
+
+        conn.execute(
+            "UPDATE documents SET content = ?, content_hash = ? WHERE id = ?",
+            ("新内容", "h2", doc["id"]),
+        )
+
+        assert cache.get_documents(conn, "")[0].content == "新内容"
+
+    def test_occurrences_are_memoized_per_term(self, conn: sqlite3.Connection) -> None:
+        """Test that the finder runs once per term until the corpus changes."""
+        create_document(conn, "a.md", "量子コンピュータ\n量子ビット", "h1")
+        cache = CorpusCache()
+        finder = MagicMock(side_effect=_finder)
+
+        first = cache.find_occurrences(conn, "", "量子ビット", finder)
+        second = cache.find_occurrences(conn, "", "量子ビット", finder)
+
+        assert first == second
+        assert first[0].line_number == 2
+        assert finder.call_count == 1
+
+        create_document(conn, "b.md", "量子ビット", "h2")
+        third = cache.find_occurrences(conn, "", "量子ビット", finder)
+
+        assert finder.call_count == 2
+        assert len(third) == 2
+
+    def test_falls_back_to_doc_root_without_caching(
+        self, conn: sqlite3.Connection, tmp_path: Path
+    ) -> None:
+        """Test that an empty documents table reads doc_root on every call."""
+        (tmp_path / "doc.md").write_text("量子ビット", encoding="utf-8")
+        cache = CorpusCache()
+        finder = MagicMock(side_effect=_finder)
+
+        cache.find_occurrences(conn, str(tmp_path), "量子ビット", finder)
+        cache.find_occurrences(conn, str(tmp_path), "量子ビット", finder)
+
+        assert finder.call_count == 2
+
+    def test_missing_doc_root_raises(self, conn: sqlite3.Connection) -> None:
+        """Test that a missing doc_root surfaces FileNotFoundError."""
+        cache = CorpusCache()
+
+        with pytest.raises(FileNotFoundError):
+            cache.get_documents(conn, "/nonexistent/doc/root")
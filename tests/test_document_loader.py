@@ -1,10 +1,11 @@
 """Tests for DocumentLoader."""
 
+import os
 from pathlib import Path
 
 import pytest
 
-from genglossary.document_loader import DocumentLoader
+from genglossary.document_loader import DocumentLoader, FileStat
 from genglossary.models.document import Document
 
 
@@ -540,3 +541,83 @@ class TestDocumentLoaderValidation:
 
         assert len(docs) == 1
         assert docs[0].file_path.endswith("valid.txt")
+
+
+def _stat(path: Path) -> FileStat:
+    st = path.stat()
+    return FileStat(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+
+class TestDocumentLoaderScanDirectory:
+    """Test DocumentLoader.scan_directory (incremental loading)."""
+
+    def test_first_scan_reads_every_file(self, tmp_path: Path) -> None:
+        """Test an empty manifest reports every file as changed."""
+        (tmp_path / "a.txt").write_text("alpha")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.md").write_text("beta")
+
+        scan = DocumentLoader().scan_directory(str(tmp_path), {})
+
+        assert [f.file_name for f in scan.changed] == ["a.txt", "sub/b.md"]
+        assert scan.changed[0].content == "alpha"
+        assert scan.changed[0].stat == _stat(tmp_path / "a.txt")
+        assert scan.unchanged == []
+        assert scan.removed == []
+
+    def test_unchanged_files_are_not_read(self, tmp_path: Path, mocker) -> None:
+        """Test files matching the manifest are skipped without reading."""
+        (tmp_path / "same.txt").write_text("same")
+        (tmp_path / "new.txt").write_text("new")
+        read = mocker.spy(DocumentLoader, "_read_text")
+
+        scan = DocumentLoader().scan_directory(
+            str(tmp_path), {"same.txt": _stat(tmp_path / "same.txt")}
+        )
+
+        assert scan.unchanged == ["same.txt"]
+        assert [f.file_name for f in scan.changed] == ["new.txt"]
+        assert read.call_count == 1
+
+    def test_modified_and_removed_files(self, tmp_path: Path) -> None:
+        """Test changed mtime is re-read and missing files are removed."""
+        path = tmp_path / "doc.txt"
+        path.write_text("v1")
+        old = _stat(path)
+        os.utime(path, ns=(old.mtime_ns + 10**9, old.mtime_ns + 10**9))
+
+        scan = DocumentLoader().scan_directory(
+            str(tmp_path),
+            {"doc.txt": old, "gone.txt": FileStat(size=1, mtime_ns=1)},
+        )
+
+        assert [f.file_name for f in scan.changed] == ["doc.txt"]
+        assert scan.removed == ["gone.txt"]
+
+    def test_excluded_directories_are_not_walked(
+        self, tmp_path: Path, mocker
+    ) -> None:
+        """Test excluded directories are pruned instead of filtered per file."""
+        (tmp_path / "doc.txt").write_text("doc")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "readme.md").write_text("x")
+        scandir = mocker.spy(os, "scandir")
+
+        scan = DocumentLoader(excluded_patterns=["node_modules"]).scan_directory(
+            str(tmp_path), {}
+        )
+
+        assert [f.file_name for f in scan.changed] == ["doc.txt"]
+        scanned = {Path(call.args[0]).name for call in scandir.call_args_list}
+        assert "node_modules" not in scanned
+
+    def test_single_worker_matches_thread_pool(self, tmp_path: Path) -> None:
+        """Test max_workers=1 reads sequentially with the same result."""
+        for i in range(5):
+            (tmp_path / f"doc{i}.txt").write_text(f"content {i}")
+
+        sequential = DocumentLoader(max_workers=1).load_directory(str(tmp_path))
+        parallel = DocumentLoader(max_workers=4).load_directory(str(tmp_path))
+
+        assert [d.file_path for d in sequential] == [d.file_path for d in parallel]
+        assert [d.content for d in sequential] == [d.content for d in parallel]
@@ -0,0 +1,159 @@
+"""Tests for ProjectEventHub."""
+
+import sqlite3
+import time
+from pathlib import Path
+from queue import Empty
+from typing import Generator
+
+import pytest
+
+from genglossary.db.connection import get_connection, transaction
+from genglossary.db.document_repository import create_document
+from genglossary.db.runs_repository import (
+    create_run,
+    update_run_progress,
+    update_run_status,
+)
+from genglossary.db.schema import initialize_db
+from genglossary.db.synonym_repository import create_group
+from genglossary.db.term_repository import create_term
+from genglossary.events import ProjectEvent, ProjectEventHub
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "project.db")
+    conn = get_connection(path)
+    initialize_db(conn)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def conn(db_path: str) -> Generator[sqlite3.Connection, None, None]:
+    connection = get_connection(db_path)
+    yield connection
+    connection.close()
+
+
+class TestPoll:
+    """Tests for turning counter changes into events."""
+
+    def test_first_poll_records_state_only(self, conn: sqlite3.Connection) -> None:
+        hub = ProjectEventHub(":unused:")
+
+        assert hub.poll(conn) == []
+        assert hub.poll(conn) == []
+
+    def test_table_changes_become_invalidate_events(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        hub = ProjectEventHub(":unused:")
+        hub.poll(conn)
+
+        with transaction(conn):
+            create_term(conn, "量子ビット")
+            create_document(conn, "doc.md", "content", "hash")
+
+        assert hub.poll(conn) == [
+            ProjectEvent("invalidate", {"resources": ["files", "terms"]})
+        ]
+
+    def test_synonym_groups_invalidate_glossaries(
+        self, conn: sqlite3.Connection
+    ) -> None:
+        hub = ProjectEventHub(":unused:")
+        hub.poll(conn)
+
+        with transaction(conn):
+            create_group(conn, "田中太郎", ["田中太郎", "田中"])
+
+        assert hub.poll(conn) == [
+            ProjectEvent(
+                "invalidate",
+                {"resources": ["provisional", "refined", "synonym_groups"]},
+            )
+        ]
+
+    def test_run_status_and_progress_events(self, conn: sqlite3.Connection) -> None:
+        hub = ProjectEventHub(":unused:")
+        hub.poll(conn)
+
+        with transaction(conn):
+            run_id = create_run(conn, scope="full")
+        [started] = hub.poll(conn)
+        assert started.event == "run"
+        assert started.data["id"] == run_id
+        assert started.data["status"] == "pending"
+
+        with transaction(conn):
+            update_run_status(conn, run_id, "running")
+        assert hub.poll(conn)[0].event == "run"
+
+        with transaction(conn):
+            update_run_progress(conn, run_id, 3, 10, "provisional")
+        [progress] = hub.poll(conn)
+        assert progress.event == "progress"
+        assert progress.data["progress_current"] == 3
+        assert progress.data["current_step"] == "provisional"
+
+        with transaction(conn):
+            update_run_status(conn, run_id, "completed")
+        [finished] = hub.poll(conn)
+        assert finished.event == "run"
+        assert finished.data["status"] == "completed"
+
+
+class TestPublish:
+    """Tests for delivering events to subscribers."""
+
+    def test_full_queue_is_replaced_by_resync(self, db_path: str) -> None:
+        hub = ProjectEventHub(db_path, poll_interval=60)
+        hub.MAX_QUEUE_SIZE = 2
+        queue = hub.subscribe()
+        try:
+            for _ in range(3):
+                hub.publish(ProjectEvent("invalidate", {"resources": ["terms"]}))
+
+            assert queue.get_nowait() == ProjectEvent("resync")
+            with pytest.raises(Empty):
+                queue.get_nowait()
+        finally:
+            hub.unsubscribe(queue)
+
+
+class TestWatcher:
+    """Tests for the watcher thread."""
+
+    def test_subscriber_receives_changes_from_other_connections(
+        self, db_path: str, conn: sqlite3.Connection
+    ) -> None:
+        hub = ProjectEventHub(db_path, poll_interval=0.01)
+        queue = hub.subscribe()
+        try:
+            # Wait until the watcher has recorded the initial state
+            deadline = time.monotonic() + 5
+            while hub._versions is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with transaction(conn):
+                create_term(conn, "量子ビット")
+
+            assert queue.get(timeout=5) == ProjectEvent(
+                "invalidate", {"resources": ["terms"]}
+            )
+        finally:
+            hub.unsubscribe(queue)
+
+    def test_watcher_stops_with_last_subscriber(self, db_path: str) -> None:
+        hub = ProjectEventHub(db_path, poll_interval=0.01)
+        queue = hub.subscribe()
+        thread = hub._thread
+        assert thread is not None
+
+        hub.unsubscribe(queue)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert hub.subscriber_count == 0
@@ -171,6 +171,24 @@ LLMは大規模言語モデルの略称です。
         assert occurrences[0].document_path == "/doc1.md"
         assert occurrences[1].document_path == "/doc2.md"
 
+    def test_find_term_occurrences_uses_document_search(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Test that documents outside the search result are not scanned."""
+        doc1 = Document(file_path="doc1.md", content="First LLM mention.")
+        doc2 = Document(file_path="doc2.md", content="Second LLM mention.")
+        document_search = MagicMock(return_value={"doc2.md"})
+
+        generator = GlossaryGenerator(
+            llm_client=mock_llm_client, document_search=document_search
+        )
+        occurrences = generator._find_term_occurrences(
+            "LLM", [doc1, doc2], synonyms=["大規模言語モデル"]
+        )
+
+        document_search.assert_called_once_with(["LLM", "大規模言語モデル"])
+        assert [occ.document_path for occ in occurrences] == ["doc2.md"]
+
     def test_generate_definition_calls_llm(
         self,
         mock_llm_client: MagicMock,
@@ -311,6 +329,28 @@ API is an interface.
 """
         return Document(file_path="/path/to/doc.md", content=content)
 
+    def test_generate_calls_term_callback_for_generated_terms(
+        self, mock_llm_client: MagicMock, sample_document: Document
+    ) -> None:
+        """Test that term_callback receives each generated term in order."""
+        mock_llm_client.generate_structured.side_effect = [
+            MockDefinitionResponse(definition="Tool", confidence=0.9),
+            RuntimeError("LLM API error"),
+            MockDefinitionResponse(definition="Interface", confidence=0.8),
+        ]
+        received: list[Term] = []
+        generator = GlossaryGenerator(llm_client=mock_llm_client)
+
+        glossary = generator.generate(
+            ["GenGlossary", "LLM", "API"],
+            [sample_document],
+            term_callback=received.append,
+        )
+
+        # Failed terms are not passed on
+        assert [term.name for term in received] == ["GenGlossary", "API"]
+        assert received == list(glossary.terms.values())
+
     def test_generate_calls_progress_callback(
         self, mock_llm_client: MagicMock, sample_document: Document
     ) -> None:
@@ -1,12 +1,16 @@
 """Tests for GlossaryReviewer - Step 3: Review glossary for issues."""
 
-from unittest.mock import MagicMock
+import re
+import time
+from threading import Event, Lock
+from unittest.mock import MagicMock, call
 
 import pytest
 from pydantic import BaseModel
 
 from genglossary.glossary_reviewer import GlossaryReviewer
-from genglossary.llm.base import BaseLLMClient
+from genglossary.llm.base import BaseLLMClient, ResponseTruncatedError
+from genglossary.llm.batching import TokenBudgetBatcher
 from genglossary.models.glossary import Glossary, GlossaryIssue
 from genglossary.models.term import Term
 
@@ -645,6 +649,148 @@ class TestGlossaryReviewerErrorHandling:
         assert "Parse error" in caplog.text
 
 
+class TestGlossaryReviewerConcurrency:
+    """Test suite for GlossaryReviewer concurrent batch execution."""
+
+    @pytest.fixture
+    def mock_llm_client(self) -> MagicMock:
+        """Create a mock LLM client."""
+        return MagicMock(spec=BaseLLMClient)
+
+    def _create_glossary_with_n_terms(self, n: int) -> Glossary:
+        """Helper to create a glossary with n terms."""
+        glossary = Glossary()
+        for i in range(n):
+            glossary.add_term(
+                Term(name=f"Term{i}", definition=f"Definition {i}", confidence=0.8)
+            )
+        return glossary
+
+    @staticmethod
+    def _first_term(prompt: str) -> int:
+        """Return the index of the first TermN listed in a review prompt."""
+        return int(re.search(r"- Term(\d+):", prompt).group(1))  # type: ignore[union-attr]
+
+    def test_max_concurrency_validation(self, mock_llm_client: MagicMock) -> None:
+        """Test that max_concurrency=0 raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=0)
+
+    def test_issues_keep_batch_order(self, mock_llm_client: MagicMock) -> None:
+        """Test that issues are ordered by batch even if later batches finish first."""
+
+        def respond(prompt: str, _model: type) -> MockReviewResponse:
+            first = self._first_term(prompt)
+            # Earlier batches take longer
+            time.sleep(0.05 * (3 - first // 10))
+            return MockReviewResponse(
+                issues=[
+                    {"term": f"Term{first}", "issue_type": "unclear", "description": "x"}
+                ]
+            )
+
+        mock_llm_client.generate_structured.side_effect = respond
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=3)
+
+        issues = reviewer.review(self._create_glossary_with_n_terms(30))
+
+        assert issues is not None
+        assert [issue.term_name for issue in issues] == ["Term0", "Term10", "Term20"]
+
+    def test_runs_batches_in_parallel_up_to_limit(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Test that no more than max_concurrency batches are in flight."""
+        lock = Lock()
+        in_flight = 0
+        peak = 0
+
+        def respond(prompt: str, _model: type) -> MockReviewResponse:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return MockReviewResponse(issues=[])
+
+        mock_llm_client.generate_structured.side_effect = respond
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=2)
+
+        reviewer.review(self._create_glossary_with_n_terms(60))
+
+        assert mock_llm_client.generate_structured.call_count == 6
+        assert peak == 2
+
+    def test_failed_batch_is_isolated(
+        self, mock_llm_client: MagicMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a failing batch is skipped and reported."""
+        import logging
+
+        def respond(prompt: str, _model: type) -> MockReviewResponse:
+            first = self._first_term(prompt)
+            if first == 10:
+                raise RuntimeError("LLM API error")
+            return MockReviewResponse(
+                issues=[
+                    {"term": f"Term{first}", "issue_type": "unclear", "description": "x"}
+                ]
+            )
+
+        mock_llm_client.generate_structured.side_effect = respond
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=3)
+
+        with caplog.at_level(logging.WARNING, logger="genglossary.glossary_reviewer"):
+            issues = reviewer.review(self._create_glossary_with_n_terms(30))
+
+        assert issues is not None
+        assert [issue.term_name for issue in issues] == ["Term0", "Term20"]
+        assert "Batch 2/3 failed" in caplog.text
+        assert "1/3 batches failed: [2]" in caplog.text
+
+    def test_progress_callback_called_in_batch_order(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Test that progress is reported once per batch, in dispatch order."""
+        mock_llm_client.generate_structured.return_value = MockReviewResponse(issues=[])
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=4)
+        callback = MagicMock()
+
+        reviewer.review(
+            self._create_glossary_with_n_terms(50), batch_progress_callback=callback
+        )
+
+        assert callback.call_args_list == [call(i, 5) for i in range(1, 6)]
+
+    def test_cancel_stops_dispatch_and_returns_promptly(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Test that cancel stops new batches and does not wait for in-flight ones."""
+        cancel_event = Event()
+        release = Event()
+
+        def respond(prompt: str, _model: type) -> MockReviewResponse:
+            cancel_event.set()
+            release.wait(timeout=5)
+            return MockReviewResponse(issues=[])
+
+        mock_llm_client.generate_structured.side_effect = respond
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, max_concurrency=2)
+
+        start = time.perf_counter()
+        result = reviewer.review(
+            self._create_glossary_with_n_terms(100), cancel_event=cancel_event
+        )
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert result is None
+        assert elapsed < 1.0
+        assert mock_llm_client.generate_structured.call_count <= 2
+
+
 class TestGlossaryReviewerUserNotes:
     """Test suite for user_notes injection in GlossaryReviewer prompts."""
 
@@ -700,3 +846,79 @@ class TestGlossaryReviewerUserNotes:
         call_args = mock_llm_client.generate_structured.call_args
         prompt = call_args[0][0]
         assert "General Practitioner" in prompt
+
+
+class TestGlossaryReviewerTokenBudget:
+    """Test suite for GlossaryReviewer with a token-budget batcher."""
+
+    @pytest.fixture
+    def mock_llm_client(self) -> MagicMock:
+        """Create a mock LLM client."""
+        client = MagicMock(spec=BaseLLMClient)
+        client.generate_structured.return_value = MockReviewResponse(issues=[])
+        return client
+
+    def _glossary(self, definitions: list[str]) -> Glossary:
+        glossary = Glossary()
+        for i, definition in enumerate(definitions):
+            glossary.add_term(Term(name=f"Term{i}", definition=definition, confidence=0.8))
+        return glossary
+
+    def test_batches_follow_definition_length(self, mock_llm_client: MagicMock) -> None:
+        """Test that long definitions make smaller batches than short ones."""
+        reviewer = GlossaryReviewer(
+            llm_client=mock_llm_client, batcher=TokenBudgetBatcher(600)
+        )
+
+        short = reviewer.split_into_batches(self._glossary(["短い定義"] * 20))
+        long = reviewer.split_into_batches(self._glossary(["長い定義" * 30] * 20))
+
+        assert len(short) == 1
+        assert len(long) > 3
+
+    def test_user_notes_count_towards_budget(self, mock_llm_client: MagicMock) -> None:
+        """Test that user notes make a term's batch fill up sooner."""
+        reviewer = GlossaryReviewer(
+            llm_client=mock_llm_client, batcher=TokenBudgetBatcher(300)
+        )
+        glossary = self._glossary(["定義"] * 6)
+        notes = {f"Term{i}": "補足" * 60 for i in range(6)}
+
+        assert len(reviewer.split_into_batches(glossary)) == 1
+        assert len(reviewer.split_into_batches(glossary, user_notes_map=notes)) > 1
+
+    def test_truncated_batch_is_split_and_retried(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Test that a truncated response splits the batch instead of losing it."""
+
+        def respond(prompt: str, _model: type) -> MockReviewResponse:
+            if prompt.count("- Term") > 2:
+                raise ResponseTruncatedError("truncated")
+            names = re.findall(r"- (Term\d+):", prompt)
+            return MockReviewResponse(
+                issues=[
+                    {"term": name, "issue_type": "unclear", "description": "x"}
+                    for name in names
+                ]
+            )
+
+        mock_llm_client.generate_structured.side_effect = respond
+        batcher = TokenBudgetBatcher(1000)
+        reviewer = GlossaryReviewer(llm_client=mock_llm_client, batcher=batcher)
+
+        issues = reviewer.review(self._glossary(["定義"] * 5))
+
+        assert issues is not None
+        assert [issue.term_name for issue in issues] == [f"Term{i}" for i in range(5)]
+        assert batcher.token_budget < 1000
+
+    def test_batch_is_full(self, mock_llm_client: MagicMock) -> None:
+        """Test incremental batch filling used by the streaming pipeline."""
+        reviewer = GlossaryReviewer(
+            llm_client=mock_llm_client, batcher=TokenBudgetBatcher(100)
+        )
+        term = Term(name="用語", definition="定義" * 20, confidence=0.8)
+
+        assert not reviewer.batch_is_full([term])
+        assert reviewer.batch_is_full([term, term])
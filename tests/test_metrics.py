@@ -0,0 +1,145 @@
+"""Tests for the in-process metrics registry."""
+
+import pytest
+
+from genglossary.metrics import (
+    LLM_REQUESTS,
+    LLM_TOKENS,
+    REGISTRY,
+    MetricsRegistry,
+    is_busy_error,
+    record_llm_request,
+)
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+class TestCounter:
+    """Tests for counters."""
+
+    def test_inc_with_labels(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("jobs_total", "Jobs.", ["kind"])
+
+        counter.labels("a").inc()
+        counter.labels(kind="a").inc(2)
+        counter.labels("b").inc()
+
+        assert registry.get_sample_value("jobs_total", {"kind": "a"}) == 3
+        assert registry.get_sample_value("jobs_total", {"kind": "b"}) == 1
+        assert registry.get_sample_value("jobs_total", {"kind": "c"}) is None
+
+    def test_rejects_negative_increment(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("jobs_total", "Jobs.")
+
+        with pytest.raises(ValueError, match="only increase"):
+            counter.inc(-1)
+
+    def test_label_mismatch_raises(self, registry: MetricsRegistry) -> None:
+        counter = registry.counter("jobs_total", "Jobs.", ["kind"])
+
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+        with pytest.raises(ValueError):
+            counter.labels(other="a")
+        with pytest.raises(ValueError, match="use labels"):
+            counter.inc()
+
+
+class TestGauge:
+    """Tests for gauges."""
+
+    def test_inc_dec_set(self, registry: MetricsRegistry) -> None:
+        gauge = registry.gauge("active", "Active.")
+
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        assert registry.get_sample_value("active") == 1
+
+        gauge.set(7)
+        assert registry.get_sample_value("active") == 7
+
+
+class TestHistogram:
+    """Tests for histograms."""
+
+    def test_cumulative_buckets(self, registry: MetricsRegistry) -> None:
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=[0.1, 1])
+
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        def bucket(le: str) -> float | None:
+            return registry.get_sample_value("latency_seconds_bucket", {"le": le})
+
+        assert bucket("0.1") == 2
+        assert bucket("1") == 3
+        assert bucket("+Inf") == 4
+        assert registry.get_sample_value("latency_seconds_count") == 4
+        assert registry.get_sample_value("latency_seconds_sum") == pytest.approx(3.65)
+
+
+class TestRegistry:
+    """Tests for registry rendering."""
+
+    def test_render_text_format(self, registry: MetricsRegistry) -> None:
+        registry.counter("jobs_total", "Jobs done.", ["kind"]).labels('a"b\\c').inc()
+        registry.histogram("wait_seconds", "Wait.", buckets=[1]).observe(0.5)
+
+        text = registry.render()
+
+        assert "# HELP jobs_total Jobs done.\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{kind="a\\"b\\\\c"} 1\n' in text
+        assert "# TYPE wait_seconds histogram\n" in text
+        assert 'wait_seconds_bucket{le="1"} 1\n' in text
+        assert "wait_seconds_sum 0.5\n" in text
+
+    def test_duplicate_name_raises(self, registry: MetricsRegistry) -> None:
+        registry.counter("jobs_total", "Jobs.")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("jobs_total", "Jobs.")
+
+    def test_clear_keeps_families(self, registry: MetricsRegistry) -> None:
+        registry.counter("jobs_total", "Jobs.").inc()
+
+        registry.clear()
+
+        assert registry.get_sample_value("jobs_total") is None
+        assert "# TYPE jobs_total counter" in registry.render()
+
+
+class TestRecordLlmRequest:
+    """Tests for record_llm_request."""
+
+    def test_counts_request_and_tokens(self) -> None:
+        labels = {"provider": "test", "model": "m1"}
+        before = REGISTRY.get_sample_value(
+            "genglossary_llm_requests_total", {**labels, "outcome": "success"}
+        ) or 0
+
+        record_llm_request("test", "m1", 0.2, "success", prompt_tokens=10, completion_tokens=4)
+
+        assert LLM_REQUESTS.labels("test", "m1", "success").value == before + 1
+        assert REGISTRY.get_sample_value(
+            "genglossary_llm_request_duration_seconds_count", labels
+        ) >= 1
+        assert LLM_TOKENS.labels("test", "m1", "completion").value >= 4
+
+    def test_ignores_missing_token_counts(self) -> None:
+        record_llm_request("test", "m2", 0.1, "success", prompt_tokens=None)
+
+        assert REGISTRY.get_sample_value(
+            "genglossary_llm_tokens_total",
+            {"provider": "test", "model": "m2", "type": "prompt"},
+        ) is None
+
+
+def test_is_busy_error() -> None:
+    import sqlite3
+
+    assert is_busy_error(sqlite3.OperationalError("database is locked"))
+    assert not is_busy_error(sqlite3.OperationalError("no such table: x"))
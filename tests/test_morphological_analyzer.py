@@ -1,8 +1,15 @@
 """Tests for MorphologicalAnalyzer using SudachiPy."""
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
 import pytest
 
-from genglossary.morphological_analyzer import MorphologicalAnalyzer
+from genglossary.morphological_analyzer import (
+    MorphologicalAnalyzer,
+    TokenizerPool,
+    get_tokenizer_pool,
+)
 
 
 class TestMorphologicalAnalyzer:
@@ -648,3 +655,64 @@ class TestMorphologicalAnalyzerFilterContainedOption:
         assert "騎士団長" in terms
         # 騎士団 would be contained in 騎士団長 and filtered out
         assert "騎士団" not in terms
+
+
+class TestTokenizerPool:
+    """Test suite for the shared SudachiPy tokenizer pool."""
+
+    def test_dictionary_is_loaded_lazily(self) -> None:
+        """Test that creating a pool or an analyzer does not load the dictionary."""
+        pool = TokenizerPool()
+        MorphologicalAnalyzer(pool=pool)
+
+        assert pool.is_loaded is False
+        assert pool.size == 0
+
+    def test_warm_up_loads_dictionary(self) -> None:
+        """Test that warm_up loads the dictionary and creates one tokenizer."""
+        pool = TokenizerPool()
+
+        pool.warm_up()
+
+        assert pool.is_loaded is True
+        assert pool.size == 1
+
+    def test_analyzers_share_pooled_tokenizer(self) -> None:
+        """Test that sequential analyzers reuse the same tokenizer."""
+        pool = TokenizerPool()
+
+        for _ in range(3):
+            MorphologicalAnalyzer(pool=pool).extract_proper_nouns("東京に行く。")
+
+        assert pool.size == 1
+
+    def test_busy_tokenizers_are_not_shared(self) -> None:
+        """Test that concurrent borrowers each get their own tokenizer."""
+        pool = TokenizerPool()
+        barrier = Barrier(3)
+
+        def borrow(_: int) -> int:
+            with pool.acquire() as tokenizer:
+                barrier.wait(timeout=5)
+                return id(tokenizer)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ids = list(executor.map(borrow, range(3)))
+
+        assert len(set(ids)) == 3
+        assert pool.size == 3
+
+    def test_concurrent_extraction_matches_sequential(self) -> None:
+        """Test that one analyzer gives the same results from several threads."""
+        analyzer = MorphologicalAnalyzer(pool=TokenizerPool())
+        texts = ["東京は日本の首都です。", "大阪と名古屋を訪問した。"] * 8
+        expected = [analyzer.extract_proper_nouns(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(analyzer.extract_proper_nouns, texts))
+
+        assert results == expected
+
+    def test_default_pool_is_process_wide(self) -> None:
+        """Test that analyzers use the shared pool by default."""
+        assert MorphologicalAnalyzer()._pool is get_tokenizer_pool()
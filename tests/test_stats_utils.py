@@ -0,0 +1,17 @@
+"""Tests for statistics utilities."""
+
+from genglossary.utils.stats import percentile
+
+
+class TestPercentile:
+    """Tests for percentile."""
+
+    def test_nearest_rank(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile([3.0], 95) == 3.0
+
+    def test_empty(self) -> None:
+        assert percentile([], 50) is None
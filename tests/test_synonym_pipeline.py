@@ -202,7 +202,7 @@ class TestRefinerSynonymInfo:
         )
 
         prompt = refiner._create_refinement_prompt(
-            term, issue, {}, synonym_groups=synonym_groups
+            term, issue, refiner.build_context_index([]), synonym_groups=synonym_groups
         )
 
         assert "同義語" in prompt
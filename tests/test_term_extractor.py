@@ -1044,6 +1044,56 @@ class TestTermExtractorBatchClassification:
         assert "アソリウス島騎士団" in prompt
         assert "エデルト軍" in prompt
 
+    def test_classify_terms_with_batcher_packs_by_tokens(
+        self, mock_llm_client: MagicMock, sample_document: Document
+    ) -> None:
+        """Test that a batcher packs short terms beyond batch_size."""
+        from genglossary.llm.batching import TokenBudgetBatcher
+        from genglossary.term_extractor import BatchTermClassificationResponse
+
+        terms = [f"用語{i}" for i in range(25)]
+        mock_llm_client.generate_structured.return_value = BatchTermClassificationResponse(
+            classifications=[{"term": t, "category": "technical_term"} for t in terms]
+        )
+        progress: list[tuple[int, int]] = []
+
+        extractor = TermExtractor(
+            llm_client=mock_llm_client, batcher=TokenBudgetBatcher(1000)
+        )
+        extractor._classify_terms(
+            terms, [sample_document], progress_callback=lambda c, t: progress.append((c, t))
+        )
+
+        assert mock_llm_client.generate_structured.call_count == 1
+        assert progress == [(1, 1)]
+
+    def test_classify_terms_splits_unparseable_batch(
+        self, mock_llm_client: MagicMock, sample_document: Document
+    ) -> None:
+        """Test that a batch whose response fails to parse is split and retried."""
+        from genglossary.llm.batching import TokenBudgetBatcher
+        from genglossary.term_extractor import BatchTermClassificationResponse
+
+        def classify(prompt: str, _model: type) -> BatchTermClassificationResponse:
+            batch = [t for t in ["騎士A", "騎士B", "騎士C", "騎士D"] if t in prompt]
+            if len(batch) > 2:
+                raise ValueError("Failed to parse structured output")
+            return BatchTermClassificationResponse(
+                classifications=[{"term": t, "category": "organization"} for t in batch]
+            )
+
+        mock_llm_client.generate_structured.side_effect = classify
+
+        extractor = TermExtractor(
+            llm_client=mock_llm_client, batcher=TokenBudgetBatcher(1000)
+        )
+        result = extractor._classify_terms(
+            ["騎士A", "騎士B", "騎士C", "騎士D"], [sample_document]
+        )
+
+        assert mock_llm_client.generate_structured.call_count == 3
+        assert result.classified_terms["organization"] == ["騎士A", "騎士B", "騎士C", "騎士D"]
+
 
 class TestTermExtractorClassification:
     """Test suite for term classification phase (legacy tests for compatibility)."""
@@ -2,7 +2,12 @@
 
 import pytest
 
-from genglossary.utils.text import CJK_RANGES, contains_cjk, is_cjk_char
+from genglossary.utils.text import (
+    CJK_RANGES,
+    compile_term_pattern,
+    contains_cjk,
+    is_cjk_char,
+)
 
 
 class TestIsCjkChar:
@@ -90,3 +95,29 @@ class TestCjkRanges:
             assert len(start) == 1
             assert len(end) == 1
             assert start <= end
+
+
+class TestCompileTermPattern:
+    """Test suite for compile_term_pattern function."""
+
+    def test_cjk_term_matches_inside_text(self) -> None:
+        """Test that CJK terms match without word boundaries."""
+        assert compile_term_pattern("騎士団").search("島騎士団は戦う")
+
+    def test_ascii_term_requires_word_boundaries(self) -> None:
+        """Test that ASCII terms do not match inside longer words."""
+        pattern = compile_term_pattern("API")
+
+        assert pattern.search("Call the API.")
+        assert pattern.search("APIを呼ぶ")
+        assert not pattern.search("APIKey")
+
+    def test_ignore_case(self) -> None:
+        """Test that ignore_case enables case-insensitive matching."""
+        assert not compile_term_pattern("API").search("api")
+        assert compile_term_pattern("API", ignore_case=True).search("api")
+
+    def test_special_characters_are_escaped(self) -> None:
+        """Test that regex metacharacters in terms are matched literally."""
+        assert compile_term_pattern("C++").search("Use C++ here")
+        assert not compile_term_pattern("a.b").search("axb")
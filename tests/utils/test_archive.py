@@ -0,0 +1,160 @@
+"""Tests for upload archive readers."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from genglossary.utils.archive import (
+    ArchiveError,
+    ArchiveMember,
+    iter_archive_members,
+    upload_format,
+)
+
+
+def _zip(files: dict[str, bytes]) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def _tar(files: dict[str, bytes], mode: str = "w:gz") -> io.BytesIO:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+def _read(fileobj, fmt: str, max_member_bytes: int = 1024) -> list[ArchiveMember]:
+    return list(iter_archive_members(fileobj, fmt, max_member_bytes=max_member_bytes))
+
+
+class TestUploadFormat:
+    """Tests for upload_format."""
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            ("application/zip", "zip"),
+            ("application/gzip", "tar"),
+            ("application/x-tar", "tar"),
+            ("application/x-ndjson; charset=utf-8", "ndjson"),
+            ("application/json", None),
+            ("", None),
+        ],
+    )
+    def test_maps_content_type(self, content_type: str, expected: str | None) -> None:
+        assert upload_format(content_type) == expected
+
+
+class TestZip:
+    """Tests for zip uploads."""
+
+    def test_yields_files_in_order(self) -> None:
+        members = _read(_zip({"a.md": b"A", "dir/b.txt": "本文".encode()}), "zip")
+
+        assert members == [
+            ArchiveMember("a.md", b"A"),
+            ArchiveMember("dir/b.txt", "本文".encode()),
+        ]
+
+    def test_skips_directories_and_resource_forks(self) -> None:
+        members = _read(
+            _zip({"dir/": b"", "__MACOSX/._a.md": b"\x00\x05", "a.md": b"A"}), "zip"
+        )
+
+        assert [m.name for m in members] == ["a.md"]
+
+    def test_decodes_cp932_names_without_utf8_flag(self) -> None:
+        raw_name = "用語集".encode("cp932")
+        placeholder = b"x" * len(raw_name)
+        # Patch the ASCII name's bytes so the UTF-8 flag stays unset
+        data = _zip({f"{placeholder.decode()}.md": b"A"}).getvalue()
+        data = data.replace(placeholder, raw_name)
+
+        members = _read(io.BytesIO(data), "zip")
+
+        assert members[0].name == "用語集.md"
+
+    def test_rejects_member_too_large(self) -> None:
+        with pytest.raises(ArchiveError, match="big.md: Content too large"):
+            _read(_zip({"big.md": b"x" * 2000}), "zip")
+
+    def test_rejects_invalid_zip(self) -> None:
+        with pytest.raises(ArchiveError, match="Invalid zip archive"):
+            _read(io.BytesIO(b"not a zip"), "zip")
+
+
+class TestTar:
+    """Tests for tar uploads."""
+
+    @pytest.mark.parametrize("mode", ["w", "w:gz"])
+    def test_yields_regular_files(self, mode: str) -> None:
+        members = _read(_tar({"a.md": b"A", "b/c.txt": b"C"}, mode), "tar")
+
+        assert members == [ArchiveMember("a.md", b"A"), ArchiveMember("b/c.txt", b"C")]
+
+    def test_skips_symlinks(self) -> None:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            link = tarfile.TarInfo("link.md")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            archive.addfile(link)
+        buffer.seek(0)
+
+        assert _read(buffer, "tar") == []
+
+    def test_rejects_member_too_large(self) -> None:
+        with pytest.raises(ArchiveError, match="Content too large"):
+            _read(_tar({"big.md": b"x" * 2000}), "tar")
+
+    def test_rejects_invalid_tar(self) -> None:
+        with pytest.raises(ArchiveError, match="Invalid tar archive"):
+            _read(io.BytesIO(b"not a tar" * 100), "tar")
+
+
+class TestNdjson:
+    """Tests for NDJSON uploads."""
+
+    def test_yields_one_file_per_line(self) -> None:
+        lines = [
+            json.dumps({"file_name": "a.md", "content": "本文"}),
+            "",
+            json.dumps({"file_name": "b.txt", "content": "B"}),
+        ]
+
+        members = _read(io.BytesIO("\n".join(lines).encode()), "ndjson")
+
+        assert members == [
+            ArchiveMember("a.md", "本文".encode()),
+            ArchiveMember("b.txt", b"B"),
+        ]
+
+    @pytest.mark.parametrize(
+        "line", [b"{not json", b'["a.md", "A"]', b'{"file_name": "a.md"}']
+    )
+    def test_rejects_malformed_lines(self, line: bytes) -> None:
+        with pytest.raises(ArchiveError, match="Line 1"):
+            _read(io.BytesIO(line), "ndjson")
+
+    def test_rejects_content_too_large(self) -> None:
+        line = json.dumps({"file_name": "big.md", "content": "x" * 2000}).encode()
+
+        with pytest.raises(ArchiveError, match="big.md: Content too large"):
+            _read(io.BytesIO(line), "ndjson")
+
+
+def test_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unknown upload format"):
+        _read(io.BytesIO(b""), "rar")
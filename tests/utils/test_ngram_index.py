@@ -0,0 +1,79 @@
+"""Tests for the character n-gram index."""
+
+from genglossary.utils.ngram_index import NgramIndex
+
+
+def _index(*lines: str) -> NgramIndex:
+    index = NgramIndex()
+    for line_num, line in enumerate(lines, start=1):
+        index.add(line, f"{line_num}: {line}")
+    return index
+
+
+class TestNgramIndex:
+    """Test suite for NgramIndex."""
+
+    def test_finds_japanese_term_inside_sentence(self) -> None:
+        """Test that a term embedded in unsegmented Japanese text is found."""
+        index = _index(
+            "アソリウス島騎士団は魔神討伐の最前線で戦っている。",
+            "騎士団長が島に戻った。",
+        )
+
+        assert index.search("アソリウス島騎士団", limit=5) == [
+            "1: アソリウス島騎士団は魔神討伐の最前線で戦っている。"
+        ]
+
+    def test_requires_contiguous_match(self) -> None:
+        """Test that lines containing all bigrams but not the term are rejected."""
+        index = _index("騎士と団体と士団", "騎士団")
+
+        assert index.search("騎士団", limit=5) == ["2: 騎士団"]
+
+    def test_two_character_term(self) -> None:
+        """Test that two-character terms (one bigram) are indexed."""
+        index = _index("魔神を倒す", "神話の話")
+
+        assert index.search("魔神", limit=5) == ["1: 魔神を倒す"]
+
+    def test_single_character_term(self) -> None:
+        """Test that single-character terms fall back to scanning."""
+        index = _index("島の話", "海の話")
+
+        assert index.search("島", limit=5) == ["1: 島の話"]
+
+    def test_ascii_term_is_case_insensitive(self) -> None:
+        """Test that ASCII lookups ignore case."""
+        index = _index("GenGlossary is a tool.", "genglossary runs locally.")
+
+        assert index.search("GENGLOSSARY", limit=5) == [
+            "1: GenGlossary is a tool.",
+            "2: genglossary runs locally.",
+        ]
+
+    def test_ascii_term_respects_word_boundaries(self) -> None:
+        """Test that ASCII terms do not match inside longer words."""
+        index = _index("Set the APIKey first.", "Call the API.", "APIを呼ぶ")
+
+        assert index.search("API", limit=5) == ["2: Call the API.", "3: APIを呼ぶ"]
+
+    def test_limit_returns_first_matches_in_order(self) -> None:
+        """Test that at most limit payloads are returned in insertion order."""
+        index = _index(*[f"騎士団{i}" for i in range(10)])
+
+        assert index.search("騎士団", limit=3) == [
+            "1: 騎士団0",
+            "2: 騎士団1",
+            "3: 騎士団2",
+        ]
+
+    def test_unknown_term_returns_empty(self) -> None:
+        """Test that a term with an unindexed bigram returns nothing."""
+        index = _index("騎士団")
+
+        assert index.search("魔神", limit=5) == []
+        assert index.search("", limit=5) == []
+
+    def test_len_counts_lines(self) -> None:
+        """Test that len() returns the number of indexed lines."""
+        assert len(_index("a", "b", "c")) == 3